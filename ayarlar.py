@@ -0,0 +1,161 @@
+"""
+Web uygulaması için ortam ayarları ve veritabanı motoru seçenekleri.
+
+Ortam ``SONDAJ_ORTAM`` ile seçilir (gelistirme, uretim, test). Motor
+seçenekleri veritabanı türüne göre belirlenir: SQLite için WAL kipi ve
+iş parçacıkları arası bağlantı paylaşımı, PostgreSQL için bağlantı havuzu
+ve sorgu önbelleği.
+"""
+import os
+import tempfile
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+
+
+def veritabani_adresi():
+    """
+    Ortamdaki veritabanı adresini döndürür.
+
+    Bazı barındırma servislerinin verdiği ``postgres://`` biçimi
+    SQLAlchemy'nin beklediği ``postgresql://`` biçimine çevrilir.
+    """
+    adres = os.environ.get('DATABASE_URL', 'sqlite:///sondaj_veritabani.db')
+    if adres.startswith('postgres://'):
+        adres = 'postgresql://' + adres[len('postgres://'):]
+    return adres
+
+
+class Ayarlar:
+    SECRET_KEY = os.environ.get('SECRET_KEY', 'gizli_anahtar')
+    SQLALCHEMY_DATABASE_URI = veritabani_adresi()
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    DEBUG = False
+    TESTING = False
+
+    # PostgreSQL bağlantı havuzu (işçi süreci başına)
+    HAVUZ_BOYUTU = int(os.environ.get('DB_HAVUZ_BOYUTU', '5'))
+    HAVUZ_TASMA = int(os.environ.get('DB_HAVUZ_TASMA', '10'))
+    HAVUZ_ZAMAN_ASIMI = 30
+    HAVUZ_YENILEME = 300
+    # Derlenmiş SQL önbelleği (SQLAlchemy) ve sunucu taraflı hazır ifadeler (psycopg 3)
+    SORGU_ONBELLEGI = 500
+    HAZIR_IFADE_ESIGI = 5
+    PG_SSLMODE = os.environ.get('DB_SSLMODE', 'prefer')
+    # SQLite kilit bekleme süresi (saniye)
+    SQLITE_ZAMAN_ASIMI = 30
+
+    # Rapor iş kuyruğu ve istek profilleri (dosyalar uygulama kurulurken/ilk kullanımda açılır)
+    RAPOR_KUYRUK_YOLU = os.environ.get('RAPOR_KUYRUK_YOLU', 'rapor_kuyrugu.db')
+    RAPOR_ISCI_SAYISI = int(os.environ.get('RAPOR_ISCI_SAYISI', '2'))
+    PROFIL_DIZINI = os.environ.get('PROFIL_DIZINI', 'profiller')
+
+    # /metrics: tanımlıysa "Authorization: Bearer <anahtar>" gerekir
+    METRIK_ANAHTARI = os.environ.get('METRIK_ANAHTARI')
+    METRIK_ANAHTARI_GEREKLI = False
+    # Çok süreçli sunucuda ölçümlerin toplandığı dizin (boşsa süreç başına ölçüm)
+    METRIK_DIZINI = os.environ.get('METRIK_DIZINI')
+
+
+class GelistirmeAyarlari(Ayarlar):
+    DEBUG = True
+
+
+class UretimAyarlari(Ayarlar):
+    HAVUZ_BOYUTU = int(os.environ.get('DB_HAVUZ_BOYUTU', '10'))
+    HAVUZ_TASMA = int(os.environ.get('DB_HAVUZ_TASMA', '20'))
+    SORGU_ONBELLEGI = 1200
+    # Üretimde anahtarsız /metrics kapalıdır
+    METRIK_ANAHTARI_GEREKLI = True
+
+
+class TestAyarlari(Ayarlar):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL', 'sqlite://')
+    WTF_CSRF_ENABLED = False
+    # Testler çalışma dizinine dosya bırakmaz
+    RAPOR_KUYRUK_YOLU = os.environ.get('TEST_RAPOR_KUYRUK_YOLU',
+                                       os.path.join(tempfile.gettempdir(), 'sondaj_test_rapor_kuyrugu.db'))
+    PROFIL_DIZINI = os.path.join(tempfile.gettempdir(), 'sondaj_test_profiller')
+
+
+ORTAMLAR = {
+    'gelistirme': GelistirmeAyarlari,
+    'uretim': UretimAyarlari,
+    'test': TestAyarlari,
+}
+
+
+def ayarlari_sec(ortam=None):
+    """
+    Ortam adına göre ayar sınıfını döndürür.
+
+    Args:
+        ortam (str, optional): gelistirme, uretim veya test; verilmezse
+            ``SONDAJ_ORTAM`` (varsayılan gelistirme)
+
+    Returns:
+        type: Ayar sınıfı
+    """
+    ortam = ortam or os.environ.get('SONDAJ_ORTAM', 'gelistirme')
+    try:
+        return ORTAMLAR[ortam]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen ortam: {ortam} (seçenekler: {', '.join(ORTAMLAR)})") from None
+
+
+def motor_secenekleri(adres, ayarlar):
+    """
+    Veritabanı türüne uygun SQLAlchemy motor seçeneklerini oluşturur.
+
+    Args:
+        adres (str): Veritabanı adresi
+        ayarlar (type): Ayar sınıfı
+
+    Returns:
+        dict: ``SQLALCHEMY_ENGINE_OPTIONS`` değeri
+    """
+    url = make_url(adres)
+    if url.get_backend_name() == 'sqlite':
+        secenekler = {
+            'connect_args': {'check_same_thread': False, 'timeout': ayarlar.SQLITE_ZAMAN_ASIMI},
+        }
+        # Bellek içi veritabanı tek bağlantıda yaşar; tüm iş parçacıkları onu paylaşmalı
+        if url.database in (None, '', ':memory:'):
+            secenekler['poolclass'] = StaticPool
+        return secenekler
+
+    secenekler = {
+        'pool_pre_ping': True,
+        'pool_recycle': ayarlar.HAVUZ_YENILEME,
+        'query_cache_size': ayarlar.SORGU_ONBELLEGI,
+    }
+    if url.get_backend_name() == 'postgresql':
+        secenekler.update({
+            'pool_size': ayarlar.HAVUZ_BOYUTU,
+            'max_overflow': ayarlar.HAVUZ_TASMA,
+            'pool_timeout': ayarlar.HAVUZ_ZAMAN_ASIMI,
+            'connect_args': {'sslmode': ayarlar.PG_SSLMODE},
+        })
+        if url.get_driver_name() == 'psycopg':
+            secenekler['connect_args']['prepare_threshold'] = ayarlar.HAZIR_IFADE_ESIGI
+    return secenekler
+
+
+def motor_olaylarini_bagla(motor):
+    """
+    SQLite bağlantılarında WAL kipini açar.
+
+    WAL, okuyucuların yazıcıyı beklemeden çalışmasını sağlar; çok iş
+    parçacıklı/çok süreçli sunucuda kilitlenme hatalarını azaltır.
+    """
+    if motor.url.get_backend_name() != 'sqlite' or motor.url.database in (None, '', ':memory:'):
+        return
+
+    @event.listens_for(motor, 'connect')
+    def sqlite_ayarla(dbapi_baglanti, baglanti_kaydi):
+        imlec = dbapi_baglanti.cursor()
+        imlec.execute('PRAGMA journal_mode=WAL')
+        imlec.execute('PRAGMA synchronous=NORMAL')
+        imlec.close()
@@ -0,0 +1,121 @@
+"""
+Masaüstü uygulamasının açılış modüllerinin içe aktarma süresini ölçer.
+
+Her modül ayrı bir ``python -X importtime`` sürecinde içe aktarılır; toplam
+süre ve en pahalı alt modüller raporlanır. Giriş ekranı ve ana pencere için
+matplotlib, numpy veya reportlab yüklenirse betik hata koduyla çıkar, böylece
+ağır içe aktarmaların açılış yoluna geri dönmesi fark edilir.
+
+Kullanım:
+    python benchmarks/ice_aktarma_suresi.py [--cikti sonuc.json] [--tekrar 3]
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+PROJE_DIZINI = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Ölçülecek modüller ve açılışta yüklenmemesi gereken paketler
+OLCUMLER = {
+    "login": ("matplotlib", "numpy", "reportlab"),
+    "main_window": ("matplotlib", "numpy", "reportlab"),
+    "visualization": (),
+    "report_generator": (),
+}
+
+
+def importtime_olc(modul):
+    """
+    Modülü yeni bir süreçte ``-X importtime`` ile içe aktarır.
+
+    Args:
+        modul: İçe aktarılacak modül adı
+
+    Returns:
+        dict: Toplam süre (µs), alt modül süreleri ve hata mesajı
+    """
+    ortam = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    surec = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modul}"],
+        cwd=PROJE_DIZINI, env=ortam, capture_output=True, text=True
+    )
+
+    moduller = {}
+    for satir in surec.stderr.splitlines():
+        if not satir.startswith("import time:") or "|" not in satir:
+            continue
+        try:
+            kendi, toplam, ad = [parca.strip() for parca in satir.split(":", 1)[1].split("|")]
+            moduller[ad] = {"kendi": int(kendi), "toplam": int(toplam)}
+        except ValueError:
+            continue  # Başlık satırı
+
+    hata = None
+    if surec.returncode != 0:
+        hata = surec.stderr.strip().splitlines()[-1] if surec.stderr.strip() else "bilinmeyen hata"
+
+    return {
+        "toplam_us": moduller.get(modul, {}).get("toplam"),
+        "moduller": moduller,
+        "hata": hata,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="İçe aktarma süresi ölçümü")
+    parser.add_argument("--cikti", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--tekrar", type=int, default=3, help="Her modül için ölçüm sayısı")
+    parser.add_argument("--en-pahali", type=int, default=10, help="Listelenecek alt modül sayısı")
+    args = parser.parse_args()
+
+    sonuclar = {}
+    ihlaller = []
+
+    for modul, yasakli_paketler in OLCUMLER.items():
+        olcumler = [importtime_olc(modul) for _ in range(args.tekrar)]
+        sureler = sorted(o["toplam_us"] for o in olcumler if o["toplam_us"] is not None)
+        son = olcumler[-1]
+
+        yuklenen_yasaklilar = sorted({
+            ad.split(".")[0] for ad in son["moduller"] if ad.split(".")[0] in yasakli_paketler
+        })
+        en_pahali = sorted(son["moduller"].items(), key=lambda kv: kv[1]["toplam"], reverse=True)
+
+        sonuclar[modul] = {
+            "medyan_ms": sureler[len(sureler) // 2] / 1000 if sureler else None,
+            "olcumler_ms": [s / 1000 for s in sureler],
+            "agir_paketler": yuklenen_yasaklilar,
+            "en_pahali": [
+                {"modul": ad, "toplam_ms": s["toplam"] / 1000}
+                for ad, s in en_pahali[:args.en_pahali] if ad != modul
+            ],
+            "hata": son["hata"],
+        }
+
+        if yuklenen_yasaklilar:
+            ihlaller.append(f"{modul}: {', '.join(yuklenen_yasaklilar)} açılışta yükleniyor")
+
+        if son["hata"]:
+            # İçe aktarma yarıda kaldıysa ölçülen süre eksiktir
+            durum = f"ölçülemedi ({son['hata']})"
+            ihlaller.append(f"{modul}: içe aktarılamadı")
+        else:
+            durum = f"{sonuclar[modul]['medyan_ms']:.1f} ms"
+        print(f"{modul:<20} {durum}")
+        for kayit in sonuclar[modul]["en_pahali"][:5]:
+            print(f"    {kayit['modul']:<40} {kayit['toplam_ms']:.1f} ms")
+
+    if args.cikti:
+        with open(args.cikti, "w", encoding="utf-8") as f:
+            json.dump(sonuclar, f, ensure_ascii=False, indent=2)
+
+    if ihlaller:
+        print("\n".join(["", "Sorunlar:"] + ihlaller))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+Uygulamanın ana iş akışları için süre ölçümleri.
+
+Sentetik veriyle (bkz. ``sentetik_veri.py``) geçici bir masaüstü ve web
+veritabanı doldurulur, ardından metraj üretimi, proje listeleme, arazi formu
+yükleme, iki analiz grafiği, PDF raporu ve Flask rotaları ölçülür. Sonuçlar
+commit'ler arasında karşılaştırılabilmesi için JSON olarak yazılır.
+
+Kullanım:
+    python benchmarks/is_akisi_suresi.py --cikti sonuc.json [--proje 50 --satir 40 --tekrar 5]
+    python benchmarks/is_akisi_suresi.py --cikti yeni.json --karsilastir eski.json
+"""
+import os
+import io
+import sys
+import json
+import time
+import platform
+import tempfile
+import argparse
+import statistics
+import subprocess
+from datetime import datetime
+
+PROJE_DIZINI = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CALISMA_DIZINI = tempfile.mkdtemp(prefix="sondaj_olcum_")
+
+# Uygulama modülleri içe aktarılmadan önce tüm dosyaları geçici dizine yönlendir
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["SONDAJ_LOG_YOLU"] = os.path.join(CALISMA_DIZINI, "error_log.txt")
+os.environ["SONDAJ_KONSOL_SEVIYESI"] = "ERROR"
+os.environ["SONDAJ_TAKILMA_BEKCISI"] = "0"
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(CALISMA_DIZINI, 'web.db')}"
+os.environ["RAPOR_KUYRUK_YOLU"] = os.path.join(CALISMA_DIZINI, "rapor_kuyrugu.db")
+
+if PROJE_DIZINI not in sys.path:
+    sys.path.insert(0, PROJE_DIZINI)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sentetik_veri import projeler_uret, masaustu_veritabanina_yaz, web_veritabanina_yaz
+
+
+def olc(fonksiyon, tekrar, isinma=1):
+    """
+    Fonksiyonu ısınma turlarından sonra ``tekrar`` kez çalıştırır.
+
+    Returns:
+        dict: Milisaniye cinsinden en kısa, medyan ve ortalama süre ya da hata
+    """
+    try:
+        for _ in range(isinma):
+            fonksiyon()
+        sureler = []
+        for _ in range(tekrar):
+            baslangic = time.perf_counter()
+            fonksiyon()
+            sureler.append((time.perf_counter() - baslangic) * 1000)
+    except Exception as e:
+        return {"hata": f"{type(e).__name__}: {e}"}
+    return {
+        "en_kisa_ms": round(min(sureler), 3),
+        "medyan_ms": round(statistics.median(sureler), 3),
+        "ortalama_ms": round(statistics.fmean(sureler), 3),
+        "tekrar": tekrar,
+    }
+
+
+def metraj_olcumleri(tekrar, satir_sayisi):
+    """Qt ve veritabanı gerektirmeyen metraj/UD hesapları"""
+    from cekirdek.hesaplamalar import (
+        METRAJ_ARALIGI, metraj_noktalari, bos_arazi_kaydi, ud_orneklerini_yerlestir
+    )
+    derinlik = satir_sayisi * METRAJ_ARALIGI
+    ud_derinlikler = [d + 0.75 for d in metraj_noktalari(derinlik, METRAJ_ARALIGI * 4)]
+
+    def metraj():
+        kayitlar = [bos_arazi_kaydi(d) for d in metraj_noktalari(derinlik)]
+        ud_orneklerini_yerlestir(kayitlar, ud_derinlikler)
+
+    return {"metraj_olustur": olc(metraj, tekrar * 10)}
+
+
+def masaustu_olcumleri(tekrar, veritabani_yolu, proje_idleri):
+    """Masaüstü arayüzü: proje listesi, arazi formu, grafikler ve PDF raporu"""
+    from cekirdek import veritabani
+    veritabani.VERITABANI_YOLU = veritabani_yolu
+    ornek_proje = proje_idleri[len(proje_idleri) // 2]
+    sonuclar = {}
+
+    try:
+        from PyQt6.QtWidgets import QApplication
+        uygulama = QApplication.instance() or QApplication([])
+        from main_window import AnaPencere
+        from widgets import AraziFormWidget
+        from visualization import SondajGrafikWidget
+
+        pencere = AnaPencere("olcum", on_isitma=False)
+        arazi_formu = AraziFormWidget()
+        grafik = SondajGrafikWidget()
+
+        sonuclar["proje_listesi"] = olc(pencere.projeleri_yukle, tekrar)
+        sonuclar["arazi_formu_yukle"] = olc(lambda: arazi_formu.load_data(ornek_proje), tekrar)
+        sonuclar["spt_grafigi"] = olc(lambda: grafik.spt_verileri_goster(ornek_proje), tekrar)
+        sonuclar["zemin_profili_grafigi"] = olc(lambda: grafik.zemin_profili_goster(ornek_proje), tekrar)
+        uygulama.processEvents()
+    except Exception as e:
+        hata = {"hata": f"{type(e).__name__}: {e}"}
+        for ad in ("proje_listesi", "arazi_formu_yukle", "spt_grafigi", "zemin_profili_grafigi"):
+            sonuclar.setdefault(ad, hata)
+
+    def rapor():
+        from cekirdek.rapor import SondajRaporuOlusturucu
+        olusturucu = SondajRaporuOlusturucu(ornek_proje, cikti_dizini=CALISMA_DIZINI)
+        dosya, mesaj = olusturucu.rapor_olustur(io.BytesIO())
+        if not dosya:
+            raise RuntimeError(mesaj)
+
+    sonuclar["pdf_raporu"] = olc(rapor, max(1, tekrar // 2))
+    return sonuclar
+
+
+def web_olcumleri(tekrar, proje_sayisi, satir_sayisi, tohum):
+    """Flask rotaları (test istemcisiyle, demo kullanıcıyla oturum açılmış)"""
+    try:
+        from main import create_app, veritabani_kur
+        app = create_app()
+        app.config["WTF_CSRF_ENABLED"] = False
+        with app.app_context():
+            veritabani_kur()
+            proje_idleri = web_veritabanina_yaz(projeler_uret(proje_sayisi, satir_sayisi, tohum))
+    except Exception as e:
+        return {"web": {"hata": f"{type(e).__name__}: {e}"}}
+
+    istemci = app.test_client()
+    istemci.post("/login", data={"username": "demo", "password": "demo123"})
+    ornek_proje = proje_idleri[len(proje_idleri) // 2]
+    rotalar = {
+        "web_dashboard": "/dashboard",
+        "web_proje_listesi": "/projeler",
+        "web_proje_detay": f"/projeler/{ornek_proje}",
+        "web_arazi_bilgileri": f"/projeler/{ornek_proje}/arazi",
+        "web_proje_analiz": f"/projeler/{ornek_proje}/analiz",
+        "web_api_projeler": "/api/projeler",
+        "web_api_proje": f"/api/projeler/{ornek_proje}",
+    }
+
+    sonuclar = {}
+    for ad, adres in rotalar.items():
+        def istek(adres=adres):
+            yanit = istemci.get(adres)
+            if yanit.status_code >= 400:
+                raise RuntimeError(f"HTTP {yanit.status_code}")
+        sonuclar[ad] = olc(istek, tekrar)
+    return sonuclar
+
+
+def ortam_bilgisi():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJE_DIZINI,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "commit": commit,
+        "tarih": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def karsilastir(onceki_yolu, sonuclar):
+    """Önceki sonuç dosyasına göre medyan değişimini yazdırır"""
+    with open(onceki_yolu, encoding="utf-8") as f:
+        onceki = json.load(f)["sonuclar"]
+    print(f"\n{'Ölçüm':<26} {'önceki ms':>10} {'şimdi ms':>10} {'değişim':>9}")
+    for ad, sonuc in sonuclar.items():
+        eski = onceki.get(ad, {}).get("medyan_ms")
+        yeni = sonuc.get("medyan_ms")
+        if eski and yeni:
+            print(f"{ad:<26} {eski:>10.2f} {yeni:>10.2f} {(yeni - eski) / eski * 100:>+8.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="İş akışı süre ölçümleri")
+    parser.add_argument("--cikti", default="olcum_sonuclari.json", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--proje", type=int, default=50, help="Sentetik proje sayısı")
+    parser.add_argument("--satir", type=int, default=40, help="Proje başına derinlik satırı")
+    parser.add_argument("--tohum", type=int, default=42, help="Rastgele sayı tohumu")
+    parser.add_argument("--tekrar", type=int, default=5, help="Ölçüm başına tekrar")
+    parser.add_argument("--karsilastir", help="Karşılaştırılacak önceki sonuç dosyası")
+    args = parser.parse_args()
+
+    masaustu_yolu = os.path.join(CALISMA_DIZINI, "sondaj_veritabani.db")
+    proje_idleri = masaustu_veritabanina_yaz(masaustu_yolu, projeler_uret(args.proje, args.satir, args.tohum))
+
+    sonuclar = {}
+    sonuclar.update(metraj_olcumleri(args.tekrar, args.satir))
+    sonuclar.update(masaustu_olcumleri(args.tekrar, masaustu_yolu, proje_idleri))
+    sonuclar.update(web_olcumleri(args.tekrar, args.proje, args.satir, args.tohum))
+
+    for ad, sonuc in sonuclar.items():
+        if "hata" in sonuc:
+            print(f"{ad:<26} HATA: {sonuc['hata']}")
+        else:
+            print(f"{ad:<26} medyan {sonuc['medyan_ms']:9.2f} ms  (en kısa {sonuc['en_kisa_ms']:.2f} ms)")
+
+    with open(args.cikti, "w", encoding="utf-8") as f:
+        json.dump({
+            "ortam": ortam_bilgisi(),
+            "parametreler": {"proje": args.proje, "satir": args.satir, "tohum": args.tohum, "tekrar": args.tekrar},
+            "sonuclar": sonuclar,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\nSonuçlar yazıldı: {args.cikti}")
+
+    if args.karsilastir:
+        karsilastir(args.karsilastir, sonuclar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Ölçüm ve yük testleri için tekrarlanabilir sentetik sondaj verisi üretir.
+
+Aynı tohum ve boyutlarla her çalıştırmada aynı projeler üretilir. Veriler hem
+masaüstü SQLite şemasına hem de web uygulamasının SQLAlchemy modellerine
+yazılabilir.
+
+Kullanım:
+    python benchmarks/sentetik_veri.py --masaustu sentetik.db --proje 50 --satir 40
+"""
+import os
+import sys
+import random
+import sqlite3
+import argparse
+from datetime import date, timedelta
+
+PROJE_DIZINI = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJE_DIZINI not in sys.path:
+    sys.path.insert(0, PROJE_DIZINI)
+
+from cekirdek.hesaplamalar import METRAJ_ARALIGI, ornek_derinlik_araligi
+
+# (zemin tanımlaması, profil kodu, taban N30, derinlikle artış / m, doğal BHA)
+ZEMIN_TURLERI = [
+    ("Kahverengi, yumuşak-orta katı, siltli KİL", "CL", 6, 1.2, 18.5),
+    ("Kahverengi-gri, katı, kumlu KİL", "CL", 12, 1.0, 19.0),
+    ("Gri, orta sıkı, siltli KUM", "SM", 15, 1.5, 19.5),
+    ("Sarımsı kahve, sıkı, killi ÇAKIL", "GC", 25, 1.8, 20.5),
+    ("Gri, çok katı, yüksek plastisiteli KİL", "CH", 18, 1.1, 18.8),
+    ("Ayrışmış, kırıklı KUMTAŞI", "KT", 40, 2.5, 22.0),
+]
+ILLER = [
+    ("Ankara", ["Çankaya", "Yenimahalle", "Etimesgut"]),
+    ("İstanbul", ["Kadıköy", "Ümraniye", "Başakşehir"]),
+    ("İzmir", ["Bornova", "Karşıyaka", "Buca"]),
+    ("Bursa", ["Nilüfer", "Osmangazi"]),
+]
+SONDORLER = ["Ahmet Yılmaz", "Mehmet Demir", "Ayşe Kaya", "Mustafa Çelik"]
+FIRMALAR = ["Zemin Etüt A.Ş.", "Yapı Sondaj Ltd.", "Jeoteknik Mühendislik", "Anadolu Sondaj"]
+SPT_RET = 50  # Bu darbe sayısından sonra ret kabul edilir
+
+# Web modeli alan adı -> masaüstü AraziBilgileri sütun adı
+MASAUSTU_ARAZI_SUTUNLARI = {
+    "sondaj_derinligi": "Sondaj derinliği (m)",
+    "muhafaza_borusu_derinligi": "Muhafaza borusu derinliği",
+    "kuyu_ici_deneyler": "Kuyu içi deneyler",
+    "ornek_derinligi": "Örnek derinliği (m)",
+    "ornek_turu_no": "Örnek türü ve no.",
+    "spt_0_15": "SPT0-15",
+    "spt_15_30": "SPT15-30",
+    "spt_30_45": "SPT30-45",
+    "n30": "N30",
+    "tmax": "Tmax",
+    "tyogrulmus": "TYoğrulmuş",
+    "c_kpa": "C (kpa)",
+    "aci_derece": "Ø(derece)",
+    "dogal_bha": "Doğal B.H.A(kN/m3)",
+    "kuru_bha": "Kuru B.H.A (kN/m3)",
+    "zemin_profili": "Zemin profili",
+    "zemin_tanimlamasi": "Zemin tanımlaması",
+}
+
+
+def _katmanlar(rnd, derinlik):
+    """Derinlik boyunca 1.5-6 m kalınlığında zemin katmanları üretir"""
+    katmanlar = []
+    ust = 0.0
+    indeks = rnd.randrange(3)
+    while ust < derinlik:
+        kalinlik = rnd.uniform(1.5, 6.0)
+        katmanlar.append((ust, ust + kalinlik, ZEMIN_TURLERI[indeks]))
+        ust += kalinlik
+        # Genelde derine doğru daha sıkı zemine geçilir
+        indeks = min(len(ZEMIN_TURLERI) - 1, max(0, indeks + rnd.choice((-1, 1, 1, 2))))
+    return katmanlar
+
+
+def arazi_kayitlari_uret(rnd, satir_sayisi, ud_araligi=4):
+    """
+    Derinliğe göre sıralı arazi deney kayıtları üretir.
+
+    SPT darbe sayıları zemin türüne ve derinliğe göre artar; 50 darbede
+    ret uygulanır. Her ``ud_araligi`` satırda bir UD örneği alınır.
+
+    Returns:
+        list: Web modelindeki alan adlarıyla kayıtlar (dict)
+    """
+    derinlik = satir_sayisi * METRAJ_ARALIGI
+    katmanlar = _katmanlar(rnd, derinlik)
+    kayitlar = []
+    ud_no = 0
+    for i in range(satir_sayisi):
+        d = round(i * METRAJ_ARALIGI, 2)
+        zemin, profil, taban, artis, bha = next(k[2] for k in katmanlar if k[0] <= d < k[1])
+        n = max(1, int(rnd.gauss(taban + artis * d, 3)))
+        ilk = max(1, int(n * rnd.uniform(0.3, 0.5)))
+        ikinci = min(SPT_RET, max(1, int(n * rnd.uniform(0.4, 0.55))))
+        ucuncu = min(SPT_RET, max(1, n - ikinci))
+
+        ud = i > 0 and i % ud_araligi == 0 and profil in ("CL", "CH")
+        if ud:
+            ud_no += 1
+        kil = profil in ("CL", "CH")
+        kayitlar.append({
+            "sondaj_derinligi": d,
+            "muhafaza_borusu_derinligi": d,
+            "kuyu_ici_deneyler": "UD" if ud else "SPT",
+            "ornek_derinligi": ornek_derinlik_araligi(d),
+            "ornek_turu_no": f"UD-{ud_no}" if ud else f"SPT-{i + 1}",
+            "spt_0_15": ilk,
+            "spt_15_30": ikinci,
+            "spt_30_45": ucuncu,
+            "n30": min(SPT_RET, ikinci + ucuncu),
+            "tmax": round(rnd.uniform(40, 180), 1) if kil else 0,
+            "tyogrulmus": round(rnd.uniform(15, 80), 1) if kil else 0,
+            "c_kpa": round(rnd.uniform(10, 60), 1) if kil else 0,
+            "aci_derece": round(rnd.uniform(5, 15), 1) if kil else round(rnd.uniform(28, 38), 1),
+            "dogal_bha": round(bha + rnd.uniform(-0.4, 0.4), 2),
+            "kuru_bha": round(bha - rnd.uniform(2.0, 3.5), 2),
+            "zemin_profili": profil,
+            "zemin_tanimlamasi": zemin,
+        })
+    return kayitlar
+
+
+def projeler_uret(proje_sayisi, satir_sayisi, tohum=42):
+    """
+    Tapu, sondaj ve arazi bilgileriyle birlikte sentetik projeler üretir.
+
+    Args:
+        proje_sayisi (int): Proje sayısı
+        satir_sayisi (int): Proje başına arazi (derinlik) satırı
+        tohum (int): Rastgele sayı tohumu
+
+    Returns:
+        list: Her proje için {"proje", "tapu", "sondaj", "arazi"} sözlüğü
+    """
+    rnd = random.Random(tohum)
+    baslangic = date(2023, 1, 2)
+    projeler = []
+    for i in range(proje_sayisi):
+        il, ilceler = rnd.choice(ILLER)
+        baslama = baslangic + timedelta(days=rnd.randrange(700))
+        arazi = arazi_kayitlari_uret(rnd, satir_sayisi)
+        derinlik = round(satir_sayisi * METRAJ_ARALIGI, 2)
+        projeler.append({
+            "proje": {
+                "proje_adi": f"Sentetik Proje {i + 1:04d}",
+                "yuklenici_firma": rnd.choice(FIRMALAR),
+                "sorumlu_muhendis": rnd.choice(SONDORLER),
+            },
+            "tapu": {
+                "il": il,
+                "ilce": rnd.choice(ilceler),
+                "mahalle": f"{rnd.randint(1, 60)}. Mahalle",
+                "ada": str(rnd.randint(100, 9999)),
+                "pafta": f"{rnd.choice('ABCDEFG')}{rnd.randint(10, 40)}",
+                "parsel": str(rnd.randint(1, 80)),
+                "koordinat_x": round(rnd.uniform(400000, 600000), 2),
+                "koordinat_y": round(rnd.uniform(4300000, 4600000), 2),
+            },
+            "sondaj": {
+                "sondor_adi": rnd.choice(SONDORLER),
+                "sondaj_kotu": round(rnd.uniform(50, 1100), 2),
+                "sondaj_derinligi": derinlik,
+                "baslama_tarihi": baslama,
+                "bitis_tarihi": baslama + timedelta(days=rnd.randint(1, 5)),
+                "delgi_capi": rnd.choice((76.0, 89.0, 101.0)),
+                "yer_alti_suyu": round(rnd.uniform(1.0, derinlik), 2) if rnd.random() < 0.6 else None,
+                "ud_ornekleri": " ".join(f"{k['sondaj_derinligi']:.2f}" for k in arazi
+                                         if k["kuyu_ici_deneyler"] == "UD"),
+                "zemin_tipi": arazi[0]["zemin_profili"] if arazi else "",
+                "makine_tipi": rnd.choice(("D-500", "Craelius D-750", "Hidrolik Paletli")),
+                "spt_sahmerdan_tipi": rnd.choice(("Otomatik", "Halat-makara")),
+            },
+            "arazi": arazi,
+        })
+    return projeler
+
+
+def masaustu_veritabanina_yaz(yol, projeler):
+    """
+    Projeleri masaüstü SQLite şemasına yazar (tablolar yoksa oluşturulur).
+
+    Args:
+        yol (str): Veritabanı dosyası
+        projeler (list): ``projeler_uret`` çıktısı
+
+    Returns:
+        list: Eklenen proje ID'leri
+    """
+    from cekirdek import veritabani
+
+    onceki_yol = veritabani.VERITABANI_YOLU
+    veritabani.VERITABANI_YOLU = yol
+    try:
+        veritabani.veritabani_olustur()
+    finally:
+        veritabani.VERITABANI_YOLU = onceki_yol
+
+    arazi_sutunlari = list(MASAUSTU_ARAZI_SUTUNLARI)
+    arazi_sql = (
+        "INSERT INTO AraziBilgileri (proje_id, sondaj_id, "
+        + ", ".join(f'"{MASAUSTU_ARAZI_SUTUNLARI[s]}"' for s in arazi_sutunlari)
+        + ") VALUES (?, ?" + ", ?" * len(arazi_sutunlari) + ")"
+    )
+    proje_idleri = []
+    with sqlite3.connect(yol) as conn:
+        for veri in projeler:
+            cursor = conn.execute(
+                "INSERT INTO Projeler (proje_adi, yuklenici_firma, sorumlu_muhendis) VALUES (?, ?, ?)",
+                (veri["proje"]["proje_adi"], veri["proje"]["yuklenici_firma"], veri["proje"]["sorumlu_muhendis"])
+            )
+            proje_id = cursor.lastrowid
+            proje_idleri.append(proje_id)
+
+            tapu = veri["tapu"]
+            conn.execute(
+                """INSERT INTO TapuBilgileri (proje_id, il, ilce, mahalle, ada, pafta, parsel, koordinat_x, koordinat_y)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (proje_id, tapu["il"], tapu["ilce"], tapu["mahalle"], tapu["ada"], tapu["pafta"],
+                 tapu["parsel"], tapu["koordinat_x"], tapu["koordinat_y"])
+            )
+
+            sondaj = veri["sondaj"]
+            cursor = conn.execute(
+                """INSERT INTO SondajBilgileri (proje_id, kuyu_adi, sondor_adi, sondaj_kotu, sondaj_derinligi,
+                   baslama_tarihi, bitis_tarihi, delgi_capi, yer_alti_suyu, ud_ornekleri, zemin_tipi,
+                   makine_tipi, spt_sahmerdan_tipi) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (proje_id, veritabani.VARSAYILAN_KUYU_ADI, sondaj["sondor_adi"], sondaj["sondaj_kotu"], sondaj["sondaj_derinligi"],
+                 sondaj["baslama_tarihi"].isoformat(), sondaj["bitis_tarihi"].isoformat(),
+                 sondaj["delgi_capi"], sondaj["yer_alti_suyu"], sondaj["ud_ornekleri"], sondaj["zemin_tipi"],
+                 sondaj["makine_tipi"], sondaj["spt_sahmerdan_tipi"])
+            )
+
+            sondaj_id = cursor.lastrowid
+            conn.executemany(arazi_sql, [(proje_id, sondaj_id, *(k[s] for s in arazi_sutunlari))
+                                         for k in veri["arazi"]])
+        conn.commit()
+    return proje_idleri
+
+
+def web_veritabanina_yaz(projeler):
+    """
+    Projeleri web uygulamasının SQLAlchemy modellerine yazar.
+
+    Uygulama bağlamı içinde çağrılmalıdır; veritabanı ``DATABASE_URL`` ile
+    seçilir.
+
+    Returns:
+        list: Eklenen proje ID'leri
+    """
+    from main import db, Proje, TapuBilgileri, SondajBilgileri, AraziBilgileri
+
+    proje_idleri = []
+    for veri in projeler:
+        proje = Proje(**veri["proje"])
+        db.session.add(proje)
+        db.session.flush()
+        db.session.add(TapuBilgileri(proje_id=proje.id, **veri["tapu"]))
+        kuyu = SondajBilgileri(proje_id=proje.id, kuyu_adi="SK-1", **veri["sondaj"])
+        db.session.add(kuyu)
+        db.session.flush()
+        db.session.add_all([AraziBilgileri(proje_id=proje.id, sondaj_id=kuyu.id, **kayit) for kayit in veri["arazi"]])
+        proje_idleri.append(proje.id)
+    db.session.commit()
+    return proje_idleri
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik sondaj verisi üretimi")
+    parser.add_argument("--masaustu", help="Yazılacak masaüstü SQLite dosyası")
+    parser.add_argument("--web", action="store_true", help="DATABASE_URL ile web veritabanına yaz")
+    parser.add_argument("--proje", type=int, default=50, help="Proje sayısı")
+    parser.add_argument("--satir", type=int, default=40, help="Proje başına derinlik satırı")
+    parser.add_argument("--tohum", type=int, default=42, help="Rastgele sayı tohumu")
+    args = parser.parse_args()
+
+    projeler = projeler_uret(args.proje, args.satir, args.tohum)
+    if args.masaustu:
+        idler = masaustu_veritabanina_yaz(args.masaustu, projeler)
+        print(f"Masaüstü veritabanına {len(idler)} proje yazıldı: {args.masaustu}")
+    if args.web:
+        from main import create_app, veritabani_kur
+        app = create_app()
+        with app.app_context():
+            veritabani_kur()
+            idler = web_veritabanina_yaz(projeler)
+        print(f"Web veritabanına {len(idler)} proje yazıldı")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""
+Flask uygulaması için yerel yük testi.
+
+Her sanal kullanıcı ayrı bir iş parçacığında demo kullanıcıyla oturum açar
+ve ağırlıklı senaryo karışımını (proje listesi, proje açma, metraj üretme,
+100 satırlık tablo kaydetme, analiz görüntüleme) süre dolana kadar
+tekrarlar. Senaryo başına verim, p50/p95/p99 gecikme ve hata oranı
+raporlanır.
+
+Çalışan bir sunucuya karşı:
+    python benchmarks/yuk_testi.py --adres http://127.0.0.1:5000 --kullanici 20 --sure 60
+
+Sunucuyu betiğin başlatması (geçici SQLite veya yerel Postgres):
+    python benchmarks/yuk_testi.py --sunucu-baslat --proje 50
+    python benchmarks/yuk_testi.py --sunucu-baslat --veritabani postgresql://localhost/sondaj_yuk
+"""
+import os
+import re
+import sys
+import json
+import time
+import random
+import socket
+import tempfile
+import argparse
+import threading
+import statistics
+import subprocess
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.cookiejar import CookieJar
+
+PROJE_DIZINI = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BETIK_DIZINI = os.path.dirname(os.path.abspath(__file__))
+
+DEMO_KULLANICI = ("demo", "demo123")
+TABLO_SATIR_SAYISI = 100
+ISTEK_ZAMAN_ASIMI = 30
+
+# Senaryo adı -> karışımdaki ağırlığı
+SENARYO_AGIRLIKLARI = {
+    "proje_listesi": 30,
+    "proje_ac": 30,
+    "metraj_olustur": 10,
+    "tablo_kaydet": 10,
+    "analiz": 20,
+}
+
+CSRF_DESENI = re.compile(r'name="csrf_token"[^>]*value="([^"]+)"|value="([^"]+)"[^>]*name="csrf_token"')
+
+
+class IstekHatasi(Exception):
+    pass
+
+
+class YonlendirmeyiIzleme(urllib.request.HTTPRedirectHandler):
+    """Yönlendirmeyi izlemez; 3xx yanıtı HTTPError olarak döner"""
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class SanalKullanici:
+    """Kendi çerez kavanozuyla oturum açan HTTP istemcisi"""
+    def __init__(self, adres):
+        self.adres = adres.rstrip("/")
+        cerezler = urllib.request.HTTPCookieProcessor(CookieJar())
+        self.acici = urllib.request.build_opener(cerezler)
+        self.yonlendirmesiz_acici = urllib.request.build_opener(cerezler, YonlendirmeyiIzleme())
+
+    def istek(self, yol, veri=None):
+        """
+        İstek gönderir; 4xx/5xx yanıtlarda IstekHatasi fırlatır.
+
+        Returns:
+            bytes: Yanıt gövdesi
+        """
+        govde = urllib.parse.urlencode(veri).encode("utf-8") if veri is not None else None
+        try:
+            with self.acici.open(self.adres + yol, data=govde, timeout=ISTEK_ZAMAN_ASIMI) as yanit:
+                return yanit.read()
+        except urllib.error.HTTPError as e:
+            raise IstekHatasi(f"HTTP {e.code} {yol}") from None
+        except (urllib.error.URLError, socket.timeout, ConnectionError) as e:
+            raise IstekHatasi(f"{type(e).__name__} {yol}") from None
+
+    def giris_yap(self):
+        """Giriş formundaki CSRF belirteciyle demo kullanıcısıyla oturum açar"""
+        veri = {"username": DEMO_KULLANICI[0], "password": DEMO_KULLANICI[1]}
+        try:
+            sayfa = self.istek("/login").decode("utf-8", "replace")
+            eslesme = CSRF_DESENI.search(sayfa)
+            if eslesme:
+                veri["csrf_token"] = eslesme.group(1) or eslesme.group(2)
+        except IstekHatasi:
+            pass  # Giriş sayfası açılamazsa belirteçsiz denenir
+
+        # Başarılı girişte panele yönlendirilir; hedef sayfa ayrıca ölçülmez
+        govde = urllib.parse.urlencode(veri).encode("utf-8")
+        try:
+            self.yonlendirmesiz_acici.open(self.adres + "/login", data=govde, timeout=ISTEK_ZAMAN_ASIMI).close()
+        except urllib.error.HTTPError as e:
+            if e.code in (301, 302, 303) and "/login" not in e.headers.get("Location", ""):
+                return
+            raise IstekHatasi(f"Giriş başarısız (HTTP {e.code})") from None
+        except (urllib.error.URLError, socket.timeout, ConnectionError) as e:
+            raise IstekHatasi(f"{type(e).__name__} /login") from None
+        raise IstekHatasi("Giriş başarısız: kullanıcı adı/şifre veya CSRF belirteci kabul edilmedi")
+
+
+def tablo_formu(satir_sayisi, rnd):
+    """Arazi tablosu kaydetme formunu ``satir_sayisi`` satırla doldurur"""
+    veri = {"kaydet": "1", "satir_sayisi": str(satir_sayisi)}
+    for i in range(satir_sayisi):
+        derinlik = i * 1.5
+        ikinci, ucuncu = rnd.randint(3, 25), rnd.randint(3, 25)
+        veri.update({
+            f"sondaj_derinligi_{i}": f"{derinlik:.2f}",
+            f"muhafaza_borusu_derinligi_{i}": f"{derinlik:.2f}",
+            f"kuyu_ici_deneyler_{i}": "SPT",
+            f"ornek_derinligi_{i}": f"{derinlik:.2f}-{derinlik + 0.45:.2f}",
+            f"ornek_turu_no_{i}": f"SPT-{i + 1}",
+            f"spt_0_15_{i}": str(rnd.randint(2, 15)),
+            f"spt_15_30_{i}": str(ikinci),
+            f"spt_30_45_{i}": str(ucuncu),
+            f"n30_{i}": str(ikinci + ucuncu),
+            f"dogal_bha_{i}": f"{rnd.uniform(17, 21):.2f}",
+            f"zemin_profili_{i}": "CL",
+            f"zemin_tanimlamasi_{i}": "Kahverengi siltli KİL",
+        })
+    return veri
+
+
+def senaryo_calistir(ad, kullanici, proje_id, rnd):
+    """Tek bir senaryoyu, bir kullanıcının yapacağı istek sırasıyla çalıştırır"""
+    if ad == "proje_listesi":
+        kullanici.istek("/projeler")
+    elif ad == "proje_ac":
+        kullanici.istek(f"/projeler/{proje_id}")
+        kullanici.istek(f"/projeler/{proje_id}/arazi")
+    elif ad == "metraj_olustur":
+        kullanici.istek(f"/projeler/{proje_id}/arazi/ekle", {"metraj_olustur": "1"})
+    elif ad == "tablo_kaydet":
+        kullanici.istek(f"/projeler/{proje_id}/arazi/ekle", tablo_formu(TABLO_SATIR_SAYISI, rnd))
+    elif ad == "analiz":
+        kullanici.istek(f"/projeler/{proje_id}/analiz")
+    else:
+        raise ValueError(f"Bilinmeyen senaryo: {ad}")
+
+
+class YukTesti:
+    """Sanal kullanıcıları çalıştırır ve senaryo ölçümlerini toplar"""
+    def __init__(self, adres, kullanici_sayisi, sure, senaryolar, tohum=42):
+        self.adres = adres
+        self.kullanici_sayisi = kullanici_sayisi
+        self.sure = sure
+        self.senaryolar = senaryolar
+        self.tohum = tohum
+        self.kilit = threading.Lock()
+        self.gecikmeler = {ad: [] for ad in senaryolar}
+        self.hatalar = {ad: 0 for ad in senaryolar}
+        self.hata_ornekleri = {}
+        self.proje_idleri = []
+
+    def projeleri_bul(self):
+        kullanici = SanalKullanici(self.adres)
+        kullanici.giris_yap()
+        projeler = json.loads(kullanici.istek("/api/projeler"))
+        self.proje_idleri = [p["id"] for p in projeler]
+        if not self.proje_idleri:
+            raise RuntimeError("Sunucuda proje yok; önce sentetik veri yükleyin (--proje)")
+
+    def _kullanici_dongusu(self, sira, bitis):
+        rnd = random.Random(self.tohum + sira)
+        kullanici = SanalKullanici(self.adres)
+        try:
+            kullanici.giris_yap()
+        except IstekHatasi as e:
+            with self.kilit:
+                self.hata_ornekleri.setdefault("giris", str(e))
+            return
+
+        adlar = list(self.senaryolar)
+        agirliklar = [self.senaryolar[ad] for ad in adlar]
+        # Veri değiştiren senaryolar çakışmasın diye her kullanıcı kendi projesinde çalışır
+        proje_id = self.proje_idleri[sira % len(self.proje_idleri)]
+        while time.monotonic() < bitis:
+            ad = rnd.choices(adlar, agirliklar)[0]
+            baslangic = time.perf_counter()
+            try:
+                senaryo_calistir(ad, kullanici, proje_id, rnd)
+                hata = None
+            except IstekHatasi as e:
+                hata = str(e)
+            sure = time.perf_counter() - baslangic
+            with self.kilit:
+                self.gecikmeler[ad].append(sure)
+                if hata:
+                    self.hatalar[ad] += 1
+                    self.hata_ornekleri.setdefault(ad, hata)
+
+    def calistir(self):
+        """
+        Testi çalıştırır.
+
+        Returns:
+            dict: Senaryo başına ölçüm özeti
+        """
+        self.projeleri_bul()
+        bitis = time.monotonic() + self.sure
+        baslangic = time.monotonic()
+        is_parcaciklari = [
+            threading.Thread(target=self._kullanici_dongusu, args=(i, bitis), daemon=True)
+            for i in range(self.kullanici_sayisi)
+        ]
+        for t in is_parcaciklari:
+            t.start()
+        for t in is_parcaciklari:
+            t.join()
+        gecen = time.monotonic() - baslangic
+        return self.ozet(gecen)
+
+    def ozet(self, gecen):
+        sonuclar = {}
+        for ad, gecikmeler in self.gecikmeler.items():
+            adet = len(gecikmeler)
+            sonuc = {"adet": adet, "verim_sn": round(adet / gecen, 2) if gecen else 0,
+                     "hata_orani": round(self.hatalar[ad] / adet, 4) if adet else 0}
+            if adet >= 2:
+                yuzdelikler = statistics.quantiles(gecikmeler, n=100, method="inclusive")
+                sonuc.update({
+                    "p50_ms": round(yuzdelikler[49] * 1000, 1),
+                    "p95_ms": round(yuzdelikler[94] * 1000, 1),
+                    "p99_ms": round(yuzdelikler[98] * 1000, 1),
+                    "en_uzun_ms": round(max(gecikmeler) * 1000, 1),
+                })
+            if ad in self.hata_ornekleri:
+                sonuc["ornek_hata"] = self.hata_ornekleri[ad]
+            sonuclar[ad] = sonuc
+        return {"sure_sn": round(gecen, 1), "kullanici": self.kullanici_sayisi,
+                "giris_hatasi": self.hata_ornekleri.get("giris"), "senaryolar": sonuclar}
+
+
+def _bos_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def sunucu_baslat(veritabani_url, proje_sayisi, satir_sayisi, tohum):
+    """
+    Sentetik veriyi yükler ve uygulamayı çok iş parçacıklı sunucuda başlatır.
+
+    Returns:
+        tuple: (subprocess.Popen, adres, geçici dizin)
+    """
+    gecici = tempfile.mkdtemp(prefix="sondaj_yuk_")
+    if not veritabani_url:
+        veritabani_url = f"sqlite:///{os.path.join(gecici, 'web.db')}"
+    ortam = dict(
+        os.environ,
+        DATABASE_URL=veritabani_url,
+        RAPOR_KUYRUK_YOLU=os.path.join(gecici, "rapor_kuyrugu.db"),
+        SONDAJ_LOG_YOLU=os.path.join(gecici, "error_log.txt"),
+        SONDAJ_KONSOL_SEVIYESI="ERROR",
+    )
+    subprocess.run(
+        [sys.executable, os.path.join(BETIK_DIZINI, "sentetik_veri.py"), "--web",
+         "--proje", str(proje_sayisi), "--satir", str(satir_sayisi), "--tohum", str(tohum)],
+        cwd=PROJE_DIZINI, env=ortam, check=True
+    )
+
+    port = _bos_port()
+    sunucu = subprocess.Popen(
+        [sys.executable, "-m", "flask", "--app", "main", "run", "--with-threads", "--no-reload",
+         "--port", str(port)],
+        cwd=PROJE_DIZINI, env=ortam, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    adres = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(adres + "/api/projeler", timeout=1).close()
+            break
+        except urllib.error.HTTPError:
+            break  # Sunucu yanıt veriyor (oturum açılmadığı için yönlendirme/401)
+        except (urllib.error.URLError, ConnectionError, socket.timeout):
+            if sunucu.poll() is not None:
+                raise RuntimeError("Sunucu başlatılamadı")
+            time.sleep(0.2)
+    return sunucu, adres, gecici
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flask rotaları için yük testi")
+    parser.add_argument("--adres", default="http://127.0.0.1:5000", help="Test edilecek sunucu")
+    parser.add_argument("--sunucu-baslat", action="store_true", help="Geçici veritabanıyla sunucuyu başlat")
+    parser.add_argument("--veritabani", help="--sunucu-baslat için veritabanı adresi (varsayılan geçici SQLite)")
+    parser.add_argument("--proje", type=int, default=50, help="Yüklenecek sentetik proje sayısı")
+    parser.add_argument("--satir", type=int, default=40, help="Proje başına derinlik satırı")
+    parser.add_argument("--kullanici", type=int, default=10, help="Eşzamanlı sanal kullanıcı sayısı")
+    parser.add_argument("--sure", type=float, default=30, help="Test süresi (saniye)")
+    parser.add_argument("--senaryo", action="append", choices=list(SENARYO_AGIRLIKLARI),
+                        help="Yalnızca bu senaryoları çalıştır (tekrarlanabilir)")
+    parser.add_argument("--tohum", type=int, default=42, help="Rastgele sayı tohumu")
+    parser.add_argument("--cikti", help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    senaryolar = {ad: SENARYO_AGIRLIKLARI[ad] for ad in (args.senaryo or SENARYO_AGIRLIKLARI)}
+    sunucu = None
+    adres = args.adres
+    if args.sunucu_baslat:
+        sunucu, adres, gecici = sunucu_baslat(args.veritabani, args.proje, args.satir, args.tohum)
+        print(f"Sunucu başlatıldı: {adres} (geçici dizin: {gecici})")
+
+    try:
+        sonuc = YukTesti(adres, args.kullanici, args.sure, senaryolar, args.tohum).calistir()
+    finally:
+        if sunucu:
+            sunucu.terminate()
+            sunucu.wait(timeout=10)
+
+    print(f"\n{args.kullanici} kullanıcı, {sonuc['sure_sn']} sn")
+    if sonuc["giris_hatasi"]:
+        print(f"Giriş hatası: {sonuc['giris_hatasi']}")
+    print(f"{'Senaryo':<16} {'adet':>6} {'istek/sn':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'hata %':>7}")
+    for ad, s in sonuc["senaryolar"].items():
+        print(f"{ad:<16} {s['adet']:>6} {s['verim_sn']:>9.2f} {s.get('p50_ms', 0):>8.1f} "
+              f"{s.get('p95_ms', 0):>8.1f} {s.get('p99_ms', 0):>8.1f} {s['hata_orani'] * 100:>7.1f}")
+        if "ornek_hata" in s:
+            print(f"{'':<16} örnek hata: {s['ornek_hata']}")
+
+    if args.cikti:
+        sonuc["adres"] = adres
+        with open(args.cikti, "w", encoding="utf-8") as f:
+            json.dump(sonuc, f, ensure_ascii=False, indent=2)
+        print(f"\nSonuçlar yazıldı: {args.cikti}")
+
+
+if __name__ == "__main__":
+    main()
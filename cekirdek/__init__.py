@@ -0,0 +1,12 @@
+"""
+Qt'ye bağımlı olmayan çekirdek modüller.
+
+Veritabanı erişimi, günlükleme, alan hesaplamaları ve rapor motoru burada
+bulunur; web uygulaması ve toplu işlem araçları PyQt6 yüklemeden bunları
+kullanabilir. Masaüstü arayüz yardımcıları ``utils`` modülündedir.
+
+Rapor motoru (``cekirdek.rapor``) matplotlib ve reportlab yüklediği için
+burada içe aktarılmaz.
+"""
+from cekirdek.gunluk import LOG_YOLU, hata_logla, baglam
+from cekirdek.veritabani import VERITABANI_YOLU, veritabani_baglantisi, veritabani_olustur
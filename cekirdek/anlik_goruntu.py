@@ -0,0 +1,304 @@
+"""
+Arşivin sütun bazlı anlık görüntüsü (masaüstü veritabanı).
+
+Projeler, TapuBilgileri, SondajBilgileri ve AraziBilgileri tabloları
+sütun başına bir ``.npy`` dosyasına yazılır: tam sayılar int64 (boş
+değer varsa ayrıca ``.gecerli.npy`` maskesi), ondalıklar float64 (boş =
+NaN), metinler sözlük kodlu (int32 kod, -1 = boş; değerler ``.sozluk.npy``).
+Dosyalar sıkıştırılmaz; ``AnlikGoruntu`` bunları ``mmap`` ile kopyasız açar.
+
+Her yazım yeni bir sürüm dizinine yapılır ve ``GUNCEL`` dosyası atomik
+olarak değiştirilir; açık okuyucular eski sürümü görmeye devam eder.
+Yenileme artımlıdır: yalnızca ``ProjeOzetleri.guncelleme_zamani`` son
+görüntüden sonra ilerlemiş projeler veritabanından okunur, silinen
+projeler çıkarılır, diğer satırlar önceki görüntüden kopyalanır.
+Projesi olmayan satırlar yalnızca tam yenilemede güncellenir.
+"""
+import os
+import json
+import shutil
+import sqlite3
+import argparse
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from cekirdek.veritabani import ARAZI_SUTUNLARI
+from cekirdek.veri_koprusu import sayiya_cevir
+
+# Tablo -> projeye bağlayan sütun
+ANLIK_TABLOLAR = {
+    "Projeler": "id",
+    "TapuBilgileri": "proje_id",
+    "SondajBilgileri": "proje_id",
+    "AraziBilgileri": "proje_id",
+}
+GUNCEL_DOSYASI = "GUNCEL"
+BILDIRIM_DOSYASI = "bildirim.json"
+BICIM_SURUMU = 1
+# Zaman damgaları saniye çözünürlüklü ve işlem içinde atanır; sınırdaki projeler yeniden okunur
+ZAMAN_PAYI = timedelta(seconds=60)
+
+_SUTUN_KIMLIKLERI = {ad: kimlik for kimlik, ad in ARAZI_SUTUNLARI.items()}
+
+def _sutun_turu(bildirilen):
+    bildirilen = (bildirilen or "").upper()
+    if "INT" in bildirilen:
+        return "tam"
+    if any(t in bildirilen for t in ("REAL", "FLOA", "DOUB")):
+        return "ondalik"
+    return "metin"
+
+def _sutun_dizileri(tur, degerler, sozluk):
+    """
+    Sütun değerlerini tipli dizilere çevirir.
+
+    Returns:
+        tuple: (veri, geçerli maskesi veya None); metinlerde ``sozluk``
+        (değer -> kod) yeni değerlerle genişletilir
+    """
+    if tur == "metin":
+        kodlar = np.empty(len(degerler), dtype=np.int32)
+        for i, deger in enumerate(degerler):
+            if deger is None:
+                kodlar[i] = -1
+            else:
+                kodlar[i] = sozluk.setdefault(str(deger), len(sozluk))
+        return kodlar, None
+    sayilar = sayiya_cevir(degerler)
+    if tur == "ondalik":
+        return sayilar, None
+    gecerli = np.isfinite(sayilar)
+    return np.where(gecerli, np.round(sayilar), 0).astype(np.int64), None if gecerli.all() else gecerli
+
+def _tablo_sutunlari(conn, tablo):
+    """(kimlik, tablodaki ad, tür) listesi"""
+    return [(_SUTUN_KIMLIKLERI.get(s[1], s[1]), s[1], _sutun_turu(s[2]))
+            for s in conn.execute(f'PRAGMA table_info("{tablo}")').fetchall()]
+
+def _tablo_oku(conn, tablo, anahtar, sutunlar, sozlukler, proje_idleri=None):
+    """
+    Tabloyu (veya yalnızca verilen projelerin satırlarını) sütun dizilerine okur.
+
+    Returns:
+        dict: kimlik -> (veri, geçerli maskesi)
+    """
+    sql = f'SELECT {", ".join(chr(34) + s[1] + chr(34) for s in sutunlar)} FROM "{tablo}"'
+    parametreler = ()
+    if proje_idleri is not None:
+        sql += f' WHERE "{anahtar}" IN (SELECT value FROM json_each(?))'
+        parametreler = (json.dumps(sorted(proje_idleri)),)
+    cursor = conn.cursor()
+    cursor.row_factory = None  # Satır başına sözlük/Row nesnesi oluşturulmaz
+    satirlar = cursor.execute(sql + " ORDER BY id", parametreler).fetchall()
+    sutun_degerleri = list(zip(*satirlar)) if satirlar else [()] * len(sutunlar)
+    return {kimlik: _sutun_dizileri(tur, list(degerler), sozlukler.setdefault(kimlik, {}))
+            for (kimlik, _, tur), degerler in zip(sutunlar, sutun_degerleri)}
+
+def _birlestir(onceki, tutulan, yeni):
+    """Önceki görüntünün tutulan satırlarını yeni satırlarla birleştirir (id sırasıyla)"""
+    sonuc = {}
+    for kimlik, (veri, gecerli) in yeni.items():
+        eski_veri, eski_gecerli = onceki[kimlik]
+        birlesik = np.concatenate([np.asarray(eski_veri)[tutulan], veri])
+        if eski_gecerli is None and gecerli is None:
+            sonuc[kimlik] = (birlesik, None)
+            continue
+        maskeler = [np.ones(tutulan.sum(), dtype=bool) if eski_gecerli is None else np.asarray(eski_gecerli)[tutulan],
+                    np.ones(len(veri), dtype=bool) if gecerli is None else gecerli]
+        birlesik_maske = np.concatenate(maskeler)
+        sonuc[kimlik] = (birlesik, None if birlesik_maske.all() else birlesik_maske)
+    sira = np.argsort(sonuc["id"][0], kind="stable")
+    return {kimlik: (veri[sira], None if gecerli is None else gecerli[sira])
+            for kimlik, (veri, gecerli) in sonuc.items()}
+
+def _surumler(dizin):
+    """Dizindeki sürüm dizinlerinin adları, eskiden yeniye"""
+    return sorted((ad for ad in os.listdir(dizin) if ad.isdigit() and os.path.isdir(os.path.join(dizin, ad))),
+                  key=int)
+
+def _surum_yaz(dizin, surum, tablolar, sutun_tanimlari, sozlukler, zaman):
+    hedef = os.path.join(dizin, surum)
+    bildirim = {"bicim": BICIM_SURUMU, "zaman": zaman, "olusturma": datetime.now().isoformat(timespec="seconds"),
+                "tablolar": {}}
+    for tablo, sutunlar in tablolar.items():
+        tablo_dizini = os.path.join(hedef, tablo)
+        os.makedirs(tablo_dizini, exist_ok=True)
+        tanimlar = []
+        for kimlik, ad, tur in sutun_tanimlari[tablo]:
+            veri, gecerli = sutunlar[kimlik]
+            np.save(os.path.join(tablo_dizini, f"{kimlik}.npy"), veri)
+            if gecerli is not None:
+                np.save(os.path.join(tablo_dizini, f"{kimlik}.gecerli.npy"), gecerli)
+            if tur == "metin":
+                degerler = list(sozlukler[tablo][kimlik])
+                np.save(os.path.join(tablo_dizini, f"{kimlik}.sozluk.npy"),
+                        np.array(degerler, dtype=str) if degerler else np.empty(0, dtype="<U1"))
+            tanimlar.append({"kimlik": kimlik, "ad": ad, "tur": tur, "maskeli": gecerli is not None})
+        bildirim["tablolar"][tablo] = {"anahtar": ANLIK_TABLOLAR[tablo], "satir_sayisi": len(sutunlar["id"][0]),
+                                       "sutunlar": tanimlar}
+    with open(os.path.join(hedef, BILDIRIM_DOSYASI), "w", encoding="utf-8") as f:
+        json.dump(bildirim, f, ensure_ascii=False, indent=1)
+
+    guncel = os.path.join(dizin, GUNCEL_DOSYASI)
+    try:
+        with open(guncel, encoding="utf-8") as f:
+            onceki = f.read().strip()
+    except FileNotFoundError:
+        onceki = None
+    gecici = guncel + ".yeni"
+    with open(gecici, "w", encoding="utf-8") as f:
+        f.write(surum)
+    os.replace(gecici, guncel)
+    # Bir önceki sürüm, GUNCEL'i yeni okumuş ama dosyaları henüz açmamış okuyucular için
+    # tutulur; diğerleri silinir (eşlenmiş dosyalar silinemezse sonraki yenilemede tekrar denenir)
+    for ad in _surumler(dizin):
+        if ad not in (surum, onceki):
+            shutil.rmtree(os.path.join(dizin, ad), ignore_errors=True)
+
+class AnlikGoruntu:
+    """
+    Anlık görüntü okuyucusu.
+
+    Bütün sütun dosyaları açılışta ``mmap`` ile eşlenir (veri okunmaz); eski
+    sürüm sonraki yenilemelerde silinse de eşlenmiş diziler geçerli kalır.
+
+    Raises:
+        FileNotFoundError: Dizinde anlık görüntü yoksa
+    """
+    def __init__(self, dizin):
+        with open(os.path.join(dizin, GUNCEL_DOSYASI), encoding="utf-8") as f:
+            self.surum = f.read().strip()
+        self.yol = os.path.join(dizin, self.surum)
+        with open(os.path.join(self.yol, BILDIRIM_DOSYASI), encoding="utf-8") as f:
+            self.bildirim = json.load(f)
+        self.zaman = self.bildirim["zaman"]
+        self._diziler = {}
+        for tablo, bilgi in self.bildirim["tablolar"].items():
+            for tanim in bilgi["sutunlar"]:
+                dosyalar = [tanim["kimlik"]]
+                if tanim["maskeli"]:
+                    dosyalar.append(f"{tanim['kimlik']}.gecerli")
+                if tanim["tur"] == "metin":
+                    dosyalar.append(f"{tanim['kimlik']}.sozluk")
+                for dosya in dosyalar:
+                    self._diziler[(tablo, dosya)] = np.load(os.path.join(self.yol, tablo, f"{dosya}.npy"), mmap_mode="r")
+
+    def _yukle(self, tablo, dosya):
+        return self._diziler[(tablo, dosya)]
+
+    def sutunlar(self, tablo):
+        """Tablonun sütun tanımları: kimlik, ad (tablodaki), tur, maskeli"""
+        return self.bildirim["tablolar"][tablo]["sutunlar"]
+
+    def satir_sayisi(self, tablo):
+        return self.bildirim["tablolar"][tablo]["satir_sayisi"]
+
+    def sutun(self, tablo, kimlik):
+        """Ham sütun (metinlerde sözlük kodları); salt okunur, kopyasız"""
+        return self._yukle(tablo, kimlik)
+
+    def gecerli(self, tablo, kimlik):
+        """Tam sayı sütununun geçerli maskesi; boş değer yoksa None"""
+        tanim = next(s for s in self.sutunlar(tablo) if s["kimlik"] == kimlik)
+        return self._yukle(tablo, f"{kimlik}.gecerli") if tanim["maskeli"] else None
+
+    def sozluk(self, tablo, kimlik):
+        """Metin sütununun değerleri (kod -> değer)"""
+        return self._yukle(tablo, f"{kimlik}.sozluk")
+
+    def metin(self, tablo, kimlik):
+        """Metin sütununu çözer (kopya, nesne dizisi; boşlar None)"""
+        kodlar = np.asarray(self.sutun(tablo, kimlik))
+        degerler = np.append(np.asarray(self.sozluk(tablo, kimlik), dtype=object), None)
+        return degerler[kodlar]
+
+    def _tablo_verisi(self, tablo):
+        """Artımlı yenileme için kimlik -> (veri, maske) ve sözlükler"""
+        veriler, sozlukler = {}, {}
+        for tanim in self.sutunlar(tablo):
+            kimlik = tanim["kimlik"]
+            veriler[kimlik] = (self.sutun(tablo, kimlik), self.gecerli(tablo, kimlik))
+            if tanim["tur"] == "metin":
+                sozlukler[kimlik] = {deger: kod for kod, deger in enumerate(self.sozluk(tablo, kimlik).tolist())}
+        return veriler, sozlukler
+
+def anlik_goruntu_al(conn, dizin, tam=False):
+    """
+    Anlık görüntüyü yazar veya artımlı yeniler.
+
+    Şema değiştiyse (ör. yeni göçle eklenen sütun) veya önceki görüntü
+    yoksa tam görüntü alınır.
+
+    Args:
+        conn (sqlite3.Connection): Masaüstü veritabanı
+        dizin (str): Anlık görüntü dizini
+        tam (bool): Önceki görüntüyü kullanmadan yeniden yaz (sözlükleri de sıkıştırır)
+
+    Returns:
+        dict: surum, tam (bool), yenilenen_proje (artımlıysa sayısı), satirlar (tablo -> satır sayısı)
+    """
+    os.makedirs(dizin, exist_ok=True)
+    onceki = None
+    if not tam:
+        try:
+            onceki = AnlikGoruntu(dizin)
+        except FileNotFoundError:
+            pass
+    son_zaman = conn.execute("SELECT MAX(guncelleme_zamani) FROM ProjeOzetleri").fetchone()[0]
+    sutun_tanimlari = {tablo: _tablo_sutunlari(conn, tablo) for tablo in ANLIK_TABLOLAR}
+    if onceki is not None and (onceki.zaman is None or any(
+            [(s["kimlik"], s["ad"], s["tur"]) for s in onceki.sutunlar(tablo)] != sutun_tanimlari[tablo]
+            for tablo in ANLIK_TABLOLAR)):
+        onceki = None
+
+    tablolar, sozlukler = {}, {}
+    yenilenen = None
+    if onceki is None:
+        for tablo, anahtar in ANLIK_TABLOLAR.items():
+            sozlukler[tablo] = {}
+            tablolar[tablo] = _tablo_oku(conn, tablo, anahtar, sutun_tanimlari[tablo], sozlukler[tablo])
+    else:
+        esik = (datetime.fromisoformat(onceki.zaman) - ZAMAN_PAYI).isoformat(timespec="seconds")
+        degisen = {s[0] for s in conn.execute(
+            "SELECT proje_id FROM ProjeOzetleri WHERE guncelleme_zamani >= ?", (esik,))}
+        mevcut = {s[0] for s in conn.execute("SELECT id FROM Projeler")}
+        silinen = set(np.asarray(onceki.sutun("Projeler", "id")).tolist()) - mevcut
+        yenilenecek = np.array(sorted(degisen | silinen), dtype=np.int64)
+        for tablo, anahtar in ANLIK_TABLOLAR.items():
+            veriler, sozlukler[tablo] = onceki._tablo_verisi(tablo)
+            tutulan = ~np.isin(np.asarray(veriler[anahtar][0]), yenilenecek)
+            if veriler[anahtar][1] is not None:
+                # Projesi olmayan satırlar olduğu gibi tutulur
+                tutulan |= ~np.asarray(veriler[anahtar][1])
+            yeni = _tablo_oku(conn, tablo, anahtar, sutun_tanimlari[tablo], sozlukler[tablo], degisen)
+            tablolar[tablo] = _birlestir(veriler, tutulan, yeni)
+        yenilenen = len(yenilenecek)
+
+    # Tam yenilemede de numara artar; var olan bir sürümün (açık okuyucuların
+    # eşlediği dosyaların) üzerine yazılmaz
+    surumler = _surumler(dizin)
+    surum_adi = f"{int(surumler[-1]) + 1 if surumler else 1:06d}"
+    _surum_yaz(dizin, surum_adi, tablolar, sutun_tanimlari, sozlukler, son_zaman)
+    return {"surum": surum_adi, "tam": onceki is None, "yenilenen_proje": yenilenen,
+            "satirlar": {tablo: len(sutunlar["id"][0]) for tablo, sutunlar in tablolar.items()}}
+
+def main():
+    from cekirdek import veritabani
+    from cekirdek.veritabani import sema_guncelle
+
+    parser = argparse.ArgumentParser(description="Arşivin sütun bazlı anlık görüntüsü")
+    parser.add_argument("dizin", help="Anlık görüntü dizini")
+    parser.add_argument("--veritabani", default=veritabani.VERITABANI_YOLU, help="Masaüstü veritabanı dosyası")
+    parser.add_argument("--tam", action="store_true", help="Artımlı yerine tam yeniden yaz")
+    args = parser.parse_args()
+
+    with sqlite3.connect(args.veritabani) as conn:
+        sema_guncelle(conn)
+        sonuc = anlik_goruntu_al(conn, args.dizin, args.tam)
+    tur = "tam" if sonuc["tam"] else f"artımlı, {sonuc['yenilenen_proje']} proje yenilendi"
+    print(f"Anlık görüntü {sonuc['surum']} ({tur}): "
+          + ", ".join(f"{tablo} {sayi}" for tablo, sayi in sonuc["satirlar"].items()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Kuyular arası mekânsal enterpolasyon: SPT (N30) profili ve katman üstleri.
+
+Arşiv bir kez (konum × derinlik aralığı) N30 matrisine ve (zemin tanımı ×
+konum) katman üstü matrisine dönüştürülür. Yeni bir noktada en yakın
+komşular ızgara indeksiyle bulunur; her derinlik aralığında yalnızca o
+aralıkta verisi olan komşular kullanılarak ters mesafe ağırlıklı (IDW) veya
+sıradan kriging tahmini yapılır. Komşular ve ağırlıklar nokta başına
+önbellekte tutulur.
+
+Koordinatlar tek bir düzlemde (metre) verilmelidir; farklı dilimlerdeki
+kayıtlar önceden ortak dilime çevrilir (bkz. ``cekirdek.koordinat``).
+"""
+import threading
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+
+from cekirdek.hesaplamalar import METRAJ_ARALIGI
+from cekirdek.konum import IzgaraIndeksi
+
+DERINLIK_ARALIGI = METRAJ_ARALIGI
+KOMSU_SAYISI = 8
+IDW_USSU = 2.0
+YONTEMLER = ("idw", "kriging")
+# Nokta başına komşu/ağırlık önbelleği
+AGIRLIK_ONBELLEK_BOYUTU = 1024
+# Variogram uydurmasında kullanılan en fazla konum (çift sayısı karesiyle büyür)
+VARIOGRAM_ORNEK_SAYISI = 400
+VARIOGRAM_SINIF_SAYISI = 15
+
+def derinlik_matrisi(konumlar, derinlikler, degerler, konum_sayisi, aralik=DERINLIK_ARALIGI):
+    """
+    Ölçümleri (konum × derinlik aralığı) ortalama matrisine toplar.
+
+    Aralıklar metraj noktalarında ortalanır: i. sütun ``i * aralik``
+    derinliğinin ± yarım aralık çevresidir.
+
+    Args:
+        konumlar (np.ndarray): Satır başına konum indisi (0..konum_sayisi-1)
+        derinlikler, degerler (np.ndarray): Satır başına derinlik (m) ve değer
+        konum_sayisi (int): Matris satır sayısı
+        aralik (float): Derinlik aralığı (m)
+
+    Returns:
+        np.ndarray: float64 matris; ölçüm olmayan hücreler NaN
+    """
+    konumlar = np.asarray(konumlar, dtype=np.int64)
+    derinlikler = np.asarray(derinlikler, dtype=np.float64)
+    degerler = np.asarray(degerler, dtype=np.float64)
+    gecerli = np.isfinite(derinlikler) & np.isfinite(degerler) & (derinlikler >= 0)
+    konumlar, derinlikler, degerler = konumlar[gecerli], derinlikler[gecerli], degerler[gecerli]
+    if not len(konumlar):
+        return np.full((konum_sayisi, 0), np.nan)
+    araliklar = np.rint(derinlikler / aralik).astype(np.int64)
+    aralik_sayisi = int(araliklar.max()) + 1
+    duz = konumlar * aralik_sayisi + araliklar
+    boyut = konum_sayisi * aralik_sayisi
+    toplam = np.bincount(duz, weights=degerler, minlength=boyut)
+    sayi = np.bincount(duz, minlength=boyut)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (toplam / sayi).reshape(konum_sayisi, aralik_sayisi)
+
+def katman_ustleri(konumlar, derinlikler, tanimlar, konum_sayisi):
+    """
+    Her zemin tanımının her konumda ilk görüldüğü derinliği bulur.
+
+    Tanımlar büyük harfe çevrilip baştaki/sondaki boşluklardan arındırılarak
+    eşleştirilir; boş tanımlar atlanır.
+
+    Returns:
+        tuple: (tanım listesi, (tanım × konum) float64 matris; görülmeyenler NaN)
+    """
+    konumlar = np.asarray(konumlar, dtype=np.int64)
+    derinlikler = np.asarray(derinlikler, dtype=np.float64)
+    anahtarlar = np.array([(t or "").strip().replace("i", "İ").upper() for t in tanimlar], dtype=object)
+    gecerli = (anahtarlar != "") & np.isfinite(derinlikler)
+    if not gecerli.any():
+        return [], np.full((0, konum_sayisi), np.nan)
+    adlar, ters = np.unique(anahtarlar[gecerli].astype(str), return_inverse=True)
+    ustler = np.full((len(adlar), konum_sayisi), np.inf)
+    np.minimum.at(ustler, (ters, konumlar[gecerli]), derinlikler[gecerli])
+    ustler[np.isinf(ustler)] = np.nan
+    return adlar.tolist(), ustler
+
+def variogram_uydur(x, y, matris, ornek_sayisi=VARIOGRAM_ORNEK_SAYISI, tohum=0):
+    """
+    Üstel variogram modelinin külçe oranı ve menzilini uydurur.
+
+    Her derinlik aralığı kendi standart sapmasıyla ölçeklenir, böylece tüm
+    aralıklar tek bir birim eşikli deneysel variogramda birleştirilir.
+    Model: γ(h) = c0 + (1 - c0)(1 - exp(-3h / a)).
+
+    Returns:
+        tuple: (c0 külçe oranı, a menzil metre)
+    """
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    if len(x) > ornek_sayisi:
+        secilen = np.random.default_rng(tohum).choice(len(x), ornek_sayisi, replace=False)
+        x, y, matris = x[secilen], y[secilen], matris[secilen]
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        # Hiç ölçümü olmayan aralıklar NaN kalır
+        warnings.simplefilter("ignore", RuntimeWarning)
+        z = (matris - np.nanmean(matris, axis=0)) / np.nanstd(matris, axis=0)
+    i, j = np.triu_indices(len(x), k=1)
+    mesafe = np.hypot(x[i] - x[j], y[i] - y[j])
+    kullanilan = mesafe <= mesafe.max() / 2 if len(mesafe) else mesafe.astype(bool)
+    i, j, mesafe = i[kullanilan], j[kullanilan], mesafe[kullanilan]
+    if len(mesafe) < VARIOGRAM_SINIF_SAYISI or not np.isfinite(z).any():
+        return 0.0, max(float(mesafe.max()) if len(mesafe) else 1.0, 1.0)
+
+    farklar = 0.5 * (z[i] - z[j]) ** 2
+    gecerli = np.isfinite(farklar)
+    sinirlar = np.unique(np.quantile(mesafe, np.linspace(0, 1, VARIOGRAM_SINIF_SAYISI + 1)))
+    sinif = np.clip(np.searchsorted(sinirlar, mesafe, side="right") - 1, 0, len(sinirlar) - 2)
+    sinif_sayisi = len(sinirlar) - 1
+    adet = np.bincount(sinif, weights=gecerli.sum(axis=1), minlength=sinif_sayisi)
+    toplam = np.bincount(sinif, weights=np.where(gecerli, farklar, 0).sum(axis=1), minlength=sinif_sayisi)
+    merkez = np.bincount(sinif, weights=mesafe, minlength=sinif_sayisi) / np.maximum(
+        np.bincount(sinif, minlength=sinif_sayisi), 1)
+    dolu = adet > 0
+    h, gamma, agirlik = merkez[dolu], toplam[dolu] / adet[dolu], adet[dolu]
+
+    # Kaba ızgara araması: çift sayısıyla ağırlıklı en küçük kareler
+    menziller = np.geomspace(max(h.min(), 1.0), max(h.max() * 3, 2.0), 40)
+    kulceler = np.linspace(0, 0.9, 10)
+    model = (kulceler[:, None, None]
+             + (1 - kulceler[:, None, None]) * (1 - np.exp(-3 * h[None, None, :] / menziller[None, :, None])))
+    hata = ((model - gamma) ** 2 * agirlik).sum(axis=2)
+    k, m = np.unravel_index(np.argmin(hata), hata.shape)
+    return float(kulceler[k]), float(menziller[m])
+
+class ProfilEnterpolatoru:
+    """
+    Arşivden SPT profili ve katman üstü tahmini.
+
+    Args:
+        kimlikler (sequence): Konum kimlikleri (ör. proje ID)
+        x, y (sequence): Ortak düzlemde koordinatlar (m)
+        n30 (np.ndarray): (konum × derinlik aralığı) N30 matrisi, bkz. ``derinlik_matrisi``
+        katman_adlari (list): Zemin tanımları
+        ustler (np.ndarray): (tanım × konum) katman üstü matrisi, bkz. ``katman_ustleri``
+        aralik (float): Derinlik aralığı (m)
+    """
+    def __init__(self, kimlikler, x, y, n30, katman_adlari, ustler, aralik=DERINLIK_ARALIGI):
+        self.kimlikler = np.asarray(kimlikler, dtype=np.int64)
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.n30 = n30
+        self.katman_adlari = katman_adlari
+        self.ustler = ustler
+        self.aralik = aralik
+        # Izgara indeksinin kimlikleri matris satır numaralarıdır
+        self.indeks = IzgaraIndeksi(np.arange(len(self.x)), self.x, self.y)
+        self.kulce, self.menzil = variogram_uydur(self.x, self.y, n30) if len(self.x) > 1 else (0.0, 1.0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            self.esikler = np.nanvar(n30, axis=0) if n30.size else np.empty(0)
+        self.onbellek = OrderedDict()
+        self.kilit = threading.Lock()
+
+    def _kovaryans(self, h):
+        # Birim eşikli üstel model; sıfır mesafede külçe dahil (ölçümün kendisi)
+        return np.where(h == 0, 1.0, (1 - self.kulce) * np.exp(-3 * h / self.menzil))
+
+    def _komsular(self, x, y, komsu_sayisi):
+        anahtar = (round(float(x), 2), round(float(y), 2), komsu_sayisi)
+        with self.kilit:
+            kayit = self.onbellek.get(anahtar)
+            if kayit is not None:
+                self.onbellek.move_to_end(anahtar)
+                return kayit
+        sonuc = self.indeks.en_yakin(x, y, komsu_sayisi)
+        satirlar = sonuc["kimlik"]
+        mesafe = sonuc["mesafe"]
+        with np.errstate(divide="ignore"):
+            idw = 1.0 / mesafe ** IDW_USSU
+        # Çakışan komşu varsa tahmin doğrudan onun değeridir
+        if len(mesafe) and mesafe[0] == 0:
+            idw = (mesafe == 0).astype(np.float64)
+        kayit = {"satirlar": satirlar, "mesafe": mesafe, "idw": idw, "kriging": {}}
+        with self.kilit:
+            self.onbellek[anahtar] = kayit
+            while len(self.onbellek) > AGIRLIK_ONBELLEK_BOYUTU:
+                self.onbellek.popitem(last=False)
+        return kayit
+
+    def _kriging_agirliklari(self, kayit, maske):
+        """Verili komşu alt kümesi için sıradan kriging ağırlıkları ve Lagrange çarpanı"""
+        anahtar = maske.tobytes()
+        agirlik = kayit["kriging"].get(anahtar)
+        if agirlik is not None:
+            return agirlik
+        satirlar = kayit["satirlar"][maske]
+        k = len(satirlar)
+        sistem = np.ones((k + 1, k + 1))
+        sistem[k, k] = 0.0
+        sistem[:k, :k] = self._kovaryans(np.hypot(self.x[satirlar, None] - self.x[satirlar],
+                                                  self.y[satirlar, None] - self.y[satirlar]))
+        sag = np.ones(k + 1)
+        sag[:k] = (1 - self.kulce) * np.exp(-3 * kayit["mesafe"][maske] / self.menzil)
+        try:
+            cozum = np.linalg.solve(sistem, sag)
+        except np.linalg.LinAlgError:
+            # Aynı noktada birden fazla konum: tekil sistem
+            cozum = np.linalg.lstsq(sistem, sag, rcond=None)[0]
+        agirlik = (cozum[:k], max(1.0 - cozum[:k] @ sag[:k] - cozum[k], 0.0))
+        kayit["kriging"][anahtar] = agirlik
+        return agirlik
+
+    def _idw(self, agirlik, degerler):
+        """Sütun başına eksik komşuları atlayan IDW tahmini ve ağırlıklı yayılım"""
+        var = np.isfinite(degerler)
+        w = np.where(var, agirlik[:, None], 0.0)
+        toplam = w.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            tahmin = np.where(var, w * degerler, 0.0).sum(axis=0) / toplam
+            yayilim = np.sqrt(np.where(var, w * (degerler - tahmin) ** 2, 0.0).sum(axis=0) / toplam)
+        return tahmin, yayilim, var.sum(axis=0), toplam
+
+    def tahmin(self, x, y, yontem="idw", komsu_sayisi=KOMSU_SAYISI):
+        """
+        Noktada tahmini SPT profili ve katman üstleri.
+
+        IDW belirsizliği komşu değerlerinin ağırlıklı yayılımı, kriging
+        belirsizliği kriging standart sapmasıdır (aralığın varyansıyla
+        ölçeklenmiş). Katman üstleri her iki yöntemde de IDW ile tahmin
+        edilir; ``oran`` tanımın görüldüğü komşuların ağırlık payıdır.
+
+        Args:
+            x, y (float): Ortak düzlemde koordinat (m)
+            yontem (str): "idw" veya "kriging"
+            komsu_sayisi (int): Kullanılacak en yakın konum sayısı
+
+        Returns:
+            dict: derinlik, n30, belirsizlik, veri_sayisi dizileri; komsular
+            (kimlik, mesafe); katmanlar (tanim, ust, belirsizlik, oran)
+        """
+        if yontem not in YONTEMLER:
+            raise ValueError(f"Bilinmeyen yöntem: {yontem}")
+        kayit = self._komsular(x, y, komsu_sayisi)
+        satirlar, idw = kayit["satirlar"], kayit["idw"]
+        degerler = self.n30[satirlar]
+        aralik_sayisi = self.n30.shape[1]
+
+        if yontem == "idw":
+            n30, belirsizlik, veri_sayisi, _ = self._idw(idw, degerler)
+        else:
+            var = np.isfinite(degerler)
+            veri_sayisi = var.sum(axis=0)
+            n30 = np.full(aralik_sayisi, np.nan)
+            belirsizlik = np.full(aralik_sayisi, np.nan)
+            # Aynı komşu alt kümesine sahip aralıklar tek çözümü paylaşır
+            maskeler, ters = np.unique(var.T, axis=0, return_inverse=True)
+            for m, maske in enumerate(maskeler):
+                if not maske.any():
+                    continue
+                sutunlar = np.flatnonzero(ters.ravel() == m)
+                agirlik, varyans = self._kriging_agirliklari(kayit, maske)
+                n30[sutunlar] = agirlik @ degerler[maske][:, sutunlar]
+                belirsizlik[sutunlar] = np.sqrt(varyans * self.esikler[sutunlar])
+
+        katmanlar = []
+        if len(self.katman_adlari) and len(satirlar):
+            ust, yayilim, _, pay = self._idw(idw, self.ustler[:, satirlar].T)
+            oran = pay / idw.sum() if idw.sum() else np.zeros(len(pay))
+            for t in np.flatnonzero(np.isfinite(ust)):
+                katmanlar.append({"tanim": self.katman_adlari[t], "ust": float(ust[t]),
+                                  "belirsizlik": float(yayilim[t]), "oran": float(oran[t])})
+            katmanlar.sort(key=lambda katman: katman["ust"])
+
+        return {
+            "derinlik": np.arange(aralik_sayisi) * self.aralik,
+            "n30": n30,
+            "belirsizlik": belirsizlik,
+            "veri_sayisi": veri_sayisi,
+            "komsular": [{"kimlik": int(self.kimlikler[s]), "mesafe": float(m)}
+                         for s, m in zip(satirlar, kayit["mesafe"])],
+            "katmanlar": katmanlar,
+        }
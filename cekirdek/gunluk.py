@@ -0,0 +1,261 @@
+import os
+import sys
+import copy
+import json
+import queue
+import atexit
+import logging
+import threading
+import multiprocessing
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import (
+    QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler, WatchedFileHandler
+)
+
+LOG_YOLU = os.environ.get("SONDAJ_LOG_YOLU", "error_log.txt")
+LOG_SEVIYESI = os.environ.get("SONDAJ_LOG_SEVIYESI", "INFO").upper()
+KONSOL_SEVIYESI = os.environ.get("SONDAJ_KONSOL_SEVIYESI", "INFO").upper()
+# "boyut": dosya LOG_AZAMI_BOYUT'a ulaşınca, "zaman": her gece yarısı döndürülür,
+# "dis": uygulama döndürmez (logrotate vb.); çok süreçli sunucuda tek dosya için kullanılır
+LOG_DONDURME = os.environ.get("SONDAJ_LOG_DONDURME", "boyut")
+LOG_AZAMI_BOYUT = int(os.environ.get("SONDAJ_LOG_AZAMI_BOYUT", str(5 * 1024 * 1024)))
+LOG_YEDEK_SAYISI = int(os.environ.get("SONDAJ_LOG_YEDEK_SAYISI", "5"))
+
+GUNLUK_ADI = "sondaj"
+# Kayıtlara eklenen bağlam alanları
+BAGLAM_ALANLARI = ("proje_id", "kullanici", "islem")
+
+_baglam = contextvars.ContextVar("gunluk_baglami", default={})
+_kilit = threading.Lock()
+_dinleyici = None
+_kuyruk_isleyici = None
+
+
+class JsonBicimlendirici(logging.Formatter):
+    """Günlük kayıtlarını tek satırlık JSON nesnesine çevirir"""
+    def format(self, record):
+        kayit = {
+            "zaman": datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S"),
+            "seviye": record.levelname,
+            "gunluk": record.name,
+            "mesaj": record.getMessage(),
+            "is_parcacigi": record.threadName,
+        }
+        for alan in BAGLAM_ALANLARI:
+            deger = getattr(record, alan, None)
+            if deger is not None:
+                kayit[alan] = deger
+        if record.exc_info:
+            kayit["hata"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            kayit["hata"] = record.exc_text
+        return json.dumps(kayit, ensure_ascii=False, default=str)
+
+
+class BaglamFiltresi(logging.Filter):
+    """
+    Etkin bağlamı (proje, kullanıcı, işlem) kayda ekler.
+
+    Kayıt kuyruğa konmadan, yani çağıran iş parçacığında çalışır; yazıcı
+    iş parçacığı çağıranın bağlamını göremez.
+    """
+    def filter(self, record):
+        for alan, deger in _baglam.get().items():
+            if getattr(record, alan, None) is None:
+                setattr(record, alan, deger)
+        return True
+
+
+class KayitKuyruguIsleyici(QueueHandler):
+    """
+    Kayıtları kuyruğa koyan işleyici.
+
+    Standart QueueHandler hata ayrıntısını mesaja ekler; burada ayrı alanda
+    tutulur ki JSON kayıtta "hata" olarak yazılabilsin.
+    """
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def surec_dosyasi(yol):
+    """Alt sürecin günlük dosyası: error_log.txt -> error_log.<pid>.txt"""
+    kok, uzanti = os.path.splitext(yol)
+    return f"{kok}.{os.getpid()}{uzanti}"
+
+
+def _dosya_isleyici_olustur(alt_surec=False):
+    """
+    Döndürme ayarına göre dosya işleyicisini oluşturur.
+
+    Bir dosyayı yalnızca tek süreç döndürebilir; aynı dosyayı döndüren
+    süreçler birbirinin kayıtlarını siler. Bu yüzden "boyut" ve "zaman"
+    kiplerinde alt süreçler (sunucu ve rapor işçileri) kendi dosyalarına
+    yazar. "dis" kipinde tüm süreçler aynı dosyaya ekler; WatchedFileHandler
+    dosya dışarıdan döndürülünce onu yeniden açar.
+
+    Args:
+        alt_surec (bool): Çağıran süreç başka bir süreçten türediyse True
+    """
+    if LOG_DONDURME == "dis":
+        isleyici = WatchedFileHandler(LOG_YOLU, encoding="utf-8", delay=True)
+    elif LOG_DONDURME == "zaman":
+        isleyici = TimedRotatingFileHandler(surec_dosyasi(LOG_YOLU) if alt_surec else LOG_YOLU, when="midnight",
+                                            backupCount=LOG_YEDEK_SAYISI, encoding="utf-8", delay=True)
+    else:
+        isleyici = RotatingFileHandler(surec_dosyasi(LOG_YOLU) if alt_surec else LOG_YOLU, maxBytes=LOG_AZAMI_BOYUT,
+                                       backupCount=LOG_YEDEK_SAYISI, encoding="utf-8", delay=True)
+    isleyici.setFormatter(JsonBicimlendirici())
+    return isleyici
+
+
+def gunluk_kur():
+    """
+    Kuyruk tabanlı günlüğü kurar (ilk çağrıda bir kez).
+
+    Kayıtlar çağıran iş parçacığında yalnızca kuyruğa konur; dosyaya ve
+    konsola yazma arka plandaki dinleyici iş parçacığında yapılır. Program
+    kapanırken kuyruk boşaltılır.
+
+    Returns:
+        logging.Logger: Uygulama günlüğü
+    """
+    global _dinleyici, _kuyruk_isleyici
+    gunluk = logging.getLogger(GUNLUK_ADI)
+    with _kilit:
+        if _dinleyici is not None:
+            return gunluk
+
+        konsol = logging.StreamHandler(sys.stdout)
+        konsol.setLevel(KONSOL_SEVIYESI)
+        konsol.setFormatter(logging.Formatter("%(asctime)s - %(message)s", "%Y-%m-%d %H:%M:%S"))
+
+        kayit_kuyrugu = queue.SimpleQueue()
+        _kuyruk_isleyici = KayitKuyruguIsleyici(kayit_kuyrugu)
+        _kuyruk_isleyici.addFilter(BaglamFiltresi())
+        alt_surec = multiprocessing.parent_process() is not None
+        _dinleyici = QueueListener(kayit_kuyrugu, _dosya_isleyici_olustur(alt_surec), konsol,
+                                   respect_handler_level=True)
+        _dinleyici.start()
+        atexit.register(gunluk_durdur)
+
+        gunluk.setLevel(LOG_SEVIYESI)
+        gunluk.addHandler(_kuyruk_isleyici)
+        gunluk.propagate = False
+    return gunluk
+
+
+def gunluk_durdur():
+    """Bekleyen kayıtları yazar ve dinleyici iş parçacığını durdurur"""
+    global _dinleyici
+    with _kilit:
+        if _dinleyici is None:
+            return
+        _dinleyici.stop()
+        _dinleyici = None
+
+
+def _catallanma_sonrasi():
+    """
+    fork() sonrası alt süreçte dinleyiciyi yeniden başlatır.
+
+    Dinleyici iş parçacığı alt sürece geçmez; yenisi kurulmazsa çok süreçli
+    sunucu işçilerinde ve rapor işçilerinde kayıtlar kuyrukta kalır. Döndüren
+    dosya işleyicisi ana süreçte kalır, alt süreç kendi dosyasını açar.
+    """
+    global _kilit, _dinleyici
+    _kilit = threading.Lock()
+    if _dinleyici is None:
+        return
+    isleyiciler = []
+    for isleyici in _dinleyici.handlers:
+        if isinstance(isleyici, (RotatingFileHandler, TimedRotatingFileHandler)):
+            isleyici.close()
+            isleyici = _dosya_isleyici_olustur(alt_surec=True)
+        isleyiciler.append(isleyici)
+    kayit_kuyrugu = queue.SimpleQueue()
+    _kuyruk_isleyici.queue = kayit_kuyrugu
+    _dinleyici = QueueListener(kayit_kuyrugu, *isleyiciler, respect_handler_level=True)
+    _dinleyici.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_catallanma_sonrasi)
+
+
+def gunluge_bagla(gunluk):
+    """
+    Başka bir günlüğün (ör. Flask ``app.logger``) kayıtlarını da aynı
+    kuyruk üzerinden dosyaya yönlendirir.
+
+    Args:
+        gunluk (logging.Logger): Bağlanacak günlük
+    """
+    gunluk_kur()
+    if _kuyruk_isleyici not in gunluk.handlers:
+        gunluk.addHandler(_kuyruk_isleyici)
+
+
+def baglam_ayarla(**alanlar):
+    """
+    Etkin bağlama alan ekler; ``baglam_sifirla`` ile geri alınır.
+
+    Bir ``with`` bloğu kurulamayan yerler (ör. Flask before/teardown
+    kancaları) içindir.
+
+    Returns:
+        contextvars.Token: Geri alma belirteci
+    """
+    return _baglam.set({**_baglam.get(), **{k: v for k, v in alanlar.items() if v is not None}})
+
+
+def baglam_sifirla(token):
+    """``baglam_ayarla`` ile yapılan değişikliği geri alır"""
+    _baglam.reset(token)
+
+
+@contextmanager
+def baglam(**alanlar):
+    """
+    Blok içinde yazılan kayıtlara bağlam alanları ekler.
+
+    Örnek:
+        with baglam(proje_id=5, islem="rapor"):
+            hata_logla("Rapor başlatıldı")
+
+    Args:
+        **alanlar: proje_id, kullanici, islem gibi alanlar
+    """
+    token = baglam_ayarla(**alanlar)
+    try:
+        yield
+    finally:
+        baglam_sifirla(token)
+
+
+def hata_logla(mesaj, exception=None, seviye=None, **alanlar):
+    """
+    Mesajı günlüğe kaydeder.
+
+    Kayıt kuyruğa konur ve hemen dönülür; disk yazımı arka planda yapılır.
+
+    Args:
+        mesaj (str): Log dosyasına kaydedilecek mesaj
+        exception (Exception, optional): Yakalanmış hata
+        seviye (int, optional): Günlük seviyesi; verilmezse hata varsa
+            ERROR, yoksa INFO
+        **alanlar: Bu kayda özel bağlam alanları (proje_id, kullanici, islem)
+    """
+    if seviye is None:
+        seviye = logging.ERROR if exception else logging.INFO
+    try:
+        gunluk_kur().log(seviye, mesaj, exc_info=exception, extra=alanlar or None)
+    except Exception as e:
+        print(f"Günlüğe yazma hatası: {str(e)}")
@@ -0,0 +1,125 @@
+METRAJ_ARALIGI = 1.5       # m, SPT metraj artışı
+ORNEK_UZUNLUGU = 0.45      # m, SPT numune boyu
+
+def metraj_noktalari(derinlik, aralik=METRAJ_ARALIGI):
+    """
+    Sondaj derinliğine göre metraj noktalarını üretir.
+
+    Noktalar 0'dan başlayarak ``aralik`` artışlarla ilerler; son derinlik
+    listeye eklenmez (PyQt6 sürümündeki davranış).
+
+    Args:
+        derinlik (float): Toplam sondaj derinliği (m)
+        aralik (float): Metraj artışı (m)
+
+    Returns:
+        list: Metraj derinlikleri
+    """
+    noktalar = []
+    mevcut = 0.0
+    while mevcut < derinlik:
+        noktalar.append(mevcut)
+        mevcut += aralik
+    return noktalar
+
+def ornek_derinlik_araligi(derinlik, uzunluk=ORNEK_UZUNLUGU):
+    """
+    Numune derinlik aralığı metnini oluşturur (ör. "1.50-1.95").
+
+    Args:
+        derinlik (float): Numune başlangıç derinliği (m)
+        uzunluk (float): Numune boyu (m)
+
+    Returns:
+        str: Derinlik aralığı
+    """
+    return f"{derinlik:.2f}-{(derinlik + uzunluk):.2f}"
+
+def bos_arazi_kaydi(derinlik, kuyu_ici_deneyler='', ornek_turu_no=''):
+    """
+    Belirli bir derinlik için deney değerleri boş arazi kaydı oluşturur.
+
+    Args:
+        derinlik (float): Sondaj derinliği (m)
+        kuyu_ici_deneyler (str): Kuyu içi deney türü (ör. "UD")
+        ornek_turu_no (str): Örnek türü ve numarası
+
+    Returns:
+        dict: Web modelindeki alan adlarıyla arazi kaydı
+    """
+    return {
+        'sondaj_derinligi': derinlik,
+        'muhafaza_borusu_derinligi': derinlik,
+        'kuyu_ici_deneyler': kuyu_ici_deneyler,
+        'ornek_derinligi': ornek_derinlik_araligi(derinlik),
+        'ornek_turu_no': ornek_turu_no,
+        'spt_0_15': 0,
+        'spt_15_30': 0,
+        'spt_30_45': 0,
+        'n30': 0,
+        'tmax': 0,
+        'tyogrulmus': 0,
+        'c_kpa': 0,
+        'aci_derece': 0,
+        'dogal_bha': 0,
+        'kuru_bha': 0,
+        'zemin_profili': '',
+        'zemin_tanimlamasi': ''
+    }
+
+def ud_derinliklerini_ayristir(metin):
+    """
+    Boşlukla ayrılmış UD derinliklerini sayıya çevirir.
+
+    Ondalık ayırıcı olarak virgül de kabul edilir.
+
+    Args:
+        metin (str): Derinlikler (ör. "3,5 7.25")
+
+    Returns:
+        list: Derinlikler (m)
+
+    Raises:
+        ValueError: Sayıya çevrilemeyen değer varsa
+    """
+    return [float(d.strip()) for d in metin.replace(',', '.').split(' ') if d.strip()]
+
+def ud_orneklerini_yerlestir(kayitlar, ud_derinlikler, tolerans=0.01):
+    """
+    UD örneklerini arazi kayıtlarına yerleştirir.
+
+    Derinliği eşleşen satır UD olarak işaretlenir; eşleşme yoksa UD'nin
+    kendi derinliğinde yeni satır eklenir. Kayıtlar yerinde güncellenir.
+
+    Args:
+        kayitlar (list): Derinliğe göre sıralı arazi kayıtları (dict)
+        ud_derinlikler (list): UD örnek derinlikleri (m)
+        tolerans (float): Derinlik eşleşmesi için tolerans (m)
+
+    Returns:
+        list: Derinliğe göre sıralı kayıtlar
+    """
+    for ud_index, ud_derinlik in enumerate(sorted(ud_derinlikler)):
+        ornek_no = f'UD-{ud_index+1}'
+
+        eslesen = next(
+            (kayit for kayit in kayitlar
+             if abs(float(kayit['sondaj_derinligi']) - ud_derinlik) < tolerans),
+            None
+        )
+
+        if eslesen is not None:
+            eslesen['kuyu_ici_deneyler'] = 'UD'
+            eslesen['ornek_turu_no'] = ornek_no
+            eslesen['ornek_derinligi'] = ornek_derinlik_araligi(ud_derinlik)
+        else:
+            # Doğru ekleme noktasını belirle
+            ekleme_indeksi = len(kayitlar)
+            for i, kayit in enumerate(kayitlar):
+                if float(kayit['sondaj_derinligi']) > ud_derinlik:
+                    ekleme_indeksi = i
+                    break
+            kayitlar.insert(ekleme_indeksi, bos_arazi_kaydi(ud_derinlik, 'UD', ornek_no))
+
+    kayitlar.sort(key=lambda x: float(x['sondaj_derinligi']))
+    return kayitlar
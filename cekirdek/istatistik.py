@@ -0,0 +1,260 @@
+"""
+Projeler arası istatistik: zemin sınıfı, il/ilçe ve derinlik bandına göre dağılımlar.
+
+Arşiv sabit kutulu histogramlar halinde tutulur. Her hücre (il, ilçe, zemin
+sınıfı, derinlik bandı) parametre başına bir histogram ile toplam ve kare
+toplamı taşır; histogramlar toplanarak birleştirilir, bu yüzden herhangi bir
+filtre yalnızca ilgili hücrelerin toplamıdır. Her projenin katkısı
+(hücre, kutu) çiftleri olarak saklanır; proje değiştiğinde eski katkı
+çıkarılıp yenisi eklenir, arşivin geri kalanı yeniden okunmaz.
+
+Yüzdelikler kutu içinde doğrusal enterpolasyonla hesaplanır; çözünürlük
+kutu genişliğidir. Ortalama ve standart sapma toplamlardan kesin hesaplanır.
+"""
+import re
+
+import numpy as np
+
+# Parametre -> (alt sınır, üst sınır, kutu genişliği); dışarıdaki değerler uç kutulara yazılır
+PARAMETRELER = {
+    "n30": (0.0, 100.0, 1.0),
+    "c_kpa": (0.0, 500.0, 5.0),
+    "aci_derece": (0.0, 50.0, 0.5),
+    "dogal_bha": (10.0, 25.0, 0.1),
+}
+DERINLIK_BANDI = 2.5
+YUZDELIKLER = (5, 10, 25, 50, 75, 90, 95)
+GRUPLAR = ("zemin", "il", "ilce", "bant")
+TANIMSIZ = "TANIMSIZ"
+
+_KELIME = re.compile(r"[^\W\d_]+")
+
+def buyuk_harf(metin):
+    """Türkçe kurallarıyla büyük harf (i -> İ, ı -> I) ve kenar boşluklarını atar"""
+    return (metin or "").strip().replace("i", "İ").upper()
+
+def zemin_sinifi(tanim):
+    """
+    Zemin tanımlamasından ana zemin sınıfını çıkarır.
+
+    Ana zemin adı tanımda büyük harfle yazılır ("Kahverengi siltli KİL" ->
+    KİL); büyük harfli kelime yoksa son kelime alınır.
+    """
+    kelimeler = _KELIME.findall(tanim or "")
+    if not kelimeler:
+        return TANIMSIZ
+    buyukler = [k for k in kelimeler if len(k) > 1 and k == buyuk_harf(k)]
+    return buyuk_harf(buyukler[-1] if buyukler else kelimeler[-1])
+
+def _kutu_sinirlari(parametre):
+    alt, ust, genislik = PARAMETRELER[parametre]
+    return np.linspace(alt, ust, int(round((ust - alt) / genislik)) + 1)
+
+def _yuzdelikler(histogramlar, sinirlar, oranlar):
+    """(grup × kutu) histogramlarından yüzdelikler; boş gruplar NaN"""
+    kumulatif = np.cumsum(histogramlar, axis=1)
+    toplam = kumulatif[:, -1:]
+    hedef = toplam * (np.asarray(oranlar, dtype=np.float64)[None, :] / 100.0)
+    sonuc = np.full(hedef.shape, np.nan)
+    for g in np.flatnonzero(toplam[:, 0] > 0):
+        kutu = np.minimum(np.searchsorted(kumulatif[g], hedef[g], side="left"), histogramlar.shape[1] - 1)
+        onceki = np.where(kutu > 0, kumulatif[g][kutu - 1], 0)
+        icerik = histogramlar[g][kutu]
+        kesir = np.where(icerik > 0, (hedef[g] - onceki) / np.maximum(icerik, 1), 0.0)
+        sonuc[g] = sinirlar[kutu] + kesir * (sinirlar[kutu + 1] - sinirlar[kutu])
+    return sonuc
+
+class ArsivIstatistigi:
+    """
+    Birleştirilebilir histogramlarla arşiv istatistiği.
+
+    Hücreler ilk görüldüklerinde eklenir ve silinmez (boşalmış hücre
+    sorgularda sıfır katkı verir).
+    """
+    def __init__(self):
+        self.sinirlar = {p: _kutu_sinirlari(p) for p in PARAMETRELER}
+        self.kodlar = {ad: {} for ad in ("il", "ilce", "zemin")}
+        self.adlar = {ad: [] for ad in ("il", "ilce", "zemin")}
+        self.hucreler = {}
+        self.kapasite = 0
+        self.hucre_sayisi = 0
+        self.hucre_il = np.empty(0, dtype=np.int32)
+        self.hucre_ilce = np.empty(0, dtype=np.int32)
+        self.hucre_zemin = np.empty(0, dtype=np.int32)
+        self.hucre_bant = np.empty(0, dtype=np.int32)
+        self.histogram = {p: np.zeros((0, len(s) - 1), dtype=np.int64) for p, s in self.sinirlar.items()}
+        self.toplam = {p: np.zeros(0) for p in PARAMETRELER}
+        self.kare_toplam = {p: np.zeros(0) for p in PARAMETRELER}
+        self.katkilar = {}
+
+    def _kod(self, tur, ad):
+        kodlar = self.kodlar[tur]
+        kod = kodlar.get(ad)
+        if kod is None:
+            kod = kodlar[ad] = len(self.adlar[tur])
+            self.adlar[tur].append(ad)
+        return kod
+
+    def _buyut(self, gereken):
+        if gereken <= self.kapasite:
+            return
+        yeni = max(gereken, self.kapasite * 2, 64)
+        for ad in ("hucre_il", "hucre_ilce", "hucre_zemin", "hucre_bant"):
+            dizi = np.zeros(yeni, dtype=np.int32)
+            dizi[:self.kapasite] = getattr(self, ad)
+            setattr(self, ad, dizi)
+        for p in PARAMETRELER:
+            histogram = np.zeros((yeni, self.histogram[p].shape[1]), dtype=np.int64)
+            histogram[:self.kapasite] = self.histogram[p]
+            self.histogram[p] = histogram
+            for sozluk in (self.toplam, self.kare_toplam):
+                dizi = np.zeros(yeni)
+                dizi[:self.kapasite] = sozluk[p]
+                sozluk[p] = dizi
+        self.kapasite = yeni
+
+    def _hucre_indisleri(self, il, ilce, zeminler, bantlar):
+        """Satır başına hücre indisi; yeni hücreler oluşturulur"""
+        il_kodu, ilce_kodu = self._kod("il", il), self._kod("ilce", ilce)
+        zemin_kodlari = np.array([self._kod("zemin", z) for z in zeminler], dtype=np.int64)
+        anahtarlar = zemin_kodlari * (1 << 20) + bantlar
+        tekil, ters = np.unique(anahtarlar, return_inverse=True)
+        indisler = np.empty(len(tekil), dtype=np.int64)
+        for i, anahtar in enumerate(tekil.tolist()):
+            hucre = (il_kodu, ilce_kodu, anahtar >> 20, anahtar & ((1 << 20) - 1))
+            indis = self.hucreler.get(hucre)
+            if indis is None:
+                indis = self.hucreler[hucre] = self.hucre_sayisi
+                self._buyut(indis + 1)
+                self.hucre_il[indis], self.hucre_ilce[indis], self.hucre_zemin[indis], self.hucre_bant[indis] = hucre
+                self.hucre_sayisi += 1
+            indisler[i] = indis
+        return indisler[ters.ravel()]
+
+    def _uygula(self, katki, isaret):
+        for p, (hucreler, kutular, degerler) in katki.items():
+            np.add.at(self.histogram[p], (hucreler, kutular), isaret)
+            np.add.at(self.toplam[p], hucreler, isaret * degerler)
+            np.add.at(self.kare_toplam[p], hucreler, isaret * degerler * degerler)
+
+    def proje_guncelle(self, proje_id, il, ilce, derinlikler, tanimlar, degerler):
+        """
+        Projenin katkısını yenisiyle değiştirir (yoksa ekler).
+
+        Args:
+            proje_id (int): Proje ID
+            il, ilce (str): Projenin il ve ilçesi
+            derinlikler (array-like): Satır başına derinlik (m)
+            tanimlar (sequence): Satır başına zemin tanımlaması
+            degerler (dict): Parametre -> satır başına değer dizisi (NaN = ölçülmedi)
+        """
+        self.proje_cikar(proje_id)
+        derinlikler = np.asarray(derinlikler, dtype=np.float64)
+        gecerli = np.isfinite(derinlikler) & (derinlikler >= 0)
+        if not gecerli.any():
+            return
+        bantlar = (derinlikler[gecerli] // DERINLIK_BANDI).astype(np.int64)
+        zeminler = [zemin_sinifi(t) for t, g in zip(tanimlar, gecerli) if g]
+        hucreler = self._hucre_indisleri(buyuk_harf(il) or TANIMSIZ, buyuk_harf(ilce) or TANIMSIZ,
+                                         zeminler, bantlar)
+        katki = {}
+        for p, sinirlar in self.sinirlar.items():
+            dizi = np.asarray(degerler.get(p, ()), dtype=np.float64)
+            if not len(dizi):
+                continue
+            dizi = dizi[gecerli]
+            olculen = np.isfinite(dizi)
+            if not olculen.any():
+                continue
+            kutular = np.clip(np.searchsorted(sinirlar, dizi[olculen], side="right") - 1, 0, len(sinirlar) - 2)
+            katki[p] = (hucreler[olculen], kutular, dizi[olculen])
+        self._uygula(katki, 1)
+        self.katkilar[proje_id] = katki
+
+    def proje_cikar(self, proje_id):
+        katki = self.katkilar.pop(proje_id, None)
+        if katki:
+            self._uygula(katki, -1)
+
+    def _maske(self, zemin=None, il=None, ilce=None, min_derinlik=None, max_derinlik=None):
+        maske = np.ones(self.hucre_sayisi, dtype=bool)
+        for tur, ad, dizi in (("zemin", zemin, self.hucre_zemin), ("il", il, self.hucre_il),
+                              ("ilce", ilce, self.hucre_ilce)):
+            if ad:
+                kod = self.kodlar[tur].get(buyuk_harf(ad))
+                if kod is None:
+                    return np.zeros(self.hucre_sayisi, dtype=bool)
+                maske &= dizi[:self.hucre_sayisi] == kod
+        bant = self.hucre_bant[:self.hucre_sayisi]
+        # Aralık dışa doğru bant sınırlarına genişletilir: aralıkla kesişen her bant dahildir
+        if min_derinlik is not None:
+            maske &= bant >= int(np.floor(min_derinlik / DERINLIK_BANDI + 1e-9))
+        if max_derinlik is not None:
+            maske &= bant < int(np.ceil(max_derinlik / DERINLIK_BANDI - 1e-9))
+        return maske
+
+    def _istatistik(self, parametre, histogramlar, toplam, kare_toplam):
+        sayi = histogramlar.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ortalama = toplam / sayi
+            std = np.sqrt(np.maximum(kare_toplam / sayi - ortalama ** 2, 0.0))
+        return sayi, ortalama, std, _yuzdelikler(histogramlar, self.sinirlar[parametre], YUZDELIKLER)
+
+    def ozet(self, parametre, **filtre):
+        """
+        Filtreye uyan tüm ölçümlerin dağılımı.
+
+        Args:
+            parametre (str): ``PARAMETRELER`` anahtarı
+            **filtre: zemin (sınıf, ör. "KİL"), il, ilce, min_derinlik, max_derinlik.
+                Derinlik süzgeci ``DERINLIK_BANDI`` çözünürlüğündedir: aralıkla
+                kısmen de olsa kesişen bantların tüm ölçümleri dahil edilir
+                (ör. max_derinlik=4 ile 2.5–5 m bandı da sayılır).
+
+        Returns:
+            dict: sayi, ortalama, std, yuzdelikler, histogram (sinirlar, sayilar)
+        """
+        maske = self._maske(**filtre)
+        histogram = self.histogram[parametre][:self.hucre_sayisi][maske].sum(axis=0)
+        sayi, ortalama, std, yuzdelik = self._istatistik(
+            parametre, histogram[None, :], np.array([self.toplam[parametre][:self.hucre_sayisi][maske].sum()]),
+            np.array([self.kare_toplam[parametre][:self.hucre_sayisi][maske].sum()]))
+        return {
+            "sayi": int(sayi[0]),
+            "ortalama": float(ortalama[0]),
+            "std": float(std[0]),
+            "yuzdelikler": dict(zip(YUZDELIKLER, yuzdelik[0].tolist())),
+            "histogram": {"sinirlar": self.sinirlar[parametre], "sayilar": histogram},
+        }
+
+    def gruplu(self, parametre, grup, **filtre):
+        """
+        Filtreye uyan ölçümlerin gruplara göre dağılımı (ör. derinlik bandı başına medyan).
+
+        Args:
+            parametre (str): ``PARAMETRELER`` anahtarı
+            grup (str): "zemin", "il", "ilce" veya "bant"
+            **filtre: ``ozet`` ile aynı (derinlik süzgeci bant çözünürlüğündedir)
+
+        Returns:
+            list: Grup başına sayi, ortalama, std ve yuzdelikler; bant gruplarında
+            ``grup`` bandın üst derinliğidir (m)
+        """
+        maske = self._maske(**filtre)
+        kodlar = getattr(self, f"hucre_{grup}")[:self.hucre_sayisi][maske]
+        if not len(kodlar):
+            return []
+        tekil, ters = np.unique(kodlar, return_inverse=True)
+        histogramlar = np.zeros((len(tekil), self.histogram[parametre].shape[1]), dtype=np.int64)
+        np.add.at(histogramlar, ters, self.histogram[parametre][:self.hucre_sayisi][maske])
+        toplam = np.bincount(ters, weights=self.toplam[parametre][:self.hucre_sayisi][maske], minlength=len(tekil))
+        kare = np.bincount(ters, weights=self.kare_toplam[parametre][:self.hucre_sayisi][maske], minlength=len(tekil))
+        sayi, ortalama, std, yuzdelik = self._istatistik(parametre, histogramlar, toplam, kare)
+        sonuc = []
+        for i, kod in enumerate(tekil.tolist()):
+            if not sayi[i]:
+                continue
+            ad = kod * DERINLIK_BANDI if grup == "bant" else self.adlar[grup][kod]
+            sonuc.append({"grup": ad, "sayi": int(sayi[i]), "ortalama": float(ortalama[i]),
+                          "std": float(std[i]), "yuzdelikler": dict(zip(YUZDELIKLER, yuzdelik[i].tolist()))})
+        return sonuc
@@ -0,0 +1,436 @@
+"""
+Sondaj konumları için mekânsal indeks ve sorgular.
+
+Koordinatlar TapuBilgileri'ndeki ``koordinat_x`` / ``koordinat_y``
+değerleridir (metre cinsinden düzlem koordinatları). Kayıtlar farklı 3
+derecelik dilimlerde olabildiğinden indeksler ortak TM düzlemine
+(``ORTAK_MERIDYEN``) taşınmış koordinatlarla kurulur. Masaüstü veritabanında
+SQLite R*Tree sanal tablosu, web uygulamasında bellekte tutulan ızgara
+indeksi kullanılır; ikisi de aynı poligon ve mesafe hesaplarını paylaşır.
+Harita gösterimi için WGS84 noktaları yakınlaştırma düzeyi başına önceden
+kümelenir (``HaritaKumeleri``).
+"""
+import threading
+
+import numpy as np
+
+from cekirdek.koordinat import (
+    KOORDINAT_SISTEMLERI, VARSAYILAN_SISTEM, VARSAYILAN_DILIM_MERIDYENI, ortak_duzleme
+)
+
+# Izgara hücresi başına hedeflenen ortalama nokta sayısı
+HUCRE_DOLULUGU = 16
+# Bu yarıçapı (m) aşan arama tüm düzlemi kapsar; daha az sonuç varsa arama biter
+AZAMI_ARAMA_YARICAPI = 2e7
+
+# Harita kümeleri: 256 piksellik Web Mercator karoları üzerinde kare hücre (piksel);
+# bu düzeyden sonra her nokta ayrı gösterilir
+KUME_PIKSELI = 60
+KUME_AZAMI_YAKINLASTIRMA = 17
+AZAMI_YAKINLASTIRMA = 22
+MERKATOR_AZAMI_ENLEM = 85.05112878
+
+def poligon_icinde(x, y, poligon):
+    """
+    Noktaların poligon içinde olup olmadığını (ışın atma) vektörel hesaplar.
+
+    Args:
+        x, y (np.ndarray): Nokta koordinatları
+        poligon (sequence): [(x, y), ...] köşeleri; kapalı olması gerekmez
+
+    Returns:
+        np.ndarray: bool maske
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    koseler = np.asarray(poligon, dtype=np.float64)
+    icinde = np.zeros(x.shape, dtype=bool)
+    x1, y1 = koseler[:, 0], koseler[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    for ax, ay, bx, by in zip(x1, y1, x2, y2):
+        kesiyor = (ay > y) != (by > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kesim_x = ax + (y - ay) * (bx - ax) / (by - ay)
+        icinde ^= kesiyor & (x < kesim_x)
+    return icinde
+
+def poligon_kutusu(poligon):
+    """Poligonu çevreleyen kutu: (min_x, min_y, max_x, max_y)"""
+    koseler = np.asarray(poligon, dtype=np.float64)
+    return (*koseler.min(axis=0), *koseler.max(axis=0))
+
+class IzgaraIndeksi:
+    """
+    Noktalar için düzenli ızgara indeksi (salt okunur, NumPy tabanlı).
+
+    Noktalar hücre anahtarına göre sıralanır; bir hücre kümesindeki noktalar
+    ``searchsorted`` ile bulunan ardışık aralıklardır. Hücre boyu, hücre
+    başına ortalama ``HUCRE_DOLULUGU`` nokta düşecek şekilde seçilir.
+
+    Args:
+        kimlikler (sequence): Nokta kimlikleri (ör. proje ID)
+        x, y (sequence): Koordinatlar
+    """
+    def __init__(self, kimlikler, x, y):
+        kimlikler = np.asarray(kimlikler, dtype=np.int64)
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        gecerli = np.isfinite(x) & np.isfinite(y)
+        kimlikler, x, y = kimlikler[gecerli], x[gecerli], y[gecerli]
+
+        self.sayi = len(kimlikler)
+        if self.sayi:
+            self.min_x, self.min_y = x.min(), y.min()
+            alan = max((x.max() - self.min_x) * (y.max() - self.min_y), 1.0)
+            self.hucre = max(np.sqrt(alan * HUCRE_DOLULUGU / self.sayi), 1.0)
+        else:
+            self.min_x = self.min_y = 0.0
+            self.hucre = 1.0
+        hx, hy = self._hucre(x, y)
+        self.sutun_sayisi = int(hx.max()) + 1 if self.sayi else 1
+        self.satir_sayisi = int(hy.max()) + 1 if self.sayi else 1
+        anahtarlar = hx * self.satir_sayisi + hy
+        sira = np.argsort(anahtarlar, kind="stable")
+        self.anahtarlar = anahtarlar[sira]
+        self.kimlikler = kimlikler[sira]
+        self.x = x[sira]
+        self.y = y[sira]
+
+    def _hucre(self, x, y):
+        hx = np.floor((np.asarray(x) - self.min_x) / self.hucre).astype(np.int64)
+        hy = np.floor((np.asarray(y) - self.min_y) / self.hucre).astype(np.int64)
+        return hx, hy
+
+    def _hucre_araligi(self, hx0, hy0, hx1, hy1):
+        """Hücre dikdörtgenindeki noktaların indislerini döndürür"""
+        hx0, hy0 = max(hx0, 0), max(hy0, 0)
+        hx1, hy1 = min(hx1, self.sutun_sayisi - 1), min(hy1, self.satir_sayisi - 1)
+        if hx0 > hx1 or hy0 > hy1:
+            return np.empty(0, dtype=np.intp)
+        # Her sütunda hy0..hy1 ardışık anahtarlardır: sütun başına tek aralık
+        sutunlar = np.arange(hx0, hx1 + 1, dtype=np.int64) * self.satir_sayisi
+        baslar = np.searchsorted(self.anahtarlar, sutunlar + hy0, side="left")
+        sonlar = np.searchsorted(self.anahtarlar, sutunlar + hy1, side="right")
+        uzunluklar = sonlar - baslar
+        if not uzunluklar.sum():
+            return np.empty(0, dtype=np.intp)
+        return np.repeat(baslar - np.cumsum(uzunluklar) + uzunluklar, uzunluklar) + np.arange(uzunluklar.sum())
+
+    def _sonuc(self, indisler, mesafeler=None):
+        sonuc = {"kimlik": self.kimlikler[indisler], "x": self.x[indisler], "y": self.y[indisler]}
+        if mesafeler is not None:
+            sonuc["mesafe"] = mesafeler
+        return sonuc
+
+    def kutu(self, min_x, min_y, max_x, max_y):
+        """
+        Kutudaki noktalar.
+
+        Returns:
+            dict: "kimlik", "x", "y" dizileri
+        """
+        hx0, hy0 = self._hucre(min_x, min_y)
+        hx1, hy1 = self._hucre(max_x, max_y)
+        aday = self._hucre_araligi(int(hx0), int(hy0), int(hx1), int(hy1))
+        x, y = self.x[aday], self.y[aday]
+        return self._sonuc(aday[(x >= min_x) & (x <= max_x) & (y >= min_y) & (y <= max_y)])
+
+    def yaricap(self, x, y, r):
+        """
+        Merkeze ``r`` uzaklıktaki noktalar, yakından uzağa.
+
+        Returns:
+            dict: "kimlik", "x", "y", "mesafe" dizileri
+        """
+        hx0, hy0 = self._hucre(x - r, y - r)
+        hx1, hy1 = self._hucre(x + r, y + r)
+        aday = self._hucre_araligi(int(hx0), int(hy0), int(hx1), int(hy1))
+        mesafe = np.hypot(self.x[aday] - x, self.y[aday] - y)
+        secilen = mesafe <= r
+        sira = np.argsort(mesafe[secilen], kind="stable")
+        return self._sonuc(aday[secilen][sira], mesafe[secilen][sira])
+
+    def en_yakin(self, x, y, n):
+        """
+        En yakın ``n`` nokta.
+
+        Arama merkez hücreden halka halka genişler. Halkanın kapsadığı kare
+        içindeki her nokta, kareye teğet çemberden daha yakın olduğundan,
+        n'inci adayın mesafesi bu yarıçapın altına inince sonuç kesinleşir.
+
+        Returns:
+            dict: "kimlik", "x", "y", "mesafe" dizileri (yakından uzağa)
+        """
+        n = min(n, self.sayi)
+        if n <= 0:
+            return self._sonuc(np.empty(0, dtype=np.intp), np.empty(0))
+        hx, hy = (int(h) for h in self._hucre(x, y))
+        # Merkez ızgaranın dışındaysa ızgaraya olan uzaklıktan başla
+        halka = max(0, -hx, -hy, hx - self.sutun_sayisi + 1, hy - self.satir_sayisi + 1)
+        azami_halka = max(self.sutun_sayisi, self.satir_sayisi) + abs(hx) + abs(hy)
+        while True:
+            aday = self._hucre_araligi(hx - halka, hy - halka, hx + halka, hy + halka)
+            if len(aday) >= n:
+                mesafe = np.hypot(self.x[aday] - x, self.y[aday] - y)
+                en_iyi = np.argpartition(mesafe, n - 1)[:n]
+                # Kare içindeki garanti yarıçap: merkezin hücre kenarına uzaklığı + halka * hücre
+                kenar = min(x - self.min_x - hx * self.hucre, (hx + 1) * self.hucre - (x - self.min_x),
+                            y - self.min_y - hy * self.hucre, (hy + 1) * self.hucre - (y - self.min_y))
+                if mesafe[en_iyi].max() <= kenar + halka * self.hucre or halka >= azami_halka:
+                    sira = en_iyi[np.argsort(mesafe[en_iyi], kind="stable")]
+                    return self._sonuc(aday[sira], mesafe[sira])
+            halka = halka * 2 + 1
+
+    def poligon(self, poligon):
+        """
+        Poligon içindeki noktalar (önce çevreleyen kutu, sonra ışın atma).
+
+        Returns:
+            dict: "kimlik", "x", "y" dizileri
+        """
+        kutu = self.kutu(*poligon_kutusu(poligon))
+        maske = poligon_icinde(kutu["x"], kutu["y"], poligon)
+        return {ad: dizi[maske] for ad, dizi in kutu.items()}
+
+class HaritaKumeleri:
+    """
+    WGS84 noktalarının yakınlaştırma düzeyi başına ızgara kümeleri.
+
+    Noktalar bir kez Web Mercator birim karesine izdüşürülür. Her düzeyin
+    kümeleri ilk istendiğinde tek ``np.unique`` geçişiyle hesaplanıp saklanır;
+    sonraki isteklerde yalnızca görünen alana göre süzülür.
+
+    Args:
+        kimlikler (sequence): Nokta kimlikleri (ör. proje ID)
+        boylam, enlem (sequence): Derece; NaN olanlar atlanır
+    """
+    def __init__(self, kimlikler, boylam, enlem):
+        kimlikler = np.asarray(kimlikler, dtype=np.int64)
+        boylam = np.asarray(boylam, dtype=np.float64)
+        enlem = np.asarray(enlem, dtype=np.float64)
+        gecerli = np.isfinite(boylam) & np.isfinite(enlem) & (np.abs(enlem) <= 90)
+        self.kimlikler = kimlikler[gecerli]
+        self.mx, self.my = self._merkator(boylam[gecerli], enlem[gecerli])
+        self.sayi = len(self.kimlikler)
+        self.duzeyler = {}
+        self.kilit = threading.Lock()
+
+    @staticmethod
+    def _merkator(boylam, enlem):
+        enlem = np.radians(np.clip(enlem, -MERKATOR_AZAMI_ENLEM, MERKATOR_AZAMI_ENLEM))
+        return (np.asarray(boylam) + 180.0) / 360.0, (1 - np.arcsinh(np.tan(enlem)) / np.pi) / 2
+
+    @staticmethod
+    def _cografi(mx, my):
+        return mx * 360.0 - 180.0, np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * my))))
+
+    def _hesapla(self, duzey):
+        if duzey > KUME_AZAMI_YAKINLASTIRMA or not self.sayi:
+            boylam, enlem = self._cografi(self.mx, self.my)
+            return {"boylam": boylam, "enlem": enlem, "sayi": np.ones(self.sayi, dtype=np.int64),
+                    "kimlik": self.kimlikler}
+        hucre_sayisi = int(np.ceil(256 * 2 ** duzey / KUME_PIKSELI))
+        hx = np.minimum((self.mx * hucre_sayisi).astype(np.int64), hucre_sayisi - 1)
+        hy = np.minimum((self.my * hucre_sayisi).astype(np.int64), hucre_sayisi - 1)
+        _, ilk, ters, sayi = np.unique(hx * hucre_sayisi + hy, return_index=True,
+                                       return_inverse=True, return_counts=True)
+        # Küme konumu, üyelerin Mercator düzlemindeki ağırlık merkezidir
+        boylam, enlem = self._cografi(np.bincount(ters, weights=self.mx) / sayi,
+                                      np.bincount(ters, weights=self.my) / sayi)
+        return {"boylam": boylam, "enlem": enlem, "sayi": sayi,
+                "kimlik": np.where(sayi == 1, self.kimlikler[ilk], -1)}
+
+    def duzey(self, duzey):
+        """
+        Düzeyin tüm kümeleri (önbellekli).
+
+        Returns:
+            dict: "boylam", "enlem", "sayi", "kimlik" dizileri; kimlik tek
+            noktalı kümelerde noktanın kimliği, diğerlerinde -1
+        """
+        duzey = min(max(int(duzey), 0), AZAMI_YAKINLASTIRMA)
+        with self.kilit:
+            kumeler = self.duzeyler.get(duzey)
+        if kumeler is None:
+            kumeler = self._hesapla(duzey)
+            with self.kilit:
+                self.duzeyler[duzey] = kumeler
+        return kumeler
+
+    def gorunum(self, duzey, min_boylam, min_enlem, max_boylam, max_enlem):
+        """
+        Görünen alandaki kümeler.
+
+        Returns:
+            dict: ``duzey()`` ile aynı anahtarlar
+        """
+        kumeler = self.duzey(duzey)
+        maske = ((kumeler["boylam"] >= min_boylam) & (kumeler["boylam"] <= max_boylam)
+                 & (kumeler["enlem"] >= min_enlem) & (kumeler["enlem"] <= max_enlem))
+        return {ad: dizi[maske] for ad, dizi in kumeler.items()}
+
+# --- Masaüstü: SQLite R*Tree ---
+#
+# İndeks kayıtların ortak düzlemdeki karşılıklarını (``ortak_x`` / ``ortak_y``)
+# tutar; sorgu noktaları da kendi dilim ve datumlarından bu düzleme taşınır ve
+# mesafeler orada ölçülür. Sonuçlarda kaydın kendi koordinatları ve dilimi
+# döner. R*Tree koordinatları 32 bit kayan noktalı saklar ve kutuları dışa
+# doğru yuvarlar; bu yüzden yalnızca ön eleme için kullanılır, kesin mesafe ve
+# sınır kontrolü TapuBilgileri'ndeki REAL değerlerle yapılır.
+
+def ortak_koordinatlari_yenile(conn):
+    """
+    Ortak düzlem koordinatı eksik tapu kayıtlarını hesaplar.
+
+    Koordinatı, datumu veya dilimi yeni girilen ya da değişen kayıtlar
+    içindir. Dilimi boş kayıtlar ``VARSAYILAN_DILIM_MERIDYENI`` ile, o da
+    tanımlı değilse hiç hesaplanmaz. Değişiklik bağlantının açık işlemine
+    yazılır.
+
+    Args:
+        conn: Veritabanı bağlantısı veya imleci
+
+    Returns:
+        int: Hesaplanan kayıt sayısı
+    """
+    varsayilan = int(VARSAYILAN_DILIM_MERIDYENI) if VARSAYILAN_DILIM_MERIDYENI else None
+    satirlar = conn.execute("""
+        SELECT id, koordinat_x, koordinat_y, COALESCE(dilim_meridyeni, ?), koordinat_sistemi
+        FROM TapuBilgileri
+        WHERE ortak_x IS NULL AND koordinat_x IS NOT NULL AND koordinat_y IS NOT NULL
+          AND COALESCE(dilim_meridyeni, ?) IS NOT NULL
+    """, (varsayilan, varsayilan)).fetchall()
+    if not satirlar:
+        return 0
+    kimlik = np.array([s[0] for s in satirlar], dtype=np.int64)
+    x, y, meridyen = (np.array([s[i] for s in satirlar], dtype=np.float64) for i in (1, 2, 3))
+    ox, oy = ortak_duzleme(x, y, meridyen, [s[4] for s in satirlar])
+    gecerli = np.isfinite(ox) & np.isfinite(oy)
+    conn.executemany("UPDATE TapuBilgileri SET ortak_x = ?, ortak_y = ? WHERE id = ?",
+                     zip(ox[gecerli].tolist(), oy[gecerli].tolist(), kimlik[gecerli].tolist()))
+    return int(gecerli.sum())
+
+def _ortak(x, y, dilim_meridyeni, sistem):
+    """Sorgu noktalarını kendi dilim ve datumundan ortak düzleme taşır"""
+    if dilim_meridyeni is None:
+        dilim_meridyeni = VARSAYILAN_DILIM_MERIDYENI
+    if dilim_meridyeni in (None, ""):
+        raise ValueError("Sorgu noktasının dilim orta meridyeni belirtilmeli")
+    if sistem not in KOORDINAT_SISTEMLERI:
+        raise ValueError(f"Bilinmeyen koordinat sistemi: {sistem}")
+    x = np.atleast_1d(np.asarray(x, dtype=np.float64))
+    y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+    return ortak_duzleme(x, y, np.full(x.shape, float(dilim_meridyeni)), [sistem] * len(x))
+
+def _rtree_adaylari(conn, min_x, min_y, max_x, max_y):
+    ortak_koordinatlari_yenile(conn)
+    satirlar = conn.execute("""
+        SELECT t.proje_id, t.ortak_x, t.ortak_y, t.koordinat_x, t.koordinat_y, t.dilim_meridyeni
+        FROM TapuKonumlari r
+        JOIN TapuBilgileri t ON t.id = r.id
+        WHERE r.min_x <= ? AND r.max_x >= ? AND r.min_y <= ? AND r.max_y >= ?
+    """, (max_x, min_x, max_y, min_y)).fetchall()
+    dizi = np.array([tuple(s) for s in satirlar], dtype=np.float64).reshape(len(satirlar), 6)
+    return dizi[:, 0].astype(np.int64), dizi[:, 1], dizi[:, 2], dizi[:, 3:]
+
+def _liste(kimlik, kayit_koordinatlari, mesafe=None):
+    kayitlar = [{"proje_id": int(k), "koordinat_x": float(a), "koordinat_y": float(b),
+                 "dilim_meridyeni": int(d) if np.isfinite(d) else None}
+                for k, (a, b, d) in zip(kimlik, kayit_koordinatlari)]
+    if mesafe is not None:
+        for kayit, m in zip(kayitlar, mesafe):
+            kayit["mesafe"] = float(m)
+    return kayitlar
+
+def kutudaki_projeler(conn, min_x, min_y, max_x, max_y, dilim_meridyeni=None, sistem=VARSAYILAN_SISTEM):
+    """
+    Kutudaki projeler (masaüstü, R*Tree).
+
+    Kutu verilen dilimde tanımlanır; ortak düzlemde hafifçe döndüğü için
+    dört köşeli poligon olarak aranır.
+
+    Args:
+        min_x, min_y, max_x, max_y (float): Kutu (metre)
+        dilim_meridyeni (int, optional): Kutunun dilimi; verilmezse ``VARSAYILAN_DILIM_MERIDYENI``
+        sistem (str): Kutunun datumu
+
+    Returns:
+        list: {"proje_id", "koordinat_x", "koordinat_y", "dilim_meridyeni"} sözlükleri
+    """
+    return poligondaki_projeler(conn, [(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)],
+                                dilim_meridyeni, sistem)
+
+def yaricaptaki_projeler(conn, x, y, r, dilim_meridyeni=None, sistem=VARSAYILAN_SISTEM):
+    """
+    Noktaya ``r`` metre uzaklıktaki projeler, yakından uzağa (masaüstü, R*Tree).
+
+    Mesafe ortak düzlemde ölçülür (ölçek hatası %1'in altında).
+
+    Args:
+        x, y (float): Nokta (metre)
+        r (float): Yarıçap (metre)
+        dilim_meridyeni (int, optional): Noktanın dilimi; verilmezse ``VARSAYILAN_DILIM_MERIDYENI``
+        sistem (str): Noktanın datumu
+
+    Returns:
+        list: {"proje_id", "koordinat_x", "koordinat_y", "dilim_meridyeni", "mesafe"} sözlükleri
+    """
+    (ox,), (oy,) = _ortak(x, y, dilim_meridyeni, sistem)
+    kimlik, ax, ay, kayit = _rtree_adaylari(conn, ox - r, oy - r, ox + r, oy + r)
+    mesafe = np.hypot(ax - ox, ay - oy)
+    sira = np.argsort(mesafe, kind="stable")
+    sira = sira[mesafe[sira] <= r]
+    return _liste(kimlik[sira], kayit[sira], mesafe[sira])
+
+def en_yakin_projeler(conn, x, y, n, dilim_meridyeni=None, sistem=VARSAYILAN_SISTEM, baslangic_yaricapi=500.0):
+    """
+    Noktaya en yakın ``n`` proje (masaüstü, R*Tree).
+
+    Kutu, içinde ``n`` aday bulunana ve n'inci adayın mesafesi kutunun iç
+    çemberine sığana kadar büyütülür. Farklı dilimlerdeki projeler birlikte
+    aranır; mesafe ortak düzlemde ölçülür.
+
+    Args:
+        x, y (float): Nokta (metre)
+        n (int): Proje sayısı
+        dilim_meridyeni (int, optional): Noktanın dilimi; verilmezse ``VARSAYILAN_DILIM_MERIDYENI``
+        sistem (str): Noktanın datumu
+
+    Returns:
+        list: {"proje_id", "koordinat_x", "koordinat_y", "dilim_meridyeni", "mesafe"} sözlükleri
+    """
+    if n <= 0:
+        return []
+    (ox,), (oy,) = _ortak(x, y, dilim_meridyeni, sistem)
+    r = baslangic_yaricapi
+    while True:
+        kimlik, ax, ay, kayit = _rtree_adaylari(conn, ox - r, oy - r, ox + r, oy + r)
+        mesafe = np.hypot(ax - ox, ay - oy)
+        sira = np.argsort(mesafe, kind="stable")[:n]
+        if len(sira) == n and mesafe[sira[-1]] <= r or r >= AZAMI_ARAMA_YARICAPI:
+            return _liste(kimlik[sira], kayit[sira], mesafe[sira])
+        if len(sira) == n:
+            # n'inci aday iç çemberin dışında: tam o yarıçapla bir kez daha ara
+            r = mesafe[sira[-1]]
+        else:
+            r = min(r * 4, AZAMI_ARAMA_YARICAPI)
+
+def poligondaki_projeler(conn, poligon, dilim_meridyeni=None, sistem=VARSAYILAN_SISTEM):
+    """
+    Poligon içindeki projeler (masaüstü, R*Tree ön elemesiyle).
+
+    Köşeler ortak düzleme taşınır; kenarlar orada doğru parçası sayılır.
+
+    Args:
+        poligon (sequence): [(x, y), ...] köşeleri (metre)
+        dilim_meridyeni (int, optional): Köşelerin dilimi; verilmezse ``VARSAYILAN_DILIM_MERIDYENI``
+        sistem (str): Köşelerin datumu
+
+    Returns:
+        list: {"proje_id", "koordinat_x", "koordinat_y", "dilim_meridyeni"} sözlükleri
+    """
+    koseler = np.asarray(poligon, dtype=np.float64)
+    ortak_poligon = np.column_stack(_ortak(koseler[:, 0], koseler[:, 1], dilim_meridyeni, sistem))
+    kimlik, x, y, kayit = _rtree_adaylari(conn, *poligon_kutusu(ortak_poligon))
+    maske = poligon_icinde(x, y, ortak_poligon)
+    return _liste(kimlik[maske], kayit[maske])
@@ -0,0 +1,236 @@
+"""
+Koordinat dönüşümleri (NumPy, sütun bazında).
+
+Tapu koordinatları 3 derecelik Transversal Merkatör (TM) dilimlerinde,
+ITRF96 (GRS80 elipsoidi) veya ED50 (Uluslararası 1924 elipsoidi) datumunda
+tutulur. ``koordinat_x`` sağa değer (doğu, yanal kaydırma 500 000 m),
+``koordinat_y`` yukarı değerdir (kuzey). Dönüşümler tek tek nokta yerine
+bütün dizi üzerinde yapılır; karışık sistemli sütunlar sistem ve dilim
+gruplarına ayrılarak her grup tek seferde dönüştürülür.
+
+TM hesabı Krüger serisiyle (6. derece, dilim içinde milimetre altı)
+yapılır. ED50 → WGS84 geçişi üç parametreli yer merkezli kaydırmadır;
+birkaç metre doğrulukla harita gösterimi içindir, ölçü işleri için değil.
+"""
+import os
+
+import numpy as np
+
+# (büyük yarı eksen, basıklık)
+ELIPSOIDLER = {
+    "GRS80": (6378137.0, 1 / 298.257222101),
+    "INT24": (6378388.0, 1 / 297.0),
+}
+
+# Sistem adı -> (elipsoid, WGS84'e yer merkezli kaydırma (dx, dy, dz) metre)
+# ITRF96 ile WGS84 arasındaki fark harita ölçeğinde ihmal edilir
+KOORDINAT_SISTEMLERI = {
+    "ITRF96": ("GRS80", None),
+    "ED50": ("INT24", (-87.0, -98.0, -121.0)),
+}
+VARSAYILAN_SISTEM = "ITRF96"
+
+# Türkiye'deki 3 derecelik dilimlerin orta meridyenleri
+DILIM_MERIDYENLERI = (27, 30, 33, 36, 39, 42, 45)
+# Dilimi girilmemiş kayıtlar için orta meridyen (ör. 33); boşsa bu kayıtların konumu bilinmez
+VARSAYILAN_DILIM_MERIDYENI = os.environ.get("VARSAYILAN_DILIM_MERIDYENI")
+# Farklı dilimlerdeki kayıtların birlikte sorgulandığı ortak TM düzleminin orta meridyeni;
+# Türkiye genelinde ölçek hatası %1'in altındadır, komşu seçimi ve mesafe süzmesi için yeterlidir
+ORTAK_MERIDYEN = 35
+TM_OLCEK = 1.0
+TM_YANAL_KAYDIRMA = 500000.0
+
+def _kruger_katsayilari(basiklik):
+    n = basiklik / (2 - basiklik)
+    n2, n3, n4, n5, n6 = n ** 2, n ** 3, n ** 4, n ** 5, n ** 6
+    A = (1 + n2 / 4 + n4 / 64 + n6 / 256) / (1 + n)
+    alfa = np.array([
+        n / 2 - 2 * n2 / 3 + 5 * n3 / 16 + 41 * n4 / 180 - 127 * n5 / 288 + 7891 * n6 / 37800,
+        13 * n2 / 48 - 3 * n3 / 5 + 557 * n4 / 1440 + 281 * n5 / 630 - 1983433 * n6 / 1935360,
+        61 * n3 / 240 - 103 * n4 / 140 + 15061 * n5 / 26880 + 167603 * n6 / 181440,
+        49561 * n4 / 161280 - 179 * n5 / 168 + 6601661 * n6 / 7257600,
+        34729 * n5 / 80640 - 3418889 * n6 / 1995840,
+        212378941 * n6 / 319334400,
+    ])
+    beta = np.array([
+        n / 2 - 2 * n2 / 3 + 37 * n3 / 96 - n4 / 360 - 81 * n5 / 512 + 96199 * n6 / 604800,
+        n2 / 48 + n3 / 15 - 437 * n4 / 1440 + 46 * n5 / 105 - 1118711 * n6 / 3870720,
+        17 * n3 / 480 - 37 * n4 / 840 - 209 * n5 / 4480 + 5569 * n6 / 90720,
+        4397 * n4 / 161280 - 11 * n5 / 504 - 830251 * n6 / 7257600,
+        4583 * n5 / 161280 - 108847 * n6 / 3991680,
+        20648693 * n6 / 638668800,
+    ])
+    return A, alfa, beta
+
+def _dis_merkezlik(basiklik):
+    return np.sqrt(basiklik * (2 - basiklik))
+
+def cografi_tm(boylam, enlem, orta_meridyen, elipsoid="GRS80"):
+    """
+    Coğrafi koordinatları (derece) TM düzlem koordinatlarına çevirir.
+
+    Args:
+        boylam, enlem (array-like): Derece
+        orta_meridyen (float): Dilimin orta meridyeni (derece)
+        elipsoid (str): ``ELIPSOIDLER`` anahtarı
+
+    Returns:
+        tuple: (saga, yukari) metre dizileri
+    """
+    a, f = ELIPSOIDLER[elipsoid]
+    e = _dis_merkezlik(f)
+    A, alfa, _ = _kruger_katsayilari(f)
+    enlem = np.radians(np.asarray(enlem, dtype=np.float64))
+    fark = np.radians(np.asarray(boylam, dtype=np.float64) - orta_meridyen)
+
+    sin_enlem = np.sin(enlem)
+    t = np.sinh(np.arctanh(sin_enlem) - e * np.arctanh(e * sin_enlem))
+    ksi_ = np.arctan2(t, np.cos(fark))
+    eta_ = np.arctanh(np.sin(fark) / np.sqrt(1 + t * t))
+    ksi, eta = ksi_.copy(), eta_.copy()
+    for j, katsayi in enumerate(alfa, start=1):
+        ksi += katsayi * np.sin(2 * j * ksi_) * np.cosh(2 * j * eta_)
+        eta += katsayi * np.cos(2 * j * ksi_) * np.sinh(2 * j * eta_)
+    return TM_YANAL_KAYDIRMA + TM_OLCEK * a * A * eta, TM_OLCEK * a * A * ksi
+
+def tm_cografi(saga, yukari, orta_meridyen, elipsoid="GRS80"):
+    """
+    TM düzlem koordinatlarını coğrafi koordinatlara (derece) çevirir.
+
+    Args:
+        saga, yukari (array-like): Metre
+        orta_meridyen (float): Dilimin orta meridyeni (derece)
+        elipsoid (str): ``ELIPSOIDLER`` anahtarı
+
+    Returns:
+        tuple: (boylam, enlem) derece dizileri
+    """
+    a, f = ELIPSOIDLER[elipsoid]
+    e = _dis_merkezlik(f)
+    e2 = e * e
+    A, _, beta = _kruger_katsayilari(f)
+    ksi = np.asarray(yukari, dtype=np.float64) / (TM_OLCEK * a * A)
+    eta = (np.asarray(saga, dtype=np.float64) - TM_YANAL_KAYDIRMA) / (TM_OLCEK * a * A)
+    ksi_, eta_ = ksi.copy(), eta.copy()
+    for j, katsayi in enumerate(beta, start=1):
+        ksi_ -= katsayi * np.sin(2 * j * ksi) * np.cosh(2 * j * eta)
+        eta_ -= katsayi * np.cos(2 * j * ksi) * np.sinh(2 * j * eta)
+
+    sinh_eta = np.sinh(eta_)
+    cos_ksi = np.cos(ksi_)
+    fark = np.arctan2(sinh_eta, cos_ksi)
+    # Konform enlemin tanjantından coğrafi enlemin tanjantı (Newton, birkaç adımda yakınsar)
+    tau_ = np.sin(ksi_) / np.hypot(sinh_eta, cos_ksi)
+    tau = tau_.copy()
+    for _ in range(5):
+        sigma = np.sinh(e * np.arctanh(e * tau / np.sqrt(1 + tau * tau)))
+        tau_i = tau * np.sqrt(1 + sigma * sigma) - sigma * np.sqrt(1 + tau * tau)
+        tau += ((tau_ - tau_i) / np.sqrt(1 + tau_i * tau_i)
+                * (1 + (1 - e2) * tau * tau) / ((1 - e2) * np.sqrt(1 + tau * tau)))
+    return orta_meridyen + np.degrees(fark), np.degrees(np.arctan(tau))
+
+def _yer_merkezli(boylam, enlem, elipsoid):
+    a, f = ELIPSOIDLER[elipsoid]
+    e2 = f * (2 - f)
+    boylam, enlem = np.radians(boylam), np.radians(enlem)
+    N = a / np.sqrt(1 - e2 * np.sin(enlem) ** 2)
+    return (N * np.cos(enlem) * np.cos(boylam), N * np.cos(enlem) * np.sin(boylam),
+            N * (1 - e2) * np.sin(enlem))
+
+def _cografi(X, Y, Z, elipsoid):
+    # Bowring yöntemi: yeryüzü yakınında tek adımda milimetre altı
+    a, f = ELIPSOIDLER[elipsoid]
+    b = a * (1 - f)
+    e2 = f * (2 - f)
+    ep2 = e2 / (1 - e2)
+    p = np.hypot(X, Y)
+    theta = np.arctan2(Z * a, p * b)
+    enlem = np.arctan2(Z + ep2 * b * np.sin(theta) ** 3, p - e2 * a * np.cos(theta) ** 3)
+    return np.degrees(np.arctan2(Y, X)), np.degrees(enlem)
+
+def datum_kaydir(boylam, enlem, kaynak, hedef, kaydirma):
+    """
+    Coğrafi koordinatları üç parametreli yer merkezli kaydırmayla başka datuma taşır.
+
+    Args:
+        boylam, enlem (array-like): Derece (kaynak elipsoidde, elipsoit yüksekliği 0)
+        kaynak, hedef (str): ``ELIPSOIDLER`` anahtarları
+        kaydirma (tuple): (dx, dy, dz) metre
+
+    Returns:
+        tuple: (boylam, enlem) derece dizileri
+    """
+    X, Y, Z = _yer_merkezli(np.asarray(boylam, dtype=np.float64), np.asarray(enlem, dtype=np.float64), kaynak)
+    return _cografi(X + kaydirma[0], Y + kaydirma[1], Z + kaydirma[2], hedef)
+
+def wgs84e(saga, yukari, orta_meridyen, sistem=VARSAYILAN_SISTEM):
+    """
+    Tek sistem ve dilimdeki TM koordinatlarını WGS84 boylam/enlemine çevirir.
+
+    Returns:
+        tuple: (boylam, enlem) derece dizileri
+    """
+    elipsoid, kaydirma = KOORDINAT_SISTEMLERI[sistem]
+    boylam, enlem = tm_cografi(saga, yukari, orta_meridyen, elipsoid)
+    if kaydirma is not None:
+        boylam, enlem = datum_kaydir(boylam, enlem, elipsoid, "GRS80", kaydirma)
+    return boylam, enlem
+
+def wgs84ten(boylam, enlem, orta_meridyen, sistem=VARSAYILAN_SISTEM):
+    """
+    WGS84 boylam/enlemini verilen sistem ve dilimdeki TM koordinatlarına çevirir.
+
+    Returns:
+        tuple: (saga, yukari) metre dizileri
+    """
+    elipsoid, kaydirma = KOORDINAT_SISTEMLERI[sistem]
+    if kaydirma is not None:
+        boylam, enlem = datum_kaydir(boylam, enlem, "GRS80", elipsoid, tuple(-d for d in kaydirma))
+    return cografi_tm(boylam, enlem, orta_meridyen, elipsoid)
+
+def karisik_wgs84e(saga, yukari, orta_meridyenler, sistemler):
+    """
+    Satır başına farklı sistem ve dilim içeren sütunları WGS84'e çevirir.
+
+    Her (sistem, dilim) grubu tek vektörel çağrıyla dönüştürülür. Dilimi
+    bilinmeyen, sistemi tanınmayan veya koordinatı eksik satırlar NaN döner.
+
+    Args:
+        saga, yukari (array-like): Metre
+        orta_meridyenler (array-like): Satır başına orta meridyen (bilinmiyorsa NaN)
+        sistemler (sequence): Satır başına sistem adı (boşsa ``VARSAYILAN_SISTEM``)
+
+    Returns:
+        tuple: (boylam, enlem) derece dizileri
+    """
+    saga = np.asarray(saga, dtype=np.float64)
+    yukari = np.asarray(yukari, dtype=np.float64)
+    meridyenler = np.asarray(orta_meridyenler, dtype=np.float64)
+    sistemler = np.array([s or VARSAYILAN_SISTEM for s in sistemler], dtype=object)
+    boylam = np.full(saga.shape, np.nan)
+    enlem = np.full(saga.shape, np.nan)
+    gecerli = np.isfinite(saga) & np.isfinite(yukari) & np.isfinite(meridyenler)
+    for sistem in KOORDINAT_SISTEMLERI:
+        sistem_maskesi = gecerli & (sistemler == sistem)
+        for meridyen in np.unique(meridyenler[sistem_maskesi]):
+            maske = sistem_maskesi & (meridyenler == meridyen)
+            boylam[maske], enlem[maske] = wgs84e(saga[maske], yukari[maske], meridyen, sistem)
+    return boylam, enlem
+
+def dilim_meridyeni(boylam):
+    """Boylama (derece) en yakın 3 derecelik dilim orta meridyeni"""
+    return int(3 * round(float(boylam) / 3))
+
+def ortak_duzleme(saga, yukari, orta_meridyenler, sistemler):
+    """
+    Karışık sistem ve dilimli TM koordinatlarını ``ORTAK_MERIDYEN`` düzlemine taşır.
+
+    Farklı dilimlerdeki sağa değerler aynı aralıkta tekrarlandığından
+    mesafe ve kutu sorguları ancak ortak düzlemde anlamlıdır. Dilimi
+    bilinmeyen satırlar NaN döner.
+
+    Returns:
+        tuple: (x, y) metre dizileri
+    """
+    boylam, enlem = karisik_wgs84e(saga, yukari, orta_meridyenler, sistemler)
+    return cografi_tm(boylam, enlem, ORTAK_MERIDYEN)
@@ -0,0 +1,557 @@
+import os
+import io
+import queue
+import threading
+from datetime import datetime, date
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
+from reportlab.pdfgen import canvas
+from reportlab.lib.units import cm
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+from matplotlib import colormaps
+from cekirdek.gunluk import hata_logla
+from cekirdek.veritabani import veritabani_baglantisi
+from cekirdek.veri_koprusu import arazi_tablosu, kayit_tablosu, hucre_metni
+
+# Rapordaki arazi tablosunun sütunları (başlık sırasıyla)
+RAPOR_SUTUNLARI = ("sondaj_derinligi", "n30", "zemin_tanimlamasi", "c_kpa", "aci_derece", "dogal_bha")
+
+def tarih_bicimle(deger):
+    """Veritabanındaki tarihi (ISO metni veya date) rapor biçimine (dd.MM.yyyy) çevirir"""
+    if not deger:
+        return None
+    if isinstance(deger, str):
+        try:
+            deger = date.fromisoformat(deger[:10])
+        except ValueError:
+            return deger
+    return deger.strftime("%d.%m.%Y")
+
+class SondajRaporuOlusturucu:
+    """Sondaj projesi için PDF raporu oluşturan sınıf"""
+    
+    def __init__(self, proje_id, cikti_dizini="raporlar", ilerleme=None, sondaj_id=None):
+        """
+        Rapor oluşturucu başlatır
+        
+        Args:
+            proje_id: Raporlanacak proje ID'si
+            cikti_dizini: Raporun kaydedileceği dizin
+            ilerleme: İlerleme bildirimi için çağrılacak fonksiyon (yuzde, mesaj)
+            sondaj_id: Raporlanacak kuyu; verilmezse projenin ilk kuyusu
+        """
+        self.proje_id = proje_id
+        self.sondaj_id = sondaj_id
+        self.cikti_dizini = cikti_dizini
+        self.ilerleme = ilerleme
+        self.proje_bilgileri = None
+        self.tapu_bilgileri = None
+        self.sondaj_bilgileri = None
+        self.arazi_bilgileri = None
+        self.styles = getSampleStyleSheet()
+        
+        # Özel stiller
+        self.styles.add(ParagraphStyle(
+            name='TurkishTitle',
+            parent=self.styles['Title'],
+            fontName='Helvetica-Bold',
+            fontSize=16,
+            alignment=1,
+            spaceAfter=14
+        ))
+        
+        self.styles.add(ParagraphStyle(
+            name='TurkishHeading1',
+            parent=self.styles['Heading1'],
+            fontName='Helvetica-Bold',
+            fontSize=14,
+            spaceAfter=10
+        ))
+        
+        self.styles.add(ParagraphStyle(
+            name='TurkishBodyText',
+            parent=self.styles['Normal'],
+            fontName='Helvetica',
+            fontSize=10,
+            spaceAfter=8
+        ))
+        
+    def ilerleme_bildir(self, yuzde, mesaj):
+        """
+        İlerleme fonksiyonu tanımlıysa rapor aşamasını bildirir
+        
+        Args:
+            yuzde: Tamamlanma yüzdesi (0-100)
+            mesaj: Aşama açıklaması
+        """
+        if self.ilerleme:
+            try:
+                self.ilerleme(yuzde, mesaj)
+            except Exception as e:
+                hata_logla(f"Rapor ilerleme bildirimi hatası: {str(e)}", e)
+    
+    def veri_yukle(self):
+        """Veritabanından gerekli bilgileri yükler"""
+        try:
+            with veritabani_baglantisi() as conn:
+                cursor = conn.cursor()
+                
+                # Proje bilgilerini al
+                cursor.execute("""
+                    SELECT * FROM Projeler 
+                    WHERE id = ?
+                """, (self.proje_id,))
+                self.proje_bilgileri = cursor.fetchone()
+                
+                # Tapu bilgilerini al
+                cursor.execute("""
+                    SELECT * FROM TapuBilgileri 
+                    WHERE proje_id = ?
+                """, (self.proje_id,))
+                self.tapu_bilgileri = cursor.fetchone()
+                
+                # Sondaj (kuyu) bilgilerini al; kuyu verilmemişse projenin ilk kuyusu
+                if self.sondaj_id is None:
+                    cursor.execute("""
+                        SELECT * FROM SondajBilgileri 
+                        WHERE proje_id = ?
+                        ORDER BY id LIMIT 1
+                    """, (self.proje_id,))
+                else:
+                    cursor.execute("""
+                        SELECT * FROM SondajBilgileri 
+                        WHERE id = ? AND proje_id = ?
+                    """, (self.sondaj_id, self.proje_id))
+                self.sondaj_bilgileri = cursor.fetchone()
+                
+                # Arazi bilgilerini al (kuyu yoksa boş tablo)
+                if self.sondaj_bilgileri:
+                    self.arazi_bilgileri = arazi_tablosu(conn, sondaj_id=self.sondaj_bilgileri["id"],
+                                                         sutunlar=RAPOR_SUTUNLARI)
+                else:
+                    self.arazi_bilgileri = kayit_tablosu([], RAPOR_SUTUNLARI)
+                
+                if not self.proje_bilgileri:
+                    raise ValueError(f"Proje bulunamadı (ID: {self.proje_id})")
+                    
+                return True
+                
+        except Exception as e:
+            hata_logla(f"Rapor için veri yükleme hatası: {str(e)}", e)
+            return False
+    
+    def spt_grafik_olustur(self):
+        """
+        SPT verilerinin grafiğini oluşturur
+        
+        Returns:
+            io.BytesIO: PNG görüntüsü, veri yoksa None
+        """
+        try:
+            if self.arazi_bilgileri is None:
+                return None
+                
+            # SPT verilerini filtrele
+            veriler = self.arazi_bilgileri[["sondaj_derinligi", "n30"]].dropna()
+            if veriler.empty:
+                return None
+            derinlikler = veriler["sondaj_derinligi"].to_numpy()
+            n30_degerleri = veriler["n30"].to_numpy(dtype="int64")
+                
+            # Grafiği oluştur (pyplot durumu kullanılmadığı için iş parçacığı güvenli)
+            fig = Figure(figsize=(5, 8))
+            ax = fig.add_subplot(111)
+            ax.barh(derinlikler, n30_degerleri, height=0.5, color='blue', alpha=0.7)
+            ax.invert_yaxis()  # Derinlik yukarıdan aşağıya artsın
+            ax.set_xlabel('N30 Değeri')
+            ax.set_ylabel('Derinlik (m)')
+            ax.set_title('SPT N30 Değerleri - Derinlik Grafiği')
+            ax.grid(True, linestyle='--', alpha=0.7)
+            fig.tight_layout()
+            
+            # Grafiği geçici dosya yerine bellekte tut
+            goruntu = io.BytesIO()
+            fig.savefig(goruntu, format='png')
+            goruntu.seek(0)
+            
+            return goruntu
+            
+        except Exception as e:
+            hata_logla(f"SPT grafiği oluşturma hatası: {str(e)}", e)
+            return None
+    
+    def zemin_profili_grafik_olustur(self):
+        """
+        Zemin profili grafiğini oluşturur
+        
+        Returns:
+            io.BytesIO: PNG görüntüsü, veri yoksa None
+        """
+        try:
+            if self.arazi_bilgileri is None:
+                return None
+            
+            # Zemin profili verilerini filtrele
+            veriler = self.arazi_bilgileri[self.arazi_bilgileri["zemin_tanimlamasi"].notna()]
+            if veriler.empty:
+                return None
+            derinlikler = veriler["sondaj_derinligi"].tolist()
+            zemin_turleri = veriler["zemin_tanimlamasi"].tolist()
+                
+            # Benzersiz zemin türlerini bul
+            benzersiz_zeminler = list(veriler["zemin_tanimlamasi"].cat.remove_unused_categories().cat.categories)
+            renkler = colormaps['tab10'](range(len(benzersiz_zeminler)))
+            zemin_renk_map = {zemin: renkler[i] for i, zemin in enumerate(benzersiz_zeminler)}
+            
+            # Grafiği oluştur
+            fig = Figure(figsize=(4, 8))
+            ax = fig.add_subplot(111)
+            prev_depth = 0
+            
+            for i, (derinlik, zemin) in enumerate(zip(derinlikler, zemin_turleri)):
+                height = derinlik - prev_depth
+                ax.bar(0.5, height, bottom=prev_depth, width=1, 
+                       color=zemin_renk_map[zemin], alpha=0.7)
+                ax.text(0.5, prev_depth + height/2, f"{zemin}", 
+                       ha='center', va='center', fontsize=8,
+                       bbox=dict(facecolor='white', alpha=0.5))
+                prev_depth = derinlik
+                ax.axhline(y=derinlik, color='black', linestyle='-', alpha=0.3)
+            
+            ax.set_xlim(0, 1)
+            ax.set_title('Zemin Profili')
+            ax.set_ylabel('Derinlik (m)')
+            ax.invert_yaxis()
+            ax.set_xticks([])
+            
+            # Lejant oluştur
+            patches = [Rectangle((0,0),1,1, color=zemin_renk_map[label]) for label in benzersiz_zeminler]
+            ax.legend(patches, benzersiz_zeminler, loc='best', title="Zemin Türleri")
+            
+            fig.tight_layout()
+            
+            # Grafiği geçici dosya yerine bellekte tut
+            goruntu = io.BytesIO()
+            fig.savefig(goruntu, format='png')
+            goruntu.seek(0)
+            
+            return goruntu
+            
+        except Exception as e:
+            hata_logla(f"Zemin profili grafiği oluşturma hatası: {str(e)}", e)
+            return None
+    
+    def rapor_dosya_adi(self):
+        """
+        Rapor için zaman damgalı dosya adı üretir
+        
+        Returns:
+            str: PDF dosya adı
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        proje_adi = self.proje_bilgileri["proje_adi"].replace(" ", "_")
+        return f"{proje_adi}_rapor_{timestamp}.pdf"
+    
+    def rapor_olustur(self, hedef=None, veri_yuklu=False):
+        """
+        PDF raporu oluşturur ve kaydeder
+        
+        Args:
+            hedef: PDF'in yazılacağı dosya benzeri nesne. Verilmezse rapor
+                çıktı dizinine dosya olarak kaydedilir.
+            veri_yuklu (bool): Veri önceden ``veri_yukle`` ile yüklendiyse True
+        
+        Returns:
+            tuple: (dosya yolu veya hedef nesne, durum mesajı)
+        """
+        try:
+            self.ilerleme_bildir(5, "Veriler yükleniyor")
+            if not veri_yuklu and not self.veri_yukle():
+                return None, "Veritabanından veri yüklenemedi"
+            self.ilerleme_bildir(20, "Veriler yüklendi")
+            
+            if hedef is None:
+                # Çıktı dizinini kontrol et
+                if not os.path.exists(self.cikti_dizini):
+                    os.makedirs(self.cikti_dizini)
+                
+                # Rapor dosya adı
+                rapor_dosyasi = os.path.join(self.cikti_dizini, self.rapor_dosya_adi())
+            else:
+                rapor_dosyasi = hedef
+            
+            # PDF oluştur
+            doc = SimpleDocTemplate(
+                rapor_dosyasi,
+                pagesize=A4,
+                rightMargin=2*cm,
+                leftMargin=2*cm,
+                topMargin=2*cm,
+                bottomMargin=2*cm
+            )
+            
+            # İçerik listesi
+            story = []
+            
+            # Başlık
+            story.append(Paragraph(f"SONDAJ RAPORU: {self.proje_bilgileri['proje_adi']}", self.styles['TurkishTitle']))
+            story.append(Spacer(1, 0.5*cm))
+            
+            # Proje bilgileri
+            story.append(Paragraph("1. PROJE BİLGİLERİ", self.styles['TurkishHeading1']))
+            
+            proje_tablo_verisi = [
+                ["Proje Adı", self.proje_bilgileri["proje_adi"]],
+                ["Yüklenici Firma", self.proje_bilgileri["yuklenici_firma"] or "-"],
+                ["Sorumlu Mühendis", self.proje_bilgileri["sorumlu_muhendis"] or "-"],
+                ["Rapor Tarihi", datetime.now().strftime("%d.%m.%Y")]
+            ]
+            
+            t = Table(proje_tablo_verisi, colWidths=[doc.width/3, doc.width*2/3])
+            t.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+                ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+                ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]))
+            story.append(t)
+            story.append(Spacer(1, 0.5*cm))
+            
+            # Tapu bilgileri
+            story.append(Paragraph("2. TAPU BİLGİLERİ", self.styles['TurkishHeading1']))
+            
+            if self.tapu_bilgileri:
+                tapu_tablo_verisi = [
+                    ["İl", self.tapu_bilgileri["il"] or "-"],
+                    ["İlçe", self.tapu_bilgileri["ilce"] or "-"],
+                    ["Mahalle", self.tapu_bilgileri["mahalle"] or "-"],
+                    ["Ada", self.tapu_bilgileri["ada"] or "-"],
+                    ["Pafta", self.tapu_bilgileri["pafta"] or "-"],
+                    ["Parsel", self.tapu_bilgileri["parsel"] or "-"],
+                    ["Koordinat X", str(self.tapu_bilgileri["koordinat_x"] or "-")],
+                    ["Koordinat Y", str(self.tapu_bilgileri["koordinat_y"] or "-")]
+                ]
+                
+                t = Table(tapu_tablo_verisi, colWidths=[doc.width/3, doc.width*2/3])
+                t.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+                    ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
+                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+                    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ]))
+                story.append(t)
+            else:
+                story.append(Paragraph("Tapu bilgisi bulunamadı.", self.styles['TurkishBodyText']))
+            
+            story.append(Spacer(1, 0.5*cm))
+            
+            # Sondaj bilgileri
+            story.append(Paragraph("3. SONDAJ BİLGİLERİ", self.styles['TurkishHeading1']))
+            
+            if self.sondaj_bilgileri:
+                sondaj_tablo_verisi = [
+                    ["Sondör Adı", self.sondaj_bilgileri["sondor_adi"] or "-"],
+                    ["Sondaj Kotu", str(self.sondaj_bilgileri["sondaj_kotu"] or "-")],
+                    ["Sondaj Derinliği", str(self.sondaj_bilgileri["sondaj_derinligi"] or "-")],
+                    ["Başlama Tarihi", tarih_bicimle(self.sondaj_bilgileri["baslama_tarihi"]) or "-"],
+                    ["Bitiş Tarihi", tarih_bicimle(self.sondaj_bilgileri["bitis_tarihi"]) or "-"],
+                    ["Delgi Çapı", str(self.sondaj_bilgileri["delgi_capi"] or "-")],
+                    ["Yeraltı Suyu", str(self.sondaj_bilgileri["yer_alti_suyu"] or "-")],
+                    ["UD Örnekleri", self.sondaj_bilgileri["ud_ornekleri"] or "-"],
+                    ["Zemin Tipi", self.sondaj_bilgileri["zemin_tipi"] or "-"],
+                    ["Makine Tipi", self.sondaj_bilgileri["makine_tipi"] or "-"],
+                    ["SPT Şahmerdan Tipi", self.sondaj_bilgileri["spt_sahmerdan_tipi"] or "-"]
+                ]
+                
+                t = Table(sondaj_tablo_verisi, colWidths=[doc.width/3, doc.width*2/3])
+                t.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+                    ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
+                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+                    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ]))
+                story.append(t)
+            else:
+                story.append(Paragraph("Sondaj bilgisi bulunamadı.", self.styles['TurkishBodyText']))
+            
+            story.append(Spacer(1, 0.5*cm))
+            
+            # Arazi bilgileri
+            story.append(Paragraph("4. ARAZİ DENEY BİLGİLERİ", self.styles['TurkishHeading1']))
+            
+            if self.arazi_bilgileri is not None and not self.arazi_bilgileri.empty:
+                # Arazi tablo verileri
+                arazi_tablo_baslik = [
+                    "Derinlik (m)", "SPT N30", "Zemin Tanımlaması",
+                    "C (kpa)", "Ø(derece)", "Doğal B.H.A (kN/m³)"
+                ]
+                
+                arazi_tablo_verisi = [arazi_tablo_baslik]
+                
+                for veri in self.arazi_bilgileri[list(RAPOR_SUTUNLARI)].itertuples(index=False):
+                    arazi_tablo_verisi.append([hucre_metni(deger) for deger in veri])
+                
+                t = Table(arazi_tablo_verisi, colWidths=[doc.width/6] * 6)
+                t.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ]))
+                story.append(t)
+            else:
+                story.append(Paragraph("Arazi bilgisi bulunamadı.", self.styles['TurkishBodyText']))
+            
+            story.append(Spacer(1, 0.5*cm))
+            
+            self.ilerleme_bildir(40, "Tablolar hazırlandı")
+            
+            # Grafikler
+            story.append(Paragraph("5. DENEY GRAFİKLERİ", self.styles['TurkishHeading1']))
+            
+            # SPT Grafiği
+            spt_grafigi = self.spt_grafik_olustur()
+            if spt_grafigi:
+                story.append(Paragraph("5.1. SPT Değerleri Grafiği", self.styles['TurkishHeading1']))
+                img = Image(spt_grafigi, width=doc.width*0.7, height=doc.width*1.2)
+                story.append(img)
+                story.append(Spacer(1, 0.5*cm))
+            
+            # Zemin Profili Grafiği
+            zemin_grafigi = self.zemin_profili_grafik_olustur()
+            if zemin_grafigi:
+                story.append(Paragraph("5.2. Zemin Profili Grafiği", self.styles['TurkishHeading1']))
+                img = Image(zemin_grafigi, width=doc.width*0.7, height=doc.width*1.2)
+                story.append(img)
+                story.append(Spacer(1, 0.5*cm))
+            
+            self.ilerleme_bildir(70, "Grafikler oluşturuldu")
+            
+            # Sonuç ve imza
+            story.append(Paragraph("6. SONUÇ VE DEĞERLENDİRME", self.styles['TurkishHeading1']))
+            story.append(Paragraph("Bu rapor, sondaj çalışması sonucunda elde edilen verileri içermektedir. Zemin etüt ve değerlendirme çalışmaları için bir kaynak olarak kullanılabilir.", self.styles['TurkishBodyText']))
+            
+            story.append(Spacer(1, 1*cm))
+            story.append(Paragraph(f"Sorumlu Mühendis: {self.proje_bilgileri['sorumlu_muhendis'] or 'Belirtilmemiş'}", self.styles['TurkishBodyText']))
+            story.append(Paragraph(f"Rapor Tarihi: {datetime.now().strftime('%d.%m.%Y')}", self.styles['TurkishBodyText']))
+            
+            # PDF dosyasını oluştur
+            self.ilerleme_bildir(80, "PDF oluşturuluyor")
+            doc.build(story)
+            
+            self.ilerleme_bildir(100, "Rapor tamamlandı")
+            return rapor_dosyasi, "Rapor başarıyla oluşturuldu."
+            
+        except Exception as e:
+            hata_mesaji = f"Rapor oluşturma hatası: {str(e)}"
+            hata_logla(hata_mesaji, e)
+            return None, hata_mesaji
+
+
+class AkisYazici(io.RawIOBase):
+    """
+    PDF çıktısını bir kuyruk üzerinden parçalar halinde aktaran yazıcı.
+    
+    Rapor ayrı bir iş parçacığında bu nesneye yazılırken, okuyan taraf
+    parçaları geldikçe yanıt olarak gönderebilir; geçici dosya gerekmez.
+    """
+    PARCA_BOYUTU = 64 * 1024
+    
+    def __init__(self, azami_parca=16):
+        super().__init__()
+        self.kuyruk = queue.Queue(maxsize=azami_parca)
+        self.yazilan = 0
+        self.iptal_edildi = threading.Event()
+    
+    def writable(self):
+        return True
+    
+    def write(self, veri):
+        veri = bytes(veri)
+        for i in range(0, len(veri), self.PARCA_BOYUTU):
+            self._koy(veri[i:i + self.PARCA_BOYUTU])
+        self.yazilan += len(veri)
+        return len(veri)
+    
+    def _koy(self, parca):
+        # Okuyan taraf bağlantıyı kapattıysa yazmayı bırak
+        while not self.iptal_edildi.is_set():
+            try:
+                self.kuyruk.put(parca, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+        raise IOError("Rapor akışı okuyucu tarafından kapatıldı")
+    
+    def tell(self):
+        return self.yazilan
+    
+    def bitir(self, hata=None):
+        """Akışın sonunu (veya hatayı) okuyan tarafa bildirir"""
+        try:
+            self._koy(hata)
+        except IOError:
+            pass
+
+
+def rapor_akisi(olusturucu):
+    """
+    Raporu oluşturmaya başlar ve PDF baytlarını parçalar halinde veren üreteci döndürür.
+    
+    Veri yükleme ve ilk parçanın üretimi çağrı sırasında yapılır; bu
+    aşamadaki hatalar yanıt başlıkları gönderilmeden önce yükseltilir.
+    
+    Args:
+        olusturucu (SondajRaporuOlusturucu): Verisi yüklenecek rapor oluşturucu
+    
+    Returns:
+        generator: PDF içeriği parçaları (bytes)
+    
+    Raises:
+        RuntimeError: Veri yüklenemez veya rapor oluşturulamazsa
+    """
+    if not olusturucu.veri_yukle():
+        raise RuntimeError("Veritabanından veri yüklenemedi")
+    yazici = AkisYazici()
+    
+    def olustur():
+        try:
+            sonuc, mesaj = olusturucu.rapor_olustur(hedef=yazici, veri_yuklu=True)
+            yazici.bitir(None if sonuc is not None else RuntimeError(mesaj))
+        except Exception as e:
+            yazici.bitir(e)
+    
+    is_parcacigi = threading.Thread(target=olustur, name=f"rapor-akisi-{olusturucu.proje_id}", daemon=True)
+    is_parcacigi.start()
+    
+    ilk = yazici.kuyruk.get()
+    if isinstance(ilk, Exception):
+        raise RuntimeError(str(ilk))
+    return _akis_parcalari(yazici, ilk)
+
+def _akis_parcalari(yazici, ilk):
+    try:
+        parca = ilk
+        while parca is not None:
+            if isinstance(parca, Exception):
+                raise RuntimeError(str(parca))
+            yield parca
+            parca = yazici.kuyruk.get()
+    finally:
+        # İstemci bağlantıyı erken kapatırsa üretici iş parçacığını serbest bırak
+        yazici.iptal_edildi.set()
@@ -0,0 +1,271 @@
+import os
+import sys
+import time
+import atexit
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from collections import defaultdict
+
+from cekirdek.gunluk import hata_logla
+
+# Profil yalnızca SONDAJ_SQL_PROFIL=1 ile açılır; kapalıyken bağlantılara dokunulmaz
+PROFIL_AKTIF = os.environ.get("SONDAJ_SQL_PROFIL", "0") == "1"
+PROFIL_RAPOR_YOLU = os.environ.get("SONDAJ_SQL_PROFIL_YOLU", "sql_profili.txt")
+# İlerleme işleyicisinin çağrılma aralığı (SQLite sanal makine komutu)
+ADIM_ARALIGI = 1000
+# Arayüz eylemi belirlenirken bakılan modüller (çağrı yığınında en dıştaki)
+ARAYUZ_MODULLERI = ("main_window.py", "widgets.py", "visualization.py", "login.py", "rapor.py")
+
+
+def _sade(sql):
+    """SQL metnindeki boşlukları tekleştirir"""
+    return " ".join(sql.split())
+
+
+class SorguIstatistigi:
+    """Tek bir SQL ifadesine ait toplu ölçümler"""
+    __slots__ = ("sayi", "toplam_sure", "en_uzun", "adim", "ornek_parametreler")
+
+    def __init__(self):
+        self.sayi = 0
+        self.toplam_sure = 0.0
+        self.en_uzun = 0.0
+        self.adim = 0
+        self.ornek_parametreler = None
+
+
+class ProfilliImlec(sqlite3.Cursor):
+    """Çalıştırma ve okuma süresini ifadeye ekleyen imleç"""
+    def execute(self, sql, parameters=()):
+        self._sql = sql
+        self._parametreler = parameters
+        with self.connection._olc(sql, parameters, yeni=True):
+            return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._sql = sql
+        self._parametreler = None
+        with self.connection._olc(sql, None, yeni=True):
+            return super().executemany(sql, seq_of_parameters)
+
+    # SQLite satırları okundukça üretir; okuma süresi de ifadeye aittir
+    def fetchone(self):
+        with self.connection._olc(getattr(self, "_sql", None)):
+            return super().fetchone()
+
+    def fetchmany(self, size=None):
+        with self.connection._olc(getattr(self, "_sql", None)):
+            return super().fetchmany(self.arraysize if size is None else size)
+
+    def fetchall(self):
+        with self.connection._olc(getattr(self, "_sql", None)):
+            return super().fetchall()
+
+    def __next__(self):
+        with self.connection._olc(getattr(self, "_sql", None)):
+            return super().__next__()
+
+
+class ProfilliBaglanti(sqlite3.Connection):
+    """
+    Sorgu profili toplayan SQLite bağlantısı.
+
+    Süreler imleç üzerinden, sanal makine adımları ilerleme işleyicisiyle,
+    örtük BEGIN/COMMIT dahil tüm ifadeler iz (trace) geri çağrısıyla sayılır.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._adim = 0
+        self.set_progress_handler(self._ilerleme, ADIM_ARALIGI)
+        self.set_trace_callback(profilleyici.ifade_izlendi)
+
+    def _ilerleme(self):
+        self._adim += ADIM_ARALIGI
+        return 0
+
+    @contextmanager
+    def _olc(self, sql, parametreler=None, yeni=False):
+        if sql is None:
+            yield
+            return
+        adim = self._adim
+        baslangic = time.perf_counter()
+        try:
+            yield
+        finally:
+            profilleyici.sure_ekle(sql, time.perf_counter() - baslangic, self._adim - adim,
+                                   parametreler, yeni)
+
+    def cursor(self, factory=ProfilliImlec):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, parameters):
+        return self.cursor().executemany(sql, parameters)
+
+
+class SorguProfilleyici:
+    """
+    Masaüstü uygulamasının SQL ifadelerini toplar ve raporlar.
+
+    İfadeler sade SQL metnine göre, arayüz eylemleri ise çağrı yığınındaki
+    en dıştaki arayüz metoduna (ör. ``AnaPencere.proje_yukle_id``) göre
+    gruplanır. Rapor, her SELECT için EXPLAIN QUERY PLAN çalıştırıp tam
+    tablo taramalarını işaretler.
+    """
+    def __init__(self):
+        self.kilit = threading.Lock()
+        self.sifirla()
+        self._yerel = threading.local()
+
+    def sifirla(self):
+        """Toplanan ölçümleri temizler"""
+        with self.kilit:
+            self.ifadeler = defaultdict(SorguIstatistigi)
+            self.eylemler = defaultdict(lambda: defaultdict(int))
+            self.baslangic = datetime.now()
+
+    @contextmanager
+    def eylem(self, ad):
+        """
+        Blok içindeki sorguları verilen eylem adına yazar.
+
+        Args:
+            ad (str): Eylem adı (ör. "Tema değiştir")
+        """
+        onceki = getattr(self._yerel, "eylem", None)
+        self._yerel.eylem = ad
+        try:
+            yield
+        finally:
+            self._yerel.eylem = onceki
+
+    def _etkin_eylem(self):
+        ad = getattr(self._yerel, "eylem", None)
+        if ad:
+            return ad
+        bulunan = None
+        cerceve = sys._getframe(1)
+        while cerceve is not None:
+            if os.path.basename(cerceve.f_code.co_filename) in ARAYUZ_MODULLERI:
+                bulunan = cerceve
+            cerceve = cerceve.f_back
+        return bulunan.f_code.co_qualname if bulunan else "diğer"
+
+    def ifade_izlendi(self, sql):
+        """set_trace_callback geri çağrısı: ifadeyi etkin eyleme sayar"""
+        eylem = self._etkin_eylem()
+        with self.kilit:
+            self.eylemler[eylem]["sorgu"] += 1
+
+    def sure_ekle(self, sql, sure, adim, parametreler=None, yeni=False):
+        """İfadenin çalıştırma veya okuma süresini toplar"""
+        anahtar = _sade(sql)
+        eylem = self._etkin_eylem()
+        with self.kilit:
+            ist = self.ifadeler[anahtar]
+            if yeni:
+                ist.sayi += 1
+                if ist.ornek_parametreler is None and parametreler is not None:
+                    ist.ornek_parametreler = parametreler
+            ist.toplam_sure += sure
+            ist.en_uzun = max(ist.en_uzun, sure)
+            ist.adim += adim
+            self.eylemler[eylem]["sure"] += sure
+
+    def sorgu_planlari(self, veritabani_yolu):
+        """
+        SELECT ifadelerinin sorgu planında tam tablo taramalarını bulur.
+
+        Args:
+            veritabani_yolu (str): Planların çıkarılacağı veritabanı
+
+        Returns:
+            dict: SQL metni -> indekssiz taranan tablo adımları
+        """
+        with self.kilit:
+            ornekler = [(sql, ist.ornek_parametreler) for sql, ist in self.ifadeler.items()
+                        if sql.upper().startswith("SELECT")]
+        taramalar = {}
+        # Profilsiz ayrı bağlantı: plan sorguları ölçümlere karışmasın
+        conn = sqlite3.connect(veritabani_yolu)
+        try:
+            for sql, parametreler in ornekler:
+                try:
+                    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", parametreler or ()).fetchall()
+                except sqlite3.Error:
+                    continue
+                tam = [satir[3] for satir in plan
+                       if satir[3].startswith("SCAN") and "INDEX" not in satir[3]]
+                if tam:
+                    taramalar[sql] = tam
+        finally:
+            conn.close()
+        return taramalar
+
+    def rapor(self, veritabani_yolu):
+        """
+        Profil raporunu metin olarak üretir.
+
+        Returns:
+            str: Rapor metni
+        """
+        taramalar = self.sorgu_planlari(veritabani_yolu)
+        with self.kilit:
+            ifadeler = sorted(self.ifadeler.items(), key=lambda kv: kv[1].toplam_sure, reverse=True)
+            eylemler = sorted(self.eylemler.items(), key=lambda kv: kv[1]["sure"], reverse=True)
+            baslangic = self.baslangic
+
+        satirlar = [f"SQL profili: {baslangic:%Y-%m-%d %H:%M:%S} - {datetime.now():%Y-%m-%d %H:%M:%S}", ""]
+        satirlar.append("Arayüz eylemleri (sorgu sayısı, toplam SQL süresi):")
+        for eylem, degerler in eylemler:
+            satirlar.append(f"  {int(degerler['sorgu']):6d}  {degerler['sure'] * 1000:10.1f} ms  {eylem}")
+
+        satirlar += ["", "İfadeler (toplam süreye göre):"]
+        satirlar.append(f"  {'adet':>6}  {'toplam ms':>10}  {'ort. ms':>8}  {'en uzun':>8}  {'VM adımı':>9}  SQL")
+        for sql, ist in ifadeler:
+            ortalama = ist.toplam_sure / ist.sayi if ist.sayi else 0.0
+            satirlar.append(f"  {ist.sayi:6d}  {ist.toplam_sure * 1000:10.1f}  {ortalama * 1000:8.2f}  "
+                            f"{ist.en_uzun * 1000:8.2f}  {ist.adim:9d}  {sql}")
+
+        satirlar += ["", "Tam tablo taramaları (EXPLAIN QUERY PLAN):"]
+        if not taramalar:
+            satirlar.append("  Yok")
+        for sql, adimlar in taramalar.items():
+            satirlar.append(f"  {sql}")
+            for adim in adimlar:
+                satirlar.append(f"      -> {adim}")
+        return "\n".join(satirlar) + "\n"
+
+    def kaydet(self, veritabani_yolu, yol=PROFIL_RAPOR_YOLU):
+        """
+        Profil raporunu dosyaya yazar.
+
+        Returns:
+            str: Rapor dosyasının yolu, hata olursa None
+        """
+        try:
+            with open(yol, "w", encoding="utf-8") as f:
+                f.write(self.rapor(veritabani_yolu))
+            return yol
+        except Exception as e:
+            hata_logla(f"SQL profili kaydetme hatası: {str(e)}", e)
+            return None
+
+
+profilleyici = SorguProfilleyici()
+
+
+def profili_etkinlestir(veritabani_yolu):
+    """
+    Profil açıksa program kapanırken raporun yazılmasını sağlar.
+
+    Args:
+        veritabani_yolu (str): Planların çıkarılacağı veritabanı
+    """
+    if PROFIL_AKTIF:
+        atexit.register(profilleyici.kaydet, veritabani_yolu)
@@ -0,0 +1,290 @@
+"""
+Arazi kayıtları için pandas/NumPy köprüsü.
+
+Grafikler, raporlar ve hesaplamalar arazi kayıtlarını buradan tipli bir
+DataFrame olarak alır. Sütunlar kararlı kimliklerle (``ARAZI_SUTUNLARI``
+anahtarları, web modelindeki alan adları) adlandırılır: derinlik ve
+ölçümler float32 (boş = NaN), SPT darbe sayıları boş değer alabilen Int16,
+zemin tanımları kategoriktir. Tablo imleçten gelen demetlerden sütun sütun
+kurulur; satır başına sözlük veya ``sqlite3.Row`` oluşturulmaz.
+
+Tablo ``AraziKayitlari`` üzerine kurulur: sütun dizileri (float32 ölçümler,
+int16 darbe sayıları + geçerlilik maskesi, zemin tanımları için tekilleştirilmiş
+sözlük ve kodlar) tutan sıkıştırılmış kayıt kabı. Form gezintisi gibi satır
+satır erişim ``AraziKaydi`` görünümleriyle yapılır; DataFrame sütunları aynı
+dizileri kopyalamadan sarar.
+
+Masaüstü veritabanı için ``arazi_kayitlari``/``arazi_tablosu``, başka
+kaynaklar (SQLAlchemy sonuçları, ORM nesneleri vb.) için
+``AraziKayitlari.satirlardan``/``orm_kayitlarindan`` ve ``kayit_tablosu``
+kullanılır. pandas yalnızca DataFrame istendiğinde yüklenir; satır satır
+erişen masaüstü formları onu içe aktarmaz.
+"""
+import sys
+import json
+
+import numpy as np
+
+from cekirdek.veritabani import ARAZI_SUTUNLARI
+
+# Kimlik -> sütun türü; listede olmayan sütunlar metin sayılır
+ARAZI_TURLERI = {
+    "id": "kimlik",
+    "proje_id": "kimlik",
+    "sondaj_id": "kimlik",
+    "sondaj_derinligi": "ondalik",
+    "muhafaza_borusu_derinligi": "ondalik",
+    "kuyu_ici_deneyler": "metin",
+    "ornek_derinligi": "metin",
+    "ornek_turu_no": "metin",
+    "spt_0_15": "darbe",
+    "spt_15_30": "darbe",
+    "spt_30_45": "darbe",
+    "n30": "darbe",
+    "tmax": "ondalik",
+    "tyogrulmus": "ondalik",
+    "c_kpa": "ondalik",
+    "aci_derece": "ondalik",
+    "dogal_bha": "ondalik",
+    "kuru_bha": "ondalik",
+    "zemin_profili": "kategori",
+    "zemin_tanimlamasi": "kategori",
+}
+TUM_SUTUNLAR = ("id", "proje_id", "sondaj_id", *ARAZI_SUTUNLARI)
+
+def sayiya_cevir(degerler):
+    """
+    Değerleri float64 dizisine çevirir; None ve sayıya çevrilemeyen değerler
+    (ör. boş metin) NaN olur.
+    """
+    try:
+        return np.array(degerler, dtype=np.float64)
+    except (TypeError, ValueError):
+        sonuc = np.full(len(degerler), np.nan)
+        for i, deger in enumerate(degerler):
+            try:
+                sonuc[i] = float(deger)
+            except (TypeError, ValueError):
+                pass
+        return sonuc
+
+def _tam_sayi(degerler, tur):
+    sayilar = sayiya_cevir(degerler)
+    bos = np.isnan(sayilar)
+    return np.where(bos, 0, np.round(sayilar)).astype(tur), ~bos
+
+def _sozluk(degerler):
+    """Metinleri sıralı, tekilleştirilmiş sözlüğe ve kodlara çevirir (boş = -1)"""
+    sozluk = sorted({deger for deger in degerler if deger is not None})
+    kodlar = {deger: kod for kod, deger in enumerate(sozluk)}
+    return (np.array([kodlar.get(deger, -1) for deger in degerler], dtype=np.int32),
+            tuple(sys.intern(deger) if isinstance(deger, str) else deger for deger in sozluk))
+
+class AraziKaydi:
+    """
+    ``AraziKayitlari`` içindeki tek satırın görünümü.
+
+    Değerler istendiğinde sütunlardan okunur; ``kayit["n30"]`` ve
+    ``kayit.n30`` aynıdır, boş değerler None döner.
+    """
+    __slots__ = ("kayitlar", "indeks")
+
+    def __init__(self, kayitlar, indeks):
+        self.kayitlar = kayitlar
+        self.indeks = indeks
+
+    def __getitem__(self, kimlik):
+        return self.kayitlar.deger(kimlik, self.indeks)
+
+    def __getattr__(self, kimlik):
+        try:
+            return self.kayitlar.deger(kimlik, self.indeks)
+        except KeyError:
+            raise AttributeError(kimlik) from None
+
+    def __repr__(self):
+        return f"<AraziKaydi {self.indeks}>"
+
+class AraziKayitlari:
+    """
+    Arazi kayıtları için sütun tabanlı kap.
+
+    Sütunlar ``ARAZI_TURLERI`` türlerine göre tutulur: ondalıklar float32
+    (boş = NaN), darbe sayıları int16 ve kimlikler int64 (geçerlilik
+    maskesiyle), kategoriler int32 kodlar + tekilleştirilmiş sözlük, metinler
+    nesne dizisi. Satır başına sözlük, ``sqlite3.Row`` veya ORM nesnesi
+    tutulmaz.
+    """
+    __slots__ = ("kimlikler", "sutunlar", "gecerli", "sozlukler", "uzunluk")
+
+    def __init__(self, kimlikler, sutunlar, gecerli, sozlukler, uzunluk):
+        self.kimlikler = kimlikler
+        self.sutunlar = sutunlar
+        self.gecerli = gecerli
+        self.sozlukler = sozlukler
+        self.uzunluk = uzunluk
+
+    @classmethod
+    def satirlardan(cls, satirlar, kimlikler, ondalik=np.float32):
+        """
+        Demet satırlarından kap kurar.
+
+        Args:
+            satirlar (iterable): Demetler (imleç, ``fetchall()`` veya SQLAlchemy sonucu)
+            kimlikler (sequence): Demetteki sıraya göre sütun kimlikleri
+            ondalik: Ondalık sütunların türü; değerler JSON'a yazılacaksa float64
+                (float32 10.45'i 10.449999... olarak genişletir)
+
+        Returns:
+            AraziKayitlari: Kayıtlar
+        """
+        kimlikler = tuple(kimlikler)
+        satirlar = list(satirlar)
+        degerler = list(zip(*satirlar)) if satirlar else [()] * len(kimlikler)
+        sutunlar, gecerli, sozlukler = {}, {}, {}
+        for kimlik, sutun in zip(kimlikler, degerler):
+            tur = ARAZI_TURLERI.get(kimlik, "metin")
+            if tur == "ondalik":
+                sutunlar[kimlik] = sayiya_cevir(sutun).astype(ondalik, copy=False)
+            elif tur in ("darbe", "kimlik"):
+                sutunlar[kimlik], gecerli[kimlik] = _tam_sayi(sutun, np.int16 if tur == "darbe" else np.int64)
+            elif tur == "kategori":
+                sutunlar[kimlik], sozlukler[kimlik] = _sozluk(sutun)
+            else:
+                sutunlar[kimlik] = np.array(sutun, dtype=object)
+        return cls(kimlikler, sutunlar, gecerli, sozlukler, len(satirlar))
+
+    @classmethod
+    def orm_kayitlarindan(cls, kayitlar, kimlikler=TUM_SUTUNLAR, ondalik=np.float32):
+        """
+        Web modeli (``AraziBilgileri``) nesnelerinden kap kurar.
+
+        Args:
+            kayitlar (iterable): ORM nesneleri; alan adları kimliklerle aynıdır
+            kimlikler (sequence): Alınacak alanlar
+
+        Returns:
+            AraziKayitlari: Kayıtlar
+        """
+        return cls.satirlardan((tuple(getattr(kayit, kimlik) for kimlik in kimlikler) for kayit in kayitlar),
+                               kimlikler, ondalik)
+
+    def __len__(self):
+        return self.uzunluk
+
+    def __getitem__(self, indeks):
+        if indeks < 0:
+            indeks += self.uzunluk
+        if not 0 <= indeks < self.uzunluk:
+            raise IndexError(indeks)
+        return AraziKaydi(self, indeks)
+
+    def __iter__(self):
+        return (AraziKaydi(self, indeks) for indeks in range(self.uzunluk))
+
+    def deger(self, kimlik, indeks):
+        """
+        Tek hücrenin Python değeri; boş değerler None.
+
+        float32 değerler en kısa ondalık gösterimleriyle döner (10.45, 10.449999... değil).
+        """
+        sutun = self.sutunlar[kimlik]
+        deger = sutun[indeks]
+        if kimlik in self.gecerli:
+            return int(deger) if self.gecerli[kimlik][indeks] else None
+        if kimlik in self.sozlukler:
+            return self.sozlukler[kimlik][deger] if deger >= 0 else None
+        if sutun.dtype.kind == "f":
+            if np.isnan(deger):
+                return None
+            return float(str(deger)) if sutun.dtype == np.float32 else float(deger)
+        return deger
+
+    def tablo(self):
+        """
+        Kayıtları tipli DataFrame olarak verir; sütun dizileri kopyalanmaz.
+
+        Returns:
+            pandas.DataFrame: Tam sayılar boş değer alabilen Int16/Int64, kategoriler ``pd.Categorical``
+        """
+        import pandas as pd
+
+        veriler = {}
+        for kimlik in self.kimlikler:
+            sutun = self.sutunlar[kimlik]
+            if kimlik in self.gecerli:
+                sutun = pd.arrays.IntegerArray(sutun, ~self.gecerli[kimlik])
+            elif kimlik in self.sozlukler:
+                sutun = pd.Categorical.from_codes(sutun, categories=list(self.sozlukler[kimlik]))
+            veriler[kimlik] = sutun
+        return pd.DataFrame(veriler, columns=list(self.kimlikler))
+
+def kayit_tablosu(satirlar, kimlikler, ondalik=np.float32):
+    """
+    Demet satırlarından tipli DataFrame kurar.
+
+    Args:
+        satirlar (iterable): Demetler (imleç, ``fetchall()`` veya SQLAlchemy sonucu)
+        kimlikler (sequence): Demetteki sıraya göre sütun kimlikleri
+        ondalik: Ondalık sütunların türü; bkz. ``AraziKayitlari.satirlardan``
+
+    Returns:
+        pandas.DataFrame: Sütunları ``ARAZI_TURLERI`` türlerinde tablo
+    """
+    return AraziKayitlari.satirlardan(satirlar, kimlikler, ondalik).tablo()
+
+def arazi_kayitlari(conn, proje_id=None, sondaj_id=None, sutunlar=TUM_SUTUNLAR):
+    """
+    Masaüstü veritabanından arazi kayıtlarını derinliğe göre sıralı okur.
+
+    Args:
+        conn (sqlite3.Connection): Veritabanı bağlantısı
+        proje_id (int veya list, optional): Proje veya projeler
+        sondaj_id (int, optional): Yalnızca bu kuyu
+        sutunlar (sequence): Okunacak sütun kimlikleri
+
+    Returns:
+        AraziKayitlari: Kayıtlar
+    """
+    secim = ", ".join(f'"{ARAZI_SUTUNLARI.get(kimlik, kimlik)}"' for kimlik in sutunlar)
+    kosullar, parametreler = [], []
+    if isinstance(proje_id, (list, tuple, set)):
+        kosullar.append("proje_id IN (SELECT value FROM json_each(?))")
+        parametreler.append(json.dumps(sorted(proje_id)))
+    elif proje_id is not None:
+        kosullar.append("proje_id = ?")
+        parametreler.append(proje_id)
+    if sondaj_id is not None:
+        kosullar.append("sondaj_id = ?")
+        parametreler.append(sondaj_id)
+    sql = f"SELECT {secim} FROM AraziBilgileri"
+    if kosullar:
+        sql += " WHERE " + " AND ".join(kosullar)
+    # Tek kuyu (sondaj_id, derinlik) indeksinden, projeler (proje_id, derinlik) indeksinden sıralı okunur
+    if sondaj_id is not None:
+        sql += ' ORDER BY "Sondaj derinliği (m)", id'
+    else:
+        sql += ' ORDER BY proje_id, "Sondaj derinliği (m)", id'
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, parametreler)
+    return AraziKayitlari.satirlardan(cursor.fetchall(), sutunlar)
+
+def arazi_tablosu(conn, proje_id=None, sondaj_id=None, sutunlar=TUM_SUTUNLAR):
+    """
+    Masaüstü veritabanından arazi kayıtlarını tipli tablo olarak okur.
+
+    Returns:
+        pandas.DataFrame: bkz. ``arazi_kayitlari`` ve ``kayit_tablosu``
+    """
+    return arazi_kayitlari(conn, proje_id, sondaj_id, sutunlar).tablo()
+
+def hucre_metni(deger):
+    """Tablo hücresi için metin: boş veya 0 ise "-", ondalıklar kısa biçimde"""
+    import pandas as pd
+
+    if deger is None or pd.isna(deger) or deger == 0 or deger == "":
+        return "-"
+    if isinstance(deger, (float, np.floating)):
+        return f"{deger:g}"
+    return str(deger)
@@ -0,0 +1,518 @@
+import sqlite3
+
+from cekirdek.gunluk import hata_logla
+from cekirdek.sorgu_profili import PROFIL_AKTIF, ProfilliBaglanti
+
+VERITABANI_YOLU = "sondaj_veritabani.db"
+KUYU_ADI_ON_EKI = "SK-"
+VARSAYILAN_KUYU_ADI = KUYU_ADI_ON_EKI + "1"
+# Kuyu tarihleri ISO 8601 metni olarak tutulur ("yyyy-MM-dd")
+TARIH_SUTUNLARI = ("baslama_tarihi", "bitis_tarihi")
+# AraziBilgileri sütunlarının kararlı kimlikleri (web modelindeki alan adları) -> tablodaki adı
+ARAZI_SUTUNLARI = {
+    "sondaj_derinligi": "Sondaj derinliği (m)",
+    "muhafaza_borusu_derinligi": "Muhafaza borusu derinliği",
+    "kuyu_ici_deneyler": "Kuyu içi deneyler",
+    "ornek_derinligi": "Örnek derinliği (m)",
+    "ornek_turu_no": "Örnek türü ve no.",
+    "spt_0_15": "SPT0-15",
+    "spt_15_30": "SPT15-30",
+    "spt_30_45": "SPT30-45",
+    "n30": "N30",
+    "tmax": "Tmax",
+    "tyogrulmus": "TYoğrulmuş",
+    "c_kpa": "C (kpa)",
+    "aci_derece": "Ø(derece)",
+    "dogal_bha": "Doğal B.H.A(kN/m3)",
+    "kuru_bha": "Kuru B.H.A (kN/m3)",
+    "zemin_profili": "Zemin profili",
+    "zemin_tanimlamasi": "Zemin tanımlaması",
+}
+
+def veritabani_baglantisi():
+    """
+    SQLite veritabanına bağlantı oluşturur.
+    
+    Returns:
+        sqlite3.Connection: Veritabanı bağlantısı
+    """
+    try:
+        if PROFIL_AKTIF:
+            conn = sqlite3.connect(VERITABANI_YOLU, factory=ProfilliBaglanti)
+        else:
+            conn = sqlite3.connect(VERITABANI_YOLU)
+        conn.row_factory = sqlite3.Row  # Sonuçları sözlük olarak al
+        return conn
+    except Exception as e:
+        hata_logla(f"Veritabanı bağlantı hatası: {str(e)}", e)
+        raise
+
+def veritabani_olustur():
+    """
+    Gerekli veritabanı tablolarını oluşturur (yoksa).
+    """
+    print("Veritabanı kontrol ediliyor...")
+    with sqlite3.connect(VERITABANI_YOLU) as conn:
+        cursor = conn.cursor()
+        cursor.execute('''CREATE TABLE IF NOT EXISTS Projeler (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            proje_adi TEXT NOT NULL,
+                            yuklenici_firma TEXT,
+                            sorumlu_muhendis TEXT)''')
+        cursor.execute('''CREATE TABLE IF NOT EXISTS TapuBilgileri (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            proje_id INTEGER,
+                            il TEXT,
+                            ilce TEXT,
+                            mahalle TEXT,
+                            ada TEXT,
+                            pafta TEXT,
+                            parsel TEXT,
+                            koordinat_x REAL,
+                            koordinat_y REAL,
+                            FOREIGN KEY (proje_id) REFERENCES Projeler(id))''')
+        cursor.execute('''CREATE TABLE IF NOT EXISTS SondajBilgileri (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            proje_id INTEGER,
+                            sondor_adi TEXT,
+                            sondaj_kotu REAL,
+                            sondaj_derinligi REAL,
+                            baslama_tarihi TEXT,
+                            bitis_tarihi TEXT,
+                            delgi_capi REAL,
+                            yer_alti_suyu REAL,
+                            ud_ornekleri TEXT,
+                            zemin_tipi TEXT,
+                            makine_tipi TEXT,
+                            spt_sahmerdan_tipi TEXT,
+                            FOREIGN KEY (proje_id) REFERENCES Projeler(id))''')
+        cursor.execute('''CREATE TABLE IF NOT EXISTS AraziBilgileri (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            proje_id INTEGER,
+                            "Sondaj derinliği (m)" REAL,
+                            "Muhafaza borusu derinliği" REAL,
+                            "Kuyu içi deneyler" TEXT,
+                            "Örnek derinliği (m)" TEXT,
+                            "Örnek türü ve no." TEXT,
+                            "SPT0-15" INTEGER,
+                            "SPT15-30" INTEGER,
+                            "SPT30-45" INTEGER,
+                            "N30" INTEGER,
+                            "Tmax" REAL,
+                            "TYoğrulmuş" REAL,
+                            "C (kpa)" REAL,
+                            "Ø(derece)" REAL,
+                            "Doğal B.H.A(kN/m3)" REAL,
+                            "Kuru B.H.A (kN/m3)" REAL,
+                            "Zemin profili" TEXT,
+                            "Zemin tanımlaması" TEXT,
+                            FOREIGN KEY (proje_id) REFERENCES Projeler(id))''')
+        sema_guncelle(conn)
+        conn.commit()
+    print("Veritabanı hazır.")
+
+def _goc_kuyular(cursor):
+    """
+    Çok kuyulu projeler: her SondajBilgileri satırı bir kuyudur.
+
+    Kuyuya ad verilir, arazi kayıtları kuyuya bağlanır. Arazi kaydı olup
+    sondaj kaydı olmayan projelere boş bir kuyu eklenir; mevcut arazi
+    kayıtları projenin ilk kuyusuna atanır.
+    """
+    cursor.execute("ALTER TABLE SondajBilgileri ADD COLUMN kuyu_adi TEXT")
+    cursor.execute("ALTER TABLE AraziBilgileri ADD COLUMN sondaj_id INTEGER REFERENCES SondajBilgileri(id)")
+    cursor.execute("""
+        INSERT INTO SondajBilgileri (proje_id)
+        SELECT DISTINCT a.proje_id FROM AraziBilgileri a
+        WHERE a.proje_id IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM SondajBilgileri s WHERE s.proje_id = a.proje_id)
+    """)
+    cursor.execute("""
+        UPDATE SondajBilgileri
+        SET kuyu_adi = 'SK-' || (SELECT COUNT(*) FROM SondajBilgileri o
+                                 WHERE o.proje_id = SondajBilgileri.proje_id AND o.id <= SondajBilgileri.id)
+    """)
+    cursor.execute("""
+        UPDATE AraziBilgileri
+        SET sondaj_id = (SELECT MIN(s.id) FROM SondajBilgileri s WHERE s.proje_id = AraziBilgileri.proje_id)
+        WHERE sondaj_id IS NULL
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_sondaj_proje ON SondajBilgileri(proje_id)")
+    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_arazi_sondaj_derinlik
+                      ON AraziBilgileri(sondaj_id, "Sondaj derinliği (m)")''')
+    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_arazi_proje_derinlik
+                      ON AraziBilgileri(proje_id, "Sondaj derinliği (m)")''')
+
+def _goc_konum_indeksi(cursor):
+    """
+    TapuBilgileri koordinatları için R*Tree indeksi.
+
+    İndeks tetikleyicilerle her tapu kaydında güncel tutulur; koordinatı
+    eksik kayıtlar indekse girmez.
+    """
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS TapuKonumlari
+        USING rtree(id, min_x, max_x, min_y, max_y)
+    """)
+    cursor.execute("""
+        INSERT OR REPLACE INTO TapuKonumlari
+        SELECT id, koordinat_x, koordinat_x, koordinat_y, koordinat_y FROM TapuBilgileri
+        WHERE koordinat_x IS NOT NULL AND koordinat_y IS NOT NULL
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_tapu_konum_ekle AFTER INSERT ON TapuBilgileri
+        WHEN NEW.koordinat_x IS NOT NULL AND NEW.koordinat_y IS NOT NULL
+        BEGIN
+            INSERT OR REPLACE INTO TapuKonumlari
+            VALUES (NEW.id, NEW.koordinat_x, NEW.koordinat_x, NEW.koordinat_y, NEW.koordinat_y);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_tapu_konum_guncelle
+        AFTER UPDATE OF koordinat_x, koordinat_y ON TapuBilgileri
+        BEGIN
+            DELETE FROM TapuKonumlari WHERE id = OLD.id;
+            INSERT INTO TapuKonumlari
+            SELECT NEW.id, NEW.koordinat_x, NEW.koordinat_x, NEW.koordinat_y, NEW.koordinat_y
+            WHERE NEW.koordinat_x IS NOT NULL AND NEW.koordinat_y IS NOT NULL;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_tapu_konum_sil AFTER DELETE ON TapuBilgileri
+        BEGIN
+            DELETE FROM TapuKonumlari WHERE id = OLD.id;
+        END
+    """)
+
+# Proje özeti: tek projenin satırını alt tablolardan yeniden hesaplayan ifade.
+# Alt sorgular (proje_id, ...) indeksleriyle yalnızca o projenin satırlarını okur.
+# Tarihler ISO tutulur; göç öncesinden veya eski sürümlerden kalan "dd.MM.yyyy" metinleri
+# karşılaştırma öncesi ISO'ya çevrilir.
+_ISO_TARIH = "CASE WHEN {0} LIKE '__.__.____' THEN substr({0}, 7, 4) || '-' || substr({0}, 4, 2) || '-' || substr({0}, 1, 2) ELSE {0} END"
+_OZET_HESABI = """
+    INSERT OR REPLACE INTO ProjeOzetleri
+    SELECT p.id,
+           (SELECT COUNT(*) FROM SondajBilgileri s WHERE s.proje_id = p.id),
+           (SELECT MAX(s.sondaj_derinligi) FROM SondajBilgileri s WHERE s.proje_id = p.id),
+           (SELECT COUNT(*) FROM AraziBilgileri a WHERE a.proje_id = p.id),
+           (SELECT MAX(a."Sondaj derinliği (m)") FROM AraziBilgileri a WHERE a.proje_id = p.id),
+           (SELECT MIN(NULLIF(a."N30", 0)) FROM AraziBilgileri a WHERE a.proje_id = p.id),
+           (SELECT AVG(NULLIF(a."N30", 0)) FROM AraziBilgileri a WHERE a.proje_id = p.id),
+           (SELECT MAX(NULLIF(a."N30", 0)) FROM AraziBilgileri a WHERE a.proje_id = p.id),
+           (SELECT a."Zemin tanımlaması" FROM AraziBilgileri a
+            WHERE a.proje_id = p.id AND COALESCE(a."Zemin tanımlaması", '') != ''
+            GROUP BY a."Zemin tanımlaması" ORDER BY COUNT(*) DESC, a."Zemin tanımlaması" LIMIT 1),
+           (SELECT COALESCE(MAX(""" + _ISO_TARIH.format("s.bitis_tarihi") + """),
+                            MAX(""" + _ISO_TARIH.format("s.baslama_tarihi") + """))
+            FROM SondajBilgileri s WHERE s.proje_id = p.id),
+           strftime('%Y-%m-%dT%H:%M:%S', 'now')
+    FROM Projeler p
+    WHERE {kosul}
+"""
+
+def _goc_proje_ozetleri(cursor):
+    """
+    Proje başına önceden hesaplanmış liste özeti (ProjeOzetleri).
+
+    Arazi ve sondaj kayıtlarındaki her ekleme, güncelleme ve silmede
+    tetikleyiciler yalnızca ilgili projenin satırını yeniden hesaplar.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS ProjeOzetleri (
+            proje_id INTEGER PRIMARY KEY REFERENCES Projeler(id) ON DELETE CASCADE,
+            kuyu_sayisi INTEGER NOT NULL DEFAULT 0,
+            kuyu_derinligi REAL,
+            satir_sayisi INTEGER NOT NULL DEFAULT 0,
+            azami_derinlik REAL,
+            n30_en_kucuk INTEGER,
+            n30_ortalama REAL,
+            n30_en_buyuk INTEGER,
+            baskin_zemin TEXT,
+            son_arazi_tarihi TEXT,
+            guncelleme_zamani TEXT)""")
+    for tablo, kisa in (("AraziBilgileri", "arazi"), ("SondajBilgileri", "sondaj")):
+        for olay, kosul in (("INSERT", "p.id = NEW.proje_id"),
+                            ("UPDATE", "p.id IN (OLD.proje_id, NEW.proje_id)"),
+                            ("DELETE", "p.id = OLD.proje_id")):
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_ozet_{kisa}_{olay.lower()} AFTER {olay} ON {tablo}
+                BEGIN {_OZET_HESABI.format(kosul=kosul)}; END
+            """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_ozet_proje_insert AFTER INSERT ON Projeler
+        BEGIN {_OZET_HESABI.format(kosul="p.id = NEW.id")}; END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_ozet_proje_delete AFTER DELETE ON Projeler
+        BEGIN DELETE FROM ProjeOzetleri WHERE proje_id = OLD.id; END
+    """)
+    proje_ozetlerini_yenile(cursor)
+
+def proje_ozetlerini_yenile(conn, proje_id=None):
+    """
+    Proje özetlerini alt tablolardan yeniden hesaplar (tetikleyici dışı sapmalar için).
+
+    Args:
+        conn: Veritabanı bağlantısı veya imleci
+        proje_id (int, optional): Yalnızca bu proje; verilmezse tümü
+    """
+    if proje_id is None:
+        conn.execute("DELETE FROM ProjeOzetleri")
+        conn.execute(_OZET_HESABI.format(kosul="1"))
+    else:
+        conn.execute("DELETE FROM ProjeOzetleri WHERE proje_id = ?", (proje_id,))
+        conn.execute(_OZET_HESABI.format(kosul="p.id = ?"), (proje_id,))
+
+def _goc_degisiklik_zamani(cursor):
+    """
+    Tapu ve proje kaydı değişiklikleri de ProjeOzetleri.guncelleme_zamani'nı günceller.
+
+    Özet yalnızca arazi ve sondaj kayıtlarından hesaplanır; bu tetikleyiciler
+    özeti yeniden hesaplamadan yalnızca zamanı ileri alır. Böylece
+    guncelleme_zamani projenin herhangi bir kaydının son değişikliğidir
+    (artımlı anlık görüntüler bunu kullanır).
+    """
+    zaman = "UPDATE ProjeOzetleri SET guncelleme_zamani = strftime('%Y-%m-%dT%H:%M:%S', 'now') WHERE proje_id"
+    for olay, kosul in (("INSERT", "= NEW.proje_id"),
+                        ("UPDATE", "IN (OLD.proje_id, NEW.proje_id)"),
+                        ("DELETE", "= OLD.proje_id")):
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_zaman_tapu_{olay.lower()} AFTER {olay} ON TapuBilgileri
+            BEGIN {zaman} {kosul}; END
+        """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_zaman_proje_update AFTER UPDATE ON Projeler
+        BEGIN {zaman} = NEW.id; END
+    """)
+
+def _goc_iso_tarihler(cursor):
+    """
+    Kuyu tarihleri "dd.MM.yyyy" metninden ISO 8601'e ("yyyy-MM-dd") çevrilir ve indekslenir.
+
+    ISO metni sözlük sırasında kronolojik sıralanır; aralık sorguları
+    (``tarih_araligi_kosulu``) indeks aralık taramasıyla çalışır.
+    """
+    for sutun in TARIH_SUTUNLARI:
+        cursor.execute(f"UPDATE SondajBilgileri SET {sutun} = {_ISO_TARIH.format(sutun)} WHERE {sutun} LIKE '__.__.____'")
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_sondaj_{sutun} ON SondajBilgileri({sutun})")
+
+def _goc_konum_dilimleri(cursor):
+    """
+    Tapu koordinatlarına datum ve dilim eklenir; R*Tree ortak düzlemi indeksler.
+
+    Farklı 3 derecelik dilimlerdeki sağa değerler aynı aralıkta tekrarlandığından
+    ham koordinatlar tek indekste karışır. ``ortak_x`` / ``ortak_y`` kaydın
+    ``ORTAK_MERIDYEN`` düzlemindeki karşılığıdır; SQL'de hesaplanamadığı için
+    koordinat, datum veya dilim değişince tetikleyici onları boşaltır ve
+    ``ortak_koordinatlari_yenile`` yeniden hesaplar. Dilimi bilinmeyen kayıtlar
+    (``VARSAYILAN_DILIM_MERIDYENI`` de yoksa) indekse girmez.
+    """
+    from cekirdek.koordinat import VARSAYILAN_SISTEM
+    from cekirdek.konum import ortak_koordinatlari_yenile
+
+    sutunlar = {s[1] for s in cursor.execute("PRAGMA table_info(TapuBilgileri)")}
+    for sutun, tur in (("koordinat_sistemi", "TEXT"), ("dilim_meridyeni", "INTEGER"),
+                       ("ortak_x", "REAL"), ("ortak_y", "REAL")):
+        if sutun not in sutunlar:
+            cursor.execute(f"ALTER TABLE TapuBilgileri ADD COLUMN {sutun} {tur}")
+    cursor.execute("UPDATE TapuBilgileri SET koordinat_sistemi = ? WHERE koordinat_sistemi IS NULL",
+                   (VARSAYILAN_SISTEM,))
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tapu_ortak_bekleyen ON TapuBilgileri(id)
+        WHERE ortak_x IS NULL AND koordinat_x IS NOT NULL AND koordinat_y IS NOT NULL
+    """)
+
+    cursor.execute("DROP TRIGGER IF EXISTS trg_tapu_konum_ekle")
+    cursor.execute("DROP TRIGGER IF EXISTS trg_tapu_konum_guncelle")
+    cursor.execute("DELETE FROM TapuKonumlari")
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_tapu_ortak_bosalt
+        AFTER UPDATE OF koordinat_x, koordinat_y, koordinat_sistemi, dilim_meridyeni ON TapuBilgileri
+        BEGIN
+            UPDATE TapuBilgileri SET ortak_x = NULL, ortak_y = NULL WHERE id = NEW.id;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_tapu_ortak_ekle AFTER INSERT ON TapuBilgileri
+        WHEN NEW.ortak_x IS NOT NULL AND NEW.ortak_y IS NOT NULL
+        BEGIN
+            INSERT OR REPLACE INTO TapuKonumlari
+            VALUES (NEW.id, NEW.ortak_x, NEW.ortak_x, NEW.ortak_y, NEW.ortak_y);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_tapu_ortak_guncelle
+        AFTER UPDATE OF ortak_x, ortak_y ON TapuBilgileri
+        BEGIN
+            DELETE FROM TapuKonumlari WHERE id = OLD.id;
+            INSERT INTO TapuKonumlari
+            SELECT NEW.id, NEW.ortak_x, NEW.ortak_x, NEW.ortak_y, NEW.ortak_y
+            WHERE NEW.ortak_x IS NOT NULL AND NEW.ortak_y IS NOT NULL;
+        END
+    """)
+    ortak_koordinatlari_yenile(cursor)
+
+# Şema göçleri sırayla uygulanır; uygulanan son göçün sırası PRAGMA user_version'da tutulur.
+# Yeni göç yalnızca listenin sonuna eklenir.
+GOCLER = [
+    _goc_kuyular,
+    _goc_konum_indeksi,
+    _goc_proje_ozetleri,
+    _goc_degisiklik_zamani,
+    _goc_iso_tarihler,
+    _goc_konum_dilimleri,
+]
+
+def sema_guncelle(conn):
+    """
+    Bekleyen şema göçlerini tek işlemde uygular.
+
+    Args:
+        conn (sqlite3.Connection): Veritabanı bağlantısı
+
+    Returns:
+        int: Uygulanan göç sayısı
+    """
+    surum = conn.execute("PRAGMA user_version").fetchone()[0]
+    bekleyen = GOCLER[surum:]
+    if not bekleyen:
+        return 0
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SAVEPOINT sema_gocu")
+        for goc in bekleyen:
+            goc(cursor)
+        cursor.execute(f"PRAGMA user_version = {len(GOCLER)}")
+        cursor.execute("RELEASE sema_gocu")
+    except Exception as e:
+        cursor.execute("ROLLBACK TO sema_gocu")
+        cursor.execute("RELEASE sema_gocu")
+        hata_logla(f"Şema göçü hatası (sürüm {surum}): {str(e)}", e)
+        raise
+    print(f"Şema sürüm {surum} -> {len(GOCLER)} güncellendi.")
+    return len(bekleyen)
+
+def ilk_kuyu(conn, proje_id):
+    """
+    Projenin ilk kuyusunun ID'sini döndürür.
+
+    Returns:
+        int: SondajBilgileri ID; projede kuyu yoksa None
+    """
+    satir = conn.execute(
+        "SELECT id FROM SondajBilgileri WHERE proje_id = ? ORDER BY id LIMIT 1", (proje_id,)
+    ).fetchone()
+    return satir[0] if satir else None
+
+def varsayilan_kuyu(conn, proje_id):
+    """
+    Projenin ilk kuyusunun ID'sini döndürür; kuyu yoksa oluşturur.
+
+    Tek kuyulu ekranlar (sondaj formu, arazi formu, rapor) bu kuyuyla çalışır.
+
+    Returns:
+        int: SondajBilgileri ID
+    """
+    kuyu_id = ilk_kuyu(conn, proje_id)
+    if kuyu_id is not None:
+        return kuyu_id
+    cursor = conn.execute(
+        "INSERT INTO SondajBilgileri (proje_id, kuyu_adi) VALUES (?, ?)", (proje_id, VARSAYILAN_KUYU_ADI)
+    )
+    return cursor.lastrowid
+
+def sonraki_kuyu_adi(adlar):
+    """
+    Projeye eklenecek kuyunun adı: mevcut "SK-<n>" adlarının en büyüğünden sonraki.
+
+    Args:
+        adlar (iterable): Projenin mevcut kuyu adları
+
+    Returns:
+        str: Kuyu adı (ör. "SK-3")
+    """
+    numaralar = [int(ad[len(KUYU_ADI_ON_EKI):]) for ad in adlar
+                 if ad and ad.startswith(KUYU_ADI_ON_EKI) and ad[len(KUYU_ADI_ON_EKI):].isdigit()]
+    return f"{KUYU_ADI_ON_EKI}{max(numaralar, default=0) + 1}"
+
+def yeni_kuyu(conn, proje_id):
+    """
+    Projeye sıradaki adla boş bir kuyu ekler (commit çağırana bırakılır).
+
+    Returns:
+        int: SondajBilgileri ID
+    """
+    adlar = [satir[0] for satir in conn.execute(
+        "SELECT kuyu_adi FROM SondajBilgileri WHERE proje_id = ?", (proje_id,)
+    )]
+    cursor = conn.execute(
+        "INSERT INTO SondajBilgileri (proje_id, kuyu_adi) VALUES (?, ?)", (proje_id, sonraki_kuyu_adi(adlar))
+    )
+    return cursor.lastrowid
+
+def kuyu_ozetleri(conn, proje_id):
+    """
+    Projenin kuyularını arazi kayıtlarının özetiyle birlikte tek sorguda döndürür.
+
+    Returns:
+        list: Kuyu başına id, kuyu_adi, sondaj_derinligi, satir_sayisi,
+        son_derinlik, ortalama_n30, azami_n30 (sqlite3.Row)
+    """
+    return conn.execute("""
+        SELECT s.id, s.kuyu_adi, s.sondaj_derinligi,
+               COUNT(a.id) AS satir_sayisi,
+               MAX(a."Sondaj derinliği (m)") AS son_derinlik,
+               AVG(NULLIF(a."N30", 0)) AS ortalama_n30,
+               MAX(a."N30") AS azami_n30
+        FROM SondajBilgileri s
+        LEFT JOIN AraziBilgileri a ON a.sondaj_id = s.id
+        WHERE s.proje_id = ?
+        GROUP BY s.id
+        ORDER BY s.id
+    """, (proje_id,)).fetchall()
+
+def proje_ozeti(conn, proje_id):
+    """
+    Proje düzeyinde tüm kuyuları kapsayan özet (tek sorgu).
+
+    Returns:
+        sqlite3.Row: kuyu_sayisi, toplam_metraj, azami_derinlik, satir_sayisi,
+        ortalama_n30
+    """
+    return conn.execute("""
+        SELECT (SELECT COUNT(*) FROM SondajBilgileri WHERE proje_id = :p) AS kuyu_sayisi,
+               (SELECT SUM(sondaj_derinligi) FROM SondajBilgileri WHERE proje_id = :p) AS toplam_metraj,
+               MAX(a."Sondaj derinliği (m)") AS azami_derinlik,
+               COUNT(a.id) AS satir_sayisi,
+               AVG(NULLIF(a."N30", 0)) AS ortalama_n30
+        FROM AraziBilgileri a
+        WHERE a.proje_id = :p
+    """, {"p": proje_id}).fetchone()
+
+def tarih_araligi_kosulu(tarihten=None, tarihe=None, alan="bitis_tarihi", proje_sutunu="p.id"):
+    """
+    Kuyu tarihi aralıktaki projeler için WHERE koşulu.
+
+    Alt sorgu tarih indeksinde aralık taraması yapar; projeler taranmaz.
+
+    Args:
+        tarihten, tarihe (date veya str, optional): Dahil sınırlar (ISO); verilmeyen sınır açıktır
+        alan (str): ``TARIH_SUTUNLARI`` içinden sütun
+        proje_sutunu (str): Dış sorgudaki proje ID sütunu
+
+    Returns:
+        tuple: (SQL koşulu, parametreler); sınır verilmemişse ("1", ())
+    """
+    if alan not in TARIH_SUTUNLARI:
+        raise ValueError(f"Geçersiz tarih alanı: {alan}")
+    kosullar, parametreler = [], []
+    if tarihten is not None:
+        kosullar.append(f"{alan} >= ?")
+        parametreler.append(str(tarihten))
+    if tarihe is not None:
+        kosullar.append(f"{alan} <= ?")
+        parametreler.append(str(tarihe))
+    if not kosullar:
+        return "1", ()
+    return (f"{proje_sutunu} IN (SELECT proje_id FROM SondajBilgileri WHERE {' AND '.join(kosullar)})",
+            tuple(parametreler))
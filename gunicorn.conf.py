@@ -0,0 +1,38 @@
+# gunicorn -c gunicorn.conf.py wsgi:app
+import os
+import shutil
+import tempfile
+import multiprocessing
+
+# İşçiler tek günlük dosyasına ekler; döndürme dışarıdan (logrotate) yapılır.
+# Uygulama döndürmesi seçilirse her işçi kendi dosyasına (error_log.<pid>.txt) yazar.
+os.environ.setdefault('SONDAJ_LOG_DONDURME', 'dis')
+# /metrics tüm işçilerin toplamını versin diye işçiler ölçümlerini bu dizine yazar
+os.environ.setdefault('METRIK_DIZINI', os.path.join(tempfile.gettempdir(), 'sondaj_metrikleri'))
+
+bind = os.environ.get('SONDAJ_ADRES', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('SONDAJ_IS_PARCACIGI', '4'))
+# Uygulama ana süreçte bir kez yüklenir, işçiler hızlı başlar
+preload_app = True
+timeout = 120
+accesslog = '-'
+
+
+def on_starting(server):
+    # Önceki çalışmadan kalan işçi ölçümleri toplama katılmasın
+    shutil.rmtree(os.environ['METRIK_DIZINI'], ignore_errors=True)
+
+
+def post_fork(server, worker):
+    # Ana süreçte açılmış veritabanı bağlantıları işçiler arasında paylaşılmamalı
+    from wsgi import app
+    from main import db
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+
+def worker_exit(server, worker):
+    # İşçinin son ölçümleri toplama katılsın
+    from main import metrikler
+    metrikler.paylas(zorla=True)
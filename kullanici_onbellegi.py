@@ -0,0 +1,133 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+
+from flask_login import UserMixin
+from sqlalchemy import event
+
+# Süre dolunca kayıt veritabanından yeniden okunur; diğer işçi süreçlerindeki
+# değişiklikler en geç bu kadar gecikmeyle görülür
+KULLANICI_ONBELLEK_SURESI = float(os.environ.get("KULLANICI_ONBELLEK_SURESI", "300"))
+# Yönetici kimlikleri daha kısa tutulur; yetkisi alınan yönetici diğer süreçlerde
+# en geç bu kadar süre yönetici görünür (yönetici rotaları ayrıca yonetici_mi ile doğrular)
+YONETICI_ONBELLEK_SURESI = float(os.environ.get("YONETICI_ONBELLEK_SURESI", "5"))
+KULLANICI_ONBELLEK_BOYUTU = int(os.environ.get("KULLANICI_ONBELLEK_BOYUTU", "1024"))
+
+
+class KullaniciKimligi(UserMixin):
+    """
+    Oturumdaki kullanıcının salt okunur kimlik kaydı.
+
+    Veritabanı oturumuna bağlı değildir; istekler arasında ve iş
+    parçacıkları arasında güvenle paylaşılabilir. Parola özeti tutulmaz.
+    """
+    def __init__(self, id, username, email, is_admin):
+        self.id = id
+        self.username = username
+        self.email = email
+        self.is_admin = bool(is_admin)
+
+    @classmethod
+    def modelden(cls, kullanici):
+        return cls(kullanici.id, kullanici.username, kullanici.email, kullanici.is_admin)
+
+    def __repr__(self):
+        return f'<KullaniciKimligi {self.username}>'
+
+
+class KullaniciOnbellegi:
+    """
+    Kullanıcı kimlikleri için süre sınırlı LRU önbellek.
+
+    Her kimlik doğrulamalı istekte yapılan ``User`` sorgusunun yerine sözlük
+    araması yapılır. Kullanıcı güncellendiğinde veya silindiğinde kaydı ORM
+    olaylarıyla bu süreçte hemen silinir; diğer süreçlerde süre dolunca
+    yenilenir. Yönetici kimliklerinin süresi kısadır ve yönetici yetkisi
+    isteyen rotalar ``yonetici_mi`` ile veritabanını yeniden sorgular.
+    """
+    def __init__(self, sure=KULLANICI_ONBELLEK_SURESI, boyut=KULLANICI_ONBELLEK_BOYUTU,
+                 yonetici_suresi=YONETICI_ONBELLEK_SURESI):
+        self.sure = sure
+        self.yonetici_suresi = yonetici_suresi
+        self.boyut = boyut
+        self.kayitlar = OrderedDict()
+        self.kilit = threading.Lock()
+        self.isabet = 0
+        self.iska = 0
+        self.model = None
+
+    def init_app(self, app, model):
+        """
+        Kullanıcı modeline geçersiz kılma olaylarını bağlar.
+
+        Args:
+            app (Flask): Uygulama
+            model: Kullanıcı modeli (id, username, email, is_admin alanlı)
+        """
+        app.extensions["kullanici_onbellegi"] = self
+        if self.model is not model:
+            self.model = model
+            event.listen(model, "after_update", self._degisti)
+            event.listen(model, "after_delete", self._degisti)
+
+    def _degisti(self, mapper, baglanti, hedef):
+        self.sil(hedef.id)
+
+    def getir(self, kullanici_id):
+        """
+        Kimliği önbellekten, yoksa veritabanından döndürür.
+
+        Returns:
+            KullaniciKimligi: Kimlik kaydı; kullanıcı yoksa None
+        """
+        simdi = time.monotonic()
+        with self.kilit:
+            kayit = self.kayitlar.get(kullanici_id)
+            if kayit is not None and kayit[1] > simdi:
+                self.kayitlar.move_to_end(kullanici_id)
+                self.isabet += 1
+                return kayit[0]
+            self.iska += 1
+
+        return self._yukle(kullanici_id, simdi)
+
+    def _yukle(self, kullanici_id, simdi=None):
+        kullanici = self.model.query.get(kullanici_id)
+        if kullanici is None:
+            self.sil(kullanici_id)
+            return None
+        kimlik = KullaniciKimligi.modelden(kullanici)
+        self.ekle(kimlik, simdi)
+        return kimlik
+
+    def yonetici_mi(self, kullanici_id):
+        """
+        Yönetici yetkisini önbelleğe bakmadan veritabanından doğrular.
+
+        Diğer süreçlerde alınan yetki veya silinen kullanıcı hemen görülür;
+        önbellekteki kayıt da yenilenir.
+
+        Returns:
+            bool: Kullanıcı var ve yöneticiyse True
+        """
+        kimlik = self._yukle(kullanici_id)
+        return kimlik is not None and kimlik.is_admin
+
+    def ekle(self, kimlik, simdi=None):
+        """Kimliği önbelleğe koyar (ör. girişte, sonraki istek sorgusuz olsun)"""
+        bitis = (simdi if simdi is not None else time.monotonic()) + (
+            self.yonetici_suresi if kimlik.is_admin else self.sure)
+        with self.kilit:
+            self.kayitlar[kimlik.id] = (kimlik, bitis)
+            self.kayitlar.move_to_end(kimlik.id)
+            while len(self.kayitlar) > self.boyut:
+                self.kayitlar.popitem(last=False)
+
+    def sil(self, kullanici_id):
+        with self.kilit:
+            self.kayitlar.pop(kullanici_id, None)
+
+    def temizle(self):
+        with self.kilit:
+            self.kayitlar.clear()
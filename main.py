@@ -1,35 +1,99 @@
 import os
 import logging
-from flask import Flask, render_template, request, flash, redirect, url_for, jsonify, session
+import click
+from flask import Flask, Response, render_template, request, flash, redirect, url_for, jsonify, session, send_file, abort, g, current_app
+from flask.cli import with_appcontext
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 from flask_migrate import Migrate
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, SubmitField, FloatField, DateField, SelectField, BooleanField, TextAreaField
 from wtforms.validators import DataRequired, Length, Email
 import json
+import unicodedata
+from urllib.parse import quote
 from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
+from rapor_kuyrugu import RaporKuyrugu, RaporIsciHavuzu, WebRaporOlusturucu, DURUM_TAMAMLANDI
+from cekirdek.hesaplamalar import (
+    metraj_noktalari, bos_arazi_kaydi, ud_derinliklerini_ayristir, ud_orneklerini_yerlestir
+)
+from cekirdek.rapor import rapor_akisi
+from cekirdek.gunluk import gunluge_bagla, baglam_ayarla, baglam_sifirla
+from web_metrikleri import IstekMetrikleri
+from web_profili import IstekProfilleyici
+from kullanici_onbellegi import KullaniciOnbellegi, KullaniciKimligi
+from web_analiz import (
+    AnalizOnbellegi, analiz_verisi, grafik_verisi, GRAFIKLER, GRAFIK_NOKTA_SAYISI, GRAFIK_AZAMI_NOKTA
+)
+from web_konum import KonumIndeksi, ProfilTahmini, ortak_duzlem_noktalari
+from web_istatistik import ArsivIstatistikleri
+from cekirdek.veri_koprusu import AraziKayitlari, TUM_SUTUNLAR
+from cekirdek.koordinat import (
+    KOORDINAT_SISTEMLERI, VARSAYILAN_SISTEM, DILIM_MERIDYENLERI, VARSAYILAN_DILIM_MERIDYENI, wgs84e
+)
+from cekirdek.enterpolasyon import YONTEMLER
+from cekirdek.istatistik import PARAMETRELER as ISTATISTIK_PARAMETRELERI, GRUPLAR as ISTATISTIK_GRUPLARI
+from cekirdek.veritabani import sonraki_kuyu_adi
+from ayarlar import ayarlari_sec, motor_secenekleri, motor_olaylarini_bagla
 
-# Uygulama oluşturma
-app = Flask(__name__)
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'gizli_anahtar')
-app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///sondaj_veritabani.db')
-app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
-    "pool_pre_ping": True,
-    "pool_recycle": 300,
-    "connect_args": {
-        "sslmode": "prefer"
-    }
-}
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Rota kaydı: rotalar uygulama nesnesinden bağımsız tanımlanır, create_app() içinde
+# uç nokta adları değişmeden (url_for('dashboard') vb.) uygulamaya eklenir
+class RotaKaydi:
+    """
+    Rotaları, istek kancalarını ve hata işleyicilerini toplayıp uygulamaya ekler.
+
+    Blueprint'ten farkı uç nokta adlarına önek eklememesidir; böylece
+    şablonlardaki ``url_for`` çağrıları değişmez.
+    """
+    def __init__(self):
+        self.kayitlar = []
+
+    def route(self, kural, **secenekler):
+        def kaydet(fonksiyon):
+            uc_nokta = secenekler.pop('endpoint', fonksiyon.__name__)
+            self.kayitlar.append(('add_url_rule', (kural, uc_nokta, fonksiyon), secenekler))
+            return fonksiyon
+        return kaydet
+
+    def before_request(self, fonksiyon):
+        self.kayitlar.append(('before_request', (fonksiyon,), {}))
+        return fonksiyon
+
+    def teardown_request(self, fonksiyon):
+        self.kayitlar.append(('teardown_request', (fonksiyon,), {}))
+        return fonksiyon
 
-# Veritabanı ve Migrasyon Ayarları
-db = SQLAlchemy(app)
-migrate = Migrate(app, db)
+    def errorhandler(self, kod):
+        def kaydet(fonksiyon):
+            self.kayitlar.append(('register_error_handler', (kod, fonksiyon), {}))
+            return fonksiyon
+        return kaydet
+
+    def init_app(self, app):
+        for yontem, args, kwargs in self.kayitlar:
+            getattr(app, yontem)(*args, **kwargs)
+
+rotalar = RotaKaydi()
+
+# Eklentiler (uygulamaya create_app() içinde bağlanır)
+db = SQLAlchemy()
+migrate = Migrate()
+metrikler = IstekMetrikleri()
+profilleyici = IstekProfilleyici()
+kullanici_onbellegi = KullaniciOnbellegi()
+analiz_onbellegi = AnalizOnbellegi()
+konum_indeksi = KonumIndeksi()
+profil_tahmini = ProfilTahmini()
+arsiv_istatistikleri = ArsivIstatistikleri()
+
+# Rapor Kuyruğu (dosyası create_app() içinde ayarlardan açılır)
+rapor_kuyrugu = RaporKuyrugu()
+RAPOR_ONBELLEK_SURESI = 3600  # Tamamlanan raporlar değişmediği için tarayıcıda tutulabilir
 
 # Login Manager Ayarları
-login_manager = LoginManager(app)
+login_manager = LoginManager()
 login_manager.login_view = 'login'
 login_manager.login_message = 'Lütfen giriş yapın.'
 login_manager.login_message_category = 'warning'
@@ -55,12 +119,20 @@ class Proje(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     tapu_bilgileri = db.relationship('TapuBilgileri', backref='proje', uselist=False, cascade='all, delete-orphan')
-    sondaj_bilgileri = db.relationship('SondajBilgileri', backref='proje', uselist=False, cascade='all, delete-orphan')
+    # Her SondajBilgileri satırı projenin bir kuyusudur
+    kuyular = db.relationship('SondajBilgileri', backref='proje', order_by='SondajBilgileri.id', cascade='all, delete-orphan')
     arazi_bilgileri = db.relationship('AraziBilgileri', backref='proje', lazy='dynamic', cascade='all, delete-orphan')
+    # Özet satırı flush sonunda SQL ile yenilenir; ORM üzerinden yazılmaz
+    ozet = db.relationship('ProjeOzeti', uselist=False, viewonly=True)
     
     def __repr__(self):
         return f'<Proje {self.proje_adi}>'
     
+    @property
+    def sondaj_bilgileri(self):
+        """Projenin ilk kuyusu (tek kuyulu ekranlar için)"""
+        return self.kuyular[0] if self.kuyular else None
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -80,8 +152,11 @@ class TapuBilgileri(db.Model):
     ada = db.Column(db.String(64))
     pafta = db.Column(db.String(64))
     parsel = db.Column(db.String(64))
-    koordinat_x = db.Column(db.Float)
-    koordinat_y = db.Column(db.Float)
+    koordinat_x = db.Column(db.Float)  # Sağa değer (doğu)
+    koordinat_y = db.Column(db.Float)  # Yukarı değer (kuzey)
+    # 3 derecelik TM dilimi: datum (ITRF96/ED50) ve orta meridyen; harita için WGS84'e çevrilir
+    koordinat_sistemi = db.Column(db.String(16), default=VARSAYILAN_SISTEM)
+    dilim_meridyeni = db.Column(db.Integer)
     
     def __repr__(self):
         return f'<TapuBilgileri {self.id}>'
@@ -97,17 +172,21 @@ class TapuBilgileri(db.Model):
             'pafta': self.pafta,
             'parsel': self.parsel,
             'koordinat_x': self.koordinat_x,
-            'koordinat_y': self.koordinat_y
+            'koordinat_y': self.koordinat_y,
+            'koordinat_sistemi': self.koordinat_sistemi,
+            'dilim_meridyeni': self.dilim_meridyeni
         }
 
 class SondajBilgileri(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    proje_id = db.Column(db.Integer, db.ForeignKey('proje.id'), nullable=False)
+    proje_id = db.Column(db.Integer, db.ForeignKey('proje.id'), nullable=False, index=True)
+    kuyu_adi = db.Column(db.String(64))
     sondor_adi = db.Column(db.String(128))
     sondaj_kotu = db.Column(db.Float)
     sondaj_derinligi = db.Column(db.Float)
-    baslama_tarihi = db.Column(db.Date)
-    bitis_tarihi = db.Column(db.Date)
+    # Tarih aralığı süzgeçleri indeks aralık taramasıyla çalışır
+    baslama_tarihi = db.Column(db.Date, index=True)
+    bitis_tarihi = db.Column(db.Date, index=True)
     delgi_capi = db.Column(db.Float)
     yer_alti_suyu = db.Column(db.Float)
     ud_ornekleri = db.Column(db.String(256))
@@ -115,6 +194,8 @@ class SondajBilgileri(db.Model):
     makine_tipi = db.Column(db.String(128))
     spt_sahmerdan_tipi = db.Column(db.String(128))
     
+    arazi_bilgileri = db.relationship('AraziBilgileri', backref='sondaj', lazy='dynamic')
+    
     def __repr__(self):
         return f'<SondajBilgileri {self.id}>'
     
@@ -122,6 +203,7 @@ class SondajBilgileri(db.Model):
         return {
             'id': self.id,
             'proje_id': self.proje_id,
+            'kuyu_adi': self.kuyu_adi,
             'sondor_adi': self.sondor_adi,
             'sondaj_kotu': self.sondaj_kotu,
             'sondaj_derinligi': self.sondaj_derinligi,
@@ -137,7 +219,9 @@ class SondajBilgileri(db.Model):
 
 class AraziBilgileri(db.Model):
     id = db.Column(db.Integer, primary_key=True)
+    # proje_id kuyudan türetilebilir; proje düzeyindeki toplu sorgular birleştirme yapmasın diye tutulur
     proje_id = db.Column(db.Integer, db.ForeignKey('proje.id'), nullable=False)
+    sondaj_id = db.Column(db.Integer, db.ForeignKey('sondaj_bilgileri.id'))
     sondaj_derinligi = db.Column(db.Float, nullable=True)
     muhafaza_borusu_derinligi = db.Column(db.Float, nullable=True)
     kuyu_ici_deneyler = db.Column(db.String(256), nullable=True)
@@ -156,6 +240,12 @@ class AraziBilgileri(db.Model):
     zemin_profili = db.Column(db.String(128), nullable=True)
     zemin_tanimlamasi = db.Column(db.String(256), nullable=True)
     
+    # Analiz sorguları proje/kuyu içinde derinliğe göre sıralı okur
+    __table_args__ = (
+        db.Index('ix_arazi_proje_derinlik', 'proje_id', 'sondaj_derinligi'),
+        db.Index('ix_arazi_sondaj_derinlik', 'sondaj_id', 'sondaj_derinligi'),
+    )
+    
     def __repr__(self):
         return f'<AraziBilgileri {self.id}>'
     
@@ -163,6 +253,7 @@ class AraziBilgileri(db.Model):
         return {
             'id': self.id,
             'proje_id': self.proje_id,
+            'sondaj_id': self.sondaj_id,
             'sondaj_derinligi': self.sondaj_derinligi,
             'muhafaza_borusu_derinligi': self.muhafaza_borusu_derinligi,
             'kuyu_ici_deneyler': self.kuyu_ici_deneyler,
@@ -182,6 +273,223 @@ class AraziBilgileri(db.Model):
             'zemin_tanimlamasi': self.zemin_tanimlamasi
         }
 
+class ProjeOzeti(db.Model):
+    """
+    Proje başına önceden hesaplanmış liste özeti.
+
+    Alt kayıtlar değiştiğinde aynı işlemde ``proje_ozetlerini_yenile`` ile
+    güncellenir; sapma olursa ``flask --app main proje-ozetleri`` tümünü
+    yeniden hesaplar.
+    """
+    __tablename__ = 'proje_ozetleri'
+    proje_id = db.Column(db.Integer, db.ForeignKey('proje.id', ondelete='CASCADE'), primary_key=True)
+    kuyu_sayisi = db.Column(db.Integer, nullable=False, default=0)
+    kuyu_derinligi = db.Column(db.Float)
+    satir_sayisi = db.Column(db.Integer, nullable=False, default=0)
+    azami_derinlik = db.Column(db.Float)
+    n30_en_kucuk = db.Column(db.Integer)
+    n30_ortalama = db.Column(db.Float)
+    n30_en_buyuk = db.Column(db.Integer)
+    baskin_zemin = db.Column(db.String(256))
+    son_arazi_tarihi = db.Column(db.Date)
+    guncelleme_zamani = db.Column(db.DateTime)
+    
+    def to_dict(self):
+        return {
+            'kuyu_sayisi': self.kuyu_sayisi,
+            'kuyu_derinligi': self.kuyu_derinligi,
+            'satir_sayisi': self.satir_sayisi,
+            'azami_derinlik': self.azami_derinlik,
+            'n30_en_kucuk': self.n30_en_kucuk,
+            'n30_ortalama': self.n30_ortalama,
+            'n30_en_buyuk': self.n30_en_buyuk,
+            'baskin_zemin': self.baskin_zemin,
+            'son_arazi_tarihi': self.son_arazi_tarihi.isoformat() if self.son_arazi_tarihi else None,
+            'guncelleme_zamani': self.guncelleme_zamani.isoformat() if self.guncelleme_zamani else None
+        }
+
+# Proje sürümü: alt kayıtlar değiştiğinde Proje.updated_at ilerletilir, böylece
+# updated_at sürüme bağlı önbellekler (analiz verisi vb.) için anahtar olarak kullanılabilir
+PROJE_ALT_MODELLERI = (TapuBilgileri, SondajBilgileri, AraziBilgileri)
+
+def proje_surumunu_artir(proje):
+    """Toplu sorgularla (Query.delete vb.) yapılan değişikliklerden sonra çağrılmalı"""
+    proje.updated_at = datetime.utcnow()
+
+@event.listens_for(db.session, 'before_flush')
+def proje_surumlerini_guncelle(oturum, flush_baglami, nesneler):
+    proje_idleri = set()
+    projeler = []
+    ozet_projeleri = []
+    for nesne in list(oturum.new) + list(oturum.dirty) + list(oturum.deleted):
+        if isinstance(nesne, Proje):
+            # Yeni/silinen projeler ve toplu sorgudan sonra sürümü artırılan projeler
+            ozet_projeleri.append(nesne)
+            continue
+        if not isinstance(nesne, PROJE_ALT_MODELLERI):
+            continue
+        if nesne in oturum.dirty and not oturum.is_modified(nesne):
+            continue
+        if nesne.proje_id is not None:
+            proje_idleri.add(nesne.proje_id)
+        elif nesne.proje is not None:
+            projeler.append(nesne.proje)
+    projeler.extend(oturum.get(Proje, proje_id) for proje_id in proje_idleri)
+    for proje in projeler:
+        if proje is not None and proje not in oturum.deleted:
+            proje_surumunu_artir(proje)
+    # Yeni projelerin ID'si flush sonrasında belli olur; özet için nesneler saklanır
+    oturum.info.setdefault('ozeti_bayat', []).extend(p for p in projeler + ozet_projeleri if p is not None)
+
+@event.listens_for(db.session, 'after_flush')
+def proje_ozetlerini_guncelle(oturum, flush_baglami):
+    proje_idleri = {p.id for p in oturum.info.pop('ozeti_bayat', []) if p.id is not None}
+    if proje_idleri:
+        proje_ozetlerini_yenile(oturum.connection(), proje_idleri)
+
+@event.listens_for(db.session, 'after_rollback')
+def bayat_ozetleri_unut(oturum):
+    oturum.info.pop('ozeti_bayat', None)
+
+def proje_ozetlerini_yenile(baglanti, proje_idleri=None, yalnizca_eksik=False):
+    """
+    Proje özetlerini alt tablolardan yeniden hesaplar.
+
+    Her sütun projenin (proje_id, derinlik) indeksiyle okunan ilişkili alt
+    sorgudur; silinmiş projelerin özet satırı kaldırılır.
+
+    Args:
+        baglanti: SQLAlchemy bağlantısı (çağıranın işlemi içinde)
+        proje_idleri (iterable, optional): Yalnızca bu projeler; verilmezse tümü
+        yalnizca_eksik (bool): Tümü yerine yalnızca özeti olmayan projeler
+    """
+    tablo = ProjeOzeti.__table__
+    if proje_idleri is not None:
+        proje_idleri = sorted(set(proje_idleri))
+        baglanti.execute(db.delete(tablo).where(tablo.c.proje_id.in_(proje_idleri)))
+        kosul = Proje.id.in_(proje_idleri)
+    elif yalnizca_eksik:
+        kosul = ~db.exists().where(tablo.c.proje_id == Proje.id)
+    else:
+        baglanti.execute(db.delete(tablo))
+        kosul = db.true()
+
+    def arazi(ifade):
+        return db.select(ifade).where(AraziBilgileri.proje_id == Proje.id).scalar_subquery()
+
+    def kuyu(ifade):
+        return db.select(ifade).where(SondajBilgileri.proje_id == Proje.id).scalar_subquery()
+
+    n30 = db.func.nullif(AraziBilgileri.n30, 0)
+    baskin_zemin = (db.select(AraziBilgileri.zemin_tanimlamasi)
+                    .where(AraziBilgileri.proje_id == Proje.id,
+                           AraziBilgileri.zemin_tanimlamasi.is_not(None), AraziBilgileri.zemin_tanimlamasi != '')
+                    .group_by(AraziBilgileri.zemin_tanimlamasi)
+                    .order_by(db.func.count().desc(), AraziBilgileri.zemin_tanimlamasi)
+                    .limit(1).scalar_subquery())
+    sorgu = db.select(
+        Proje.id,
+        kuyu(db.func.count()),
+        kuyu(db.func.max(SondajBilgileri.sondaj_derinligi)),
+        arazi(db.func.count()),
+        arazi(db.func.max(AraziBilgileri.sondaj_derinligi)),
+        arazi(db.func.min(n30)),
+        arazi(db.func.avg(n30)),
+        arazi(db.func.max(n30)),
+        baskin_zemin,
+        kuyu(db.func.coalesce(db.func.max(SondajBilgileri.bitis_tarihi), db.func.max(SondajBilgileri.baslama_tarihi))),
+        db.literal(datetime.utcnow(), db.DateTime),
+    ).where(kosul)
+    baglanti.execute(tablo.insert().from_select(
+        ['proje_id', 'kuyu_sayisi', 'kuyu_derinligi', 'satir_sayisi', 'azami_derinlik', 'n30_en_kucuk',
+         'n30_ortalama', 'n30_en_buyuk', 'baskin_zemin', 'son_arazi_tarihi', 'guncelleme_zamani'], sorgu))
+
+def proje_surumu(proje_id):
+    """Projenin sürüm zaman damgasını tek sütunluk sorguyla döndürür (yoksa 404)"""
+    surum = db.session.query(Proje.updated_at).filter_by(id=proje_id).scalar()
+    if surum is None:
+        abort(404)
+    return surum
+
+# Kuyular
+VARSAYILAN_KUYU_ADI = 'SK-1'
+
+def proje_kuyusu(proje, kuyu_id=None):
+    """
+    Projenin istenen kuyusunu döndürür.
+
+    Kuyu verilmezse projenin ilk kuyusu kullanılır; projede hiç kuyu yoksa
+    oluşturulur (oturuma eklenir, commit çağırana bırakılır).
+
+    Args:
+        proje (Proje): Proje
+        kuyu_id (int, optional): SondajBilgileri ID
+
+    Returns:
+        SondajBilgileri: Kuyu
+    """
+    if kuyu_id is not None:
+        return SondajBilgileri.query.filter_by(id=kuyu_id, proje_id=proje.id).first_or_404()
+    if proje.sondaj_bilgileri:
+        return proje.sondaj_bilgileri
+    kuyu = SondajBilgileri(proje_id=proje.id, kuyu_adi=VARSAYILAN_KUYU_ADI)
+    proje.kuyular.append(kuyu)
+    db.session.flush()
+    return kuyu
+
+def yeni_kuyu(proje):
+    """
+    Projeye sıradaki adla (SK-2, SK-3, ...) boş bir kuyu ekler.
+
+    Kuyu oturuma eklenir, commit çağırana bırakılır.
+
+    Returns:
+        SondajBilgileri: Yeni kuyu
+    """
+    kuyu = SondajBilgileri(proje_id=proje.id, kuyu_adi=sonraki_kuyu_adi(k.kuyu_adi for k in proje.kuyular))
+    proje.kuyular.append(kuyu)
+    db.session.flush()
+    return kuyu
+
+def kuyu_ozetleri(proje_id):
+    """
+    Projenin kuyularını arazi kayıtlarının özetiyle tek sorguda döndürür.
+
+    Returns:
+        list: Kuyu başına sözlük (id, kuyu_adi, sondaj_derinligi, satir_sayisi,
+        son_derinlik, ortalama_n30, azami_n30)
+    """
+    n30 = db.func.nullif(AraziBilgileri.n30, 0)
+    sorgu = (db.select(SondajBilgileri.id, SondajBilgileri.kuyu_adi, SondajBilgileri.sondaj_derinligi,
+                       db.func.count(AraziBilgileri.id).label('satir_sayisi'),
+                       db.func.max(AraziBilgileri.sondaj_derinligi).label('son_derinlik'),
+                       db.func.avg(n30).label('ortalama_n30'),
+                       db.func.max(AraziBilgileri.n30).label('azami_n30'))
+             .outerjoin(AraziBilgileri, AraziBilgileri.sondaj_id == SondajBilgileri.id)
+             .where(SondajBilgileri.proje_id == proje_id)
+             .group_by(SondajBilgileri.id)
+             .order_by(SondajBilgileri.id))
+    return [dict(satir._mapping) for satir in db.session.execute(sorgu)]
+
+def proje_ozeti(proje_id):
+    """
+    Proje düzeyinde tüm kuyuları kapsayan özet (tek sorgu).
+
+    Returns:
+        dict: kuyu_sayisi, toplam_metraj, azami_derinlik, satir_sayisi, ortalama_n30
+    """
+    kuyu_sayisi = (db.select(db.func.count(SondajBilgileri.id))
+                   .where(SondajBilgileri.proje_id == proje_id).scalar_subquery())
+    toplam_metraj = (db.select(db.func.sum(SondajBilgileri.sondaj_derinligi))
+                     .where(SondajBilgileri.proje_id == proje_id).scalar_subquery())
+    sorgu = (db.select(kuyu_sayisi.label('kuyu_sayisi'),
+                       toplam_metraj.label('toplam_metraj'),
+                       db.func.max(AraziBilgileri.sondaj_derinligi).label('azami_derinlik'),
+                       db.func.count(AraziBilgileri.id).label('satir_sayisi'),
+                       db.func.avg(db.func.nullif(AraziBilgileri.n30, 0)).label('ortalama_n30'))
+             .where(AraziBilgileri.proje_id == proje_id))
+    return dict(db.session.execute(sorgu).one()._mapping)
+
 # Formlar
 class LoginForm(FlaskForm):
     username = StringField('Kullanıcı Adı', validators=[DataRequired()])
@@ -204,6 +512,12 @@ class TapuBilgileriForm(FlaskForm):
     parsel = StringField('Parsel')
     koordinat_x = FloatField('Koordinat X')
     koordinat_y = FloatField('Koordinat Y')
+    koordinat_sistemi = SelectField('Datum', choices=[(ad, ad) for ad in KOORDINAT_SISTEMLERI],
+                                    default=VARSAYILAN_SISTEM, validate_choice=False)
+    dilim_meridyeni = SelectField('Dilim Orta Meridyeni',
+                                  choices=[('', 'Belirtilmemiş')] + [(m, f'{m}°') for m in DILIM_MERIDYENLERI],
+                                  coerce=lambda deger: int(deger) if deger not in (None, '', 'None') else None,
+                                  validate_choice=False)
     submit = SubmitField('Kaydet')
 
 class SondajBilgileriForm(FlaskForm):
@@ -240,10 +554,10 @@ class AraziBilgileriForm(FlaskForm):
     zemin_tanimlamasi = StringField('Zemin Tanımlaması')
     submit = SubmitField('Kaydet')
 
-# Kullanıcı yükleme
+# Kullanıcı yükleme: kimlik kaydı önbellekten gelir, istek başına sorgu yapılmaz
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    return kullanici_onbellegi.getir(int(user_id))
 
 # Demo kullanıcısı oluşturma fonksiyonu
 def create_demo_user():
@@ -267,48 +581,215 @@ def create_demo_user():
     
     db.session.commit()
 
-# Flask 2.0+ için alternatif ilk çalıştırma işlemi
-with app.app_context():
+def kuyu_gocu():
+    """
+    Tek kuyulu şemadan çok kuyulu şemaya geçiş (tekrar çalıştırılabilir).
+
+    Eksik sütunları ekler, arazi kaydı olup kuyusu olmayan projelere kuyu
+    açar ve kuyusuz arazi kayıtlarını projenin ilk kuyusuna bağlar.
+    """
+    denetci = db.inspect(db.engine)
+    sondaj_sutunlari = {s['name'] for s in denetci.get_columns('sondaj_bilgileri')}
+    arazi_sutunlari = {s['name'] for s in denetci.get_columns('arazi_bilgileri')}
+    with db.engine.begin() as baglanti:
+        if 'kuyu_adi' not in sondaj_sutunlari:
+            baglanti.execute(db.text('ALTER TABLE sondaj_bilgileri ADD COLUMN kuyu_adi VARCHAR(64)'))
+        if 'sondaj_id' not in arazi_sutunlari:
+            baglanti.execute(db.text(
+                'ALTER TABLE arazi_bilgileri ADD COLUMN sondaj_id INTEGER REFERENCES sondaj_bilgileri(id)'))
+        baglanti.execute(db.text("""
+            INSERT INTO sondaj_bilgileri (proje_id, kuyu_adi)
+            SELECT DISTINCT a.proje_id, :kuyu_adi FROM arazi_bilgileri a
+            WHERE a.sondaj_id IS NULL
+              AND NOT EXISTS (SELECT 1 FROM sondaj_bilgileri s WHERE s.proje_id = a.proje_id)
+        """), {'kuyu_adi': VARSAYILAN_KUYU_ADI})
+        baglanti.execute(db.text("""
+            UPDATE sondaj_bilgileri SET kuyu_adi = 'SK-' || CAST(
+                (SELECT COUNT(*) FROM sondaj_bilgileri o
+                 WHERE o.proje_id = sondaj_bilgileri.proje_id AND o.id <= sondaj_bilgileri.id) AS VARCHAR(16))
+            WHERE kuyu_adi IS NULL
+        """))
+        baglanti.execute(db.text("""
+            UPDATE arazi_bilgileri
+            SET sondaj_id = (SELECT MIN(s.id) FROM sondaj_bilgileri s WHERE s.proje_id = arazi_bilgileri.proje_id)
+            WHERE sondaj_id IS NULL
+        """))
+    # create_all yeni sütunlardan önce var olan tablolarda indeksleri oluşturmaz
+    for indeks in (*AraziBilgileri.__table__.indexes, *SondajBilgileri.__table__.indexes):
+        indeks.create(db.engine, checkfirst=True)
+
+def koordinat_sistemi_gocu():
+    """Tapu tablosuna datum ve dilim sütunlarını ekler (tekrar çalıştırılabilir)"""
+    sutunlar = {s['name'] for s in db.inspect(db.engine).get_columns('tapu_bilgileri')}
+    with db.engine.begin() as baglanti:
+        if 'koordinat_sistemi' not in sutunlar:
+            baglanti.execute(db.text('ALTER TABLE tapu_bilgileri ADD COLUMN koordinat_sistemi VARCHAR(16)'))
+        if 'dilim_meridyeni' not in sutunlar:
+            baglanti.execute(db.text('ALTER TABLE tapu_bilgileri ADD COLUMN dilim_meridyeni INTEGER'))
+        baglanti.execute(db.text('UPDATE tapu_bilgileri SET koordinat_sistemi = :sistem WHERE koordinat_sistemi IS NULL'),
+                         {'sistem': VARSAYILAN_SISTEM})
+
+def veritabani_kur():
+    """Tabloları oluşturur, şemayı günceller ve demo kullanıcılarını ekler (uygulama bağlamında çağrılmalı)"""
     db.create_all()
+    kuyu_gocu()
+    koordinat_sistemi_gocu()
+    with db.engine.begin() as baglanti:
+        proje_ozetlerini_yenile(baglanti, yalnizca_eksik=True)
     create_demo_user()
 
+@click.command('proje-ozetleri')
+@with_appcontext
+def proje_ozetleri_komutu():
+    """Tüm proje özetlerini yeniden hesaplar: flask --app main proje-ozetleri"""
+    with db.engine.begin() as baglanti:
+        proje_ozetlerini_yenile(baglanti)
+    click.echo(f'{db.session.query(ProjeOzeti).count()} proje özeti yenilendi.')
+
+@click.command('veritabani-kur')
+@with_appcontext
+def veritabani_kur_komutu():
+    """Şemayı ve demo kullanıcılarını oluşturur: flask --app main veritabani-kur"""
+    veritabani_kur()
+    click.echo('Veritabanı hazır.')
+
+def create_app(ortam=None):
+    """
+    Uygulama fabrikası.
+
+    Şema oluşturma burada yapılmaz; bir kez ``flask --app main veritabani-kur``
+    (veya ``flask db upgrade``) çalıştırılmalıdır. Böylece çok süreçli
+    sunucuda işçiler ``create_all`` için yarışmaz.
+
+    Args:
+        ortam (str, optional): gelistirme, uretim veya test (bkz. ayarlar.py)
+
+    Returns:
+        Flask: Yapılandırılmış uygulama
+    """
+    ayarlar = ayarlari_sec(ortam)
+    app = Flask(__name__)
+    app.config.from_object(ayarlar)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = motor_secenekleri(app.config['SQLALCHEMY_DATABASE_URI'], ayarlar)
+
+    # Uygulama günlüğü de kuyruk üzerinden arka planda dosyaya yazılır
+    gunluge_bagla(app.logger)
+
+    db.init_app(app)
+    migrate.init_app(app, db)
+    login_manager.init_app(app)
+    kullanici_onbellegi.init_app(app, User)
+    konum_indeksi.init_app(app, db, Proje, TapuBilgileri)
+    profil_tahmini.init_app(app, db, Proje, TapuBilgileri, AraziBilgileri)
+    arsiv_istatistikleri.init_app(app, db, Proje, ProjeOzeti, TapuBilgileri, AraziBilgileri)
+    rapor_kuyrugu.init_app(app)
+    rotalar.init_app(app)
+
+    with app.app_context():
+        motor_olaylarini_bagla(db.engine)
+        # İstek süresi, sorgu sayısı ve /metrics
+        metrikler.init_app(app, db.engine)
+
+    # Yöneticiler için istek bazında profil (?_profil=1 veya X-Profil başlığı)
+    profilleyici.init_app(app)
+
+    app.cli.add_command(veritabani_kur_komutu)
+    app.cli.add_command(proje_ozetleri_komutu)
+    return app
+
+# İstek bağlamı: bu istekte yazılan günlük kayıtlarına kullanıcı, rota ve proje eklenir
+@rotalar.before_request
+def gunluk_baglamini_ayarla():
+    g.gunluk_baglami = baglam_ayarla(
+        kullanici=current_user.username if current_user.is_authenticated else None,
+        islem=request.endpoint,
+        proje_id=(request.view_args or {}).get('proje_id')
+    )
+
+@rotalar.teardown_request
+def gunluk_baglamini_sifirla(exc):
+    token = g.pop('gunluk_baglami', None)
+    if token is not None:
+        baglam_sifirla(token)
+
 # Rotalar
-@app.route('/')
+@rotalar.route('/')
 def index():
     return render_template('index.html')
 
-@app.route('/login', methods=['GET', 'POST'])
+@rotalar.route('/login', methods=['GET', 'POST'])
 def login():
     form = LoginForm()
     if form.validate_on_submit():
         user = User.query.filter_by(username=form.username.data).first()
         if user and check_password_hash(user.password, form.password.data):
             login_user(user, remember=form.remember.data)
+            kullanici_onbellegi.ekle(KullaniciKimligi.modelden(user))
             next_page = request.args.get('next')
             return redirect(next_page or url_for('dashboard'))
         else:
             flash('Giriş başarısız. Lütfen kullanıcı adı ve şifrenizi kontrol edin.', 'danger')
     return render_template('login.html', form=form)
 
-@app.route('/logout')
+@rotalar.route('/logout')
 def logout():
     logout_user()
     return redirect(url_for('index'))
 
-@app.route('/dashboard')
+def tarih_araligi_filtresi():
+    """
+    Proje listelerinin kuyu tarihi süzgeci.
+
+    ``?tarihten=`` ve ``?tarihe=`` (ISO, dahil) ile isteğe bağlı
+    ``tarih_alani`` (bitis veya baslama, varsayılan bitis); geçersiz
+    değerlerde 400 döner.
+
+    Returns:
+        tuple: (Proje sorgusu koşulu veya None, şablona geri verilen değerler)
+    """
+    degerler = {'tarih_alani': request.args.get('tarih_alani', 'bitis')}
+    alan = {'bitis': SondajBilgileri.bitis_tarihi,
+            'baslama': SondajBilgileri.baslama_tarihi}.get(degerler['tarih_alani'])
+    if alan is None:
+        abort(400)
+    for ad in ('tarihten', 'tarihe'):
+        if request.args.get(ad):
+            try:
+                degerler[ad] = datetime.strptime(request.args[ad], '%Y-%m-%d').date()
+            except ValueError:
+                abort(400)
+    kosullar = []
+    if 'tarihten' in degerler:
+        kosullar.append(alan >= degerler['tarihten'])
+    if 'tarihe' in degerler:
+        kosullar.append(alan <= degerler['tarihe'])
+    if not kosullar:
+        return None, degerler
+    # Alt sorgu tarih indeksinde aralık taraması yapar
+    return Proje.id.in_(db.select(SondajBilgileri.proje_id).where(*kosullar)), degerler
+
+def proje_sorgusu():
+    """Özetleriyle birlikte, tarih süzgeci uygulanmış projeler"""
+    kosul, degerler = tarih_araligi_filtresi()
+    sorgu = Proje.query.options(db.joinedload(Proje.ozet))
+    if kosul is not None:
+        sorgu = sorgu.filter(kosul)
+    return sorgu.all(), degerler
+
+@rotalar.route('/dashboard')
 @login_required
 def dashboard():
-    projeler = Proje.query.all()
-    return render_template('dashboard.html', projeler=projeler)
+    projeler, tarih_filtresi = proje_sorgusu()
+    return render_template('dashboard.html', projeler=projeler, tarih_filtresi=tarih_filtresi)
 
 # Proje İşlemleri
-@app.route('/projeler')
+@rotalar.route('/projeler')
 @login_required
 def proje_listesi():
-    projeler = Proje.query.all()
-    return render_template('projeler/liste.html', projeler=projeler)
+    projeler, tarih_filtresi = proje_sorgusu()
+    return render_template('projeler/liste.html', projeler=projeler, tarih_filtresi=tarih_filtresi)
 
-@app.route('/projeler/yeni', methods=['GET', 'POST'])
+@rotalar.route('/projeler/yeni', methods=['GET', 'POST'])
 @login_required
 def proje_ekle():
     form = ProjeForm()
@@ -324,13 +805,13 @@ def proje_ekle():
         return redirect(url_for('proje_detay', proje_id=proje.id))
     return render_template('projeler/ekle.html', form=form)
 
-@app.route('/projeler/<int:proje_id>')
+@rotalar.route('/projeler/<int:proje_id>')
 @login_required
 def proje_detay(proje_id):
     proje = Proje.query.get_or_404(proje_id)
     return render_template('projeler/detay.html', proje=proje)
 
-@app.route('/projeler/<int:proje_id>/duzenle', methods=['GET', 'POST'])
+@rotalar.route('/projeler/<int:proje_id>/duzenle', methods=['GET', 'POST'])
 @login_required
 def proje_duzenle(proje_id):
     proje = Proje.query.get_or_404(proje_id)
@@ -342,7 +823,7 @@ def proje_duzenle(proje_id):
         return redirect(url_for('proje_detay', proje_id=proje.id))
     return render_template('projeler/duzenle.html', form=form, proje=proje)
 
-@app.route('/projeler/<int:proje_id>/sil', methods=['POST'])
+@rotalar.route('/projeler/<int:proje_id>/sil', methods=['POST'])
 @login_required
 def proje_sil(proje_id):
     proje = Proje.query.get_or_404(proje_id)
@@ -351,7 +832,7 @@ def proje_sil(proje_id):
     flash('Proje silindi!', 'success')
     return redirect(url_for('proje_listesi'))
 
-@app.route('/projeler/<int:proje_id>/tapu', methods=['GET', 'POST'])
+@rotalar.route('/projeler/<int:proje_id>/tapu', methods=['GET', 'POST'])
 @login_required
 def tapu_bilgileri(proje_id):
     proje = Proje.query.get_or_404(proje_id)
@@ -370,18 +851,21 @@ def tapu_bilgileri(proje_id):
     
     return render_template('projeler/tapu.html', form=form, proje=proje)
 
-@app.route('/projeler/<int:proje_id>/sondaj', methods=['GET', 'POST'])
+@rotalar.route('/projeler/<int:proje_id>/sondaj', methods=['GET', 'POST'])
 @login_required
 def sondaj_bilgileri(proje_id):
     proje = Proje.query.get_or_404(proje_id)
-    sondaj = proje.sondaj_bilgileri or SondajBilgileri(proje_id=proje.id)
+    # Düzenlenen kuyu ?kuyu=<id> veya formdaki kuyu alanıyla seçilir (varsayılan ilk kuyu)
+    kuyu_id = request.values.get('kuyu', type=int)
+    kayitli = proje_kuyusu(proje, kuyu_id) if kuyu_id is not None else proje.sondaj_bilgileri
+    sondaj = kayitli or SondajBilgileri(proje_id=proje.id)
     form = SondajBilgileriForm(obj=sondaj)
     
     if form.validate_on_submit():
-        eski_derinlik = sondaj.sondaj_derinligi if proje.sondaj_bilgileri else None
+        eski_derinlik = sondaj.sondaj_derinligi if kayitli else None
         
-        if not proje.sondaj_bilgileri:
-            sondaj = SondajBilgileri(proje_id=proje.id)
+        if not kayitli:
+            sondaj = SondajBilgileri(proje_id=proje.id, kuyu_adi=VARSAYILAN_KUYU_ADI)
             db.session.add(sondaj)
         
         form.populate_obj(sondaj)
@@ -390,24 +874,19 @@ def sondaj_bilgileri(proje_id):
         # Sondaj derinliği değiştiyse arazi metrajlarını güncelle
         if eski_derinlik != sondaj.sondaj_derinligi:
             # Önce mevcut arazi bilgilerini kontrol et
-            arazi_kayitlari_var = AraziBilgileri.query.filter_by(proje_id=proje.id).count() > 0
+            arazi_kayitlari_var = AraziBilgileri.query.filter_by(sondaj_id=sondaj.id).count() > 0
             
             if arazi_kayitlari_var:
-                # Mevcut arazi kayıtlarını temizle
-                AraziBilgileri.query.filter_by(proje_id=proje.id).delete()
+                # Bu kuyunun arazi kayıtlarını temizle
+                AraziBilgileri.query.filter_by(sondaj_id=sondaj.id).delete()
+                proje_surumunu_artir(proje)
                 db.session.commit()
                 
                 # Yeni derinliğe göre arazi kayıtlarını oluştur
-                derinlik = float(sondaj.sondaj_derinligi)
-                metraj_noktalari = []
-                for i in range(int(derinlik / 1.5) + 1):
-                    if i * 1.5 < derinlik:  # Son noktayı dahil etme
-                        metraj_noktalari.append(i * 1.5)
-                
-                # Yeni arazi kayıtlarını ekle
-                for metraj in metraj_noktalari:
+                for metraj in metraj_noktalari(float(sondaj.sondaj_derinligi)):
                     arazi = AraziBilgileri(
                         proje_id=proje.id,
+                        sondaj_id=sondaj.id,
                         sondaj_derinligi=metraj,
                     )
                     db.session.add(arazi)
@@ -421,16 +900,30 @@ def sondaj_bilgileri(proje_id):
             
         return redirect(url_for('proje_detay', proje_id=proje.id))
     
-    return render_template('projeler/sondaj.html', form=form, proje=proje)
+    return render_template('projeler/sondaj.html', form=form, proje=proje, kuyular=proje.kuyular, kuyu=kayitli)
+
+@rotalar.route('/projeler/<int:proje_id>/kuyular/yeni', methods=['POST'])
+@login_required
+def kuyu_ekle(proje_id):
+    proje = Proje.query.get_or_404(proje_id)
+    kuyu = yeni_kuyu(proje)
+    db.session.commit()
+    flash(f'{kuyu.kuyu_adi} kuyusu eklendi.', 'success')
+    return redirect(url_for('sondaj_bilgileri', proje_id=proje.id, kuyu=kuyu.id))
 
-@app.route('/projeler/<int:proje_id>/arazi')
+@rotalar.route('/projeler/<int:proje_id>/arazi')
 @login_required
 def arazi_bilgileri_liste(proje_id):
     proje = Proje.query.get_or_404(proje_id)
-    arazi_kayitlari = AraziBilgileri.query.filter_by(proje_id=proje.id).order_by(AraziBilgileri.sondaj_derinligi).all()
+    # Satır başına ORM nesnesi yerine sütun tabanlı kayıtlar; şablon alanlara aynı adlarla erişir
+    arazi_kayitlari = AraziKayitlari.satirlardan(db.session.execute(
+        db.select(*(getattr(AraziBilgileri, kimlik) for kimlik in TUM_SUTUNLAR))
+        .where(AraziBilgileri.proje_id == proje.id)
+        .order_by(AraziBilgileri.sondaj_id, AraziBilgileri.sondaj_derinligi)
+    ), TUM_SUTUNLAR)
     return render_template('projeler/arazi_liste.html', proje=proje, arazi_kayitlari=arazi_kayitlari)
 
-@app.route('/projeler/<int:proje_id>/arazi/ekle', methods=['GET', 'POST'])
+@rotalar.route('/projeler/<int:proje_id>/arazi/ekle', methods=['GET', 'POST'])
 @login_required
 def arazi_bilgileri_ekle(proje_id):
     proje = Proje.query.get_or_404(proje_id)
@@ -442,242 +935,67 @@ def arazi_bilgileri_ekle(proje_id):
             return render_template('projeler/arazi_ekle_tablo.html', proje=proje, arazi_kayitlari=[], 
                                   has_data=False, derinlik=None, spt_count=1, karot_count=1, ud_count=1)
     
+    # Tablo projenin tek kuyusuyla çalışır (?kuyu=<id> veya formdaki kuyu alanı, varsayılan ilk kuyu)
+    kuyu_id = request.values.get('kuyu', type=int)
+    
     # Metraj oluşturma işlemi
     if request.method == 'POST' and 'metraj_olustur' in request.form:
         try:
-            app.logger.info("Metraj oluşturma isteği alındı")
+            current_app.logger.info("Metraj oluşturma isteği alındı")
+            kuyu = proje_kuyusu(proje, kuyu_id)
             
             # Kullanıcının Form'dan girdiği derinlik değerini al
             # Eğer form'dan gelmiyorsa, sondaj bilgilerinden al
             if 'sondaj_derinligi' in request.form and request.form['sondaj_derinligi'].strip():
                 derinlik = float(request.form['sondaj_derinligi'])
-                app.logger.info(f"Formdan derinlik alındı: {derinlik}m")
+                current_app.logger.info(f"Formdan derinlik alındı: {derinlik}m")
             else:
-                derinlik = float(proje.sondaj_bilgileri.sondaj_derinligi)
-                app.logger.info(f"Sondaj bilgilerinden derinlik alındı: {derinlik}m")
+                derinlik = float(kuyu.sondaj_derinligi)
+                current_app.logger.info(f"Sondaj bilgilerinden derinlik alındı: {derinlik}m")
             
             # Minimum derinlik kontrolü
             if derinlik < 1.5:
                 derinlik = 1.5
-                app.logger.info("Derinlik çok küçük, minimum değer olan 1.5m'ye ayarlandı")
+                current_app.logger.info("Derinlik çok küçük, minimum değer olan 1.5m'ye ayarlandı")
                 flash('Sondaj derinliği en az 1.5m olmalıdır. Derinlik 1.5m olarak ayarlandı.', 'warning')
 
             # Mevcut kayıtları sil
-            AraziBilgileri.query.filter_by(proje_id=proje.id).delete()
+            AraziBilgileri.query.filter_by(sondaj_id=kuyu.id).delete()
+            proje_surumunu_artir(proje)
             db.session.commit()
             
-            # Arazi kayıtları için boş liste
-            arazi_kayitlari = []
-            
             # TAM OLARAK PYQT6 GİBİ METRAJ OLUŞTUR
             # 1.5m artışlarla (0.0, 1.5, 3.0, 4.5) ve son derinlik EKLENMESİN
-            current_depth = 0.0
-            row_index = 1  # Sıra numarası 1'den başlasın
-            
-            app.logger.info(f"Metraj oluşturma döngüsü başlıyor - Derinlik: {derinlik}m")
-            
-            # PyQt6 kodundaki gibi metraj oluştur
-            # ÇOK ÖNEMLİ: while döngüsünün içindeki koşul current_depth < derinlik olmalıdır
-            # böylece son derinlik eklenmez ve tamamı 1.5m artışlarla olur
-            depths = []  # Debug için derinlik listesi
-            
-            while current_depth < derinlik:
-                # Debug için derinlik listesine ekle
-                depths.append(current_depth)
-                
-                app.logger.info(f"Ekleniyor: Derinlik {current_depth}m, Sıra: {row_index}")
-                
-                # Örnek derinlik aralığını oluştur (0.00-0.45, 1.50-1.95, vb.)
-                ornek_derinlik_araligi = f"{current_depth:.2f}-{(current_depth + 0.45):.2f}"
-                
-                # Yeni arazi kaydı oluştur
-                yeni_arazi = AraziBilgileri(
-                    proje_id=proje.id,
-                    sondaj_derinligi=current_depth,
-                    muhafaza_borusu_derinligi=current_depth,
-                    kuyu_ici_deneyler='',  # Boş olarak başla
-                    ornek_derinligi=ornek_derinlik_araligi,
-                    ornek_turu_no='',
-                    spt_0_15=0,
-                    spt_15_30=0,
-                    spt_30_45=0,
-                    n30=0,
-                    tmax=0,
-                    tyogrulmus=0,
-                    c_kpa=0,
-                    aci_derece=0,
-                    dogal_bha=0,
-                    kuru_bha=0,
-                    zemin_profili='',
-                    zemin_tanimlamasi=''
-                )
-                
-                # Veritabanına ekle
-                db.session.add(yeni_arazi)
-                
-                # Arazi listesine ekle
-                kayit_dict = {
-                    'sondaj_derinligi': current_depth,
-                    'muhafaza_borusu_derinligi': current_depth,
-                    'kuyu_ici_deneyler': '',
-                    'ornek_derinligi': ornek_derinlik_araligi,
-                    'ornek_turu_no': '',
-                    'spt_0_15': 0,
-                    'spt_15_30': 0,
-                    'spt_30_45': 0,
-                    'n30': 0,
-                    'tmax': 0,
-                    'tyogrulmus': 0,
-                    'c_kpa': 0,
-                    'aci_derece': 0,
-                    'dogal_bha': 0,
-                    'kuru_bha': 0,
-                    'zemin_profili': '',
-                    'zemin_tanimlamasi': ''
-                }
-                arazi_kayitlari.append(kayit_dict)
-                
-                # Derinliği artır - PyQt6 kodundaki gibi 1.5m artışlı
-                current_depth += 1.5
-                row_index += 1
-            
-            # Debug için oluşturulan derinlikler
-            app.logger.info(f"Oluşturulan derinlikler: {depths}")
-            app.logger.info(f"Son derinlik: {current_depth}, hedef derinlik: {derinlik}")
+            arazi_kayitlari = [bos_arazi_kaydi(metraj) for metraj in metraj_noktalari(derinlik)]
+            current_app.logger.info(f"Metraj oluşturuldu: {len(arazi_kayitlari)} satır, derinlik: {derinlik}m")
             
-            # Değişiklikleri kaydet ve log bilgisi
-            db.session.commit()
-            app.logger.info(f"Metraj oluşturuldu: {len(arazi_kayitlari)} satır, derinlik: {derinlik}m")
-                
             # UD örneği varsa
             if 'ud_ornekleri_var' in request.form:
-                app.logger.info("UD örnekleri işleniyor...")
+                current_app.logger.info("UD örnekleri işleniyor...")
                 ud_derinlikler = request.form.get('ud_derinlikler', '')
                 ud_adet = int(request.form.get('ud_adet', 1))
                 
                 if ud_derinlikler:
                     try:
-                        # Virgülle ayrılmış UD derinliklerini işle
-                        ud_depths = [float(d.strip()) for d in ud_derinlikler.replace(',', '.').split(' ') if d.strip()]
-                        app.logger.info(f"UD derinlikleri: {ud_depths}")
+                        ud_depths = ud_derinliklerini_ayristir(ud_derinlikler)
+                        current_app.logger.info(f"UD derinlikleri: {ud_depths}")
                         
                         # UD adet ve derinlik sayısının eşit olup olmadığını kontrol et
                         if len(ud_depths) != ud_adet:
                             flash(f'UD derinlik sayısı ({len(ud_depths)}) ile UD adet sayısı ({ud_adet}) eşleşmiyor! Metraj oluşturuldu ancak UD örnekleri eklenemedi.', 'warning')
-                            app.logger.warning(f"UD derinlik sayısı ({len(ud_depths)}) ile UD adet sayısı ({ud_adet}) eşleşmiyor!")
+                            current_app.logger.warning(f"UD derinlik sayısı ({len(ud_depths)}) ile UD adet sayısı ({ud_adet}) eşleşmiyor!")
                         else:
-                            app.logger.info("UD örnekleri eklenmeye başlanıyor")
-                            
-                            # Önce tüm ud_depths noktalarını sırala
-                            ud_depths.sort()
-                            
-                            for ud_index, ud_depth in enumerate(ud_depths):
-                                app.logger.info(f"UD-{ud_index+1} ekleniyor, derinlik: {ud_depth}m")
-                                
-                                # Önce uygun satır var mı kontrol et
-                                found_exact = False
-                                found_row = None
-                                
-                                # Tam eşleşme var mı?
-                                for i, arazi in enumerate(arazi_kayitlari):
-                                    # Arazi kayıtları dict formatında olduğu için tip dönüşümü gerekli
-                                    if abs(float(arazi['sondaj_derinligi']) - ud_depth) < 0.01:  # Tam eşleşme kontrolü
-                                        found_exact = True
-                                        found_row = i
-                                        app.logger.info(f"Tam eşleşen satır bulundu: {i}, derinlik: {arazi['sondaj_derinligi']}m")
-                                        break
-                                
-                                # Eğer tam eşleşme yoksa, doğrudan yeni satır ekle
-                                # (Orijinal koddaki gibi en yakın noktayı değil, direkt UD'nin kendi derinliğinde yeni satır ekliyoruz)
-                                if not found_exact:
-                                    app.logger.info(f"Tam eşleşme yok, {ud_depth}m için yeni satır ekleniyor")
-                                    
-                                    # Doğru ekleme noktasını belirle
-                                    insert_index = 0
-                                    for i, arazi in enumerate(arazi_kayitlari):
-                                        if float(arazi['sondaj_derinligi']) > ud_depth:
-                                            insert_index = i
-                                            break
-                                        else:
-                                            insert_index = i + 1
-                                    
-                                    # Yeni satır hazırla
-                                    new_row = {
-                                        'sondaj_derinligi': ud_depth,
-                                        'muhafaza_borusu_derinligi': ud_depth,
-                                        'kuyu_ici_deneyler': 'UD',
-                                        'ornek_derinligi': f"{ud_depth:.2f}-{(ud_depth + 0.45):.2f}",
-                                        'ornek_turu_no': f'UD-{ud_index+1}',
-                                        'spt_0_15': 0,
-                                        'spt_15_30': 0,
-                                        'spt_30_45': 0,
-                                        'n30': 0,
-                                        'tmax': 0,
-                                        'tyogrulmus': 0,
-                                        'c_kpa': 0,
-                                        'aci_derece': 0,
-                                        'dogal_bha': 0,
-                                        'kuru_bha': 0,
-                                        'zemin_profili': '',
-                                        'zemin_tanimlamasi': ''
-                                    }
-                                    
-                                    app.logger.info(f"Yeni UD satırı ekleniyor: index={insert_index}, derinlik={ud_depth}m")
-                                    
-                                    # Hem geçici listeye hem de veritabanına ekle
-                                    arazi_kayitlari.insert(insert_index, new_row)
-                                    
-                                    # Veritabanına da ekle
-                                    yeni_arazi = AraziBilgileri(
-                                        proje_id=proje.id,
-                                        sondaj_derinligi=ud_depth,
-                                        muhafaza_borusu_derinligi=ud_depth,
-                                        kuyu_ici_deneyler='UD',
-                                        ornek_derinligi=f"{ud_depth:.2f}-{(ud_depth + 0.45):.2f}",
-                                        ornek_turu_no=f'UD-{ud_index+1}',
-                                        spt_0_15=0,
-                                        spt_15_30=0,
-                                        spt_30_45=0,
-                                        n30=0,
-                                        tmax=0,
-                                        tyogrulmus=0,
-                                        c_kpa=0,
-                                        aci_derece=0,
-                                        dogal_bha=0,
-                                        kuru_bha=0,
-                                        zemin_profili='',
-                                        zemin_tanimlamasi=''
-                                    )
-                                    db.session.add(yeni_arazi)
-                                else:
-                                    # Eğer tam eşleşen satır bulunduysa, UD olarak güncelle
-                                    app.logger.info(f"Mevcut satır UD olarak güncelleniyor: {found_row}")
-                                    arazi_kayitlari[found_row]['kuyu_ici_deneyler'] = 'UD'
-                                    arazi_kayitlari[found_row]['ornek_turu_no'] = f'UD-{ud_index+1}'
-                                    arazi_kayitlari[found_row]['ornek_derinligi'] = f"{ud_depth:.2f}-{(ud_depth + 0.45):.2f}"
-                                    
-                                    # Veritabanında da güncelle
-                                    arazi_db = AraziBilgileri.query.filter_by(
-                                        proje_id=proje.id, 
-                                        sondaj_derinligi=arazi_kayitlari[found_row]['sondaj_derinligi']
-                                    ).first()
-                                    
-                                    if arazi_db:
-                                        arazi_db.kuyu_ici_deneyler = 'UD'
-                                        arazi_db.ornek_turu_no = f'UD-{ud_index+1}'
-                                        arazi_db.ornek_derinligi = f"{ud_depth:.2f}-{(ud_depth + 0.45):.2f}"
-                            
-                            # Tüm UD örnekleri ekledikten sonra veritabanı değişikliklerini kaydet
-                            db.session.commit()
-                            app.logger.info("Tüm UD örnekleri başarıyla eklendi ve veritabanına kaydedildi")
-                            
-                            # Son olarak arazi_kayitları sırala (ud eklendikten sonra)
-                            arazi_kayitlari.sort(key=lambda x: float(x['sondaj_derinligi']))
-                            app.logger.info(f"Sıralamadan sonra toplam satır sayısı: {len(arazi_kayitlari)}")
+                            # Eşleşen satırlar UD olarak işaretlenir, diğerleri için yeni satır eklenir
+                            arazi_kayitlari = ud_orneklerini_yerlestir(arazi_kayitlari, ud_depths)
+                            current_app.logger.info(f"UD örnekleri eklendi, toplam satır sayısı: {len(arazi_kayitlari)}")
                             
                     except Exception as e:
                         flash(f'UD örnekleri eklenirken hata oluştu: {str(e)}', 'danger')
-                        app.logger.error(f'UD örnekleri eklenirken hata: {str(e)}', exc_info=True)
+                        current_app.logger.error(f'UD örnekleri eklenirken hata: {str(e)}', exc_info=True)
+            
+            # Tüm satırları tek seferde kaydet
+            db.session.add_all([AraziBilgileri(proje_id=proje.id, sondaj_id=kuyu.id, **kayit) for kayit in arazi_kayitlari])
+            db.session.commit()
             
             # Oturum verisine kaydet
             session['arazi_kayitlari'] = arazi_kayitlari
@@ -697,7 +1015,9 @@ def arazi_bilgileri_ekle(proje_id):
     # Verileri kaydetme işlemi
     elif request.method == 'POST' and 'kaydet' in request.form:
         # Mevcut arazi bilgilerini temizle
-        AraziBilgileri.query.filter_by(proje_id=proje.id).delete()
+        kuyu = proje_kuyusu(proje, kuyu_id)
+        AraziBilgileri.query.filter_by(sondaj_id=kuyu.id).delete()
+        proje_surumunu_artir(proje)
         db.session.commit()
         
         # Tablodan gelen verileri işle
@@ -706,6 +1026,7 @@ def arazi_bilgileri_ekle(proje_id):
                 try:
                     arazi = AraziBilgileri(
                         proje_id=proje.id,
+                        sondaj_id=kuyu.id,
                         sondaj_derinligi=float(request.form.get(f'sondaj_derinligi_{i}', 0)),
                         muhafaza_borusu_derinligi=float(request.form.get(f'muhafaza_borusu_derinligi_{i}', 0)) if request.form.get(f'muhafaza_borusu_derinligi_{i}') else None,
                         kuyu_ici_deneyler=request.form.get(f'kuyu_ici_deneyler_{i}', ''),
@@ -753,7 +1074,7 @@ def arazi_bilgileri_ekle(proje_id):
                           arazi_kayitlari=arazi_kayitlari, has_data=has_data,
                           derinlik=derinlik, spt_count=spt_count, karot_count=karot_count, ud_count=ud_count)
 
-@app.route('/projeler/<int:proje_id>/arazi/<int:arazi_id>/duzenle', methods=['GET', 'POST'])
+@rotalar.route('/projeler/<int:proje_id>/arazi/<int:arazi_id>/duzenle', methods=['GET', 'POST'])
 @login_required
 def arazi_bilgileri_duzenle(proje_id, arazi_id):
     proje = Proje.query.get_or_404(proje_id)
@@ -768,7 +1089,7 @@ def arazi_bilgileri_duzenle(proje_id, arazi_id):
     
     return render_template('projeler/arazi_duzenle.html', form=form, proje=proje, arazi=arazi)
 
-@app.route('/projeler/<int:proje_id>/arazi/<int:arazi_id>/sil', methods=['POST'])
+@rotalar.route('/projeler/<int:proje_id>/arazi/<int:arazi_id>/sil', methods=['POST'])
 @login_required
 def arazi_bilgileri_sil(proje_id, arazi_id):
     arazi = AraziBilgileri.query.get_or_404(arazi_id)
@@ -778,63 +1099,473 @@ def arazi_bilgileri_sil(proje_id, arazi_id):
     return redirect(url_for('arazi_bilgileri_liste', proje_id=proje_id))
 
 # Analiz ve Grafikler
-@app.route('/projeler/<int:proje_id>/analiz')
+def analiz_kuyusu(proje_id):
+    """
+    Analizin kuyusu: ``?kuyu=`` veya (formlar ve rapor gibi) projenin ilk kuyusu.
+
+    Farklı kuyuların katmanları tek derinlik serisinde birleştirilmez.
+
+    Returns:
+        int: SondajBilgileri ID; projede kuyu yoksa None
+    """
+    kuyu_id = request.args.get('kuyu', type=int)
+    if kuyu_id is not None:
+        return kuyu_id
+    return db.session.scalar(db.select(db.func.min(SondajBilgileri.id))
+                             .where(SondajBilgileri.proje_id == proje_id))
+
+@rotalar.route('/projeler/<int:proje_id>/analiz')
 @login_required
 def proje_analiz(proje_id):
     proje = Proje.query.get_or_404(proje_id)
-    arazi_bilgileri = AraziBilgileri.query.filter_by(proje_id=proje.id).all()
-    
-    # SPT Verileri
-    spt_derinlikler = []
-    spt_degerler = []
-    
-    # Zemin Profili
-    zemin_derinlikler = []
-    zemin_turleri = []
-    
-    for arazi in arazi_bilgileri:
-        if arazi.n30:
-            spt_derinlikler.append(arazi.sondaj_derinligi)
-            spt_degerler.append(arazi.n30)
-        
-        if arazi.zemin_tanimlamasi:
-            zemin_derinlikler.append(arazi.sondaj_derinligi)
-            zemin_turleri.append(arazi.zemin_tanimlamasi)
+    veri = proje_analiz_verisi(proje.id, proje.updated_at, analiz_kuyusu(proje.id))[0]
     
     return render_template('projeler/analiz.html', 
                            proje=proje, 
-                           spt_derinlikler=json.dumps(spt_derinlikler),
-                           spt_degerler=json.dumps(spt_degerler),
-                           zemin_derinlikler=json.dumps(zemin_derinlikler),
-                           zemin_turleri=json.dumps(zemin_turleri))
+                           spt_derinlikler=json.dumps(veri['spt']['derinlik']),
+                           spt_degerler=json.dumps(veri['spt']['n30']),
+                           zemin_derinlikler=json.dumps(veri['zemin']['derinlik']),
+                           zemin_turleri=json.dumps(veri['zemin']['tanim']))
+
+def proje_analiz_verisi(proje_id, surum, kuyu_id):
+    """
+    Analiz serilerini proje sürümüne göre önbellekten döndürür.
+
+    Args:
+        proje_id (int): Proje ID
+        surum (datetime): Proje sürümü
+        kuyu_id (int): Kuyu ID (bkz. ``analiz_kuyusu``)
+
+    Returns:
+        tuple: (veri sözlüğü, JSON gövdesi bytes)
+    """
+    return analiz_onbellegi.getir(
+        (proje_id, surum, kuyu_id),
+        lambda: dict(proje_id=proje_id, kuyu_id=kuyu_id, surum=surum.isoformat(),
+                     **analiz_verisi(db.session, AraziBilgileri, proje_id, kuyu_id)))
+
+def surumlu_json_yaniti(proje_id, anahtar, olustur):
+    """
+    Proje sürümüne bağlı, önbellekli ve ETag'li JSON yanıtı döndürür.
+
+    Sürüm tek sütunluk sorguyla okunur; aynı sürümde arazi tablosuna hiç
+    gidilmez, istemcide güncel kopya varsa 304 döner.
+
+    Args:
+        proje_id (int): Proje ID
+        anahtar (tuple): Yanıt türünü ayırt eden önbellek anahtarı eki
+        olustur (callable): ``olustur(surum)`` veri sözlüğünü üretir
+    """
+    surum = proje_surumu(proje_id)
+    etag = '-'.join(str(parca) for parca in (*anahtar, proje_id, f'{surum.timestamp():.6f}'))
+    if request.if_none_match.contains(etag):
+        yanit = Response(status=304)
+    else:
+        govde = analiz_onbellegi.getir((proje_id, surum, *anahtar), lambda: olustur(surum))[1]
+        yanit = Response(govde, mimetype='application/json')
+    yanit.set_etag(etag)
+    yanit.cache_control.private = True
+    yanit.cache_control.no_cache = True
+    return yanit
+
+@rotalar.route('/api/projeler/<int:proje_id>/analiz')
+@login_required
+def api_proje_analiz(proje_id):
+    kuyu_id = analiz_kuyusu(proje_id)
+    return surumlu_json_yaniti(
+        proje_id, ('analiz', kuyu_id),
+        lambda surum: dict(proje_id=proje_id, kuyu_id=kuyu_id, surum=surum.isoformat(),
+                           **analiz_verisi(db.session, AraziBilgileri, proje_id, kuyu_id)))
+
+@rotalar.route('/api/projeler/<int:proje_id>/analiz/grafik/<tur>')
+@login_required
+def api_proje_grafik(proje_id, tur):
+    """
+    Plotly'ye doğrudan verilebilecek şekil JSON'u döndürür (Plotly.react).
+
+    Türler: spt, zemin, parametreler. ``?nokta=`` iz başına azami nokta
+    sayısını belirler (uç değer koruyan seyreltme); ``?ikili=0`` dizileri
+    base64 yerine düz liste olarak gönderir; ``?kuyu=`` kuyuyu seçer
+    (varsayılan projenin ilk kuyusu).
+    """
+    if tur not in GRAFIKLER:
+        abort(404)
+    hedef = min(max(request.args.get('nokta', GRAFIK_NOKTA_SAYISI, type=int), 10), GRAFIK_AZAMI_NOKTA)
+    ikili = request.args.get('ikili', '1') != '0'
+    kuyu_id = analiz_kuyusu(proje_id)
+    return surumlu_json_yaniti(
+        proje_id, ('grafik', tur, hedef, int(ikili), kuyu_id),
+        lambda surum: grafik_verisi(db.session, AraziBilgileri, proje_id, tur,
+                                    hedef=hedef, ikili=ikili, kuyu_id=kuyu_id))
+
+# Rapor İşleri
+def rapor_isi_sozluk(is_kaydi):
+    """Rapor işini API yanıtı için sözlüğe çevirir"""
+    veri = {
+        'id': is_kaydi['id'],
+        'proje_id': is_kaydi['proje_id'],
+        'durum': is_kaydi['durum'],
+        'ilerleme': is_kaydi['ilerleme'],
+        'mesaj': is_kaydi['mesaj'],
+        'sira': is_kaydi.get('sira'),
+        'olusturma_zamani': is_kaydi['olusturma_zamani'],
+        'bitis_zamani': is_kaydi['bitis_zamani'],
+        'durum_url': url_for('api_rapor_durum', is_id=is_kaydi['id'])
+    }
+    if is_kaydi['durum'] == DURUM_TAMAMLANDI:
+        veri['indirme_url'] = url_for('rapor_indir', is_id=is_kaydi['id'])
+    if is_kaydi['hata']:
+        veri['hata'] = is_kaydi['hata']
+    return veri
+
+@rotalar.route('/projeler/<int:proje_id>/rapor', methods=['POST'])
+@login_required
+def rapor_iste(proje_id):
+    proje = Proje.query.get_or_404(proje_id)
+    is_id, yeni = rapor_kuyrugu.is_ekle(proje.id, kullanici=current_user.username)
+    veri = rapor_isi_sozluk(rapor_kuyrugu.durum(is_id))
+    veri['yeni'] = yeni
+    return jsonify(veri), 202
+
+@rotalar.route('/api/raporlar/<int:is_id>')
+@login_required
+def api_rapor_durum(is_id):
+    is_kaydi = rapor_kuyrugu.durum(is_id)
+    if not is_kaydi:
+        abort(404)
+    return jsonify(rapor_isi_sozluk(is_kaydi))
+
+@rotalar.route('/raporlar/<int:is_id>/indir')
+@login_required
+def rapor_indir(is_id):
+    is_kaydi = rapor_kuyrugu.durum(is_id)
+    if not is_kaydi or is_kaydi['durum'] != DURUM_TAMAMLANDI or not os.path.exists(is_kaydi['dosya_yolu'] or ''):
+        abort(404)
+    
+    # Dosya bloklar halinde akıtılır; conditional=True ile If-None-Match /
+    # If-Modified-Since (304) ve Range (206) istekleri de karşılanır, böylece
+    # zayıf bağlantılarda yarım kalan indirmeler kaldığı yerden sürdürülebilir.
+    yanit = send_file(is_kaydi['dosya_yolu'], mimetype='application/pdf', as_attachment=True,
+                      download_name=os.path.basename(is_kaydi['dosya_yolu']),
+                      conditional=True, etag=True, max_age=RAPOR_ONBELLEK_SURESI)
+    yanit.cache_control.private = True
+    return yanit
+
+@rotalar.route('/projeler/<int:proje_id>/rapor.pdf')
+@login_required
+def rapor_canli(proje_id):
+    """Raporu kuyruğa almadan, oluşturulur oluşturulmaz yanıta akıtır"""
+    proje = Proje.query.get_or_404(proje_id)
+    # Uygulamanın motoru ve bağlantı havuzu kullanılır
+    olusturucu = WebRaporOlusturucu(proje.id, db.engine)
+    dosya_adi = f"{proje.proje_adi.replace(' ', '_')}_rapor.pdf"
+    
+    # Veri ve ilk parça yanıttan önce hazırlanır; hata olursa yarım PDF yerine 500 döner
+    try:
+        parcalar = rapor_akisi(olusturucu)
+    except Exception as e:
+        current_app.logger.error(f'Canlı rapor oluşturulamadı (proje {proje.id}): {e}', exc_info=True)
+        abort(500)
+    yanit = Response(parcalar, mimetype='application/pdf')
+    # send_file ile aynı şekilde: ASCII yedek ad + UTF-8 kodlu asıl ad
+    ascii_ad = unicodedata.normalize('NFKD', dosya_adi).encode('ascii', 'ignore').decode('ascii')
+    yanit.headers.set('Content-Disposition', 'attachment', filename=ascii_ad,
+                      **{'filename*': f"UTF-8''{quote(dosya_adi)}"})
+    yanit.cache_control.no_store = True
+    return yanit
 
 # Hata Yönetimi
-@app.errorhandler(404)
+@rotalar.errorhandler(404)
 def page_not_found(e):
     return render_template('errors/404.html'), 404
 
-@app.errorhandler(500)
+@rotalar.errorhandler(500)
 def server_error(e):
     return render_template('errors/500.html'), 500
 
-@app.errorhandler(403)
+@rotalar.errorhandler(403)
 def forbidden(e):
     return render_template('errors/403.html'), 403
 
 # API Rotaları
-@app.route('/api/projeler')
+@rotalar.route('/api/projeler')
 @login_required
 def api_projeler():
-    projeler = Proje.query.all()
-    return jsonify([proje.to_dict() for proje in projeler])
+    # Proje başına tek özet satırı; arazi tablosu okunmaz
+    projeler, _ = proje_sorgusu()
+    return jsonify([dict(proje.to_dict(), ozet=proje.ozet.to_dict() if proje.ozet else None)
+                    for proje in projeler])
 
-@app.route('/api/projeler/<int:proje_id>')
+@rotalar.route('/api/projeler/<int:proje_id>')
 @login_required
 def api_proje_detay(proje_id):
     proje = Proje.query.get_or_404(proje_id)
     return jsonify(proje.to_dict())
 
+@rotalar.route('/api/projeler/<int:proje_id>/kuyular')
+@login_required
+def api_proje_kuyulari(proje_id):
+    proje_surumu(proje_id)  # Proje yoksa 404
+    return jsonify({'ozet': proje_ozeti(proje_id), 'kuyular': kuyu_ozetleri(proje_id)})
+
+# Konum sorguları. Noktalar WGS84 (boylam, enlem) ya da bir dilimdeki TM koordinatı
+# (x, y metre ve dilim[, sistem]) olarak verilir; indeks farklı dilimlerdeki kayıtları
+# ortak düzlemde tuttuğu için mesafeler de orada ölçülür (metre, ölçek hatası %1'in altında).
+KONUM_AZAMI_SONUC = 1000
+
+def konum_yaniti(sonuc):
+    """Izgara indeksi sonucunu proje adları ve kayıtlı tapu koordinatlarıyla JSON listesine çevirir"""
+    kimlikler = [int(k) for k in sonuc['kimlik'][:KONUM_AZAMI_SONUC]]
+    tapular = {satir[0]: satir for satir in db.session.execute(
+        db.select(Proje.id, Proje.proje_adi, TapuBilgileri.koordinat_x, TapuBilgileri.koordinat_y,
+                  TapuBilgileri.dilim_meridyeni, TapuBilgileri.koordinat_sistemi)
+        .outerjoin(TapuBilgileri, TapuBilgileri.proje_id == Proje.id)
+        .where(Proje.id.in_(kimlikler))).all()} if kimlikler else {}
+    kayitlar = []
+    for i, proje_id in enumerate(kimlikler):
+        _, adi, x, y, dilim, sistem = tapular.get(proje_id, (proje_id, None, None, None, None, None))
+        kayit = {'proje_id': proje_id, 'proje_adi': adi, 'koordinat_x': x, 'koordinat_y': y,
+                 'dilim_meridyeni': dilim, 'koordinat_sistemi': sistem}
+        if 'mesafe' in sonuc:
+            kayit['mesafe'] = float(sonuc['mesafe'][i])
+        kayitlar.append(kayit)
+    return jsonify(kayitlar)
+
+def koordinat_parametreleri(*adlar):
+    degerler = [request.args.get(ad, type=float) for ad in adlar]
+    if any(deger is None for deger in degerler):
+        abort(400)
+    return degerler
+
+def konum_dilimi(dilim, sistem):
+    """TM sorgusunun dilim ve datumu; dilim verilmezse ``VARSAYILAN_DILIM_MERIDYENI``"""
+    if dilim is None and VARSAYILAN_DILIM_MERIDYENI:
+        dilim = int(VARSAYILAN_DILIM_MERIDYENI)
+    if dilim is None or (sistem or VARSAYILAN_SISTEM) not in KOORDINAT_SISTEMLERI:
+        abort(400)
+    return dilim, sistem
+
+def konum_parametreleri(tm_adlari, cografi_adlari):
+    """
+    Konum sorgusunun koordinatlarını okur.
+
+    ``cografi_adlari``nın ilki istekte varsa değerler WGS84'tür ve dilim
+    None döner; yoksa ``tm_adlari`` ile ``?dilim=[&sistem=]`` okunur.
+
+    Returns:
+        tuple: (değerler, dilim, sistem); noktalar ``ortak_duzlem_noktalari`` ile taşınır
+    """
+    if cografi_adlari[0] in request.args:
+        return koordinat_parametreleri(*cografi_adlari), None, None
+    degerler = koordinat_parametreleri(*tm_adlari)
+    return (degerler, *konum_dilimi(request.args.get('dilim', type=int), request.args.get('sistem')))
+
+@rotalar.route('/api/konum/yakin')
+@login_required
+def api_konum_yakin():
+    """``?boylam=&enlem=`` veya ``?x=&y=&dilim=[&sistem=]`` noktasına en yakın ``?n=`` proje (varsayılan 10)"""
+    (x, y), dilim, sistem = konum_parametreleri(('x', 'y'), ('boylam', 'enlem'))
+    (x, y), = ortak_duzlem_noktalari([(x, y)], dilim, sistem)
+    n = min(max(request.args.get('n', 10, type=int), 1), KONUM_AZAMI_SONUC)
+    return konum_yaniti(konum_indeksi.getir().en_yakin(x, y, n))
+
+@rotalar.route('/api/konum/yaricap')
+@login_required
+def api_konum_yaricap():
+    """Noktaya (bkz. ``/api/konum/yakin``) ``?r=`` metre uzaklıktaki projeler, yakından uzağa"""
+    (x, y), dilim, sistem = konum_parametreleri(('x', 'y'), ('boylam', 'enlem'))
+    (x, y), = ortak_duzlem_noktalari([(x, y)], dilim, sistem)
+    r, = koordinat_parametreleri('r')
+    return konum_yaniti(konum_indeksi.getir().yaricap(x, y, max(r, 0.0)))
+
+@rotalar.route('/api/konum/kutu')
+@login_required
+def api_konum_kutu():
+    """
+    Kutudaki projeler: ``?min_boylam=&min_enlem=&max_boylam=&max_enlem=`` veya
+    ``?min_x=&min_y=&max_x=&max_y=&dilim=[&sistem=]``. Kutu ortak düzlemde
+    dört köşeli poligon olarak aranır.
+    """
+    (min_a, min_b, max_a, max_b), dilim, sistem = konum_parametreleri(
+        ('min_x', 'min_y', 'max_x', 'max_y'), ('min_boylam', 'min_enlem', 'max_boylam', 'max_enlem'))
+    koseler = ortak_duzlem_noktalari([(min_a, min_b), (max_a, min_b), (max_a, max_b), (min_a, max_b)],
+                                     dilim, sistem)
+    return konum_yaniti(konum_indeksi.getir().poligon(koseler))
+
+@rotalar.route('/api/konum/poligon', methods=['POST'])
+@login_required
+def api_konum_poligon():
+    """
+    Gövde: {"koordinatlar": [[x, y], ...], "dilim": 33[, "sistem": "ED50"]} veya
+    {"cografi": true, "koordinatlar": [[boylam, enlem], ...]} (en az üç köşe)
+    """
+    veri = request.get_json(silent=True) or {}
+    try:
+        poligon = [(float(x), float(y)) for x, y in veri.get('koordinatlar', [])]
+        dilim = None if veri.get('dilim') is None else int(veri['dilim'])
+    except (TypeError, ValueError):
+        abort(400)
+    if len(poligon) < 3:
+        abort(400)
+    if veri.get('cografi'):
+        koseler = ortak_duzlem_noktalari(poligon)
+    else:
+        koseler = ortak_duzlem_noktalari(poligon, *konum_dilimi(dilim, veri.get('sistem')))
+    return konum_yaniti(konum_indeksi.getir().poligon(koseler))
+
+# Harita (WGS84; kümeler yakınlaştırma düzeyi başına önceden hesaplanır)
+@rotalar.route('/api/harita/kumeler')
+@login_required
+def api_harita_kumeleri():
+    """
+    Görünen alandaki proje kümeleri.
+
+    Parametreler: ``?z=`` yakınlaştırma düzeyi, ``?alan=min_boylam,min_enlem,max_boylam,max_enlem``
+    (verilmezse tüm kümeler). Tek projeli kümelerde proje ID ve adı döner.
+    """
+    z = request.args.get('z', 0, type=int)
+    alan = request.args.get('alan')
+    harita = konum_indeksi.harita()
+    if alan:
+        try:
+            sinirlar = [float(deger) for deger in alan.split(',')]
+        except ValueError:
+            abort(400)
+        if len(sinirlar) != 4:
+            abort(400)
+        kumeler = harita.gorunum(z, *sinirlar)
+    else:
+        kumeler = harita.duzey(z)
+
+    tekil = [int(k) for k in kumeler['kimlik'] if k >= 0]
+    adlar = dict(db.session.execute(
+        db.select(Proje.id, Proje.proje_adi).where(Proje.id.in_(tekil))).all()) if tekil else {}
+    sonuc = []
+    for boylam, enlem, sayi, kimlik in zip(kumeler['boylam'].tolist(), kumeler['enlem'].tolist(),
+                                          kumeler['sayi'].tolist(), kumeler['kimlik'].tolist()):
+        kume = {'boylam': round(boylam, 6), 'enlem': round(enlem, 6), 'sayi': sayi}
+        if kimlik >= 0:
+            kume['proje_id'] = kimlik
+            kume['proje_adi'] = adlar.get(kimlik)
+        sonuc.append(kume)
+    return jsonify({'z': z, 'kumeler': sonuc})
+
+# Enterpolasyon (yakındaki kuyulardan tahmini profil)
+@rotalar.route('/api/enterpolasyon/profil')
+@login_required
+def api_enterpolasyon_profil():
+    """
+    Verilen noktada tahmini SPT profili ve katman üstleri.
+
+    Nokta ``?boylam=&enlem=`` (WGS84) veya ``?x=&y=&dilim=[&sistem=]`` (TM)
+    olarak verilir. ``?yontem=idw|kriging`` (varsayılan idw), ``?komsu=``
+    kullanılacak en yakın proje sayısı.
+    """
+    yontem = request.args.get('yontem', 'idw')
+    if yontem not in YONTEMLER:
+        abort(400)
+    if 'boylam' in request.args:
+        boylam, enlem = koordinat_parametreleri('boylam', 'enlem')
+    else:
+        x, y, dilim = koordinat_parametreleri('x', 'y', 'dilim')
+        sistem = request.args.get('sistem', VARSAYILAN_SISTEM)
+        if sistem not in KOORDINAT_SISTEMLERI:
+            abort(400)
+        boylam, enlem = (float(deger) for deger in wgs84e(x, y, dilim, sistem))
+    komsu = request.args.get('komsu', type=int)
+    tahmin = profil_tahmini.tahmin(boylam, enlem, yontem, min(max(komsu, 1), 50) if komsu else None)
+
+    adlar = dict(db.session.execute(
+        db.select(Proje.id, Proje.proje_adi).where(
+            Proje.id.in_([komsu['kimlik'] for komsu in tahmin['komsular']]))).all())
+    return jsonify({
+        'boylam': boylam,
+        'enlem': enlem,
+        'yontem': yontem,
+        'derinlik': tahmin['derinlik'].round(3).tolist(),
+        'n30': [None if d != d else round(d, 2) for d in tahmin['n30'].tolist()],
+        'belirsizlik': [None if d != d else round(d, 2) for d in tahmin['belirsizlik'].tolist()],
+        'veri_sayisi': tahmin['veri_sayisi'].tolist(),
+        'komsular': [{'proje_id': komsu['kimlik'], 'proje_adi': adlar.get(komsu['kimlik']),
+                      'mesafe': round(komsu['mesafe'], 1)} for komsu in tahmin['komsular']],
+        # Katman üstü ve belirsizliği derinlik gibi metredir (3 basamak)
+        'katmanlar': [{'tanim': katman['tanim'], 'ust': round(katman['ust'], 3),
+                       'belirsizlik': round(katman['belirsizlik'], 3), 'oran': round(katman['oran'], 3)}
+                      for katman in tahmin['katmanlar']],
+    })
+
+# Projeler arası istatistik
+def istatistik_parametreleri():
+    """
+    İstatistik rotalarının ortak parametreleri.
+
+    ``?parametre=`` (n30, c_kpa, aci_derece, dogal_bha) ile isteğe bağlı
+    ``zemin`` (zemin sınıfı, ör. KİL), ``il``, ``ilce``, ``min_derinlik`` ve
+    ``max_derinlik`` süzgeçleri; geçersiz değerlerde 400 döner. Derinlik
+    süzgeci 2.5 m'lik bantlara göre uygulanır: aralıkla kısmen kesişen
+    bantlar da tümüyle dahildir (ör. ``max_derinlik=4`` 2.5–5 m bandını içerir).
+    """
+    parametre = request.args.get('parametre', 'n30')
+    if parametre not in ISTATISTIK_PARAMETRELERI:
+        abort(400)
+    filtre = {ad: request.args.get(ad) for ad in ('zemin', 'il', 'ilce')}
+    for ad in ('min_derinlik', 'max_derinlik'):
+        if request.args.get(ad):
+            filtre[ad] = request.args.get(ad, type=float)
+            if filtre[ad] is None:
+                abort(400)
+    return parametre, filtre
+
+@rotalar.route('/api/istatistik/ozet')
+@login_required
+def api_istatistik_ozet():
+    """Tüm projelerde süzgece uyan ölçümlerin dağılımı (yüzdelikler ve histogram)"""
+    parametre, filtre = istatistik_parametreleri()
+    ozet = arsiv_istatistikleri.ozet(parametre, **filtre)
+    sinirlar = ozet['histogram']['sinirlar'].tolist()
+    return jsonify({
+        'parametre': parametre,
+        'filtre': filtre,
+        'sayi': ozet['sayi'],
+        'ortalama': None if ozet['ortalama'] != ozet['ortalama'] else round(ozet['ortalama'], 3),
+        'std': None if ozet['std'] != ozet['std'] else round(ozet['std'], 3),
+        'yuzdelikler': {str(k): None if d != d else round(d, 3) for k, d in ozet['yuzdelikler'].items()},
+        # Yalnızca dolu kutular: (alt sınır, üst sınır, sayı)
+        'histogram': [[round(sinirlar[i], 3), round(sinirlar[i + 1], 3), sayi]
+                      for i, sayi in enumerate(ozet['histogram']['sayilar'].tolist()) if sayi],
+    })
+
+@rotalar.route('/api/istatistik/gruplu')
+@login_required
+def api_istatistik_gruplu():
+    """Süzgece uyan ölçümlerin ``?grup=zemin|il|ilce|bant`` başına dağılımı"""
+    parametre, filtre = istatistik_parametreleri()
+    grup = request.args.get('grup', 'zemin')
+    if grup not in ISTATISTIK_GRUPLARI:
+        abort(400)
+    gruplar = arsiv_istatistikleri.gruplu(parametre, grup, **filtre)
+    for satir in gruplar:
+        satir['ortalama'] = round(satir['ortalama'], 3)
+        satir['std'] = round(satir['std'], 3)
+        satir['yuzdelikler'] = {str(k): round(d, 3) for k, d in satir['yuzdelikler'].items()}
+    return jsonify({'parametre': parametre, 'grup': grup, 'filtre': filtre, 'gruplar': gruplar})
+
 if __name__ == '__main__':
+    # Geliştirme sunucusu; üretimde wsgi.py ile çok süreçli sunucu kullanılır
+    app = create_app()
     with app.app_context():
-        db.create_all()
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+        veritabani_kur()
+    
+    # Geliştirme sunucusunda rapor işçilerini aynı makinede çalıştır
+    # (yeniden yükleyicinin ana sürecinde değil, yalnızca çalışan süreçte)
+    rapor_iscileri = None
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        # İşçiler veritabanı adresini ortamdan okur ve kendi motorlarını kurar
+        rapor_iscileri = RaporIsciHavuzu(isci_sayisi=app.config['RAPOR_ISCI_SAYISI'],
+                                         kuyruk_yolu=app.config['RAPOR_KUYRUK_YOLU'])
+        rapor_iscileri.baslat()
+    try:
+        app.run(host='0.0.0.0', port=5000, debug=app.config['DEBUG'])
+    finally:
+        if rapor_iscileri:
+            rapor_iscileri.durdur()
@@ -1,6 +1,9 @@
 import sys
 import os
 import sqlite3
+import logging
+import importlib
+import threading
 import traceback
 from functools import partial
 from PyQt6.QtWidgets import (
@@ -14,28 +17,69 @@ from PyQt6.QtGui import QDoubleValidator, QFont, QIcon, QAction, QPixmap
 from constants import VERITABANI_YOLU, LOG_YOLU, UYGULAMA_ADI
 from utils import (
     hata_logla, bilgi_goster, hata_goster, uyari_goster, onay_al, 
-    veritabani_baglantisi, tema_sinifi_belirle
+    veritabani_baglantisi, tema_sinifi_belirle, tarih_kaydi
 )
+from cekirdek.sorgu_profili import PROFIL_AKTIF, profilleyici, profili_etkinlestir
+from cekirdek.veritabani import proje_ozetlerini_yenile, tarih_araligi_kosulu, yeni_kuyu
+from takilma_bekcisi import BEKCI_AKTIF, TakilmaBekcisi
 from widgets import (
     ProjectCardWidget, TapuFormWidget, SondajFormWidget, AraziFormWidget,
     ProjectTableWidget, StatusIndicator
 )
-from dialogs import (
-    YeniProjeDialog, ProjeDetayDialog, RaporDialog
-)
-from visualization import SondajGrafikWidget
-from report_generator import SondajRaporuOlusturucu
+
+# Diyaloglar (rapor diyaloğu reportlab/pyplot yükler) ve grafikler
+# (matplotlib, numpy) ilk kullanımda içe aktarılır; böylece giriş
+# sonrasında ana pencere bu kütüphaneleri beklemeden açılır.
+
+# Pencere gösterildikten sonra arka planda önceden yüklenecek modüller
+ON_ISITMA_MODULLERI = ("numpy", "matplotlib.figure", "reportlab.platypus")
+ON_ISITMA_GECIKMESI = 1500  # ms
+ON_ISITMA_AKTIF = os.environ.get("SONDAJ_ON_ISITMA", "1") != "0"
+
+def agir_modulleri_isit(moduller=ON_ISITMA_MODULLERI):
+    """
+    Ağır kütüphaneleri arka plan iş parçacığında içe aktarır.
+    
+    Kullanıcı analiz sekmesini veya rapor diyaloğunu açtığında modüller
+    hazır olur. Qt nesnesi oluşturulmadığı için GUI iş parçacığına dokunmaz.
+    
+    Returns:
+        threading.Thread: Başlatılan iş parçacığı
+    """
+    def yukle():
+        for modul in moduller:
+            try:
+                importlib.import_module(modul)
+            except Exception as e:
+                hata_logla(f"Ön yükleme hatası ({modul}): {str(e)}", seviye=logging.WARNING)
+    
+    is_parcacigi = threading.Thread(target=yukle, name="modul-on-isitma", daemon=True)
+    is_parcacigi.start()
+    return is_parcacigi
 
 class AnaPencere(QMainWindow):
-    def __init__(self, kullanici_adi):
+    def __init__(self, kullanici_adi, on_isitma=ON_ISITMA_AKTIF):
         super().__init__()
         self.kullanici_adi = kullanici_adi
         self.mevcut_proje_id = None
         self.mevcut_proje_adi = None
+        self.mevcut_kuyu_id = None
         self.is_dark_theme = False
         self.is_data_changed = False
         self.status_timer = None
         self.unsaved_changes = False
+        self.on_isitma = on_isitma
+        self.on_isitma_basladi = False
+        
+        # Analiz grafikleri sekme ilk açıldığında oluşturulur
+        self.spt_graph = None
+        self.soil_graph = None
+        
+        # Olay döngüsü takılmalarını çağrı yeriyle kaydeder
+        self.takilma_bekcisi = None
+        if BEKCI_AKTIF:
+            self.takilma_bekcisi = TakilmaBekcisi(self)
+            self.takilma_bekcisi.baslat()
         
         hata_logla("Ana pencere başlatılıyor")
         try:
@@ -68,6 +112,11 @@ class AnaPencere(QMainWindow):
         # Araç çubuğu oluştur
         self.create_toolbar()
         
+        # SQL profili açıksa hata ayıklama menüsü
+        if PROFIL_AKTIF:
+            profili_etkinlestir(VERITABANI_YOLU)
+            self.create_debug_menu()
+        
         # Sekme widget'ı oluştur
         self.tabs = QTabWidget()
         self.tabs.setTabPosition(QTabWidget.TabPosition.North)
@@ -77,6 +126,7 @@ class AnaPencere(QMainWindow):
         self.create_dashboard_tab()
         self.create_project_tab()
         self.create_analysis_tab()
+        self.tabs.currentChanged.connect(self.sekme_degisti)
         
         # Ana düzene ekle
         self.main_layout.addWidget(self.tabs)
@@ -91,6 +141,13 @@ class AnaPencere(QMainWindow):
         
         # Başlangıç durumu
         self.update_statusbar("Hazır")
+    
+    def showEvent(self, event):
+        """Pencere ilk gösterildiğinde ağır modülleri arka planda yüklemeye başlar"""
+        super().showEvent(event)
+        if self.on_isitma and not self.on_isitma_basladi:
+            self.on_isitma_basladi = True
+            QTimer.singleShot(ON_ISITMA_GECIKMESI, agir_modulleri_isit)
         
     def create_toolbar(self):
         """Araç çubuğunu oluşturur"""
@@ -144,6 +201,42 @@ class AnaPencere(QMainWindow):
         exit_action.triggered.connect(self.cikis)
         toolbar.addAction(exit_action)
     
+    def create_debug_menu(self):
+        """SQL profili için hata ayıklama menüsünü oluşturur"""
+        debug_menu = self.menuBar().addMenu("Hata Ayıklama")
+        
+        save_profile_action = QAction("SQL Profilini Kaydet", self)
+        save_profile_action.triggered.connect(self.sql_profili_kaydet)
+        debug_menu.addAction(save_profile_action)
+        
+        reset_profile_action = QAction("SQL Profilini Sıfırla", self)
+        reset_profile_action.triggered.connect(profilleyici.sifirla)
+        debug_menu.addAction(reset_profile_action)
+        
+        debug_menu.addSeparator()
+        rebuild_summary_action = QAction("Proje Özetlerini Yeniden Hesapla", self)
+        rebuild_summary_action.triggered.connect(self.proje_ozetlerini_yenile)
+        debug_menu.addAction(rebuild_summary_action)
+    
+    def sql_profili_kaydet(self):
+        """Toplanan SQL profilini dosyaya yazar"""
+        yol = profilleyici.kaydet(VERITABANI_YOLU)
+        if yol:
+            bilgi_goster(self, "SQL Profili", f"Profil kaydedildi: {os.path.abspath(yol)}")
+        else:
+            hata_goster(self, "SQL Profili", "Profil kaydedilemedi. Ayrıntılar günlük dosyasında.")
+    
+    def proje_ozetlerini_yenile(self):
+        """Proje listesi özetlerini alt tablolardan yeniden hesaplar"""
+        try:
+            with veritabani_baglantisi() as conn:
+                proje_ozetlerini_yenile(conn)
+            self.projeleri_yukle()
+            bilgi_goster(self, "Proje Özetleri", "Proje özetleri yeniden hesaplandı.")
+        except Exception as e:
+            hata_logla(f"Proje özeti yenileme hatası: {str(e)}", e)
+            hata_goster(self, "Proje Özetleri", f"Özetler hesaplanamadı: {str(e)}")
+    
     def create_dashboard_tab(self):
         """Gösterge tablosu sekmesini oluşturur"""
         dashboard_tab = QWidget()
@@ -184,6 +277,17 @@ class AnaPencere(QMainWindow):
         self.search_box.setMinimumHeight(35)
         self.search_box.textChanged.connect(self.projeleri_filtrele)
         
+        # Kuyu bitiş tarihi aralığı (tarih indeksiyle veritabanında süzülür)
+        self.tarih_filtresi = QCheckBox("Bitiş tarihi")
+        self.tarih_filtresi.toggled.connect(lambda _: self.projeleri_yukle())
+        self.tarihten = QDateEdit(QDate.currentDate().addYears(-1))
+        self.tarihe = QDateEdit(QDate.currentDate())
+        for tarih_kutusu in (self.tarihten, self.tarihe):
+            tarih_kutusu.setCalendarPopup(True)
+            tarih_kutusu.setDisplayFormat("dd.MM.yyyy")
+            tarih_kutusu.setMinimumHeight(35)
+            tarih_kutusu.dateChanged.connect(self.tarih_filtresi_degisti)
+        
         # Yeni proje butonu
         new_project_btn = QPushButton("Yeni Proje")
         new_project_btn.setMinimumHeight(35)
@@ -191,6 +295,9 @@ class AnaPencere(QMainWindow):
         new_project_btn.clicked.connect(self.yeni_proje_ac)
         
         projects_toolbar_layout.addWidget(self.search_box, 3)
+        projects_toolbar_layout.addWidget(self.tarih_filtresi)
+        projects_toolbar_layout.addWidget(self.tarihten)
+        projects_toolbar_layout.addWidget(self.tarihe)
         projects_toolbar_layout.addWidget(new_project_btn, 1)
         
         # Projeler bölümü - Tabloya yüklemek için container
@@ -227,8 +334,20 @@ class AnaPencere(QMainWindow):
         self.project_status = QLabel("Lütfen bir proje seçin veya yeni proje oluşturun")
         self.project_status.setObjectName("status-label")
         
+        # Sondaj ve arazi formları ile analiz grafikleri seçili kuyuyla çalışır
+        self.kuyu_secici = QComboBox()
+        self.kuyu_secici.setMinimumWidth(120)
+        self.kuyu_secici.currentIndexChanged.connect(self.kuyu_degisti)
+        
+        self.btn_yeni_kuyu = QPushButton("Yeni Kuyu")
+        self.btn_yeni_kuyu.setIcon(QIcon.fromTheme("list-add", QIcon(":/icons/new.svg")))
+        self.btn_yeni_kuyu.clicked.connect(self.kuyu_ekle)
+        
         header_layout.addWidget(self.project_title)
         header_layout.addStretch()
+        header_layout.addWidget(QLabel("Kuyu:"))
+        header_layout.addWidget(self.kuyu_secici)
+        header_layout.addWidget(self.btn_yeni_kuyu)
         header_layout.addWidget(self.project_status)
         
         # Proje detay sekmelerini oluştur
@@ -309,10 +428,12 @@ class AnaPencere(QMainWindow):
         spt_title.setObjectName("subheader-label")
         spt_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        self.spt_graph = SondajGrafikWidget()
+        # Grafik widget'ı sekme ilk açıldığında yer tutucunun yerine konur
+        self.spt_graph_placeholder = QLabel("Grafikler yükleniyor...")
+        self.spt_graph_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         spt_layout.addWidget(spt_title)
-        spt_layout.addWidget(self.spt_graph)
+        spt_layout.addWidget(self.spt_graph_placeholder)
         
         # Zemin Profili Grafiği
         self.soil_graph_container = QFrame()
@@ -323,10 +444,11 @@ class AnaPencere(QMainWindow):
         soil_title.setObjectName("subheader-label")
         soil_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        self.soil_graph = SondajGrafikWidget()
+        self.soil_graph_placeholder = QLabel("Grafikler yükleniyor...")
+        self.soil_graph_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         soil_layout.addWidget(soil_title)
-        soil_layout.addWidget(self.soil_graph)
+        soil_layout.addWidget(self.soil_graph_placeholder)
         
         # Splitter'a ekle
         self.splitter.addWidget(self.spt_graph_container)
@@ -337,7 +459,32 @@ class AnaPencere(QMainWindow):
         analysis_layout.addWidget(control_frame)
         analysis_layout.addWidget(self.splitter)
         
-        self.tabs.addTab(analysis_tab, QIcon.fromTheme("applications-science", QIcon(":/icons/analyze.svg")), "Analiz")
+        self.analysis_tab_index = self.tabs.addTab(analysis_tab, QIcon.fromTheme("applications-science", QIcon(":/icons/analyze.svg")), "Analiz")
+    
+    def sekme_degisti(self, index):
+        """Analiz sekmesi ilk kez açıldığında grafikleri oluşturur"""
+        if index == self.analysis_tab_index and self.spt_graph is None:
+            self.grafikleri_olustur()
+    
+    def grafikleri_olustur(self):
+        """Matplotlib tabanlı grafik widget'larını ilk kullanımda oluşturur"""
+        try:
+            self.update_statusbar("Grafik modülleri yükleniyor...")
+            from visualization import SondajGrafikWidget
+            
+            self.spt_graph = SondajGrafikWidget()
+            self.spt_graph_container.layout().replaceWidget(self.spt_graph_placeholder, self.spt_graph)
+            self.spt_graph_placeholder.deleteLater()
+            
+            self.soil_graph = SondajGrafikWidget()
+            self.soil_graph_container.layout().replaceWidget(self.soil_graph_placeholder, self.soil_graph)
+            self.soil_graph_placeholder.deleteLater()
+            
+            # Seçili projenin grafiklerini çiz
+            self.analizi_guncelle()
+        except Exception as e:
+            hata_logla(f"Grafik modülleri yükleme hatası: {str(e)}", e)
+            hata_goster(self, "Analiz Hatası", f"Grafik modülleri yüklenirken bir hata oluştu: {str(e)}")
     
     def projeleri_yukle(self):
         """Veritabanından projeleri yükler"""
@@ -345,15 +492,18 @@ class AnaPencere(QMainWindow):
             self.update_statusbar("Projeler yükleniyor...")
             with veritabani_baglantisi() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
+                kosul, parametreler = self.tarih_kosulu()
+                # Proje başına tek özet satırı (tetikleyicilerle güncel tutulur)
+                cursor.execute(f"""
                     SELECT p.id, p.proje_adi, p.yuklenici_firma, p.sorumlu_muhendis,
-                           t.il, t.ilce, 
-                           s.sondaj_derinligi, s.bitis_tarihi
+                           t.il, t.ilce,
+                           o.kuyu_sayisi, o.kuyu_derinligi, o.son_arazi_tarihi
                     FROM Projeler p
                     LEFT JOIN TapuBilgileri t ON p.id = t.proje_id
-                    LEFT JOIN SondajBilgileri s ON p.id = s.proje_id
+                    LEFT JOIN ProjeOzetleri o ON p.id = o.proje_id
+                    WHERE {kosul}
                     ORDER BY p.id DESC
-                """)
+                """, parametreler)
                 
                 projeler = cursor.fetchall()
                 
@@ -375,13 +525,15 @@ class AnaPencere(QMainWindow):
                         proje["yuklenici_firma"] or "-",
                         proje["sorumlu_muhendis"] or "-",
                         f"{proje['il'] or '-'}, {proje['ilce'] or '-'}",
-                        proje["sondaj_derinligi"] or 0,
-                        proje["bitis_tarihi"] or "-"
+                        proje["kuyu_derinligi"] or 0,
+                        QDate.fromString(proje["son_arazi_tarihi"], "yyyy-MM-dd").toString("dd.MM.yyyy")
+                        if proje["son_arazi_tarihi"] else "-"
                     )
                     
                     # Analiz ComboBox'a ekle
                     self.analysis_project_selector.addItem(f"{proje_id} - {proje_adi}", proje_id)
                 
+                self.projeleri_filtrele(self.search_box.text())
                 self.update_statusbar("Projeler yüklendi")
         except Exception as e:
             hata_logla(f"Projeleri yükleme hatası: {str(e)}", e)
@@ -391,6 +543,17 @@ class AnaPencere(QMainWindow):
         """Projeleri filtreler"""
         self.projects_table.filter_projects(text)
     
+    def tarih_kosulu(self):
+        """Proje listesi için tarih aralığı koşulu ve parametreleri"""
+        if not self.tarih_filtresi.isChecked():
+            return tarih_araligi_kosulu()
+        return tarih_araligi_kosulu(tarih_kaydi(self.tarihten.date()), tarih_kaydi(self.tarihe.date()))
+    
+    def tarih_filtresi_degisti(self):
+        """Aralık değişince filtre açıksa projeleri yeniden yükler"""
+        if self.tarih_filtresi.isChecked():
+            self.projeleri_yukle()
+    
     def yeni_proje_ac(self):
         """Yeni proje oluşturma diyaloğunu açar"""
         try:
@@ -400,6 +563,7 @@ class AnaPencere(QMainWindow):
                         "Kaydedilmemiş değişiklikler var. Devam etmek istiyor musunuz?"):
                     return
             
+            from dialogs import YeniProjeDialog
             dialog = YeniProjeDialog(self)
             if dialog.exec():
                 proje_adi = dialog.get_project_name()
@@ -491,10 +655,11 @@ class AnaPencere(QMainWindow):
                 self.txt_yuklenici.setText(proje["yuklenici_firma"] or "")
                 self.txt_muhendis.setText(proje["sorumlu_muhendis"] or "")
                 
-                # Tapu, sondaj ve arazi formlarını yükle
+                # Tapu, sondaj ve arazi formlarını yükle (sondaj ve arazi ilk kuyuyla)
+                self.kuyulari_yukle(proje_id)
                 self.tapu_form_widget.load_data(proje_id)
-                self.sondaj_form_widget.load_data(proje_id)
-                self.arazi_form_widget.load_data(proje_id)
+                self.sondaj_form_widget.load_data(proje_id, self.mevcut_kuyu_id)
+                self.arazi_form_widget.load_data(proje_id, self.mevcut_kuyu_id)
                 
                 # Analiz grafiklerini güncelle
                 self.analysis_project_selector.setCurrentIndex(
@@ -511,9 +676,80 @@ class AnaPencere(QMainWindow):
                 self.update_statusbar(f"Proje #{proje_id} - {self.mevcut_proje_adi} yüklendi")
                 
         except Exception as e:
-            hata_logla(f"Proje yükleme hatası (ID: {proje_id}): {str(e)}", e)
+            hata_logla(f"Proje yükleme hatası (ID: {proje_id}): {str(e)}", e, proje_id=proje_id)
             hata_goster(self, "Proje Yükleme Hatası", f"Proje yüklenirken bir hata oluştu: {str(e)}")
     
+    def kuyulari_yukle(self, proje_id, kuyu_id=None):
+        """
+        Kuyu seçicisini projenin kuyularıyla doldurur.
+        
+        Args:
+            proje_id (int): Proje ID
+            kuyu_id (int, optional): Seçilecek kuyu; verilmezse ilk kuyu
+        """
+        with veritabani_baglantisi() as conn:
+            kuyular = conn.execute(
+                "SELECT id, kuyu_adi FROM SondajBilgileri WHERE proje_id = ? ORDER BY id", (proje_id,)
+            ).fetchall()
+        
+        # Doldururken formlar ayrı ayrı yeniden yüklenmesin
+        self.kuyu_secici.blockSignals(True)
+        self.kuyu_secici.clear()
+        for kuyu in kuyular:
+            self.kuyu_secici.addItem(kuyu["kuyu_adi"] or f"Kuyu #{kuyu['id']}", kuyu["id"])
+        self.kuyu_secici.setCurrentIndex(max(0, self.kuyu_secici.findData(kuyu_id)) if kuyular else -1)
+        self.kuyu_secici.blockSignals(False)
+        
+        self.mevcut_kuyu_id = self.kuyu_secici.currentData()
+    
+    def kuyu_degisti(self, index):
+        """Kuyu seçicisinde kuyu değiştiğinde sondaj/arazi formlarını ve grafikleri yeniler"""
+        kuyu_id = self.kuyu_secici.currentData()
+        if not self.mevcut_proje_id or kuyu_id is None or kuyu_id == self.mevcut_kuyu_id:
+            return
+        
+        if self.unsaved_changes:
+            if not onay_al(self, "Kaydedilmemiş Değişiklikler", 
+                    "Kaydedilmemiş değişiklikler var. Devam etmek istiyor musunuz?"):
+                # Seçimi önceki kuyuya geri al
+                self.kuyu_secici.blockSignals(True)
+                self.kuyu_secici.setCurrentIndex(self.kuyu_secici.findData(self.mevcut_kuyu_id))
+                self.kuyu_secici.blockSignals(False)
+                return
+        
+        try:
+            self.mevcut_kuyu_id = kuyu_id
+            self.sondaj_form_widget.load_data(self.mevcut_proje_id, kuyu_id)
+            self.arazi_form_widget.load_data(self.mevcut_proje_id, kuyu_id)
+            self.analizi_guncelle()
+            
+            self.unsaved_changes = False
+            self.update_statusbar(f"Proje #{self.mevcut_proje_id} - {self.kuyu_secici.currentText()} yüklendi")
+            
+        except Exception as e:
+            hata_logla(f"Kuyu yükleme hatası (ID: {kuyu_id}): {str(e)}", e, proje_id=self.mevcut_proje_id)
+            hata_goster(self, "Kuyu Yükleme Hatası", f"Kuyu yüklenirken bir hata oluştu: {str(e)}")
+    
+    def kuyu_ekle(self):
+        """Projeye sıradaki adla (SK-2, SK-3, ...) yeni kuyu ekler ve onu seçer"""
+        if not self.mevcut_proje_id:
+            uyari_goster(self, "Proje Seçilmedi", "Lütfen önce bir proje seçin.")
+            return
+        
+        try:
+            with veritabani_baglantisi() as conn:
+                kuyu_id = yeni_kuyu(conn, self.mevcut_proje_id)
+                conn.commit()
+            
+            # Seçici yeni kuyuya geçer; formlar kuyu_degisti ile yüklenir
+            self.kuyulari_yukle(self.mevcut_proje_id, self.mevcut_kuyu_id)
+            self.kuyu_secici.setCurrentIndex(self.kuyu_secici.findData(kuyu_id))
+            self.project_tabs.setCurrentWidget(self.sondaj_form_widget)
+            
+        except Exception as e:
+            hata_logla(f"Kuyu ekleme hatası: {str(e)}", e, proje_id=self.mevcut_proje_id)
+            hata_goster(self, "Kuyu Ekleme Hatası", f"Kuyu eklenirken bir hata oluştu: {str(e)}")
+    
     def proje_guncelle(self):
         """Proje bilgilerini günceller"""
         if not self.mevcut_proje_id:
@@ -576,6 +812,9 @@ class AnaPencere(QMainWindow):
             if not self.arazi_form_widget.save_data(self.mevcut_proje_id):
                 raise Exception("Arazi bilgileri kaydedilemedi")
             
+            # Kuyusu olmayan projede kayıt ilk kuyuyu açar; seçici yenilenir
+            self.kuyulari_yukle(self.mevcut_proje_id, self.sondaj_form_widget.sondaj_id)
+            
             # Değişiklik bayrağını sıfırla
             self.unsaved_changes = False
             
@@ -628,6 +867,10 @@ class AnaPencere(QMainWindow):
             if proje_id == self.mevcut_proje_id:
                 self.mevcut_proje_id = None
                 self.mevcut_proje_adi = None
+                self.mevcut_kuyu_id = None
+                self.kuyu_secici.blockSignals(True)
+                self.kuyu_secici.clear()
+                self.kuyu_secici.blockSignals(False)
                 self.project_title.setText("Proje Yüklenmedi")
                 self.project_status.setText("Lütfen bir proje seçin veya yeni proje oluşturun")
                 self.txt_proje_adi.clear()
@@ -653,6 +896,7 @@ class AnaPencere(QMainWindow):
     def proje_detay_goster(self, proje_id):
         """Proje detaylarını gösteren diyalog açar"""
         try:
+            from dialogs import ProjeDetayDialog
             dialog = ProjeDetayDialog(self, proje_id)
             dialog.exec()
         except Exception as e:
@@ -667,6 +911,10 @@ class AnaPencere(QMainWindow):
     
     def analizi_guncelle(self, proje_id=None):
         """Analiz grafiklerini günceller"""
+        if self.spt_graph is None:
+            # Grafikler henüz oluşturulmadı; analiz sekmesi açıldığında çizilecek
+            return
+        
         if proje_id is None:
             proje_id = self.analysis_project_selector.currentData()
             
@@ -686,11 +934,14 @@ class AnaPencere(QMainWindow):
         try:
             self.update_statusbar("Grafikler oluşturuluyor...")
             
+            # Açık projenin grafikleri seçili kuyuyu, diğer projelerinki ilk kuyuyu gösterir
+            kuyu_id = self.mevcut_kuyu_id if proje_id == self.mevcut_proje_id else None
+            
             # SPT Grafiği
-            self.spt_graph.spt_verileri_goster(proje_id)
+            self.spt_graph.spt_verileri_goster(proje_id, kuyu_id)
             
             # Zemin Profili Grafiği
-            self.soil_graph.zemin_profili_goster(proje_id)
+            self.soil_graph.zemin_profili_goster(proje_id, kuyu_id)
             
             self.update_statusbar("Grafikler oluşturuldu")
             
@@ -705,6 +956,8 @@ class AnaPencere(QMainWindow):
             return
         
         try:
+            self.update_statusbar("Rapor modülleri yükleniyor...")
+            from dialogs import RaporDialog  # reportlab ve pyplot ilk raporda yüklenir
             dialog = RaporDialog(self, self.mevcut_proje_id, self.mevcut_proje_adi)
             dialog.exec()
         except Exception as e:
@@ -820,4 +1073,6 @@ class AnaPencere(QMainWindow):
                 event.ignore()
                 return
         
+        if self.takilma_bekcisi:
+            self.takilma_bekcisi.durdur()
         event.accept()
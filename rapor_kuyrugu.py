@@ -0,0 +1,495 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+import multiprocessing
+from datetime import datetime
+
+from sqlalchemy import create_engine, text
+
+from ayarlar import ayarlari_sec, veritabani_adresi, motor_secenekleri, motor_olaylarini_bagla
+from cekirdek.gunluk import hata_logla, baglam
+from cekirdek.rapor import SondajRaporuOlusturucu, RAPOR_SUTUNLARI
+from cekirdek.veri_koprusu import kayit_tablosu
+
+KUYRUK_YOLU = os.environ.get("RAPOR_KUYRUK_YOLU", "rapor_kuyrugu.db")
+RAPOR_DIZINI = os.environ.get("RAPOR_DIZINI", "raporlar")
+VARSAYILAN_ISCI_SAYISI = int(os.environ.get("RAPOR_ISCI_SAYISI", "2"))
+
+# İş durumları
+DURUM_BEKLIYOR = "bekliyor"
+DURUM_CALISIYOR = "calisiyor"
+DURUM_TAMAMLANDI = "tamamlandi"
+DURUM_HATA = "hata"
+AKTIF_DURUMLAR = (DURUM_BEKLIYOR, DURUM_CALISIYOR)
+
+# Bu süre boyunca ilerleme bildirmeyen çalışan işler çökmüş kabul edilir
+TAKILMA_SURESI = 600
+
+
+def _simdi():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class RaporKuyrugu:
+    """
+    SQLite tablosu üzerinde çalışan rapor iş kuyruğu.
+
+    Harici bir aracı (broker) gerektirmez; web işlemleri iş ekler ve durum
+    sorgular, ayrı işçi süreçleri işleri sırayla alıp raporu üretir.
+    """
+    def __init__(self, yol=None, azami_eszamanli=VARSAYILAN_ISCI_SAYISI):
+        """
+        Kuyruğu başlatır
+
+        Args:
+            yol: Kuyruk veritabanı dosyasının yolu; verilmezse kuyruk
+                ``init_app`` ile uygulama ayarlarından açılır
+            azami_eszamanli: Aynı anda çalışabilecek en fazla iş sayısı
+        """
+        self.yol = yol
+        self.azami_eszamanli = azami_eszamanli
+        if yol is not None:
+            self.tablo_olustur()
+
+    def init_app(self, app):
+        """
+        Kuyruğu ``RAPOR_KUYRUK_YOLU`` ayarındaki dosyada açar.
+
+        Args:
+            app (Flask): Uygulama
+        """
+        self.yol = app.config.get("RAPOR_KUYRUK_YOLU", KUYRUK_YOLU)
+        self.azami_eszamanli = app.config.get("RAPOR_ISCI_SAYISI", self.azami_eszamanli)
+        self.tablo_olustur()
+        app.extensions["rapor_kuyrugu"] = self
+
+    def baglanti(self):
+        """
+        Kuyruk veritabanına bağlantı oluşturur.
+
+        Returns:
+            sqlite3.Connection: Otomatik commit kipinde bağlantı
+        """
+        conn = sqlite3.connect(self.yol, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def tablo_olustur(self):
+        """Kuyruk tablosunu ve indekslerini oluşturur (yoksa)"""
+        conn = self.baglanti()
+        try:
+            conn.execute('''CREATE TABLE IF NOT EXISTS RaporIsleri (
+                                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                anahtar TEXT NOT NULL,
+                                tur TEXT NOT NULL,
+                                proje_id INTEGER NOT NULL,
+                                parametreler TEXT,
+                                kullanici TEXT,
+                                durum TEXT NOT NULL,
+                                ilerleme INTEGER DEFAULT 0,
+                                mesaj TEXT,
+                                dosya_yolu TEXT,
+                                hata TEXT,
+                                isci TEXT,
+                                olusturma_zamani TEXT,
+                                baslama_zamani TEXT,
+                                bitis_zamani TEXT,
+                                son_nabiz REAL)''')
+            # Aynı anahtarla yalnızca bir aktif iş olabilir
+            conn.execute('''CREATE UNIQUE INDEX IF NOT EXISTS ix_rapor_isleri_aktif_anahtar
+                            ON RaporIsleri(anahtar)
+                            WHERE durum IN ('bekliyor', 'calisiyor')''')
+            conn.execute('''CREATE INDEX IF NOT EXISTS ix_rapor_isleri_durum
+                            ON RaporIsleri(durum, id)''')
+        finally:
+            conn.close()
+
+    @staticmethod
+    def anahtar_olustur(tur, proje_id, parametreler=None):
+        """
+        Aynı işlerin tekilleştirilmesi için iş anahtarı üretir.
+
+        Returns:
+            str: İşi tanımlayan özet değer
+        """
+        icerik = json.dumps({"tur": tur, "proje_id": proje_id, "parametreler": parametreler or {}},
+                            sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(icerik.encode("utf-8")).hexdigest()
+
+    def is_ekle(self, proje_id, tur="pdf", parametreler=None, kullanici=None):
+        """
+        Kuyruğa yeni bir rapor işi ekler.
+
+        Aynı proje ve parametrelerle bekleyen veya çalışan bir iş varsa
+        yeni iş eklenmez, mevcut iş döndürülür.
+
+        Args:
+            proje_id: Raporlanacak proje ID'si
+            tur: Rapor türü
+            parametreler (dict, optional): Rapora özel parametreler
+            kullanici (str, optional): İşi isteyen kullanıcı
+
+        Returns:
+            tuple: (iş ID'si, yeni iş eklendiyse True)
+        """
+        anahtar = self.anahtar_olustur(tur, proje_id, parametreler)
+        conn = self.baglanti()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            mevcut = conn.execute(
+                "SELECT id FROM RaporIsleri WHERE anahtar = ? AND durum IN (?, ?)",
+                (anahtar, *AKTIF_DURUMLAR)
+            ).fetchone()
+            if mevcut:
+                conn.execute("COMMIT")
+                return mevcut["id"], False
+
+            cursor = conn.execute(
+                """INSERT INTO RaporIsleri
+                   (anahtar, tur, proje_id, parametreler, kullanici, durum, mesaj, olusturma_zamani)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (anahtar, tur, proje_id, json.dumps(parametreler or {}), kullanici,
+                 DURUM_BEKLIYOR, "Sırada bekliyor", _simdi())
+            )
+            conn.execute("COMMIT")
+            return cursor.lastrowid, True
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def durum(self, is_id):
+        """
+        İşin güncel durumunu döndürür.
+
+        Returns:
+            dict: İş kaydı, iş bulunamazsa None
+        """
+        conn = self.baglanti()
+        try:
+            satir = conn.execute("SELECT * FROM RaporIsleri WHERE id = ?", (is_id,)).fetchone()
+            if not satir:
+                return None
+            kayit = dict(satir)
+            kayit["parametreler"] = json.loads(kayit["parametreler"] or "{}")
+            # Sıradaki konum bekleyen işler için bilgilendirme amaçlı
+            if kayit["durum"] == DURUM_BEKLIYOR:
+                kayit["sira"] = conn.execute(
+                    "SELECT COUNT(*) FROM RaporIsleri WHERE durum = ? AND id < ?",
+                    (DURUM_BEKLIYOR, is_id)
+                ).fetchone()[0] + 1
+            return kayit
+        finally:
+            conn.close()
+
+    def is_al(self, isci_adi):
+        """
+        Sıradaki bekleyen işi çalışıyor olarak işaretleyip döndürür.
+
+        Eşzamanlı çalışan iş sayısı sınırına ulaşıldıysa iş verilmez.
+
+        Args:
+            isci_adi: İşi alan işçinin adı
+
+        Returns:
+            dict: Alınan iş, uygun iş yoksa None
+        """
+        conn = self.baglanti()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            calisan = conn.execute(
+                "SELECT COUNT(*) FROM RaporIsleri WHERE durum = ?", (DURUM_CALISIYOR,)
+            ).fetchone()[0]
+            if calisan >= self.azami_eszamanli:
+                conn.execute("COMMIT")
+                return None
+
+            satir = conn.execute(
+                "SELECT * FROM RaporIsleri WHERE durum = ? ORDER BY id LIMIT 1", (DURUM_BEKLIYOR,)
+            ).fetchone()
+            if not satir:
+                conn.execute("COMMIT")
+                return None
+
+            conn.execute(
+                """UPDATE RaporIsleri
+                   SET durum = ?, isci = ?, baslama_zamani = ?, son_nabiz = ?, mesaj = ?
+                   WHERE id = ?""",
+                (DURUM_CALISIYOR, isci_adi, _simdi(), time.time(), "Başlatıldı", satir["id"])
+            )
+            conn.execute("COMMIT")
+            kayit = dict(satir)
+            kayit["parametreler"] = json.loads(kayit["parametreler"] or "{}")
+            return kayit
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def ilerleme_bildir(self, is_id, yuzde, mesaj=None):
+        """Çalışan işin ilerleme yüzdesini ve mesajını günceller"""
+        conn = self.baglanti()
+        try:
+            conn.execute(
+                "UPDATE RaporIsleri SET ilerleme = ?, mesaj = ?, son_nabiz = ? WHERE id = ? AND durum = ?",
+                (int(yuzde), mesaj, time.time(), is_id, DURUM_CALISIYOR)
+            )
+        finally:
+            conn.close()
+
+    def tamamla(self, is_id, dosya_yolu):
+        """İşi tamamlandı olarak işaretler"""
+        conn = self.baglanti()
+        try:
+            conn.execute(
+                """UPDATE RaporIsleri
+                   SET durum = ?, ilerleme = 100, mesaj = ?, dosya_yolu = ?, bitis_zamani = ?
+                   WHERE id = ?""",
+                (DURUM_TAMAMLANDI, "Rapor hazır", dosya_yolu, _simdi(), is_id)
+            )
+        finally:
+            conn.close()
+
+    def basarisiz(self, is_id, hata):
+        """İşi hatalı olarak işaretler"""
+        conn = self.baglanti()
+        try:
+            conn.execute(
+                "UPDATE RaporIsleri SET durum = ?, mesaj = ?, hata = ?, bitis_zamani = ? WHERE id = ?",
+                (DURUM_HATA, "Rapor oluşturulamadı", str(hata), _simdi(), is_id)
+            )
+        finally:
+            conn.close()
+
+    def takili_isleri_kurtar(self, sure=TAKILMA_SURESI):
+        """
+        Uzun süredir nabız göndermeyen çalışan işleri yeniden sıraya alır.
+
+        Returns:
+            int: Yeniden sıraya alınan iş sayısı
+        """
+        conn = self.baglanti()
+        try:
+            cursor = conn.execute(
+                """UPDATE RaporIsleri
+                   SET durum = ?, isci = NULL, ilerleme = 0, mesaj = ?
+                   WHERE durum = ? AND son_nabiz < ?""",
+                (DURUM_BEKLIYOR, "Yeniden sıraya alındı", DURUM_CALISIYOR, time.time() - sure)
+            )
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+
+class WebRaporOlusturucu(SondajRaporuOlusturucu):
+    """
+    Web uygulamasının veritabanındaki projeler için rapor oluşturucu.
+
+    Proje, tapu ve sondaj satırları masaüstü şemasındaki adlarla, arazi
+    kayıtları köprü tablosu olarak okunur; böylece rapor gövdesi masaüstü
+    sürümüyle aynı kalır.
+
+    Args:
+        proje_id: Raporlanacak proje ID'si
+        motor (sqlalchemy.engine.Engine): Bağlantıların alınacağı motor; uygulama
+            içinde ``db.engine``, işçi süreçlerinde ``veritabani_motoru()``
+    """
+    def __init__(self, proje_id, motor, cikti_dizini=RAPOR_DIZINI, ilerleme=None):
+        super().__init__(proje_id, cikti_dizini, ilerleme)
+        self.motor = motor
+
+    def veri_yukle(self):
+        """Web veritabanından gerekli bilgileri yükler"""
+        try:
+            with self.motor.connect() as conn:
+                parametre = {"proje_id": self.proje_id}
+
+                satir = conn.execute(text(
+                    "SELECT * FROM proje WHERE id = :proje_id"
+                ), parametre).mappings().first()
+                self.proje_bilgileri = dict(satir) if satir else None
+
+                satir = conn.execute(text(
+                    "SELECT * FROM tapu_bilgileri WHERE proje_id = :proje_id"
+                ), parametre).mappings().first()
+                self.tapu_bilgileri = dict(satir) if satir else None
+
+                # Projenin ilk kuyusu raporlanır
+                satir = conn.execute(text(
+                    "SELECT * FROM sondaj_bilgileri WHERE proje_id = :proje_id ORDER BY id LIMIT 1"
+                ), parametre).mappings().first()
+                parametre["sondaj_id"] = satir["id"] if satir else None
+                # Tarihler rapor gövdesinde ``tarih_bicimle`` ile biçimlenir
+                self.sondaj_bilgileri = dict(satir) if satir else None
+
+                # Web sütun adları köprünün kararlı kimlikleriyle aynıdır
+                self.arazi_bilgileri = kayit_tablosu(conn.execute(text(
+                    f"SELECT {', '.join(RAPOR_SUTUNLARI)} FROM arazi_bilgileri "
+                    "WHERE sondaj_id = :sondaj_id ORDER BY sondaj_derinligi"
+                ), parametre), RAPOR_SUTUNLARI)
+
+            if not self.proje_bilgileri:
+                raise ValueError(f"Proje bulunamadı (ID: {self.proje_id})")
+
+            return True
+
+        except Exception as e:
+            hata_logla(f"Rapor için web verisi yükleme hatası: {str(e)}", e)
+            return False
+
+
+def veritabani_motoru(veritabani_url=None):
+    """
+    İşçi süreci için veritabanı motoru (işçi başına bir kez kurulur).
+
+    Motor, uygulamadaki gibi ``motor_secenekleri`` ve SQLite ayarlarıyla
+    kurulur. Adres verilmezse ortamdan (``DATABASE_URL``) okunur; böylece
+    parola süreç argümanlarında taşınmaz.
+
+    Args:
+        veritabani_url (str, optional): Web uygulamasının veritabanı adresi
+
+    Returns:
+        sqlalchemy.engine.Engine: Motor
+    """
+    adres = veritabani_url or veritabani_adresi()
+    motor = create_engine(adres, **motor_secenekleri(adres, ayarlari_sec()))
+    motor_olaylarini_bagla(motor)
+    return motor
+
+
+def isi_calistir(kuyruk, is_kaydi, motor, cikti_dizini=RAPOR_DIZINI):
+    """
+    Tek bir rapor işini çalıştırır ve sonucunu kuyruğa yazar.
+
+    Args:
+        kuyruk (RaporKuyrugu): İşin bulunduğu kuyruk
+        is_kaydi (dict): Kuyruktan alınan iş
+        motor (sqlalchemy.engine.Engine): Web uygulamasının veritabanı motoru
+        cikti_dizini: Raporların kaydedileceği dizin
+    """
+    is_id = is_kaydi["id"]
+    with baglam(proje_id=is_kaydi["proje_id"], kullanici=is_kaydi.get("kullanici"), islem="rapor"):
+        try:
+            olusturucu = WebRaporOlusturucu(
+                is_kaydi["proje_id"],
+                motor,
+                cikti_dizini=os.path.join(cikti_dizini, str(is_id)),
+                ilerleme=lambda yuzde, mesaj: kuyruk.ilerleme_bildir(is_id, yuzde, mesaj)
+            )
+            dosya_yolu, mesaj = olusturucu.rapor_olustur()
+            if dosya_yolu:
+                kuyruk.tamamla(is_id, os.path.abspath(dosya_yolu))
+            else:
+                kuyruk.basarisiz(is_id, mesaj)
+        except Exception as e:
+            hata_logla(f"Rapor işi hatası (İş: {is_id}): {str(e)}", e)
+            kuyruk.basarisiz(is_id, str(e))
+
+
+def isci_dongusu(kuyruk_yolu, veritabani_url=None, cikti_dizini=RAPOR_DIZINI, azami_eszamanli=VARSAYILAN_ISCI_SAYISI,
+                 bekleme=1.0, durdur=None, tek_sefer=False):
+    """
+    Kuyruktan iş alıp çalıştıran işçi döngüsü.
+
+    Args:
+        kuyruk_yolu: Kuyruk veritabanı dosyasının yolu
+        veritabani_url (str, optional): Web uygulamasının veritabanı adresi;
+            verilmezse ``DATABASE_URL``
+        cikti_dizini: Raporların kaydedileceği dizin
+        azami_eszamanli: Aynı anda çalışabilecek en fazla iş sayısı
+        bekleme: Kuyruk boşken iki kontrol arasındaki süre (saniye)
+        durdur (multiprocessing.Event, optional): Döngüyü sonlandırma sinyali
+        tek_sefer: True ise kuyrukta iş kalmayınca döngüden çıkılır
+
+    Returns:
+        int: Çalıştırılan iş sayısı
+    """
+    kuyruk = RaporKuyrugu(kuyruk_yolu, azami_eszamanli)
+    motor = veritabani_motoru(veritabani_url)
+    isci_adi = f"isci-{os.getpid()}"
+    sayac = 0
+
+    try:
+        while not (durdur and durdur.is_set()):
+            try:
+                kuyruk.takili_isleri_kurtar()
+                is_kaydi = kuyruk.is_al(isci_adi)
+            except sqlite3.Error as e:
+                hata_logla(f"Rapor kuyruğu okuma hatası: {str(e)}", e)
+                is_kaydi = None
+
+            if is_kaydi:
+                isi_calistir(kuyruk, is_kaydi, motor, cikti_dizini)
+                sayac += 1
+                continue
+
+            if tek_sefer:
+                break
+            time.sleep(bekleme)
+    finally:
+        motor.dispose()
+
+    return sayac
+
+
+class RaporIsciHavuzu:
+    """Rapor işlerini çalıştıran işçi süreçlerini yönetir"""
+    def __init__(self, veritabani_url=None, isci_sayisi=VARSAYILAN_ISCI_SAYISI,
+                 kuyruk_yolu=KUYRUK_YOLU, cikti_dizini=RAPOR_DIZINI):
+        self.veritabani_url = veritabani_url
+        self.isci_sayisi = isci_sayisi
+        self.kuyruk_yolu = kuyruk_yolu
+        self.cikti_dizini = cikti_dizini
+        self.surecler = []
+        self.durdur_olayi = multiprocessing.Event()
+
+    def baslat(self):
+        """İşçi süreçlerini başlatır"""
+        # Tablonun süreçler başlamadan oluşturulduğundan emin ol
+        RaporKuyrugu(self.kuyruk_yolu, self.isci_sayisi)
+        for i in range(self.isci_sayisi):
+            surec = multiprocessing.Process(
+                target=isci_dongusu,
+                name=f"rapor-iscisi-{i + 1}",
+                args=(self.kuyruk_yolu, self.veritabani_url, self.cikti_dizini, self.isci_sayisi),
+                kwargs={"durdur": self.durdur_olayi},
+                daemon=True
+            )
+            surec.start()
+            self.surecler.append(surec)
+        hata_logla(f"{self.isci_sayisi} rapor işçisi başlatıldı")
+
+    def durdur(self, zaman_asimi=10):
+        """İşçi süreçlerini durdurur"""
+        self.durdur_olayi.set()
+        for surec in self.surecler:
+            surec.join(zaman_asimi)
+            if surec.is_alive():
+                surec.terminate()
+        self.surecler = []
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rapor kuyruğu işçilerini çalıştırır")
+    parser.add_argument("--isci", type=int, default=VARSAYILAN_ISCI_SAYISI, help="İşçi süreç sayısı")
+    parser.add_argument("--veritabani", help="Web uygulamasının veritabanı adresi (verilmezse DATABASE_URL)")
+    parser.add_argument("--kuyruk", default=KUYRUK_YOLU, help="Kuyruk veritabanı dosyası")
+    parser.add_argument("--cikti", default=RAPOR_DIZINI, help="Rapor çıktı dizini")
+    args = parser.parse_args()
+
+    havuz = RaporIsciHavuzu(args.veritabani, args.isci, args.kuyruk, args.cikti)
+    havuz.baslat()
+    try:
+        while any(surec.is_alive() for surec in havuz.surecler):
+            time.sleep(1)
+    except KeyboardInterrupt:
+        havuz.durdur()
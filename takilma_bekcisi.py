@@ -0,0 +1,198 @@
+import os
+import sys
+import json
+import time
+import threading
+from collections import Counter
+from datetime import datetime
+
+from PyQt6.QtCore import QObject, QTimer
+
+from cekirdek.gunluk import hata_logla
+
+BEKCI_AKTIF = os.environ.get("SONDAJ_TAKILMA_BEKCISI", "1") == "1"
+# Olay döngüsü bu süreden uzun yanıt vermezse takılma sayılır
+TAKILMA_ESIGI = int(os.environ.get("SONDAJ_TAKILMA_ESIGI_MS", "100"))
+TAKILMA_PROFIL_YOLU = os.environ.get("SONDAJ_TAKILMA_PROFIL_YOLU", "gui_takilmalari.json")
+NABIZ_ARALIGI = 25          # ms, GUI iş parçacığındaki zamanlayıcı
+ORNEKLEME_ARALIGI = 0.01    # s, takılma sırasında yığın örnekleme aralığı
+YAZMA_ARALIGI = 60          # s, profil dosyasının güncellenme aralığı
+SON_OLAY_SAYISI = 200       # Dosyada tutulan son takılma olayı sayısı
+# Çağrı yeri belirlenirken bakılan uygulama modülleri
+UYGULAMA_MODULLERI = ("main_window.py", "widgets.py", "visualization.py", "login.py", "utils.py")
+
+
+def _cerceve_adi(cerceve):
+    return f"{cerceve.f_code.co_qualname} ({os.path.basename(cerceve.f_code.co_filename)}:{cerceve.f_lineno})"
+
+
+def cagri_yerleri(cerceve):
+    """
+    GUI yığınından takılmanın çağrı yerini çıkarır.
+
+    Returns:
+        tuple: (en dıştaki uygulama metodu, en içteki çerçeve) ör.
+            ("AnaPencere.proje_yukle_id", "AraziFormWidget.load_data (widgets.py:750)")
+    """
+    en_ic = _cerceve_adi(cerceve) if cerceve is not None else "?"
+    dis = None
+    while cerceve is not None:
+        if os.path.basename(cerceve.f_code.co_filename) in UYGULAMA_MODULLERI:
+            dis = cerceve
+        cerceve = cerceve.f_back
+    return (dis.f_code.co_qualname if dis is not None else "Qt olay döngüsü"), en_ic
+
+
+class CagriYeriOzeti:
+    """Bir çağrı yerindeki takılmaların toplamı"""
+    __slots__ = ("sayi", "toplam_ms", "en_uzun_ms", "sicak_noktalar")
+
+    def __init__(self):
+        self.sayi = 0
+        self.toplam_ms = 0.0
+        self.en_uzun_ms = 0.0
+        self.sicak_noktalar = Counter()
+
+    def sozluk(self):
+        return {
+            "sayi": self.sayi,
+            "toplam_ms": round(self.toplam_ms, 1),
+            "ortalama_ms": round(self.toplam_ms / self.sayi, 1) if self.sayi else 0,
+            "en_uzun_ms": round(self.en_uzun_ms, 1),
+            "sicak_noktalar": self.sicak_noktalar.most_common(10),
+        }
+
+
+class TakilmaBekcisi(QObject):
+    """
+    Qt olay döngüsündeki takılmaları yakalayan bekçi.
+
+    GUI iş parçacığında çalışan bir zamanlayıcı düzenli nabız bırakır; ayrı
+    bir bekçi iş parçacığı nabız eşikten uzun süre gecikirse GUI
+    iş parçacığının yığınını ``sys._current_frames`` ile örnekler. Takılmalar
+    çağrı yerine göre toplanır ve düzenli aralıklarla profil dosyasına
+    yazılır.
+
+    Örnek:
+        bekci = TakilmaBekcisi(pencere)
+        bekci.baslat()
+    """
+    def __init__(self, parent=None, esik_ms=TAKILMA_ESIGI, yol=TAKILMA_PROFIL_YOLU):
+        super().__init__(parent)
+        self.esik = esik_ms / 1000
+        self.yol = yol
+        self.gui_kimligi = threading.get_ident()
+        self.son_nabiz = time.monotonic()
+        self.kilit = threading.Lock()
+        self.ozetler = {}
+        self.son_olaylar = []
+        self.durdur_olayi = threading.Event()
+        self.is_parcacigi = None
+
+        self.nabiz_zamanlayici = QTimer(self)
+        self.nabiz_zamanlayici.timeout.connect(self._nabiz)
+
+    def _nabiz(self):
+        self.son_nabiz = time.monotonic()
+
+    def baslat(self):
+        """Nabız zamanlayıcısını ve bekçi iş parçacığını başlatır (GUI iş parçacığından çağrılmalı)"""
+        if self.is_parcacigi is not None:
+            return
+        self.gui_kimligi = threading.get_ident()
+        self._nabiz()
+        self.nabiz_zamanlayici.start(NABIZ_ARALIGI)
+        self.is_parcacigi = threading.Thread(target=self._izle, name="takilma-bekcisi", daemon=True)
+        self.is_parcacigi.start()
+
+    def durdur(self):
+        """Bekçiyi durdurur ve profili son kez yazar"""
+        self.nabiz_zamanlayici.stop()
+        if self.is_parcacigi is not None:
+            self.durdur_olayi.set()
+            self.is_parcacigi.join(timeout=1)
+            self.is_parcacigi = None
+        self.kaydet()
+
+    def _izle(self):
+        son_yazma = time.monotonic()
+        while not self.durdur_olayi.wait(NABIZ_ARALIGI / 1000):
+            if time.monotonic() - self.son_nabiz > self.esik:
+                self._takilmayi_ornekle()
+            if time.monotonic() - son_yazma > YAZMA_ARALIGI:
+                self.kaydet()
+                son_yazma = time.monotonic()
+
+    def _takilmayi_ornekle(self):
+        """Nabız geri gelene kadar GUI yığınını örnekler ve olayı kaydeder"""
+        baslangic_nabzi = self.son_nabiz
+        disaridaki = Counter()
+        icerideki = Counter()
+        while self.son_nabiz == baslangic_nabzi and not self.durdur_olayi.is_set():
+            cerceve = sys._current_frames().get(self.gui_kimligi)
+            dis, ic = cagri_yerleri(cerceve)
+            disaridaki[dis] += 1
+            icerideki[ic] += 1
+            del cerceve
+            time.sleep(ORNEKLEME_ARALIGI)
+
+        # Olay döngüsü en son nabızdan bu yana meşguldü
+        sure_ms = (time.monotonic() - baslangic_nabzi) * 1000 - NABIZ_ARALIGI
+        if not disaridaki:
+            return
+        cagri_yeri = disaridaki.most_common(1)[0][0]
+        with self.kilit:
+            ozet = self.ozetler.setdefault(cagri_yeri, CagriYeriOzeti())
+            ozet.sayi += 1
+            ozet.toplam_ms += sure_ms
+            ozet.en_uzun_ms = max(ozet.en_uzun_ms, sure_ms)
+            ozet.sicak_noktalar.update(icerideki)
+            self.son_olaylar.append({
+                "zaman": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "sure_ms": round(sure_ms, 1),
+                "cagri_yeri": cagri_yeri,
+                "sicak_nokta": icerideki.most_common(1)[0][0],
+            })
+            del self.son_olaylar[:-SON_OLAY_SAYISI]
+
+    def kaydet(self):
+        """
+        Toplanan takılmaları profil dosyasına yazar.
+
+        Dosya önceki oturumların toplamlarını da içerir; yeni değerler
+        bunlara eklenir ve yalnızca son olaylar tutulur.
+        """
+        with self.kilit:
+            if not self.ozetler:
+                return
+            ozetler, self.ozetler = self.ozetler, {}
+            olaylar, self.son_olaylar = self.son_olaylar, []
+
+        try:
+            try:
+                with open(self.yol, encoding="utf-8") as f:
+                    profil = json.load(f)
+            except (FileNotFoundError, ValueError):
+                profil = {"esik_ms": self.esik * 1000, "cagri_yerleri": {}, "son_olaylar": []}
+
+            for cagri_yeri, ozet in ozetler.items():
+                onceki = profil["cagri_yerleri"].get(cagri_yeri)
+                yeni = ozet.sozluk()
+                if onceki:
+                    sicak = Counter(dict(map(tuple, onceki["sicak_noktalar"])))
+                    sicak.update(ozet.sicak_noktalar)
+                    yeni["sayi"] += onceki["sayi"]
+                    yeni["toplam_ms"] = round(yeni["toplam_ms"] + onceki["toplam_ms"], 1)
+                    yeni["ortalama_ms"] = round(yeni["toplam_ms"] / yeni["sayi"], 1)
+                    yeni["en_uzun_ms"] = max(yeni["en_uzun_ms"], onceki["en_uzun_ms"])
+                    yeni["sicak_noktalar"] = sicak.most_common(10)
+                profil["cagri_yerleri"][cagri_yeri] = yeni
+            profil["son_olaylar"] = (profil["son_olaylar"] + olaylar)[-SON_OLAY_SAYISI:]
+            profil["guncelleme"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            gecici = f"{self.yol}.tmp"
+            with open(gecici, "w", encoding="utf-8") as f:
+                json.dump(profil, f, ensure_ascii=False, indent=2)
+            os.replace(gecici, self.yol)
+        except Exception as e:
+            hata_logla(f"Takılma profili kaydetme hatası: {str(e)}", e)
@@ -6,7 +6,9 @@ import matplotlib.pyplot as plt
 import numpy as np
 from PyQt6.QtWidgets import QVBoxLayout, QWidget
 from PyQt6.QtCore import Qt
-from utils import hata_logla, veritabani_baglantisi
+from cekirdek import hata_logla, veritabani_baglantisi
+from cekirdek.veritabani import ilk_kuyu
+from cekirdek.veri_koprusu import arazi_tablosu
 
 class MatplotlibCanvas(FigureCanvas):
     """Matplotlib için Qt özellikleriyle genişletilmiş tuval sınıfı"""
@@ -33,26 +35,21 @@ class SondajGrafikWidget(QWidget):
         self.layout.addWidget(self.canvas)
         self.setLayout(self.layout)
         
-    def spt_verileri_goster(self, proje_id):
+    def spt_verileri_goster(self, proje_id, sondaj_id=None):
         """
         SPT verilerini gösteren grafik oluşturur
         
         Args:
             proje_id: Projenin ID'si
+            sondaj_id: Kuyu ID'si; verilmezse projenin ilk kuyusu
         """
         try:
             with veritabani_baglantisi() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT "Sondaj derinliği (m)", "N30"
-                    FROM AraziBilgileri
-                    WHERE proje_id = ? AND "N30" IS NOT NULL
-                    ORDER BY "Sondaj derinliği (m)"
-                """, (proje_id,))
+                if sondaj_id is None:
+                    sondaj_id = ilk_kuyu(conn, proje_id)
+                veriler = arazi_tablosu(conn, proje_id, sondaj_id, sutunlar=("sondaj_derinligi", "n30")).dropna()
                 
-                veriler = cursor.fetchall()
-                
-                if not veriler:
+                if veriler.empty:
                     self.canvas.axes.clear()
                     self.canvas.axes.text(0.5, 0.5, "Bu proje için SPT verisi bulunamadı", 
                                          ha='center', va='center', fontsize=12)
@@ -60,8 +57,8 @@ class SondajGrafikWidget(QWidget):
                     self.canvas.draw()
                     return
                     
-                derinlikler = [row["Sondaj derinliği (m)"] for row in veriler]
-                n30_degerleri = [row["N30"] for row in veriler]
+                derinlikler = veriler["sondaj_derinligi"].to_numpy()
+                n30_degerleri = veriler["n30"].to_numpy(dtype=np.int64)
                 
                 self.canvas.axes.clear()
                 self.canvas.axes.barh(derinlikler, n30_degerleri, height=0.5, color='blue', alpha=0.7)
@@ -96,26 +93,22 @@ class SondajGrafikWidget(QWidget):
             self.canvas.fig.tight_layout()
             self.canvas.draw()
 
-    def zemin_profili_goster(self, proje_id):
+    def zemin_profili_goster(self, proje_id, sondaj_id=None):
         """
         Zemin profili grafiği oluşturur
         
         Args:
             proje_id: Projenin ID'si
+            sondaj_id: Kuyu ID'si; verilmezse projenin ilk kuyusu
         """
         try:
             with veritabani_baglantisi() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT "Sondaj derinliği (m)", "Zemin tanımlaması"
-                    FROM AraziBilgileri
-                    WHERE proje_id = ? AND "Zemin tanımlaması" IS NOT NULL
-                    ORDER BY "Sondaj derinliği (m)"
-                """, (proje_id,))
-                
-                veriler = cursor.fetchall()
+                if sondaj_id is None:
+                    sondaj_id = ilk_kuyu(conn, proje_id)
+                veriler = arazi_tablosu(conn, proje_id, sondaj_id, sutunlar=("sondaj_derinligi", "zemin_tanimlamasi"))
+                veriler = veriler[veriler["zemin_tanimlamasi"].notna()]
                 
-                if not veriler:
+                if veriler.empty:
                     self.canvas.axes.clear()
                     self.canvas.axes.text(0.5, 0.5, "Bu proje için zemin profili verisi bulunamadı", 
                                          ha='center', va='center', fontsize=12)
@@ -124,11 +117,11 @@ class SondajGrafikWidget(QWidget):
                     return
                 
                 # Zemin türleri ve derinlikler
-                derinlikler = [row["Sondaj derinliği (m)"] for row in veriler]
-                zemin_turleri = [row["Zemin tanımlaması"] for row in veriler]
+                derinlikler = veriler["sondaj_derinligi"].tolist()
+                zemin_turleri = veriler["zemin_tanimlamasi"].tolist()
                 
-                # Benzersiz zemin türleri
-                benzersiz_zeminler = list(set(zemin_turleri))
+                # Benzersiz zemin türleri (yalnızca bu projede geçenler)
+                benzersiz_zeminler = list(veriler["zemin_tanimlamasi"].cat.remove_unused_categories().cat.categories)
                 
                 # Her zemin türü için renk belirle
                 renkler = plt.cm.tab10(np.linspace(0, 1, len(benzersiz_zeminler)))
@@ -156,7 +149,7 @@ class SondajGrafikWidget(QWidget):
                     self.canvas.axes.axhline(y=derinlik, color='black', linestyle='-', alpha=0.3)
                     
                     # Derinlik değerini ekle
-                    self.canvas.axes.text(0.05, derinlik, f"{derinlik} m", 
+                    self.canvas.axes.text(0.05, derinlik, f"{derinlik:g} m", 
                                          ha='left', va='bottom', fontsize=8)
                     
                     # Lejant için kaydet
@@ -0,0 +1,356 @@
+import os
+import json
+import base64
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from sqlalchemy import select
+
+from cekirdek.veri_koprusu import kayit_tablosu
+
+# Proje sürümü anahtarın parçası olduğu için geçersiz kılma gerekmez;
+# eski sürümler LRU sırasıyla düşer
+ANALIZ_ONBELLEK_BOYUTU = int(os.environ.get("ANALIZ_ONBELLEK_BOYUTU", "256"))
+
+# Grafik başına varsayılan/azami nokta sayısı (seyreltme hedefi)
+GRAFIK_NOKTA_SAYISI = 2000
+GRAFIK_AZAMI_NOKTA = 20000
+
+# Çoklu parametre izleri: (sütun, eksen başlığı); 0 değeri "ölçülmedi" sayılır
+PARAMETRE_IZLERI = (
+    ("c_kpa", "c (kPa)"),
+    ("aci_derece", "φ (°)"),
+    ("dogal_bha", "γ (kN/m³)"),
+    ("tmax", "Tmax"),
+)
+KATMAN_RENKLERI = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+                   "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf")
+TANIMSIZ_KATMAN = "Tanımsız"
+
+
+def _kapsam(model, proje_id, kuyu_id):
+    # Kuyu verilirse (sondaj_id, derinlik) indeksi, verilmezse (proje_id, derinlik) indeksi kullanılır
+    if kuyu_id is not None:
+        return (model.proje_id == proje_id, model.sondaj_id == kuyu_id)
+    return (model.proje_id == proje_id,)
+
+
+def spt_serisi(oturum, model, proje_id, kuyu_id=None):
+    """
+    Derinliğe göre sıralı SPT (N30) serisini yalnızca iki sütunu okuyarak döndürür.
+
+    N30 değeri boş veya sıfır olan satırlar atlanır.
+
+    Args:
+        oturum: SQLAlchemy oturumu
+        model: Arazi bilgileri modeli
+        proje_id (int): Proje ID
+        kuyu_id (int, optional): Yalnızca bu kuyu; verilmezse projenin tüm kuyuları
+            (katmanlar kuyular arasında karışır; rotalar varsayılan olarak ilk kuyuyu verir)
+
+    Returns:
+        tuple: (derinlikler, n30) float64 dizileri
+    """
+    sorgu = (select(model.sondaj_derinligi, model.n30)
+             .where(*_kapsam(model, proje_id, kuyu_id), model.n30.is_not(None), model.n30 != 0)
+             .order_by(model.sondaj_derinligi, model.id))
+    tablo = kayit_tablosu(oturum.execute(sorgu), ("sondaj_derinligi", "n30"), ondalik=np.float64)
+    return tablo["sondaj_derinligi"].to_numpy(), tablo["n30"].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def zemin_serisi(oturum, model, proje_id, kuyu_id=None):
+    """
+    Derinliğe göre sıralı zemin tanımlamalarını döndürür (boş olanlar atlanır).
+
+    Returns:
+        tuple: (derinlikler float64 dizisi, tanımlamalar listesi)
+    """
+    sorgu = (select(model.sondaj_derinligi, model.zemin_tanimlamasi)
+             .where(*_kapsam(model, proje_id, kuyu_id), model.zemin_tanimlamasi.is_not(None),
+                    model.zemin_tanimlamasi != "")
+             .order_by(model.sondaj_derinligi, model.id))
+    tablo = kayit_tablosu(oturum.execute(sorgu), ("sondaj_derinligi", "zemin_tanimlamasi"), ondalik=np.float64)
+    return tablo["sondaj_derinligi"].to_numpy(), tablo["zemin_tanimlamasi"].tolist()
+
+
+def _liste(dizi):
+    # NaN JSON'da geçersiz olduğundan None'a çevrilir
+    return [None if d != d else d for d in dizi.tolist()]
+
+
+def analiz_verisi(oturum, model, proje_id, kuyu_id=None):
+    """
+    Analiz sayfasının SPT ve zemin profili serilerini oluşturur.
+
+    Returns:
+        dict: {"spt": {"derinlik", "n30"}, "zemin": {"derinlik", "tanim"}}
+    """
+    spt_derinlik, n30 = spt_serisi(oturum, model, proje_id, kuyu_id)
+    zemin_derinlik, tanimlar = zemin_serisi(oturum, model, proje_id, kuyu_id)
+    return {
+        "spt": {"derinlik": _liste(spt_derinlik), "n30": _liste(n30)},
+        "zemin": {"derinlik": _liste(zemin_derinlik), "tanim": tanimlar},
+    }
+
+
+def profil_serileri(oturum, model, proje_id, kuyu_id=None):
+    """
+    Grafikler için derinlik, N30, parametre ve zemin sütunlarını tek sorguda okur.
+
+    Returns:
+        dict: Sütun adı -> dizi; sayısal sütunlar float64 (boş/0 değerler NaN),
+        "zemin_tanimlamasi" nesne dizisi
+    """
+    sutunlar = ["sondaj_derinligi", "n30"] + [ad for ad, _ in PARAMETRE_IZLERI]
+    sorgu = (select(*(getattr(model, ad) for ad in sutunlar), model.zemin_tanimlamasi)
+             .where(*_kapsam(model, proje_id, kuyu_id), model.sondaj_derinligi.is_not(None))
+             .order_by(model.sondaj_derinligi, model.id))
+    tablo = kayit_tablosu(oturum.execute(sorgu), sutunlar + ["zemin_tanimlamasi"], ondalik=np.float64)
+    seriler = {}
+    for ad in sutunlar:
+        sutun = tablo[ad].to_numpy(dtype=np.float64, na_value=np.nan)
+        if ad != "sondaj_derinligi":
+            sutun = np.where(sutun <= 0, np.nan, sutun)
+        seriler[ad] = sutun
+    seriler["zemin_tanimlamasi"] = tablo["zemin_tanimlamasi"].to_numpy(dtype=object, na_value="")
+    return seriler
+
+
+def minmax_seyrelt(degerler, hedef):
+    """
+    Yoğun seriyi uç değerleri koruyarak seyreltir.
+
+    Seri ``hedef / 2`` ardışık kovaya bölünür ve her kovanın en küçük ve en
+    büyük değerli noktası tutulur; böylece tepe ve çukurlar kaybolmaz. İlk
+    ve son nokta her zaman korunur. NaN değerler atlanır.
+
+    Args:
+        degerler (np.ndarray): Derinliğe göre sıralı değerler
+        hedef (int): Yaklaşık azami nokta sayısı
+
+    Returns:
+        np.ndarray: Tutulacak noktaların artan sıralı indisleri
+    """
+    gecerli = np.flatnonzero(~np.isnan(degerler))
+    if len(gecerli) <= max(hedef, 2):
+        return gecerli
+    kova_sayisi = max(1, hedef // 2)
+    kovalar = np.arange(len(gecerli)) * kova_sayisi // len(gecerli)
+    # Kova içinde değere göre sırala: her kovanın ilk elemanı en küçük, son elemanı en büyük
+    sira = np.lexsort((degerler[gecerli], kovalar))
+    sinirlar = np.flatnonzero(np.diff(kovalar[sira])) + 1
+    ilkler = np.concatenate(([0], sinirlar))
+    sonlar = np.concatenate((sinirlar, [len(sira)])) - 1
+    secilen = gecerli[sira[np.concatenate((ilkler, sonlar))]]
+    return np.unique(np.concatenate((secilen, gecerli[[0, -1]])))
+
+
+def katmanlar(derinlikler, tanimlar):
+    """
+    Ardışık aynı zemin tanımlamalı satırları katmanlara ayırır.
+
+    Boş tanımlamalı satırlar üstteki katmana dahil edilir.
+
+    Returns:
+        list: (tanım, ilk satır, son satır + 1, üst derinlik, alt derinlik)
+    """
+    if len(tanimlar) == 0:
+        return []
+    dolu = np.flatnonzero(tanimlar != "")
+    # Boşları bir önceki dolu tanımla doldur (ileri doldurma)
+    kaynak = np.zeros(len(tanimlar), dtype=np.intp)
+    kaynak[dolu] = dolu
+    kaynak = np.maximum.accumulate(kaynak)
+    doldurulmus = tanimlar[kaynak]
+    if len(dolu) == 0 or dolu[0] > 0:
+        doldurulmus[:dolu[0] if len(dolu) else len(tanimlar)] = TANIMSIZ_KATMAN
+    baslar = np.concatenate(([0], np.flatnonzero(doldurulmus[1:] != doldurulmus[:-1]) + 1))
+    sonlar = np.concatenate((baslar[1:], [len(tanimlar)]))
+    return [(doldurulmus[b], int(b), int(e), float(derinlikler[b]),
+             float(derinlikler[e] if e < len(derinlikler) else derinlikler[-1]))
+            for b, e in zip(baslar, sonlar)]
+
+
+def _kodla(dizi, ikili):
+    """Diziyi Plotly'nin ikili dizi biçimine ({"dtype", "bdata"}) veya listeye çevirir"""
+    dizi = np.asarray(dizi, dtype="<f4")
+    if ikili:
+        return {"dtype": "f4", "bdata": base64.b64encode(dizi.tobytes()).decode("ascii")}
+    return _liste(dizi.astype(np.float64).round(4))
+
+
+def _katman_renkleri(katman_listesi):
+    renkler = {}
+    for tanim, *_ in katman_listesi:
+        renkler.setdefault(tanim, KATMAN_RENKLERI[len(renkler) % len(KATMAN_RENKLERI)])
+    return renkler
+
+
+def _derinlik_ekseni(**ekler):
+    return dict(title="Derinlik (m)", autorange="reversed", zeroline=False, **ekler)
+
+
+def spt_grafigi(seriler, hedef=GRAFIK_NOKTA_SAYISI, ikili=True):
+    """
+    Derinliğe karşı N30 grafiği; her zemin katmanı ayrı iz olarak çizilir.
+
+    Returns:
+        dict: Plotly şekli ({"data", "layout"})
+    """
+    derinlik, n30 = seriler["sondaj_derinligi"], seriler["n30"]
+    secilen = minmax_seyrelt(n30, hedef)
+    katman_listesi = katmanlar(derinlik, seriler["zemin_tanimlamasi"])
+    renkler = _katman_renkleri(katman_listesi)
+    izler = []
+    gosterilen = set()
+    for tanim, bas, son, _, _ in katman_listesi:
+        indisler = secilen[(secilen >= bas) & (secilen < son)]
+        if len(indisler) == 0:
+            continue
+        izler.append({
+            "type": "scatter", "mode": "lines+markers", "name": tanim,
+            "legendgroup": tanim, "showlegend": tanim not in gosterilen,
+            "x": _kodla(n30[indisler], ikili), "y": _kodla(derinlik[indisler], ikili),
+            "line": {"color": renkler[tanim]}, "marker": {"size": 5},
+            "hovertemplate": "N30: %{x:.0f}<br>Derinlik: %{y:.2f} m<extra>%{fullData.name}</extra>",
+        })
+        gosterilen.add(tanim)
+    return {
+        "data": izler,
+        "layout": {
+            "title": {"text": "SPT (N30) - Derinlik"},
+            "xaxis": {"title": "N30", "side": "top", "rangemode": "tozero"},
+            "yaxis": _derinlik_ekseni(),
+            "hovermode": "closest",
+            "meta": {"nokta": int(len(secilen)), "toplam_nokta": int(np.count_nonzero(~np.isnan(n30)))},
+        },
+    }
+
+
+def zemin_kolonu(seriler, ikili=True):
+    """
+    Zemin kolonu: her katman dolgulu bir dikdörtgen izi olarak çizilir.
+
+    Returns:
+        dict: Plotly şekli
+    """
+    katman_listesi = katmanlar(seriler["sondaj_derinligi"], seriler["zemin_tanimlamasi"])
+    renkler = _katman_renkleri(katman_listesi)
+    izler = []
+    gosterilen = set()
+    for tanim, _, _, ust, alt in katman_listesi:
+        izler.append({
+            "type": "scatter", "mode": "lines", "fill": "toself", "name": tanim,
+            "legendgroup": tanim, "showlegend": tanim not in gosterilen,
+            "x": _kodla([0, 1, 1, 0, 0], ikili), "y": _kodla([ust, ust, alt, alt, ust], ikili),
+            "fillcolor": renkler[tanim], "line": {"color": "#333", "width": 1},
+            "hoveron": "fills", "text": f"{tanim}: {ust:.2f} - {alt:.2f} m",
+            "hoverinfo": "text",
+        })
+        gosterilen.add(tanim)
+    return {
+        "data": izler,
+        "layout": {
+            "title": {"text": "Zemin Profili"},
+            "xaxis": {"visible": False, "range": [0, 1], "fixedrange": True},
+            "yaxis": _derinlik_ekseni(),
+        },
+    }
+
+
+def parametre_izleri(seriler, hedef=GRAFIK_NOKTA_SAYISI, ikili=True):
+    """
+    c, φ, γ ve Tmax için ortak derinlik eksenli yan yana izler.
+
+    Returns:
+        dict: Plotly şekli
+    """
+    derinlik = seriler["sondaj_derinligi"]
+    genislik = 1 / len(PARAMETRE_IZLERI)
+    izler = []
+    yerlesim = {
+        "title": {"text": "Parametre İzleri"},
+        "yaxis": _derinlik_ekseni(),
+        "showlegend": False,
+        "meta": {},
+    }
+    for i, (sutun, baslik) in enumerate(PARAMETRE_IZLERI):
+        degerler = seriler[sutun]
+        secilen = minmax_seyrelt(degerler, hedef)
+        eksen = "x" if i == 0 else f"x{i + 1}"
+        izler.append({
+            "type": "scatter", "mode": "lines+markers", "name": baslik,
+            "x": _kodla(degerler[secilen], ikili), "y": _kodla(derinlik[secilen], ikili),
+            "xaxis": eksen, "yaxis": "y", "marker": {"size": 4},
+        })
+        yerlesim["xaxis" if i == 0 else f"xaxis{i + 1}"] = {
+            "title": baslik, "side": "top",
+            "domain": [i * genislik + 0.02, (i + 1) * genislik - 0.02],
+        }
+        yerlesim["meta"][sutun] = int(len(secilen))
+    return {"data": izler, "layout": yerlesim}
+
+
+GRAFIKLER = {
+    "spt": spt_grafigi,
+    "zemin": zemin_kolonu,
+    "parametreler": parametre_izleri,
+}
+
+
+def grafik_verisi(oturum, model, proje_id, tur, hedef=GRAFIK_NOKTA_SAYISI, ikili=True, kuyu_id=None):
+    """
+    İstenen türde Plotly şeklini oluşturur.
+
+    Args:
+        tur (str): spt, zemin veya parametreler
+        hedef (int): İz başına yaklaşık azami nokta sayısı
+        ikili (bool): Diziler base64 ikili biçimde mi gönderilsin
+        kuyu_id (int, optional): Yalnızca bu kuyu
+
+    Returns:
+        dict: Plotly şekli
+    """
+    seriler = profil_serileri(oturum, model, proje_id, kuyu_id)
+    if tur == "zemin":
+        return zemin_kolonu(seriler, ikili=ikili)
+    return GRAFIKLER[tur](seriler, hedef=hedef, ikili=ikili)
+
+
+class AnalizOnbellegi:
+    """
+    Analiz yanıtları için (proje_id, sürüm) anahtarlı LRU önbellek.
+
+    Yanıt gövdesi JSON olarak bir kez kodlanıp saklanır; aynı sürüm için
+    sonraki isteklerde arazi tablosu okunmaz.
+    """
+    def __init__(self, boyut=ANALIZ_ONBELLEK_BOYUTU):
+        self.boyut = boyut
+        self.kayitlar = OrderedDict()
+        self.kilit = threading.Lock()
+
+    def getir(self, anahtar, olustur):
+        """
+        Anahtarın kaydını döndürür; yoksa ``olustur()`` ile üretip saklar.
+
+        Returns:
+            tuple: (veri sözlüğü, JSON gövdesi bytes)
+        """
+        with self.kilit:
+            kayit = self.kayitlar.get(anahtar)
+            if kayit is not None:
+                self.kayitlar.move_to_end(anahtar)
+                return kayit
+
+        veri = olustur()
+        kayit = (veri, json.dumps(veri, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        with self.kilit:
+            self.kayitlar[anahtar] = kayit
+            while len(self.kayitlar) > self.boyut:
+                self.kayitlar.popitem(last=False)
+        return kayit
+
+    def temizle(self):
+        with self.kilit:
+            self.kayitlar.clear()
@@ -0,0 +1,163 @@
+import os
+import time
+import threading
+from datetime import timedelta
+
+import numpy as np
+from sqlalchemy import event, select, func
+
+from cekirdek.istatistik import ArsivIstatistigi, PARAMETRELER
+from cekirdek.veri_koprusu import kayit_tablosu
+
+# Diğer işçi süreçlerindeki değişiklikler en geç bu kadar gecikmeyle görülür (saniye)
+ISTATISTIK_KONTROL_SURESI = float(os.environ.get("ISTATISTIK_KONTROL_SURESI", "30"))
+# Özet zaman damgaları işlem içinde atanır; geç kaydedilen işlemler kaçmasın diye
+# son görülen zamandan bu kadar geriye bakılır (projeyi yeniden okumak zararsızdır)
+ZAMAN_PAYI = timedelta(seconds=60)
+
+
+class ArsivIstatistikleri:
+    """
+    Projeler arası istatistik (web), projeye göre artımlı güncellenir.
+
+    İlk sorguda arşiv sütun sütun okunup histogramlar kurulur. Sonrasında
+    yalnızca değişen projeler yeniden okunur: bu süreçteki değişiklikler ORM
+    olaylarıyla, diğer süreçlerdekiler ``kontrol_suresi`` aralıklarla
+    ``proje_ozetleri.guncelleme_zamani`` üzerinden yakalanır.
+    """
+    uzanti_adi = "arsiv_istatistikleri"
+
+    def __init__(self, kontrol_suresi=ISTATISTIK_KONTROL_SURESI):
+        self.kontrol_suresi = kontrol_suresi
+        self.istatistik = None
+        self.son_zaman = None
+        self.son_kontrol = 0.0
+        self.bayat = set()
+        # Olaylar okuma sırasında (autoflush) tetiklenebilir; bayat küme ayrı kilitle korunur
+        self.bayat_kilidi = threading.Lock()
+        self.kilit = threading.Lock()
+        self.db = None
+        self.proje_modeli = None
+        self.ozet_modeli = None
+        self.tapu_modeli = None
+        self.arazi_modeli = None
+
+    def init_app(self, app, db, proje_modeli, ozet_modeli, tapu_modeli, arazi_modeli):
+        """
+        Değişen projeleri işaretleyen olayları bağlar.
+
+        Alt kayıt değişiklikleri proje sürümünü artırdığından proje
+        olayları yeterlidir.
+
+        Args:
+            app (Flask): Uygulama
+            db (SQLAlchemy): Veritabanı eklentisi
+            proje_modeli, ozet_modeli, tapu_modeli, arazi_modeli: Okunan modeller
+        """
+        app.extensions[self.uzanti_adi] = self
+        self.db = db
+        self.proje_modeli = proje_modeli
+        self.ozet_modeli = ozet_modeli
+        self.tapu_modeli = tapu_modeli
+        self.arazi_modeli = arazi_modeli
+        for olay in ("after_insert", "after_update", "after_delete"):
+            event.listen(proje_modeli, olay, self._proje_degisti)
+
+    def _proje_degisti(self, mapper, baglanti, hedef):
+        with self.bayat_kilidi:
+            self.bayat.add(hedef.id)
+
+    def _projeleri_oku(self, proje_idleri=None):
+        """
+        Projelerin tapu ve arazi satırlarını okuyup istatistiğe işler.
+
+        Args:
+            proje_idleri (iterable, optional): Yalnızca bu projeler; None ise tümü
+        """
+        tapu, arazi = self.tapu_modeli, self.arazi_modeli
+        tapu_sorgusu = select(tapu.proje_id, tapu.il, tapu.ilce)
+        arazi_sorgusu = (
+            select(arazi.proje_id, arazi.sondaj_derinligi, arazi.zemin_tanimlamasi,
+                   *(getattr(arazi, p) for p in PARAMETRELER))
+            .where(arazi.sondaj_derinligi.is_not(None))
+            .order_by(arazi.proje_id)
+        )
+        if proje_idleri is not None:
+            proje_idleri = list(proje_idleri)
+            tapu_sorgusu = tapu_sorgusu.where(tapu.proje_id.in_(proje_idleri))
+            arazi_sorgusu = arazi_sorgusu.where(arazi.proje_id.in_(proje_idleri))
+            for proje_id in proje_idleri:
+                self.istatistik.proje_cikar(proje_id)
+
+        konumlar = {proje_id: (il, ilce) for proje_id, il, ilce in self.db.session.execute(tapu_sorgusu)}
+        tablo = kayit_tablosu(self.db.session.execute(arazi_sorgusu),
+                              ["proje_id", "sondaj_derinligi", "zemin_tanimlamasi", *PARAMETRELER], ondalik=np.float64)
+        projeler = tablo["proje_id"].to_numpy(dtype=np.int64)
+        if len(projeler) == 0:
+            # Arazi kaydı olmayan (yeni veya silinmiş) projeler yalnızca çıkarılır
+            return
+        derinlikler = tablo["sondaj_derinligi"].to_numpy()
+        tanimlar = tablo["zemin_tanimlamasi"].to_numpy(dtype=object, na_value=None)
+        # 0 "ölçülmedi" anlamındadır
+        degerler = {p: np.where(tablo[p] == 0, np.nan, tablo[p].to_numpy(dtype=np.float64, na_value=np.nan))
+                    for p in PARAMETRELER}
+        # Satırlar proje sırasıyla geldiğinden her proje bir dilimdir
+        sinirlar = np.flatnonzero(np.diff(projeler)) + 1
+        for bas, son in zip(np.r_[0, sinirlar], np.r_[sinirlar, len(projeler)]):
+            proje_id = int(projeler[bas])
+            il, ilce = konumlar.get(proje_id, (None, None))
+            self.istatistik.proje_guncelle(
+                proje_id, il, ilce, derinlikler[bas:son], tanimlar[bas:son],
+                {p: dizi[bas:son] for p, dizi in degerler.items()},
+            )
+
+    def _degisen_projeler(self):
+        """Son kontrolden beri başka süreçlerde değişen veya silinen projeler"""
+        ozet = self.ozet_modeli
+        sorgu = select(ozet.proje_id)
+        if self.son_zaman is not None:
+            sorgu = sorgu.where(ozet.guncelleme_zamani >= self.son_zaman - ZAMAN_PAYI)
+        degisen = set(self.db.session.scalars(sorgu))
+        mevcut = set(self.db.session.scalars(select(ozet.proje_id)))
+        return degisen | (set(self.istatistik.katkilar) - mevcut)
+
+    def _guncel(self):
+        simdi = time.monotonic()
+        with self.bayat_kilidi:
+            bayat, self.bayat = self.bayat, set()
+        with self.kilit:
+            if self.istatistik is None:
+                self.istatistik = ArsivIstatistigi()
+                self.son_zaman = self.db.session.scalar(select(func.max(self.ozet_modeli.guncelleme_zamani)))
+                self._projeleri_oku()
+                self.son_kontrol = simdi
+            else:
+                if simdi - self.son_kontrol >= self.kontrol_suresi:
+                    son_zaman = self.db.session.scalar(select(func.max(self.ozet_modeli.guncelleme_zamani)))
+                    bayat |= self._degisen_projeler()
+                    self.son_zaman, self.son_kontrol = son_zaman, simdi
+                if bayat:
+                    self._projeleri_oku(bayat)
+            return self.istatistik
+
+    def ozet(self, parametre, **filtre):
+        """
+        Filtreye uyan ölçümlerin dağılımı.
+
+        Returns:
+            dict: bkz. ``ArsivIstatistigi.ozet``
+        """
+        istatistik = self._guncel()
+        with self.kilit:
+            return istatistik.ozet(parametre, **filtre)
+
+    def gruplu(self, parametre, grup, **filtre):
+        """
+        Filtreye uyan ölçümlerin gruplara göre dağılımı.
+
+        Returns:
+            list: bkz. ``ArsivIstatistigi.gruplu``
+        """
+        istatistik = self._guncel()
+        with self.kilit:
+            return istatistik.gruplu(parametre, grup, **filtre)
@@ -0,0 +1,226 @@
+import os
+import time
+import threading
+
+import numpy as np
+from sqlalchemy import event, select, func
+
+from cekirdek.konum import IzgaraIndeksi, HaritaKumeleri
+from cekirdek.koordinat import (
+    karisik_wgs84e, cografi_tm, ortak_duzleme, ORTAK_MERIDYEN, VARSAYILAN_DILIM_MERIDYENI, VARSAYILAN_SISTEM
+)
+from cekirdek.enterpolasyon import derinlik_matrisi, katman_ustleri, ProfilEnterpolatoru
+
+# Diğer işçi süreçlerindeki değişiklikler en geç bu kadar gecikmeyle
+# görülür (saniye); bu süreçteki değişiklikler ORM olaylarıyla hemen işlenir
+KONUM_INDEKSI_KONTROL_SURESI = float(os.environ.get("KONUM_INDEKSI_KONTROL_SURESI", "30"))
+
+
+class SurumluBellek:
+    """
+    Veritabanından kurulan, süreç içinde tutulan salt okunur yapı.
+
+    Yapı ilk istekte kurulur. İzlenen modellerde bu süreçte ekleme,
+    güncelleme veya silme olduğunda bayatlamış sayılır; diğer süreçlerdeki
+    değişiklikler ``kontrol_suresi`` aralıklarla kayıt sayıları ve son proje
+    sürümü karşılaştırılarak yakalanır. Alt sınıflar ``_kur()`` yazar.
+    """
+    uzanti_adi = None
+
+    def __init__(self, kontrol_suresi=KONUM_INDEKSI_KONTROL_SURESI):
+        self.kontrol_suresi = kontrol_suresi
+        self.durum = None
+        self.imza = None
+        self.son_kontrol = 0.0
+        self.nesil = 0
+        self.kilit = threading.Lock()
+        self.db = None
+        self.proje_modeli = None
+        self.modeller = ()
+
+    def init_app(self, app, db, proje_modeli, *modeller):
+        """
+        İzlenen modellere geçersiz kılma olaylarını bağlar.
+
+        Args:
+            app (Flask): Uygulama
+            db (SQLAlchemy): Veritabanı eklentisi
+            proje_modeli: Proje modeli (updated_at alanlı)
+            *modeller: Yapının okuduğu modeller
+        """
+        app.extensions[self.uzanti_adi] = self
+        self.db = db
+        self.proje_modeli = proje_modeli
+        for model in modeller:
+            if model not in self.modeller:
+                for olay in ("after_insert", "after_update", "after_delete"):
+                    event.listen(model, olay, self._degisti)
+        self.modeller = tuple(dict.fromkeys((*self.modeller, *modeller)))
+
+    def _degisti(self, mapper, baglanti, hedef):
+        self.temizle()
+
+    def temizle(self):
+        with self.kilit:
+            self.durum = None
+            self.nesil += 1
+
+    def _imza(self):
+        # Güncellemeler kayıt sayısını değiştirmez ama proje sürümünü artırır
+        return self.db.session.execute(select(
+            *(select(func.count()).select_from(model).scalar_subquery() for model in self.modeller),
+            select(func.max(self.proje_modeli.updated_at)).scalar_subquery(),
+        )).one()
+
+    def _kur(self):
+        raise NotImplementedError
+
+    def _guncel(self):
+        simdi = time.monotonic()
+        with self.kilit:
+            durum, imza, nesil = self.durum, self.imza, self.nesil
+            kontrol = simdi - self.son_kontrol >= self.kontrol_suresi
+        if durum is not None and not kontrol:
+            return durum
+
+        yeni_imza = self._imza()
+        if durum is None or yeni_imza != imza:
+            durum = self._kur()
+        with self.kilit:
+            # Kurulum sırasında bu süreçte değişiklik olduysa sonraki istek yeniden kurar
+            if self.nesil == nesil:
+                self.durum, self.imza, self.son_kontrol = durum, yeni_imza, simdi
+        return durum
+
+
+def tapu_konumlari(oturum, tapu):
+    """
+    Koordinatlı tapu kayıtlarını okur ve bütün sütunu WGS84'e çevirir.
+
+    Returns:
+        tuple: (proje ID'leri, x, y, boylam, enlem) dizileri; dilimi
+        bilinmeyen kayıtların boylam/enlemi NaN
+    """
+    satirlar = oturum.execute(
+        select(tapu.proje_id, tapu.koordinat_x, tapu.koordinat_y,
+               tapu.dilim_meridyeni, tapu.koordinat_sistemi)
+        .where(tapu.koordinat_x.is_not(None), tapu.koordinat_y.is_not(None))
+    ).all()
+    varsayilan = float(VARSAYILAN_DILIM_MERIDYENI) if VARSAYILAN_DILIM_MERIDYENI else np.nan
+    kimlikler = np.array([s[0] for s in satirlar], dtype=np.int64)
+    x = np.array([s[1] for s in satirlar], dtype=np.float64)
+    y = np.array([s[2] for s in satirlar], dtype=np.float64)
+    meridyenler = np.array([s[3] if s[3] is not None else varsayilan for s in satirlar], dtype=np.float64)
+    boylam, enlem = karisik_wgs84e(x, y, meridyenler, [s[4] for s in satirlar])
+    return kimlikler, x, y, boylam, enlem
+
+
+def ortak_duzlem_noktalari(noktalar, dilim=None, sistem=None):
+    """
+    Sorgu noktalarını konum indeksinin ortak düzlemine taşır.
+
+    Args:
+        noktalar (sequence): [(a, b), ...]; ``dilim`` verilmişse o dilimdeki
+            TM koordinatları (x, y), verilmemişse WGS84 (boylam, enlem)
+        dilim (int, optional): TM noktalarının orta meridyeni
+        sistem (str, optional): TM noktalarının datumu (varsayılan ``VARSAYILAN_SISTEM``)
+
+    Returns:
+        np.ndarray: (n, 2) ortak düzlem koordinatları (metre)
+    """
+    noktalar = np.asarray(noktalar, dtype=np.float64).reshape(-1, 2)
+    if dilim is None:
+        x, y = cografi_tm(noktalar[:, 0], noktalar[:, 1], ORTAK_MERIDYEN)
+    else:
+        x, y = ortak_duzleme(noktalar[:, 0], noktalar[:, 1], np.full(len(noktalar), float(dilim)),
+                             [sistem or VARSAYILAN_SISTEM] * len(noktalar))
+    return np.column_stack([x, y])
+
+
+class KonumIndeksi(SurumluBellek):
+    """
+    Tapu koordinatları için ızgara indeksi ve harita kümeleri (web).
+
+    Bütün sütun bir kez WGS84'e çevrilir. Farklı dilimlerdeki sağa değerler
+    aynı aralıkta tekrarlandığından ızgara indeksi ``ORTAK_MERIDYEN``
+    düzleminde kurulur; dilimi bilinmeyen kayıtlar indekse ve haritaya girmez.
+    """
+    uzanti_adi = "konum_indeksi"
+
+    def _kur(self):
+        kimlikler, _, _, boylam, enlem = tapu_konumlari(self.db.session, self.modeller[0])
+        x, y = cografi_tm(boylam, enlem, ORTAK_MERIDYEN)
+        return IzgaraIndeksi(kimlikler, x, y), HaritaKumeleri(kimlikler, boylam, enlem)
+
+    def getir(self):
+        """
+        Güncel ızgara indeksini döndürür; gerekiyorsa yeniden kurar.
+
+        Sorgu noktaları önce ``ortak_duzlem_noktalari`` ile taşınmalıdır.
+
+        Returns:
+            IzgaraIndeksi: İndeks (ortak düzlem koordinatları)
+        """
+        return self._guncel()[0]
+
+    def harita(self):
+        """
+        Güncel harita kümelerini döndürür; gerekiyorsa yeniden kurar.
+
+        Returns:
+            HaritaKumeleri: WGS84 kümeleri
+        """
+        return self._guncel()[1]
+
+
+class ProfilTahmini(SurumluBellek):
+    """
+    Arşivdeki kuyulardan SPT profili ve katman üstü tahmini (web).
+
+    Konum projedir: projenin tüm kuyuları tapudaki tek koordinatı paylaşır
+    ve aynı derinlik aralığındaki ölçümleri ortalanır. Koordinatlar WGS84
+    üzerinden ``ORTAK_MERIDYEN`` dilimine taşınır; dilimi bilinmeyen
+    kayıtlar kullanılmaz.
+    """
+    uzanti_adi = "profil_tahmini"
+
+    def _kur(self):
+        tapu, arazi = self.modeller
+        kimlikler, _, _, boylam, enlem = tapu_konumlari(self.db.session, tapu)
+        bilinen = np.isfinite(boylam) & np.isfinite(enlem)
+        kimlikler = kimlikler[bilinen]
+        x, y = cografi_tm(boylam[bilinen], enlem[bilinen], ORTAK_MERIDYEN)
+
+        satirlar = self.db.session.execute(
+            select(arazi.proje_id, arazi.sondaj_derinligi, arazi.n30, arazi.zemin_tanimlamasi)
+            .where(arazi.sondaj_derinligi.is_not(None))
+        ).all()
+        # Proje ID'sini matris satırına eşle; koordinatı bilinmeyen projelerin satırları atlanır
+        satir_no = {kimlik: i for i, kimlik in enumerate(kimlikler.tolist())}
+        konumlar, derinlikler, n30, tanimlar = [], [], [], []
+        for proje_id, derinlik, deger, tanim in satirlar:
+            i = satir_no.get(proje_id)
+            if i is not None:
+                konumlar.append(i)
+                derinlikler.append(derinlik)
+                # 0 "ölçülmedi" anlamındadır
+                n30.append(deger if deger else np.nan)
+                tanimlar.append(tanim)
+        matris = derinlik_matrisi(konumlar, derinlikler, n30, len(kimlikler))
+        adlar, ustler = katman_ustleri(konumlar, derinlikler, tanimlar, len(kimlikler))
+
+        # Yalnızca en az bir ölçümü olan konumlar komşu olabilir
+        verili = np.isfinite(matris).any(axis=1) | np.isfinite(ustler).any(axis=0)
+        return ProfilEnterpolatoru(kimlikler[verili], x[verili], y[verili], matris[verili],
+                                   adlar, ustler[:, verili])
+
+    def tahmin(self, boylam, enlem, yontem="idw", komsu_sayisi=None):
+        """
+        WGS84 noktasında tahmini profil.
+
+        Returns:
+            dict: bkz. ``ProfilEnterpolatoru.tahmin``
+        """
+        x, y = cografi_tm(boylam, enlem, ORTAK_MERIDYEN)
+        secenekler = {"komsu_sayisi": komsu_sayisi} if komsu_sayisi else {}
+        return self._guncel().tahmin(float(x), float(y), yontem, **secenekler)
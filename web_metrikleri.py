@@ -0,0 +1,275 @@
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+from collections import defaultdict
+
+from flask import Response, g, request, has_request_context, abort
+from sqlalchemy import event
+
+from cekirdek.gunluk import hata_logla
+
+# Gecikme kovaları (saniye) ve istek başına sorgu sayısı kovaları
+SURE_KOVALARI = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SORGU_KOVALARI = (1, 2, 5, 10, 20, 50, 100, 250)
+
+YAVAS_SORGU_ESIGI = float(os.environ.get("YAVAS_SORGU_ESIGI_MS", "100")) / 1000
+# Çok süreçli sunucuda süreçlerin ölçümleri paylaşılan dizine en fazla bu aralıkla yazılır (saniye)
+METRIK_YAZMA_ARALIGI = 5.0
+
+
+class Histogram:
+    """Prometheus biçiminde kümülatif kovalı histogram (etiket kümesi başına)"""
+    def __init__(self, ad, aciklama, kovalar, etiketler):
+        self.ad = ad
+        self.aciklama = aciklama
+        self.kovalar = kovalar
+        self.etiketler = etiketler
+        self.seriler = {}
+
+    def gozlemle(self, etiket_degerleri, deger):
+        seri = self.seriler.get(etiket_degerleri)
+        if seri is None:
+            seri = self.seriler[etiket_degerleri] = [[0] * len(self.kovalar), 0.0, 0]
+        for i, sinir in enumerate(self.kovalar):
+            if deger <= sinir:
+                seri[0][i] += 1
+        seri[1] += deger
+        seri[2] += 1
+
+    def durum(self):
+        return [[list(etiket_degerleri), seri] for etiket_degerleri, seri in self.seriler.items()]
+
+    def birlestir(self, durum):
+        """Başka bir sürecin ``durum()`` çıktısını bu histograma ekler"""
+        for etiket_degerleri, (kovalar, toplam, adet) in durum:
+            seri = self.seriler.setdefault(tuple(etiket_degerleri), [[0] * len(self.kovalar), 0.0, 0])
+            seri[0] = [a + b for a, b in zip(seri[0], kovalar)]
+            seri[1] += toplam
+            seri[2] += adet
+
+    def metin(self):
+        satirlar = [f"# HELP {self.ad} {self.aciklama}", f"# TYPE {self.ad} histogram"]
+        for etiket_degerleri, (kovalar, toplam, adet) in sorted(self.seriler.items()):
+            etiket = _etiket_metni(self.etiketler, etiket_degerleri)
+            for sinir, sayi in zip(self.kovalar, kovalar):
+                satirlar.append(f'{self.ad}_bucket{{{etiket},le="{sinir}"}} {sayi}')
+            satirlar.append(f'{self.ad}_bucket{{{etiket},le="+Inf"}} {adet}')
+            satirlar.append(f"{self.ad}_sum{{{etiket}}} {toplam:.6f}")
+            satirlar.append(f"{self.ad}_count{{{etiket}}} {adet}")
+        return satirlar
+
+
+class Sayac:
+    """Etiketli, yalnızca artan sayaç"""
+    def __init__(self, ad, aciklama, etiketler):
+        self.ad = ad
+        self.aciklama = aciklama
+        self.etiketler = etiketler
+        self.seriler = defaultdict(float)
+
+    def artir(self, etiket_degerleri, miktar=1):
+        self.seriler[etiket_degerleri] += miktar
+
+    def durum(self):
+        return [[list(etiket_degerleri), deger] for etiket_degerleri, deger in self.seriler.items()]
+
+    def birlestir(self, durum):
+        """Başka bir sürecin ``durum()`` çıktısını bu sayaca ekler"""
+        for etiket_degerleri, deger in durum:
+            self.seriler[tuple(etiket_degerleri)] += deger
+
+    def metin(self):
+        satirlar = [f"# HELP {self.ad} {self.aciklama}", f"# TYPE {self.ad} counter"]
+        for etiket_degerleri, deger in sorted(self.seriler.items()):
+            satirlar.append(f"{self.ad}{{{_etiket_metni(self.etiketler, etiket_degerleri)}}} {deger:g}")
+        return satirlar
+
+
+def _etiket_metni(etiketler, degerler):
+    return ",".join(
+        f'{ad}="{str(deger).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for ad, deger in zip(etiketler, degerler)
+    )
+
+
+class IstekMetrikleri:
+    """
+    Flask istekleri ve SQLAlchemy sorguları için ölçüm toplayıcı.
+
+    Her istek için rota bazında süre, sorgu sayısı ve sorgu süresi
+    histogramlara eklenir; eşiği aşan sorgular günlüğe yazılır. Değerler
+    ``/metrics`` adresinden Prometheus metin biçiminde okunur.
+
+    Ölçümler süreç içinde tutulur. ``METRIK_DIZINI`` ayarlıysa her süreç
+    kendi ölçümlerini bu dizine yazar ve ``/metrics`` tüm süreçlerin
+    toplamını verir; ayarlı değilse yanıt yalnızca isteği karşılayan
+    sürecin ölçümleridir. ``METRIK_ANAHTARI`` ayarlıysa sayfa yalnızca
+    ``Authorization: Bearer <anahtar>`` ile okunur; ``METRIK_ANAHTARI_GEREKLI``
+    açıkken (üretim) anahtar tanımlanmamışsa sayfa kapalıdır.
+
+    Örnek:
+        metrikler = IstekMetrikleri()
+        with app.app_context():
+            metrikler.init_app(app, db.engine)
+    """
+    def __init__(self, yavas_sorgu_esigi=YAVAS_SORGU_ESIGI):
+        self.yavas_sorgu_esigi = yavas_sorgu_esigi
+        self.kilit = threading.Lock()
+        self.istek_suresi = Histogram(
+            "sondaj_http_istek_suresi_saniye", "Rota bazında istek süresi",
+            SURE_KOVALARI, ("rota", "yontem", "durum"))
+        self.istek_sorgu_sayisi = Histogram(
+            "sondaj_http_istek_sorgu_sayisi", "İstek başına çalıştırılan SQL sorgusu sayısı",
+            SORGU_KOVALARI, ("rota",))
+        self.istek_sorgu_suresi = Histogram(
+            "sondaj_http_istek_sorgu_suresi_saniye", "İstek başına toplam SQL süresi",
+            SURE_KOVALARI, ("rota",))
+        self.sorgular = Sayac("sondaj_sql_sorgu_toplam", "Çalıştırılan SQL sorgusu sayısı", ("rota",))
+        self.yavas_sorgular = Sayac("sondaj_sql_yavas_sorgu_toplam", "Eşiği aşan SQL sorgusu sayısı", ("rota",))
+        self.dizin = None
+        self.anahtar = None
+        self.anahtar_gerekli = False
+        self.son_yazim = 0.0
+
+    def _olcumler(self):
+        return {"istek_suresi": self.istek_suresi, "istek_sorgu_sayisi": self.istek_sorgu_sayisi,
+                "istek_sorgu_suresi": self.istek_sorgu_suresi, "sorgular": self.sorgular,
+                "yavas_sorgular": self.yavas_sorgular}
+
+    def init_app(self, app, engine):
+        """
+        Flask kancalarını, SQLAlchemy olaylarını ve /metrics rotasını kaydeder.
+
+        Args:
+            app (Flask): Uygulama
+            engine (sqlalchemy.engine.Engine): İzlenecek veritabanı motoru
+        """
+        self.dizin = app.config.get("METRIK_DIZINI")
+        self.anahtar = app.config.get("METRIK_ANAHTARI")
+        self.anahtar_gerekli = app.config.get("METRIK_ANAHTARI_GEREKLI", False)
+        if self.dizin:
+            os.makedirs(self.dizin, exist_ok=True)
+            # Son aralıkta biriken ölçümler süreç kapanırken yazılır
+            atexit.register(self.paylas, zorla=True)
+        app.before_request(self._istek_basladi)
+        app.after_request(self._istek_bitti)
+        event.listen(engine, "before_cursor_execute", self._sorgu_basladi)
+        event.listen(engine, "after_cursor_execute", self._sorgu_bitti)
+        app.add_url_rule("/metrics", "metrics", self.metrik_sayfasi)
+
+    @staticmethod
+    def _rota():
+        if has_request_context():
+            return request.endpoint or "bilinmiyor"
+        return "istek_disi"
+
+    def _istek_basladi(self):
+        g.istek_baslangici = time.perf_counter()
+        g.sorgu_sayisi = 0
+        g.sorgu_suresi = 0.0
+
+    def _istek_bitti(self, response):
+        baslangic = g.pop("istek_baslangici", None)
+        if baslangic is None or request.endpoint == "metrics":
+            return response
+        sure = time.perf_counter() - baslangic
+        rota = self._rota()
+        sorgu_sayisi = g.get("sorgu_sayisi", 0)
+        sorgu_suresi = g.get("sorgu_suresi", 0.0)
+        with self.kilit:
+            self.istek_suresi.gozlemle((rota, request.method, str(response.status_code)), sure)
+            self.istek_sorgu_sayisi.gozlemle((rota,), sorgu_sayisi)
+            self.istek_sorgu_suresi.gozlemle((rota,), sorgu_suresi)
+        self.paylas()
+        # Tarayıcı geliştirici araçlarında da görünsün
+        response.headers.add(
+            "Server-Timing",
+            f'app;dur={sure * 1000:.1f}, db;dur={sorgu_suresi * 1000:.1f};desc="{sorgu_sayisi} sorgu"'
+        )
+        return response
+
+    def _sorgu_basladi(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("sorgu_baslangici", []).append(time.perf_counter())
+
+    def _sorgu_bitti(self, conn, cursor, statement, parameters, context, executemany):
+        baslangiclar = conn.info.get("sorgu_baslangici")
+        if not baslangiclar:
+            return
+        sure = time.perf_counter() - baslangiclar.pop()
+        rota = self._rota()
+        if has_request_context() and "sorgu_sayisi" in g:
+            g.sorgu_sayisi += 1
+            g.sorgu_suresi += sure
+        with self.kilit:
+            self.sorgular.artir((rota,))
+            if sure >= self.yavas_sorgu_esigi:
+                self.yavas_sorgular.artir((rota,))
+        if sure >= self.yavas_sorgu_esigi:
+            hata_logla(f"Yavaş sorgu ({sure * 1000:.1f} ms, {rota}): {' '.join(statement.split())}",
+                       seviye=logging.WARNING, islem="yavas_sorgu")
+
+    def paylas(self, zorla=False):
+        """
+        Süreç ölçümlerini paylaşılan dizindeki <pid>.json dosyasına yazar.
+
+        Args:
+            zorla (bool): False ise son yazımdan ``METRIK_YAZMA_ARALIGI`` geçmeden yazılmaz
+        """
+        if not self.dizin:
+            return
+        simdi = time.monotonic()
+        if not zorla and simdi - self.son_yazim < METRIK_YAZMA_ARALIGI:
+            return
+        self.son_yazim = simdi
+        with self.kilit:
+            durum = {ad: olcum.durum() for ad, olcum in self._olcumler().items()}
+        yol = os.path.join(self.dizin, f"{os.getpid()}.json")
+        try:
+            with open(f"{yol}.{threading.get_ident()}.tmp", "w", encoding="utf-8") as f:
+                json.dump(durum, f)
+            os.replace(f.name, yol)
+        except OSError as e:
+            hata_logla(f"Metrik dosyası yazılamadı: {str(e)}", e, seviye=logging.WARNING)
+
+    def _toplam(self):
+        """Paylaşılan dizindeki tüm süreçlerin ölçümlerini toplar"""
+        self.paylas(zorla=True)
+        toplam = IstekMetrikleri(self.yavas_sorgu_esigi)
+        olcumler = toplam._olcumler()
+        for ad in sorted(os.listdir(self.dizin)):
+            if not ad.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.dizin, ad), encoding="utf-8") as f:
+                    durum = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for olcum_adi, olcum_durumu in durum.items():
+                if olcum_adi in olcumler:
+                    olcumler[olcum_adi].birlestir(olcum_durumu)
+        return toplam
+
+    def metin(self):
+        """
+        Tüm ölçümleri Prometheus metin biçiminde döndürür.
+
+        Returns:
+            str: /metrics yanıt gövdesi
+        """
+        kaynak = self._toplam() if self.dizin else self
+        with kaynak.kilit:
+            satirlar = []
+            for olcum in kaynak._olcumler().values():
+                satirlar.extend(olcum.metin())
+        return "\n".join(satirlar) + "\n"
+
+    def metrik_sayfasi(self):
+        if self.anahtar:
+            if request.headers.get("Authorization") != f"Bearer {self.anahtar}":
+                abort(401)
+        elif self.anahtar_gerekli:
+            abort(403)
+        return Response(self.metin(), mimetype="text/plain; version=0.0.4; charset=utf-8")
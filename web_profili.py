@@ -0,0 +1,262 @@
+import os
+import io
+import re
+import json
+import time
+import pstats
+import cProfile
+import threading
+from datetime import datetime
+
+from flask import Response, g, request, jsonify, abort, send_file, url_for, current_app
+from flask_login import current_user
+
+from cekirdek.gunluk import hata_logla
+
+try:
+    from pyinstrument import Profiler as OrneklemeProfilleyici
+except ImportError:  # İsteğe bağlı; yoksa yalnızca cProfile kullanılır
+    OrneklemeProfilleyici = None
+
+PROFIL_DIZINI = os.environ.get("PROFIL_DIZINI", "profiller")
+PROFIL_AZAMI_SAYI = int(os.environ.get("PROFIL_AZAMI_SAYI", "50"))
+# Profil istemek için sorgu parametresi veya başlık: ?_profil=1 / X-Profil: 1
+# (değer "ornekleme" ise pyinstrument kullanılır)
+PROFIL_PARAMETRESI = "_profil"
+PROFIL_BASLIGI = "X-Profil"
+AGAC_ESIGI = 0.01   # Toplam sürenin bu oranından kısa dallar ağaçta gösterilmez
+AGAC_DERINLIGI = 30
+
+_GUVENLI_AD = re.compile(r"^[\w.-]+$")
+# Süreçte aynı anda tek profilleyici çalışabilir (Python 3.12+ ikinci cProfile'ı reddeder)
+_profil_kilidi = threading.Lock()
+
+
+def _fonksiyon_adi(fonksiyon):
+    dosya, satir, ad = fonksiyon
+    if dosya == "~":
+        return ad  # Yerleşik fonksiyon
+    return f"{ad} ({os.path.basename(dosya)}:{satir})"
+
+
+def cagri_agaci(istatistik, esik=AGAC_ESIGI, derinlik=AGAC_DERINLIGI):
+    """
+    cProfile istatistiklerinden kümülatif süreli çağrı ağacı metni üretir.
+
+    Kökler, profil başladığında yığında olan (çağıranı kaydedilmemiş)
+    fonksiyonlardır. Toplam sürenin ``esik`` oranından kısa dallar atlanır.
+
+    Args:
+        istatistik (pstats.Stats): Profil istatistikleri
+
+    Returns:
+        str: Girintili çağrı ağacı
+    """
+    istatistik.calc_callees()
+    kokler = [f for f, (_, _, _, _, cagiranlar) in istatistik.stats.items() if not cagiranlar]
+    kokler.sort(key=lambda f: istatistik.stats[f][3], reverse=True)
+    toplam = istatistik.total_tt or 1e-9
+    satirlar = []
+
+    def yaz(fonksiyon, kumulatif, cagri, seviye, yol):
+        satirlar.append(f"{'  ' * seviye}{kumulatif * 1000:9.1f} ms {kumulatif / toplam * 100:5.1f}%  "
+                        f"{cagri:>6}x  {_fonksiyon_adi(fonksiyon)}")
+        if seviye >= derinlik or fonksiyon in yol:
+            return
+        cagrilanlar = istatistik.all_callees.get(fonksiyon, {})
+        for alt, degerler in sorted(cagrilanlar.items(), key=lambda kv: kv[1][3], reverse=True):
+            if degerler[3] < toplam * esik:
+                break
+            yaz(alt, degerler[3], degerler[1], seviye + 1, yol | {fonksiyon})
+
+    for kok in kokler:
+        _, cagri, _, kumulatif, _ = istatistik.stats[kok]
+        if kumulatif >= toplam * esik:
+            yaz(kok, kumulatif, cagri, 0, frozenset())
+    return "\n".join(satirlar)
+
+
+class IstekProfilleyici:
+    """
+    Yöneticilerin tek bir isteği profillemesini sağlar.
+
+    Bayrak taşımayan isteklerde yalnızca sorgu parametresi ve başlık
+    kontrol edilir. Profiller sunucuda saklanır, en fazla
+    ``PROFIL_AZAMI_SAYI`` adet tutulur (en eskiler silinir) ve
+    ``/admin/profiller`` altından görüntülenir.
+    """
+    def __init__(self, dizin=PROFIL_DIZINI, azami_sayi=PROFIL_AZAMI_SAYI):
+        self.dizin = dizin
+        self.azami_sayi = azami_sayi
+        self.kilit = threading.Lock()
+
+    def init_app(self, app):
+        """
+        Flask kancalarını ve görüntüleme rotalarını kaydeder.
+
+        Profil dizini ``PROFIL_DIZINI`` ayarından alınır ve ilk profil
+        kaydedilirken oluşturulur.
+        """
+        self.dizin = app.config.get("PROFIL_DIZINI", self.dizin)
+        app.before_request(self._istek_basladi)
+        app.after_request(self._istek_bitti)
+        app.teardown_request(self._istek_temizle)
+        app.add_url_rule("/admin/profiller", "profil_listesi", self.profil_listesi)
+        app.add_url_rule("/admin/profiller/<ad>", "profil_goster", self.profil_goster)
+
+    @staticmethod
+    def _yonetici_mi():
+        if not (current_user.is_authenticated and getattr(current_user, "is_admin", False)):
+            return False
+        # Önbellekteki kimlik başka bir süreçte alınmış yetkiyi henüz göstermeyebilir
+        onbellek = current_app.extensions.get("kullanici_onbellegi")
+        return onbellek is None or onbellek.yonetici_mi(current_user.id)
+
+    def _istek_basladi(self):
+        tur = request.args.get(PROFIL_PARAMETRESI) or request.headers.get(PROFIL_BASLIGI)
+        if not tur or not self._yonetici_mi():
+            return
+        # Başka bir istek profillenirken bu istek profilsiz çalışır
+        if not _profil_kilidi.acquire(blocking=False):
+            g.profil_atlandi = True
+            return
+        try:
+            if tur == "ornekleme" and OrneklemeProfilleyici is not None:
+                profilleyici = OrneklemeProfilleyici()
+                profilleyici.start()
+            else:
+                profilleyici = cProfile.Profile()
+                profilleyici.enable()
+        except (ValueError, RuntimeError):
+            # Süreçte başka bir profilleyici etkin (ör. sys.monitoring aracı)
+            _profil_kilidi.release()
+            g.profil_atlandi = True
+            return
+        g.istek_profili = (profilleyici, time.perf_counter())
+
+    def _istek_bitti(self, response):
+        profil = g.pop("istek_profili", None)
+        if profil is None:
+            if g.pop("profil_atlandi", False):
+                response.headers["X-Profil-Atlandi"] = "baska-profil-etkin"
+            return response
+        profilleyici, baslangic = profil
+        try:
+            if isinstance(profilleyici, cProfile.Profile):
+                profilleyici.disable()
+            else:
+                profilleyici.stop()
+        finally:
+            _profil_kilidi.release()
+        sure = time.perf_counter() - baslangic
+
+        try:
+            ad = self.kaydet(profilleyici, {
+                "zaman": datetime.now().isoformat(timespec="seconds"),
+                "rota": request.endpoint,
+                "adres": request.full_path,
+                "yontem": request.method,
+                "durum": response.status_code,
+                "kullanici": current_user.username,
+                "sure_ms": round(sure * 1000, 1),
+            })
+            response.headers["X-Profil-Adresi"] = url_for("profil_goster", ad=ad)
+        except Exception as e:
+            hata_logla(f"İstek profili kaydetme hatası: {str(e)}", e)
+        return response
+
+    def _istek_temizle(self, hata):
+        # Yanıt üretilemeden biten isteklerde profilleyici durdurulur ve kilit bırakılır
+        profil = g.pop("istek_profili", None)
+        if profil is None:
+            return
+        profilleyici = profil[0]
+        try:
+            if isinstance(profilleyici, cProfile.Profile):
+                profilleyici.disable()
+            else:
+                profilleyici.stop()
+        finally:
+            _profil_kilidi.release()
+
+    def kaydet(self, profilleyici, bilgi):
+        """
+        Profili ve açıklama bilgisini diske yazar, fazla profilleri siler.
+
+        Returns:
+            str: Profil adı
+        """
+        rota = re.sub(r"\W+", "_", bilgi["rota"] or "rota")
+        ad = f"{datetime.now():%Y%m%d_%H%M%S_%f}_{rota}"
+        os.makedirs(self.dizin, exist_ok=True)
+        if isinstance(profilleyici, cProfile.Profile):
+            bilgi["tur"] = "cprofile"
+            profilleyici.dump_stats(os.path.join(self.dizin, f"{ad}.prof"))
+        else:
+            bilgi["tur"] = "ornekleme"
+            with open(os.path.join(self.dizin, f"{ad}.html"), "w", encoding="utf-8") as f:
+                f.write(profilleyici.output_html())
+        with open(os.path.join(self.dizin, f"{ad}.json"), "w", encoding="utf-8") as f:
+            json.dump(bilgi, f, ensure_ascii=False)
+        self._dondur()
+        return ad
+
+    def _dondur(self):
+        with self.kilit:
+            adlar = sorted(d[:-5] for d in os.listdir(self.dizin) if d.endswith(".json"))
+            for eski in adlar[:-self.azami_sayi] if self.azami_sayi else []:
+                for uzanti in (".json", ".prof", ".html"):
+                    try:
+                        os.remove(os.path.join(self.dizin, eski + uzanti))
+                    except FileNotFoundError:
+                        pass
+
+    def _bilgi(self, ad):
+        if not _GUVENLI_AD.match(ad):
+            abort(404)
+        try:
+            with open(os.path.join(self.dizin, f"{ad}.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            abort(404)
+
+    def profil_listesi(self):
+        """Saklanan profilleri yeniden eskiye listeler (JSON)"""
+        if not self._yonetici_mi():
+            abort(403)
+        if not os.path.isdir(self.dizin):
+            return jsonify([])
+        adlar = sorted((d[:-5] for d in os.listdir(self.dizin) if d.endswith(".json")), reverse=True)
+        profiller = []
+        for ad in adlar:
+            bilgi = self._bilgi(ad)
+            bilgi.update(ad=ad, goruntule=url_for("profil_goster", ad=ad))
+            profiller.append(bilgi)
+        return jsonify(profiller)
+
+    def profil_goster(self, ad):
+        """
+        Profili görüntüler.
+
+        cProfile için çağrı ağacı ve en pahalı fonksiyonlar düz metin olarak
+        döner; ``?bicim=ham`` ile .prof dosyası (snakeviz vb. için) indirilir.
+        Örnekleme profilleri pyinstrument'ın HTML alev grafiğiyle gösterilir.
+        """
+        if not self._yonetici_mi():
+            abort(403)
+        bilgi = self._bilgi(ad)
+        if bilgi.get("tur") == "ornekleme":
+            return send_file(os.path.abspath(os.path.join(self.dizin, f"{ad}.html")), mimetype="text/html")
+
+        yol = os.path.abspath(os.path.join(self.dizin, f"{ad}.prof"))
+        if request.args.get("bicim") == "ham":
+            return send_file(yol, as_attachment=True, download_name=f"{ad}.prof")
+
+        cikti = io.StringIO()
+        istatistik = pstats.Stats(yol, stream=cikti)
+        baslik = (f"{bilgi['yontem']} {bilgi['adres']} -> {bilgi['durum']}  "
+                  f"{bilgi['sure_ms']} ms  ({bilgi['kullanici']}, {bilgi['zaman']})")
+        cikti.write(f"{baslik}\n\nÇağrı ağacı (kümülatif):\n{cagri_agaci(istatistik)}\n\n")
+        cikti.write("En pahalı fonksiyonlar (kümülatif):\n")
+        istatistik.sort_stats("cumulative").print_stats(30)
+        return Response(cikti.getvalue(), mimetype="text/plain; charset=utf-8")
@@ -15,8 +15,9 @@ from PyQt6.QtGui import (
 
 from utils import (
     hata_logla, bilgi_goster, hata_goster, uyari_goster, onay_al,
-    veritabani_baglantisi
+    veritabani_baglantisi, kayit_tarihi, tarih_kaydi
 )
+from cekirdek.veritabani import ilk_kuyu, varsayilan_kuyu
 from constants import ZEMIN_TIPLERI, MAKINE_TIPLERI, SPT_TIP_SECENEKLERI
 
 class StatusIndicator(QWidget):
@@ -244,6 +245,9 @@ class TapuFormWidget(QWidget):
         self.txt_koordinat_x.setValidator(QDoubleValidator())
         self.txt_koordinat_y = QLineEdit()
         self.txt_koordinat_y.setValidator(QDoubleValidator())
+        # Seçenekler ilk yüklemede doldurulur (_secenekleri_doldur)
+        self.cmb_koordinat_sistemi = QComboBox()
+        self.cmb_dilim_meridyeni = QComboBox()
         
         # Kaydet butonu
         self.btn_kaydet = QPushButton("Tapu Bilgilerini Kaydet")
@@ -258,6 +262,8 @@ class TapuFormWidget(QWidget):
         layout.addRow("Parsel:", self.txt_parsel)
         layout.addRow("Koordinat X:", self.txt_koordinat_x)
         layout.addRow("Koordinat Y:", self.txt_koordinat_y)
+        layout.addRow("Datum:", self.cmb_koordinat_sistemi)
+        layout.addRow("Dilim Orta Meridyeni:", self.cmb_dilim_meridyeni)
         layout.addRow("", self.btn_kaydet)
         
         # Veri değişikliği sinyallerini bağla
@@ -269,10 +275,26 @@ class TapuFormWidget(QWidget):
         self.txt_parsel.textChanged.connect(self.dataChanged)
         self.txt_koordinat_x.textChanged.connect(self.dataChanged)
         self.txt_koordinat_y.textChanged.connect(self.dataChanged)
+        self.cmb_koordinat_sistemi.currentIndexChanged.connect(self.dataChanged)
+        self.cmb_dilim_meridyeni.currentIndexChanged.connect(self.dataChanged)
+    
+    def _secenekleri_doldur(self):
+        """Datum ve dilim seçeneklerini ilk kullanımda doldurur"""
+        if self.cmb_koordinat_sistemi.count():
+            return
+        # cekirdek.koordinat NumPy yükler; açılış yolunda içe aktarılmaz
+        from cekirdek.koordinat import KOORDINAT_SISTEMLERI, VARSAYILAN_SISTEM, DILIM_MERIDYENLERI
+        for ad in KOORDINAT_SISTEMLERI:
+            self.cmb_koordinat_sistemi.addItem(ad, ad)
+        self.cmb_koordinat_sistemi.setCurrentIndex(self.cmb_koordinat_sistemi.findData(VARSAYILAN_SISTEM))
+        self.cmb_dilim_meridyeni.addItem("Belirtilmemiş", None)
+        for meridyen in DILIM_MERIDYENLERI:
+            self.cmb_dilim_meridyeni.addItem(f"{meridyen}°", meridyen)
     
     def load_data(self, proje_id):
         """Veritabanından verileri yükler"""
         try:
+            self._secenekleri_doldur()
             with veritabani_baglantisi() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -292,6 +314,11 @@ class TapuFormWidget(QWidget):
                     self.txt_parsel.setText(tapu["parsel"] or "")
                     self.txt_koordinat_x.setText(str(tapu["koordinat_x"] or ""))
                     self.txt_koordinat_y.setText(str(tapu["koordinat_y"] or ""))
+                    sistem = self.cmb_koordinat_sistemi.findData(tapu["koordinat_sistemi"])
+                    if sistem >= 0:
+                        self.cmb_koordinat_sistemi.setCurrentIndex(sistem)
+                    self.cmb_dilim_meridyeni.setCurrentIndex(
+                        max(self.cmb_dilim_meridyeni.findData(tapu["dilim_meridyeni"]), 0))
                 else:
                     # Formları temizle
                     self.clear_form()
@@ -313,6 +340,10 @@ class TapuFormWidget(QWidget):
             if self.txt_koordinat_y.text().strip():
                 koordinat_y = float(self.txt_koordinat_y.text().replace(",", "."))
             
+            self._secenekleri_doldur()
+            koordinat_sistemi = self.cmb_koordinat_sistemi.currentData()
+            dilim_meridyeni = self.cmb_dilim_meridyeni.currentData()
+            
             with veritabani_baglantisi() as conn:
                 cursor = conn.cursor()
                 
@@ -329,25 +360,30 @@ class TapuFormWidget(QWidget):
                     cursor.execute("""
                         UPDATE TapuBilgileri
                         SET il = ?, ilce = ?, mahalle = ?, ada = ?, 
-                            pafta = ?, parsel = ?, koordinat_x = ?, koordinat_y = ?
+                            pafta = ?, parsel = ?, koordinat_x = ?, koordinat_y = ?,
+                            koordinat_sistemi = ?, dilim_meridyeni = ?
                         WHERE proje_id = ?
                     """, (
                         self.txt_il.text(), self.txt_ilce.text(), self.txt_mahalle.text(),
                         self.txt_ada.text(), self.txt_pafta.text(), self.txt_parsel.text(),
-                        koordinat_x, koordinat_y, proje_id
+                        koordinat_x, koordinat_y, koordinat_sistemi, dilim_meridyeni, proje_id
                     ))
                 else:
                     # Yeni kayıt oluştur
                     cursor.execute("""
                         INSERT INTO TapuBilgileri
-                        (proje_id, il, ilce, mahalle, ada, pafta, parsel, koordinat_x, koordinat_y)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        (proje_id, il, ilce, mahalle, ada, pafta, parsel, koordinat_x, koordinat_y,
+                         koordinat_sistemi, dilim_meridyeni)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         proje_id, self.txt_il.text(), self.txt_ilce.text(), self.txt_mahalle.text(),
                         self.txt_ada.text(), self.txt_pafta.text(), self.txt_parsel.text(),
-                        koordinat_x, koordinat_y
+                        koordinat_x, koordinat_y, koordinat_sistemi, dilim_meridyeni
                     ))
                 
+                # Konum indeksi ortak düzlem koordinatlarıyla güncellenir
+                from cekirdek.konum import ortak_koordinatlari_yenile
+                ortak_koordinatlari_yenile(cursor)
                 conn.commit()
             
             return True
@@ -365,6 +401,8 @@ class TapuFormWidget(QWidget):
         self.txt_parsel.clear()
         self.txt_koordinat_x.clear()
         self.txt_koordinat_y.clear()
+        self.cmb_koordinat_sistemi.setCurrentIndex(0)
+        self.cmb_dilim_meridyeni.setCurrentIndex(0)
     
     def save_triggered(self):
         """Kaydet butonu tıklandığında çağrılır"""
@@ -373,12 +411,14 @@ class TapuFormWidget(QWidget):
         self.dataChanged.emit()
 
 class SondajFormWidget(QWidget):
-    """Sondaj bilgileri formu"""
+    """Sondaj bilgileri formu (projenin bir kuyusu)"""
     
     dataChanged = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.proje_id = None
+        self.sondaj_id = None
         self.setupUI()
         
     def setupUI(self):
@@ -458,17 +498,32 @@ class SondajFormWidget(QWidget):
         self.cmb_makine_tipi.currentIndexChanged.connect(self.dataChanged)
         self.cmb_spt_tip.currentIndexChanged.connect(self.dataChanged)
     
-    def load_data(self, proje_id):
-        """Veritabanından verileri yükler"""
+    def load_data(self, proje_id, sondaj_id=None):
+        """
+        Veritabanından verileri yükler.
+        
+        Args:
+            proje_id (int): Proje ID
+            sondaj_id (int, optional): Kuyu ID; verilmezse projenin ilk kuyusu
+        """
         try:
+            self.proje_id = proje_id
             with veritabani_baglantisi() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM SondajBilgileri
-                    WHERE proje_id = ?
-                """, (proje_id,))
+                if sondaj_id is None:
+                    cursor.execute("""
+                        SELECT * FROM SondajBilgileri
+                        WHERE proje_id = ?
+                        ORDER BY id LIMIT 1
+                    """, (proje_id,))
+                else:
+                    cursor.execute("""
+                        SELECT * FROM SondajBilgileri
+                        WHERE id = ? AND proje_id = ?
+                    """, (sondaj_id, proje_id))
                 
                 sondaj = cursor.fetchone()
+                self.sondaj_id = sondaj["id"] if sondaj else None
                 
                 if sondaj:
                     # Mevcut kayıtları yükle
@@ -484,15 +539,11 @@ class SondajFormWidget(QWidget):
                     else:
                         self.txt_derinlik.setValue(0)
                     
-                    if sondaj["baslama_tarihi"]:
-                        self.date_baslama.setDate(QDate.fromString(sondaj["baslama_tarihi"], "dd.MM.yyyy"))
-                    else:
-                        self.date_baslama.setDate(QDate.currentDate())
+                    baslama = kayit_tarihi(sondaj["baslama_tarihi"])
+                    self.date_baslama.setDate(baslama if baslama.isValid() else QDate.currentDate())
                     
-                    if sondaj["bitis_tarihi"]:
-                        self.date_bitis.setDate(QDate.fromString(sondaj["bitis_tarihi"], "dd.MM.yyyy"))
-                    else:
-                        self.date_bitis.setDate(QDate.currentDate())
+                    bitis = kayit_tarihi(sondaj["bitis_tarihi"])
+                    self.date_bitis.setDate(bitis if bitis.isValid() else QDate.currentDate())
                     
                     if sondaj["delgi_capi"] is not None:
                         self.txt_delgi_capi.setValue(sondaj["delgi_capi"])
@@ -530,53 +581,33 @@ class SondajFormWidget(QWidget):
             with veritabani_baglantisi() as conn:
                 cursor = conn.cursor()
                 
-                # Önce mevcut kaydı kontrol et
-                cursor.execute("""
-                    SELECT id FROM SondajBilgileri
-                    WHERE proje_id = ?
-                """, (proje_id,))
-                
-                existing = cursor.fetchone()
+                # Yüklenen kuyu bu projeye aitse o güncellenir, değilse projenin ilk kuyusu
+                if self.sondaj_id is None or self.proje_id != proje_id:
+                    self.sondaj_id = varsayilan_kuyu(conn, proje_id)
+                    self.proje_id = proje_id
                 
                 # Tarihleri biçimlendir
-                baslama_tarihi = self.date_baslama.date().toString("dd.MM.yyyy")
-                bitis_tarihi = self.date_bitis.date().toString("dd.MM.yyyy")
+                baslama_tarihi = tarih_kaydi(self.date_baslama.date())
+                bitis_tarihi = tarih_kaydi(self.date_bitis.date())
                 
                 # Zemin tipi, makine tipi ve SPT tipi
                 zemin_tipi = self.cmb_zemin_tipi.currentText() if self.cmb_zemin_tipi.currentIndex() > 0 else None
                 makine_tipi = self.cmb_makine_tipi.currentText() if self.cmb_makine_tipi.currentIndex() > 0 else None
                 spt_tipi = self.cmb_spt_tip.currentText() if self.cmb_spt_tip.currentIndex() > 0 else None
                 
-                if existing:
-                    # Mevcut kaydı güncelle
-                    cursor.execute("""
-                        UPDATE SondajBilgileri
-                        SET sondor_adi = ?, sondaj_kotu = ?, sondaj_derinligi = ?, 
-                            baslama_tarihi = ?, bitis_tarihi = ?, delgi_capi = ?, 
-                            yer_alti_suyu = ?, ud_ornekleri = ?, zemin_tipi = ?, 
-                            makine_tipi = ?, spt_sahmerdan_tipi = ?
-                        WHERE proje_id = ?
-                    """, (
-                        self.txt_sondor.text(), self.txt_kotu.value(), self.txt_derinlik.value(),
-                        baslama_tarihi, bitis_tarihi, self.txt_delgi_capi.value(),
-                        self.txt_yer_alti_suyu.value(), self.txt_ud_ornekleri.text(),
-                        zemin_tipi, makine_tipi, spt_tipi, proje_id
-                    ))
-                else:
-                    # Yeni kayıt oluştur
-                    cursor.execute("""
-                        INSERT INTO SondajBilgileri
-                        (proje_id, sondor_adi, sondaj_kotu, sondaj_derinligi, 
-                         baslama_tarihi, bitis_tarihi, delgi_capi, 
-                         yer_alti_suyu, ud_ornekleri, zemin_tipi, 
-                         makine_tipi, spt_sahmerdan_tipi)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        proje_id, self.txt_sondor.text(), self.txt_kotu.value(), self.txt_derinlik.value(),
-                        baslama_tarihi, bitis_tarihi, self.txt_delgi_capi.value(),
-                        self.txt_yer_alti_suyu.value(), self.txt_ud_ornekleri.text(),
-                        zemin_tipi, makine_tipi, spt_tipi
-                    ))
+                cursor.execute("""
+                    UPDATE SondajBilgileri
+                    SET sondor_adi = ?, sondaj_kotu = ?, sondaj_derinligi = ?, 
+                        baslama_tarihi = ?, bitis_tarihi = ?, delgi_capi = ?, 
+                        yer_alti_suyu = ?, ud_ornekleri = ?, zemin_tipi = ?, 
+                        makine_tipi = ?, spt_sahmerdan_tipi = ?
+                    WHERE id = ?
+                """, (
+                    self.txt_sondor.text(), self.txt_kotu.value(), self.txt_derinlik.value(),
+                    baslama_tarihi, bitis_tarihi, self.txt_delgi_capi.value(),
+                    self.txt_yer_alti_suyu.value(), self.txt_ud_ornekleri.text(),
+                    zemin_tipi, makine_tipi, spt_tipi, self.sondaj_id
+                ))
                 
                 conn.commit()
             
@@ -610,7 +641,9 @@ class AraziFormWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.proje_id = None
         self.arazi_id = None
+        self.sondaj_id = None
         self.setupUI()
         
     def setupUI(self):
@@ -739,19 +772,24 @@ class AraziFormWidget(QWidget):
         self.txt_zemin_profili.textChanged.connect(self.dataChanged)
         self.txt_zemin_tanimlamasi.textChanged.connect(self.dataChanged)
     
-    def load_data(self, proje_id):
-        """Veritabanından verileri yükler"""
+    def load_data(self, proje_id, sondaj_id=None):
+        """
+        Veritabanından verileri yükler.
+        
+        Args:
+            proje_id (int): Proje ID
+            sondaj_id (int, optional): Kuyu ID; verilmezse projenin ilk kuyusu
+        """
         try:
             self.proje_id = proje_id
             with veritabani_baglantisi() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM AraziBilgileri
-                    WHERE proje_id = ?
-                    ORDER BY "Sondaj derinliği (m)"
-                """, (proje_id,))
-                
-                self.arazi_kayitlari = cursor.fetchall()
+                if sondaj_id is None:
+                    sondaj_id = ilk_kuyu(conn, proje_id)
+                self.sondaj_id = sondaj_id
+                # Sütun tabanlı kayıtlar; (sondaj_id, derinlik) indeksi sıralamayı da karşılar.
+                # cekirdek.veri_koprusu NumPy yükler; açılış yolunda içe aktarılmaz
+                from cekirdek.veri_koprusu import arazi_kayitlari
+                self.arazi_kayitlari = arazi_kayitlari(conn, sondaj_id=sondaj_id) if sondaj_id is not None else []
                 
                 if self.arazi_kayitlari:
                     # İlk kaydı yükle
@@ -784,57 +822,57 @@ class AraziFormWidget(QWidget):
             self.arazi_id = kayit["id"]
             
             # Form alanlarını doldur
-            if kayit["Sondaj derinliği (m)"] is not None:
-                self.txt_sondaj_derinligi.setValue(kayit["Sondaj derinliği (m)"])
+            if kayit["sondaj_derinligi"] is not None:
+                self.txt_sondaj_derinligi.setValue(kayit["sondaj_derinligi"])
             else:
                 self.txt_sondaj_derinligi.setValue(0)
                 
-            if kayit["Muhafaza borusu derinliği"] is not None:
-                self.txt_muhafaza_derinligi.setValue(kayit["Muhafaza borusu derinliği"])
+            if kayit["muhafaza_borusu_derinligi"] is not None:
+                self.txt_muhafaza_derinligi.setValue(kayit["muhafaza_borusu_derinligi"])
             else:
                 self.txt_muhafaza_derinligi.setValue(0)
             
-            self.txt_kuyu_ici_deneyler.setText(kayit["Kuyu içi deneyler"] or "")
-            self.txt_ornek_derinligi.setText(kayit["Örnek derinliği (m)"] or "")
-            self.txt_ornek_turu.setText(kayit["Örnek türü ve no."] or "")
+            self.txt_kuyu_ici_deneyler.setText(kayit["kuyu_ici_deneyler"] or "")
+            self.txt_ornek_derinligi.setText(kayit["ornek_derinligi"] or "")
+            self.txt_ornek_turu.setText(kayit["ornek_turu_no"] or "")
             
-            self.txt_spt_0_15.setValue(kayit["SPT0-15"] or 0)
-            self.txt_spt_15_30.setValue(kayit["SPT15-30"] or 0)
-            self.txt_spt_30_45.setValue(kayit["SPT30-45"] or 0)
-            self.txt_n30.setValue(kayit["N30"] or 0)
+            self.txt_spt_0_15.setValue(kayit["spt_0_15"] or 0)
+            self.txt_spt_15_30.setValue(kayit["spt_15_30"] or 0)
+            self.txt_spt_30_45.setValue(kayit["spt_30_45"] or 0)
+            self.txt_n30.setValue(kayit["n30"] or 0)
             
-            if kayit["Tmax"] is not None:
-                self.txt_tmax.setValue(kayit["Tmax"])
+            if kayit["tmax"] is not None:
+                self.txt_tmax.setValue(kayit["tmax"])
             else:
                 self.txt_tmax.setValue(0)
                 
-            if kayit["TYoğrulmuş"] is not None:
-                self.txt_tyogrulmus.setValue(kayit["TYoğrulmuş"])
+            if kayit["tyogrulmus"] is not None:
+                self.txt_tyogrulmus.setValue(kayit["tyogrulmus"])
             else:
                 self.txt_tyogrulmus.setValue(0)
                 
-            if kayit["C (kpa)"] is not None:
-                self.txt_c_kpa.setValue(kayit["C (kpa)"])
+            if kayit["c_kpa"] is not None:
+                self.txt_c_kpa.setValue(kayit["c_kpa"])
             else:
                 self.txt_c_kpa.setValue(0)
                 
-            if kayit["Ø(derece)"] is not None:
-                self.txt_aci.setValue(kayit["Ø(derece)"])
+            if kayit["aci_derece"] is not None:
+                self.txt_aci.setValue(kayit["aci_derece"])
             else:
                 self.txt_aci.setValue(0)
                 
-            if kayit["Doğal B.H.A(kN/m3)"] is not None:
-                self.txt_dogal_birim_hacim.setValue(kayit["Doğal B.H.A(kN/m3)"])
+            if kayit["dogal_bha"] is not None:
+                self.txt_dogal_birim_hacim.setValue(kayit["dogal_bha"])
             else:
                 self.txt_dogal_birim_hacim.setValue(0)
                 
-            if kayit["Kuru B.H.A (kN/m3)"] is not None:
-                self.txt_kuru_birim_hacim.setValue(kayit["Kuru B.H.A (kN/m3)"])
+            if kayit["kuru_bha"] is not None:
+                self.txt_kuru_birim_hacim.setValue(kayit["kuru_bha"])
             else:
                 self.txt_kuru_birim_hacim.setValue(0)
             
-            self.txt_zemin_profili.setText(kayit["Zemin profili"] or "")
-            self.txt_zemin_tanimlamasi.setText(kayit["Zemin tanımlaması"] or "")
+            self.txt_zemin_profili.setText(kayit["zemin_profili"] or "")
+            self.txt_zemin_tanimlamasi.setText(kayit["zemin_tanimlamasi"] or "")
             
             # Navigasyon butonlarını güncelle
             self.btn_onceki.setEnabled(indeks > 0)
@@ -853,6 +891,10 @@ class AraziFormWidget(QWidget):
             with veritabani_baglantisi() as conn:
                 cursor = conn.cursor()
                 
+                if self.sondaj_id is None or self.proje_id != proje_id:
+                    self.sondaj_id = varsayilan_kuyu(conn, proje_id)
+                    self.proje_id = proje_id
+                
                 # Eğer bir arazi_id varsa, mevcut kaydı güncelle
                 if self.arazi_id:
                     cursor.execute("""
@@ -899,14 +941,15 @@ class AraziFormWidget(QWidget):
                     # Yeni kayıt oluştur
                     cursor.execute("""
                         INSERT INTO AraziBilgileri
-                        (proje_id, "Sondaj derinliği (m)", "Muhafaza borusu derinliği", 
+                        (proje_id, sondaj_id, "Sondaj derinliği (m)", "Muhafaza borusu derinliği", 
                          "Kuyu içi deneyler", "Örnek derinliği (m)", "Örnek türü ve no.", 
                          "SPT0-15", "SPT15-30", "SPT30-45", "N30", "Tmax", "TYoğrulmuş", 
                          "C (kpa)", "Ø(derece)", "Doğal B.H.A(kN/m3)", "Kuru B.H.A (kN/m3)", 
                          "Zemin profili", "Zemin tanımlaması")
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         proje_id,
+                        self.sondaj_id,
                         self.txt_sondaj_derinligi.value(),
                         self.txt_muhafaza_derinligi.value(),
                         self.txt_kuyu_ici_deneyler.text(),
@@ -930,7 +973,7 @@ class AraziFormWidget(QWidget):
                 conn.commit()
                 
                 # Kayıtları yeniden yükle
-                self.load_data(proje_id)
+                self.load_data(proje_id, self.sondaj_id)
             
             return True
         except Exception as e:
@@ -0,0 +1,16 @@
+"""
+Üretim sunucusu giriş noktası.
+
+Önce şema bir kez oluşturulur, ardından çok süreçli sunucu başlatılır:
+
+    flask --app main veritabani-kur
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Uygulama ana süreçte bir kez yüklenir (preload) ve işçiler fork ile
+kopyalanır; içe aktarma ve yapılandırma her işçide tekrarlanmaz.
+"""
+import os
+
+from main import create_app
+
+app = create_app(os.environ.get('SONDAJ_ORTAM', 'uretim'))